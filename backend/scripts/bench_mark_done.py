@@ -0,0 +1,188 @@
+"""Benchmark concurrent completions of a single task.
+
+Creates a throwaway group with one hot task, fires ``--completions`` calls to
+``TaskService.mark_done`` from ``--concurrency`` parallel sessions and reports
+throughput and latency. The fixture group is deleted afterwards unless
+``--keep`` is passed. Point it at a disposable database.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+from dataclasses import dataclass, field
+from decimal import Decimal
+from uuid import uuid4
+
+from db.enums import TaskLogStatus, Weekday
+from db.models import Group, GroupMembership, GroupMemberWeight, Task, TaskLog, User
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from unitkeeper_backend.application.tasks.service import TaskService
+from unitkeeper_backend.config import settings
+from unitkeeper_backend.domain.errors import BusinessRuleViolation
+from unitkeeper_backend.infrastructure.time import UtcClock
+from unitkeeper_backend.infrastructure.uow.sqlalchemy import SqlAlchemyUnitOfWork
+
+BENCH_USER_ID_BASE = 9_100_000_000
+
+
+@dataclass
+class BenchResult:
+    latencies: list[float] = field(default_factory=list)
+    accepted: int = 0
+    exhausted: int = 0
+
+
+async def create_fixture(
+    session_maker: async_sessionmaker[AsyncSession], *, members: int, frequency: int
+) -> tuple[int, int, list[int]]:
+    user_ids = [BENCH_USER_ID_BASE + index for index in range(members)]
+    async with session_maker() as session:
+        async with session.begin():
+            for user_id in user_ids:
+                if await session.get(User, user_id) is None:
+                    session.add(User(id=user_id, first_name=f"Bench {user_id}"))
+            group = Group(
+                name=f"bench-{uuid4().hex[:12]}",
+                join_secret="bench",
+                owner_user_id=user_ids[0],
+                sprint_start_weekday=Weekday.MONDAY,
+                sprint_duration_days=7,
+            )
+            session.add(group)
+            await session.flush()
+            weight = (Decimal("100") / members).quantize(Decimal("0.01"))
+            for user_id in user_ids:
+                membership = GroupMembership(group_id=group.id, user_id=user_id)
+                session.add(membership)
+                await session.flush()
+                session.add(GroupMemberWeight(membership_id=membership.id, weight_percent=weight))
+            task = Task(
+                group_id=group.id,
+                title="Bench task",
+                frequency_per_sprint=frequency,
+                unit_cost=Decimal("1.00"),
+            )
+            session.add(task)
+            await session.flush()
+            return group.id, task.id, user_ids
+
+
+async def drop_fixture(session_maker: async_sessionmaker[AsyncSession], *, group_id: int) -> None:
+    async with session_maker() as session:
+        async with session.begin():
+            await session.execute(delete(TaskLog).where(TaskLog.group_id == group_id))
+            await session.execute(delete(Group).where(Group.id == group_id))
+
+
+async def complete_once(
+    session_maker: async_sessionmaker[AsyncSession],
+    *,
+    group_id: int,
+    task_id: int,
+    performer_user_id: int,
+    result: BenchResult,
+) -> None:
+    started = time.perf_counter()
+    async with session_maker() as session:
+        service = TaskService(uow=SqlAlchemyUnitOfWork(session), clock=UtcClock())
+        try:
+            await service.mark_done(
+                group_id=group_id, performer_user_id=performer_user_id, task_id=task_id
+            )
+        except BusinessRuleViolation:
+            result.exhausted += 1
+        else:
+            result.accepted += 1
+    result.latencies.append(time.perf_counter() - started)
+
+
+async def run_benchmark(
+    database_url: str,
+    *,
+    completions: int,
+    concurrency: int,
+    members: int,
+    frequency: int,
+    keep: bool,
+) -> None:
+    engine = create_async_engine(database_url, pool_size=concurrency, max_overflow=0)
+    session_maker = async_sessionmaker(engine, expire_on_commit=False)
+    group_id, task_id, user_ids = await create_fixture(
+        session_maker, members=members, frequency=frequency
+    )
+    result = BenchResult()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def worker(index: int) -> None:
+        async with semaphore:
+            await complete_once(
+                session_maker,
+                group_id=group_id,
+                task_id=task_id,
+                performer_user_id=user_ids[index % len(user_ids)],
+                result=result,
+            )
+
+    try:
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(index) for index in range(completions)))
+        elapsed = time.perf_counter() - started
+
+        async with session_maker() as session:
+            stored = await session.scalar(
+                select(func.count(TaskLog.id)).where(
+                    TaskLog.task_id == task_id,
+                    TaskLog.status.in_([TaskLogStatus.PENDING, TaskLogStatus.COMPLETED]),
+                )
+            )
+
+        latencies = sorted(result.latencies)
+        p95 = latencies[max(int(len(latencies) * 0.95) - 1, 0)]
+        print(f"Completions: {completions} at concurrency {concurrency} ({members} members)")
+        print(f"Accepted: {result.accepted}, rejected by the sprint cap: {result.exhausted}")
+        print(f"Stored open logs: {stored} (cap {frequency})")
+        print(f"Elapsed: {elapsed:.2f}s, throughput: {completions / elapsed:.1f} req/s")
+        print(
+            f"Latency p50: {statistics.median(latencies) * 1000:.1f}ms, "
+            f"p95: {p95 * 1000:.1f}ms, max: {latencies[-1] * 1000:.1f}ms"
+        )
+    finally:
+        if not keep:
+            await drop_fixture(session_maker, group_id=group_id)
+        await engine.dispose()
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmark concurrent mark_done calls against a single hot task."
+    )
+    parser.add_argument("--database-url", default=settings.database_url)
+    parser.add_argument("--completions", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--members", type=int, default=2)
+    parser.add_argument(
+        "--frequency",
+        type=int,
+        default=None,
+        help="Sprint cap of the task; defaults to --completions so every call fits.",
+    )
+    parser.add_argument("--keep", action="store_true", help="Keep the fixture group.")
+    args = parser.parse_args()
+
+    await run_benchmark(
+        args.database_url,
+        completions=args.completions,
+        concurrency=args.concurrency,
+        members=args.members,
+        frequency=args.frequency if args.frequency is not None else args.completions,
+        keep=args.keep,
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
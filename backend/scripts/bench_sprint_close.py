@@ -0,0 +1,165 @@
+"""Benchmark sprint close as the group and its backlog of pending logs grow.
+
+For each ``--members`` value, creates a throwaway group with that many members,
+one task with ``--completed`` completed logs and ``--pending`` pending logs per
+member, then times ``SprintService.close_current_sprint`` and counts the SQL
+statements it issues. With set-based settlement the statement count is the
+same for every size. The fixture groups are deleted afterwards unless
+``--keep`` is passed. Point it at a disposable database.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from datetime import UTC, datetime
+from decimal import Decimal
+from typing import Any
+from uuid import uuid4
+
+from db.enums import TaskLogStatus, Weekday
+from db.models import Group, GroupMembership, GroupMemberWeight, Task, TaskLog, User
+from sqlalchemy import delete, event, insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from unitkeeper_backend.application.sprints.service import SprintService
+from unitkeeper_backend.config import settings
+from unitkeeper_backend.infrastructure.time import UtcClock
+from unitkeeper_backend.infrastructure.uow.sqlalchemy import SqlAlchemyUnitOfWork
+
+BENCH_USER_ID_BASE = 9_200_000_000
+
+
+async def create_fixture(
+    session_maker: async_sessionmaker[AsyncSession],
+    *,
+    first_user_id: int,
+    members: int,
+    completed: int,
+    pending: int,
+) -> int:
+    # A user can hold one active membership, so every size gets its own users.
+    user_ids = [first_user_id + index for index in range(members)]
+    async with session_maker() as session:
+        async with session.begin():
+            for user_id in user_ids:
+                if await session.get(User, user_id) is None:
+                    session.add(User(id=user_id, first_name=f"Bench {user_id}"))
+            group = Group(
+                name=f"bench-{uuid4().hex[:12]}",
+                join_secret="bench",
+                owner_user_id=user_ids[0],
+                sprint_start_weekday=Weekday.MONDAY,
+                sprint_duration_days=7,
+            )
+            session.add(group)
+            await session.flush()
+            weight = (Decimal("100") / members).quantize(Decimal("0.01"))
+            for user_id in user_ids:
+                membership = GroupMembership(group_id=group.id, user_id=user_id)
+                session.add(membership)
+                await session.flush()
+                session.add(GroupMemberWeight(membership_id=membership.id, weight_percent=weight))
+            task = Task(
+                group_id=group.id,
+                title="Bench task",
+                frequency_per_sprint=members * (completed + pending),
+                unit_cost=Decimal("1.00"),
+            )
+            session.add(task)
+            await session.flush()
+            now = datetime.now(UTC)
+            logs: list[dict[str, Any]] = [
+                {
+                    "group_id": group.id,
+                    "task_id": task.id,
+                    "performer_user_id": user_id,
+                    "status": status,
+                    "approver_user_id": user_id if status is TaskLogStatus.COMPLETED else None,
+                    "decided_at": now if status is TaskLogStatus.COMPLETED else None,
+                    "created_at": now,
+                }
+                for user_id in user_ids
+                for status in [TaskLogStatus.COMPLETED] * completed
+                + [TaskLogStatus.PENDING] * pending
+            ]
+            if logs:
+                await session.execute(insert(TaskLog), logs)
+            return group.id
+
+
+async def drop_fixture(session_maker: async_sessionmaker[AsyncSession], *, group_id: int) -> None:
+    async with session_maker() as session:
+        async with session.begin():
+            await session.execute(delete(TaskLog).where(TaskLog.group_id == group_id))
+            await session.execute(delete(Group).where(Group.id == group_id))
+
+
+async def run_benchmark(
+    database_url: str,
+    *,
+    member_counts: list[int],
+    completed: int,
+    pending: int,
+    keep: bool,
+) -> None:
+    engine = create_async_engine(database_url)
+    session_maker = async_sessionmaker(engine, expire_on_commit=False)
+    statements = 0
+
+    def count_statement(*_: object) -> None:
+        nonlocal statements
+        statements += 1
+
+    event.listen(engine.sync_engine, "before_cursor_execute", count_statement)
+    group_ids: list[int] = []
+    try:
+        print(f"{'members':>8} {'pending':>8} {'statements':>10} {'close ms':>9}")
+        for run, members in enumerate(member_counts):
+            group_id = await create_fixture(
+                session_maker,
+                first_user_id=BENCH_USER_ID_BASE + run * 100_000,
+                members=members,
+                completed=completed,
+                pending=pending,
+            )
+            group_ids.append(group_id)
+            async with session_maker() as session:
+                service = SprintService(uow=SqlAlchemyUnitOfWork(session), clock=UtcClock())
+                statements = 0
+                started = time.perf_counter()
+                await service.close_current_sprint(group_id=group_id)
+                elapsed = time.perf_counter() - started
+            print(f"{members:>8} {members * pending:>8} {statements:>10} {elapsed * 1000:>9.1f}")
+    finally:
+        if not keep:
+            for group_id in group_ids:
+                await drop_fixture(session_maker, group_id=group_id)
+        await engine.dispose()
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmark close_current_sprint against growing groups."
+    )
+    parser.add_argument("--database-url", default=settings.database_url)
+    parser.add_argument(
+        "--members", type=int, nargs="+", default=[2, 10, 50, 200], help="Group sizes to try."
+    )
+    parser.add_argument("--completed", type=int, default=5, help="Completed logs per member.")
+    parser.add_argument("--pending", type=int, default=20, help="Pending logs per member.")
+    parser.add_argument("--keep", action="store_true", help="Keep the fixture groups.")
+    args = parser.parse_args()
+
+    await run_benchmark(
+        args.database_url,
+        member_counts=args.members,
+        completed=args.completed,
+        pending=args.pending,
+        keep=args.keep,
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
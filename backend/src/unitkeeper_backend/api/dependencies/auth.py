@@ -6,18 +6,23 @@ from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
 from unitkeeper_backend.api.dependencies.injection import INJECTED
 from unitkeeper_backend.application.auth.service import AuthService
+from unitkeeper_backend.application.models import SessionClaims
 from unitkeeper_backend.domain.errors import AuthenticationError
 
 bearer_scheme = HTTPBearer(auto_error=False)
 
 
 @inject
-async def require_user_id(
+async def require_session_claims(
     credentials: HTTPAuthorizationCredentials | None = Depends(bearer_scheme),
     auth_service: FromDishka[AuthService] = INJECTED,
-) -> int:
+) -> SessionClaims:
     if credentials is None:
         raise AuthenticationError("Authorization header is required")
     if credentials.scheme.lower() != "bearer":
         raise AuthenticationError("Authorization scheme must be Bearer")
-    return auth_service.resolve_user_id(credentials.credentials)
+    return auth_service.resolve_claims(credentials.credentials)
+
+
+async def require_user_id(claims: SessionClaims = Depends(require_session_claims)) -> int:
+    return claims.user_id
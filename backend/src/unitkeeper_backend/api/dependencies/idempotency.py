@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+from dishka.integrations.fastapi import FromDishka, inject
+from fastapi import Depends, Header, Request, Response, status
+from fastapi.routing import APIRoute
+from pydantic import BaseModel
+
+from unitkeeper_backend.api.dependencies.auth import require_user_id
+from unitkeeper_backend.api.dependencies.injection import INJECTED
+from unitkeeper_backend.application.idempotency.service import IdempotencyService
+from unitkeeper_backend.application.models import IdempotencyKeyRef, StoredResponse
+
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+IDEMPOTENT_REPLAYED_HEADER = "Idempotent-Replayed"
+
+ResponseT = TypeVar("ResponseT", bound=BaseModel)
+
+
+class IdempotentRequest:
+    """Runs a route's use case at most once per ``Idempotency-Key`` and caller.
+
+    Without the header the use case simply runs. With it, a retry of a request
+    that already succeeded gets the stored response back after one lookup on
+    the ``(scope, actor_key, key)`` unique index, and the use case is not run
+    again.
+    """
+
+    def __init__(
+        self,
+        *,
+        service: IdempotencyService,
+        ref: IdempotencyKeyRef | None,
+        response: Response,
+        status_code: int,
+    ) -> None:
+        self._service = service
+        self._ref = ref
+        self._response = response
+        self._status_code = status_code
+
+    async def run(
+        self, operation: Callable[[], Awaitable[ResponseT]], *, response_type: type[ResponseT]
+    ) -> ResponseT:
+        if self._ref is None:
+            return await operation()
+        stored = await self._service.begin(self._ref)
+        if stored is not None:
+            self._response.status_code = stored.status_code
+            self._response.headers[IDEMPOTENT_REPLAYED_HEADER] = "true"
+            return response_type.model_validate(stored.payload)
+        # The mutation and its stored response commit together, so a crash
+        # in between leaves neither and the retry simply runs the use case.
+        async with self._service.single_commit():
+            result = await operation()
+            await self._service.complete(
+                self._ref,
+                StoredResponse(
+                    status_code=self._status_code, payload=result.model_dump(mode="json")
+                ),
+            )
+        return result
+
+
+@inject
+async def idempotent_request(
+    request: Request,
+    response: Response,
+    user_id: int = Depends(require_user_id),
+    idempotency_key: str | None = Header(
+        default=None, alias=IDEMPOTENCY_KEY_HEADER, min_length=1, max_length=255
+    ),
+    idempotency_service: FromDishka[IdempotencyService] = INJECTED,
+) -> IdempotentRequest:
+    route: APIRoute = request.scope["route"]
+    ref = None
+    if idempotency_key is not None:
+        # The key is scoped to the route template; the concrete path and body
+        # tell a genuine retry apart from a key reused for another request.
+        fingerprint = hashlib.sha256()
+        fingerprint.update(f"{request.method} {request.url.path}\n".encode())
+        fingerprint.update(await request.body())
+        ref = IdempotencyKeyRef(
+            scope=f"{request.method} {route.path}",
+            actor_key=str(user_id),
+            key=idempotency_key,
+            request_fingerprint=fingerprint.hexdigest(),
+        )
+    return IdempotentRequest(
+        service=idempotency_service,
+        ref=ref,
+        response=response,
+        status_code=route.status_code or status.HTTP_200_OK,
+    )
@@ -26,6 +26,19 @@ async def authenticate_telegram(
     )
 
 
+@router.post("/refresh", response_model=SessionResponse)
+async def refresh_session(
+    user_id: int = Depends(require_user_id),
+    auth_service: FromDishka[AuthService] = INJECTED,
+) -> SessionResponse:
+    session = await auth_service.refresh(user_id)
+    return SessionResponse(
+        access_token=session.access_token,
+        expires_at=session.expires_at,
+        context=CurrentContextResponse.model_validate(session.context, from_attributes=True),
+    )
+
+
 @router.get("/me", response_model=CurrentContextResponse)
 async def get_me(
     user_id: int = Depends(require_user_id),
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+from datetime import datetime
+
 from dishka.integrations.fastapi import DishkaRoute, FromDishka
 from fastapi import APIRouter, Depends, Query, status
 
 from unitkeeper_backend.api.dependencies.auth import require_user_id
+from unitkeeper_backend.api.dependencies.idempotency import IdempotentRequest, idempotent_request
 from unitkeeper_backend.api.dependencies.injection import INJECTED
 from unitkeeper_backend.api.schemas.balances import (
+    BalanceAsOfResponse,
     BalanceResponse,
     BalanceTransactionPageResponse,
     BalanceTransactionResponse,
@@ -29,6 +33,16 @@ async def get_my_balance(
     return BalanceResponse.model_validate(balance, from_attributes=True)
 
 
+@router.get("/me/as-of", response_model=BalanceAsOfResponse)
+async def get_my_balance_as_of(
+    at: datetime = Query(),
+    user_id: int = Depends(require_user_id),
+    balance_service: FromDishka[BalanceService] = INJECTED,
+) -> BalanceAsOfResponse:
+    balance = await balance_service.get_my_balance_as_of(user_id=user_id, at=at)
+    return BalanceAsOfResponse.model_validate(balance, from_attributes=True)
+
+
 @router.get("/transfer-candidates", response_model=TransferCandidatesResponse)
 async def list_transfer_candidates(
     user_id: int = Depends(require_user_id),
@@ -52,14 +66,18 @@ async def list_transfer_candidates(
 async def create_transfer(
     request: CreateTransferRequest,
     user_id: int = Depends(require_user_id),
+    idempotency: IdempotentRequest = Depends(idempotent_request),
     balance_service: FromDishka[BalanceService] = INJECTED,
 ) -> BalanceTransferResponse:
-    transfer = await balance_service.transfer(
-        sender_user_id=user_id,
-        recipient_user_id=request.recipient_user_id,
-        amount=request.amount,
-    )
-    return BalanceTransferResponse.model_validate(transfer, from_attributes=True)
+    async def transfer() -> BalanceTransferResponse:
+        info = await balance_service.transfer(
+            sender_user_id=user_id,
+            recipient_user_id=request.recipient_user_id,
+            amount=request.amount,
+        )
+        return BalanceTransferResponse.model_validate(info, from_attributes=True)
+
+    return await idempotency.run(transfer, response_type=BalanceTransferResponse)
 
 
 @router.get("/transactions", response_model=BalanceTransactionPageResponse)
@@ -1,10 +1,22 @@
 from __future__ import annotations
 
+from dishka.integrations.fastapi import DishkaRoute, FromDishka
 from fastapi import APIRouter
 
-router = APIRouter(tags=["health"])
+from unitkeeper_backend.api.dependencies.injection import INJECTED
+from unitkeeper_backend.api.schemas.common import ContextCacheStatsResponse
+from unitkeeper_backend.application.context.cache import CurrentContextCache
+
+router = APIRouter(tags=["health"], route_class=DishkaRoute)
 
 
 @router.get("/health")
 async def healthcheck() -> dict[str, str]:
     return {"status": "ok"}
+
+
+@router.get("/health/context-cache", response_model=ContextCacheStatsResponse)
+async def context_cache_stats(
+    cache: FromDishka[CurrentContextCache] = INJECTED,
+) -> ContextCacheStatsResponse:
+    return ContextCacheStatsResponse.model_validate(cache.stats(), from_attributes=True)
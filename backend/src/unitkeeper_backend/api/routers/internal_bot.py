@@ -9,9 +9,12 @@ from unitkeeper_backend.api.dependencies.injection import INJECTED
 from unitkeeper_backend.api.dependencies.internal import require_internal_auth
 from unitkeeper_backend.api.schemas.bot import (
     BotApproveRequest,
+    BotNotificationClaimRequest,
     BotNotificationEventResponse,
     BotNotificationFailRequest,
     BotNotificationOutboxResponse,
+    BotNotificationResultsRequest,
+    BotNotificationResultsResponse,
     BotRejectRequest,
     EnsureUserRequest,
 )
@@ -21,7 +24,11 @@ from unitkeeper_backend.api.schemas.common import (
     UserResponse,
 )
 from unitkeeper_backend.application.bot.service import BotService
-from unitkeeper_backend.application.models import TelegramIdentity
+from unitkeeper_backend.application.models import (
+    NotificationFailureReport,
+    NotificationOutboxEventInfo,
+    TelegramIdentity,
+)
 from unitkeeper_backend.application.notifications.service import NotificationOutboxService
 
 router = APIRouter(
@@ -89,20 +96,44 @@ async def list_notification_outbox(
 ) -> BotNotificationOutboxResponse:
     events = await outbox_service.list_ready(limit=min(max(limit, 1), 100))
     return BotNotificationOutboxResponse(
-        items=[
-            BotNotificationEventResponse(
-                id=event.id,
-                event_type=event.event_type.value,
-                recipient_user_id=event.recipient_user_id,
-                group_id=event.group_id,
-                payload=event.payload,
-                deep_link_path=event.deep_link_path,
-                correlation_id=event.correlation_id,
-                attempt_count=event.attempt_count,
+        items=[_notification_event_response(event) for event in events]
+    )
+
+
+@router.post("/notifications/claim", response_model=BotNotificationOutboxResponse)
+async def claim_notification_outbox(
+    request: BotNotificationClaimRequest,
+    outbox_service: FromDishka[NotificationOutboxService] = INJECTED,
+) -> BotNotificationOutboxResponse:
+    events = await outbox_service.claim_ready(
+        worker_id=request.worker_id,
+        limit=request.limit,
+        lease_seconds=request.lease_seconds,
+        wait_seconds=request.wait_seconds,
+    )
+    return BotNotificationOutboxResponse(
+        items=[_notification_event_response(event) for event in events]
+    )
+
+
+@router.post("/notifications/results", response_model=BotNotificationResultsResponse)
+async def record_notification_results(
+    request: BotNotificationResultsRequest,
+    outbox_service: FromDishka[NotificationOutboxService] = INJECTED,
+) -> BotNotificationResultsResponse:
+    results = await outbox_service.record_results(
+        acknowledged=request.acknowledged,
+        failed=[
+            NotificationFailureReport(
+                event_id=item.event_id,
+                error_message=item.error_message,
+                retry_after_seconds=item.retry_after_seconds,
+                terminal=item.terminal,
             )
-            for event in events
-        ]
+            for item in request.failed
+        ],
     )
+    return BotNotificationResultsResponse.model_validate(results, from_attributes=True)
 
 
 @router.post("/notifications/{event_id}/ack", response_model=BotNotificationEventResponse)
@@ -111,16 +142,7 @@ async def acknowledge_notification(
     outbox_service: FromDishka[NotificationOutboxService] = INJECTED,
 ) -> BotNotificationEventResponse:
     event = await outbox_service.acknowledge(event_id=event_id)
-    return BotNotificationEventResponse(
-        id=event.id,
-        event_type=event.event_type.value,
-        recipient_user_id=event.recipient_user_id,
-        group_id=event.group_id,
-        payload=event.payload,
-        deep_link_path=event.deep_link_path,
-        correlation_id=event.correlation_id,
-        attempt_count=event.attempt_count,
-    )
+    return _notification_event_response(event)
 
 
 @router.post("/notifications/{event_id}/fail", response_model=BotNotificationEventResponse)
@@ -135,6 +157,12 @@ async def fail_notification(
         retry_after_seconds=request.retry_after_seconds,
         terminal=request.terminal,
     )
+    return _notification_event_response(event)
+
+
+def _notification_event_response(
+    event: NotificationOutboxEventInfo,
+) -> BotNotificationEventResponse:
     return BotNotificationEventResponse(
         id=event.id,
         event_type=event.event_type.value,
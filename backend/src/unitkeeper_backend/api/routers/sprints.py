@@ -1,16 +1,25 @@
 from __future__ import annotations
 
 from dishka.integrations.fastapi import DishkaRoute, FromDishka
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Response
 
 from unitkeeper_backend.api.dependencies.auth import require_user_id
 from unitkeeper_backend.api.dependencies.injection import INJECTED
 from unitkeeper_backend.api.routers.tasks import require_group_id
-from unitkeeper_backend.api.schemas.common import SprintRunResponse, TempResultsResponse
+from unitkeeper_backend.api.schemas.common import (
+    SprintRunPageResponse,
+    SprintRunResponse,
+    SprintRunSummaryResponse,
+    TempResultsResponse,
+)
 from unitkeeper_backend.application.sprints.service import SprintService
 
 router = APIRouter(prefix="/sprints", tags=["sprints"], route_class=DishkaRoute)
 
+# A closed sprint's snapshot never changes, and neither does a history page
+# reached through a cursor: newer sprints only ever land on the first page.
+_IMMUTABLE_CACHE_CONTROL = "private, max-age=31536000, immutable"
+
 
 @router.get("/current/results", response_model=TempResultsResponse)
 async def get_temp_results(
@@ -29,3 +38,44 @@ async def close_current_sprint(
 ) -> SprintRunResponse:
     sprint_run = await sprint_service.close_current_sprint(group_id=group_id)
     return SprintRunResponse.model_validate(sprint_run, from_attributes=True)
+
+
+@router.get("/history", response_model=SprintRunPageResponse)
+async def list_sprint_history(
+    response: Response,
+    group_id: int = Depends(require_group_id),
+    limit: int = Query(default=20, ge=1, le=100),
+    cursor: str | None = Query(default=None, max_length=128),
+    sprint_service: FromDishka[SprintService] = INJECTED,
+) -> SprintRunPageResponse:
+    page = await sprint_service.list_sprint_history(group_id=group_id, limit=limit, cursor=cursor)
+    _set_cache_headers(response, immutable=cursor is not None)
+    return SprintRunPageResponse(
+        items=[
+            SprintRunSummaryResponse.model_validate(item, from_attributes=True)
+            for item in page.items
+        ],
+        limit=page.limit,
+        has_more=page.has_more,
+        next_cursor=page.next_cursor,
+    )
+
+
+@router.get("/history/{sprint_run_id}", response_model=SprintRunResponse)
+async def get_sprint_history(
+    sprint_run_id: int,
+    response: Response,
+    group_id: int = Depends(require_group_id),
+    sprint_service: FromDishka[SprintService] = INJECTED,
+) -> SprintRunResponse:
+    sprint_run = await sprint_service.get_sprint_history(
+        group_id=group_id, sprint_run_id=sprint_run_id
+    )
+    _set_cache_headers(response, immutable=True)
+    return SprintRunResponse.model_validate(sprint_run, from_attributes=True)
+
+
+def _set_cache_headers(response: Response, *, immutable: bool) -> None:
+    response.headers["Cache-Control"] = _IMMUTABLE_CACHE_CONTROL if immutable else "no-cache"
+    # Tokens carry the caller's group, so a cached page is never served across groups.
+    response.headers["Vary"] = "Authorization"
@@ -4,15 +4,22 @@ from db.enums import TaskLogStatus
 from dishka.integrations.fastapi import DishkaRoute, FromDishka, inject
 from fastapi import APIRouter, Depends, Query, status
 
-from unitkeeper_backend.api.dependencies.auth import require_user_id
+from unitkeeper_backend.api.dependencies.auth import require_session_claims, require_user_id
+from unitkeeper_backend.api.dependencies.idempotency import IdempotentRequest, idempotent_request
 from unitkeeper_backend.api.dependencies.injection import INJECTED
 from unitkeeper_backend.api.schemas.common import (
+    ErrorResponse,
+    TaskLogBatchItemResponse,
+    TaskLogBatchResponse,
     TaskLogPageResponse,
     TaskLogResponse,
     TaskLogViewResponse,
     TaskResponse,
 )
 from unitkeeper_backend.api.schemas.tasks import (
+    BatchApproveTaskLogsRequest,
+    BatchMarkTasksDoneRequest,
+    BatchRejectTaskLogsRequest,
     BulkImportTasksRequest,
     CreateTaskRequest,
     FrequencyAdjustmentRequest,
@@ -20,22 +27,23 @@ from unitkeeper_backend.api.schemas.tasks import (
     UpdateTaskRequest,
 )
 from unitkeeper_backend.application.context.service import CurrentContextService
-from unitkeeper_backend.application.models import TaskLogPage
-from unitkeeper_backend.application.tasks.service import TaskImportItem, TaskService
-from unitkeeper_backend.domain.errors import NotFoundError
+from unitkeeper_backend.application.models import (
+    SessionClaims,
+    TaskImportItem,
+    TaskLogBatchItem,
+    TaskLogPage,
+)
+from unitkeeper_backend.application.tasks.service import TaskService
 
 router = APIRouter(tags=["tasks"], route_class=DishkaRoute)
 
 
 @inject
 async def require_group_id(
-    user_id: int = Depends(require_user_id),
+    claims: SessionClaims = Depends(require_session_claims),
     context_service: FromDishka[CurrentContextService] = INJECTED,
 ) -> int:
-    context = await context_service.resolve(user_id)
-    if context.group is None:
-        raise NotFoundError("User has no active group")
-    return context.group.id
+    return await context_service.resolve_group_id(claims)
 
 
 @router.get("/tasks", response_model=list[TaskResponse])
@@ -82,6 +90,23 @@ async def import_tasks(
     return [TaskResponse.model_validate(task, from_attributes=True) for task in created]
 
 
+@router.post("/tasks/done", response_model=TaskLogBatchResponse)
+async def mark_tasks_done(
+    request: BatchMarkTasksDoneRequest,
+    user_id: int = Depends(require_user_id),
+    group_id: int = Depends(require_group_id),
+    idempotency: IdempotentRequest = Depends(idempotent_request),
+    task_service: FromDishka[TaskService] = INJECTED,
+) -> TaskLogBatchResponse:
+    async def mark_done() -> TaskLogBatchResponse:
+        items = await task_service.mark_done_many(
+            group_id=group_id, performer_user_id=user_id, task_ids=request.task_ids
+        )
+        return _task_log_batch_response(items)
+
+    return await idempotency.run(mark_done, response_type=TaskLogBatchResponse)
+
+
 @router.get("/tasks/{task_id}", response_model=TaskResponse)
 async def get_task(
     task_id: int,
@@ -147,12 +172,16 @@ async def mark_task_done(
     task_id: int,
     user_id: int = Depends(require_user_id),
     group_id: int = Depends(require_group_id),
+    idempotency: IdempotentRequest = Depends(idempotent_request),
     task_service: FromDishka[TaskService] = INJECTED,
 ) -> TaskLogResponse:
-    log = await task_service.mark_done(
-        group_id=group_id, performer_user_id=user_id, task_id=task_id
-    )
-    return TaskLogResponse.model_validate(log, from_attributes=True)
+    async def mark_done() -> TaskLogResponse:
+        log = await task_service.mark_done(
+            group_id=group_id, performer_user_id=user_id, task_id=task_id
+        )
+        return TaskLogResponse.model_validate(log, from_attributes=True)
+
+    return await idempotency.run(mark_done, response_type=TaskLogResponse)
 
 
 @router.get("/task-logs/pending-approval", response_model=TaskLogPageResponse)
@@ -161,10 +190,17 @@ async def list_pending_approvals(
     group_id: int = Depends(require_group_id),
     limit: int = Query(default=50, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
+    cursor: str | None = Query(default=None, max_length=128),
+    include_total: bool | None = Query(default=None),
     task_service: FromDishka[TaskService] = INJECTED,
 ) -> TaskLogPageResponse:
     page = await task_service.list_pending_approvals(
-        group_id=group_id, user_id=user_id, limit=limit, offset=offset
+        group_id=group_id,
+        user_id=user_id,
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        include_total=include_total,
     )
     return _task_log_page_response(page)
 
@@ -177,6 +213,8 @@ async def list_my_task_logs(
     statuses: list[TaskLogStatus] | None = Query(default=None),
     limit: int = Query(default=50, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
+    cursor: str | None = Query(default=None, max_length=128),
+    include_total: bool | None = Query(default=None),
     task_service: FromDishka[TaskService] = INJECTED,
 ) -> TaskLogPageResponse:
     page = await task_service.list_my_task_logs(
@@ -186,6 +224,8 @@ async def list_my_task_logs(
         statuses=statuses,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+        include_total=include_total,
     )
     return _task_log_page_response(page)
 
@@ -199,6 +239,8 @@ async def list_group_task_logs(
     statuses: list[TaskLogStatus] | None = Query(default=None),
     limit: int = Query(default=50, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
+    cursor: str | None = Query(default=None, max_length=128),
+    include_total: bool | None = Query(default=None),
     task_service: FromDishka[TaskService] = INJECTED,
 ) -> TaskLogPageResponse:
     page = await task_service.list_group_task_logs(
@@ -209,10 +251,49 @@ async def list_group_task_logs(
         statuses=statuses,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+        include_total=include_total,
     )
     return _task_log_page_response(page)
 
 
+@router.post("/task-logs/approve", response_model=TaskLogBatchResponse)
+async def approve_task_logs(
+    request: BatchApproveTaskLogsRequest,
+    user_id: int = Depends(require_user_id),
+    group_id: int = Depends(require_group_id),
+    idempotency: IdempotentRequest = Depends(idempotent_request),
+    task_service: FromDishka[TaskService] = INJECTED,
+) -> TaskLogBatchResponse:
+    async def approve() -> TaskLogBatchResponse:
+        items = await task_service.approve_many(
+            group_id=group_id, approver_user_id=user_id, log_ids=request.log_ids
+        )
+        return _task_log_batch_response(items)
+
+    return await idempotency.run(approve, response_type=TaskLogBatchResponse)
+
+
+@router.post("/task-logs/reject", response_model=TaskLogBatchResponse)
+async def reject_task_logs(
+    request: BatchRejectTaskLogsRequest,
+    user_id: int = Depends(require_user_id),
+    group_id: int = Depends(require_group_id),
+    idempotency: IdempotentRequest = Depends(idempotent_request),
+    task_service: FromDishka[TaskService] = INJECTED,
+) -> TaskLogBatchResponse:
+    async def reject() -> TaskLogBatchResponse:
+        items = await task_service.reject_many(
+            group_id=group_id,
+            approver_user_id=user_id,
+            log_ids=request.log_ids,
+            rejection_reason=request.reason,
+        )
+        return _task_log_batch_response(items)
+
+    return await idempotency.run(reject, response_type=TaskLogBatchResponse)
+
+
 @router.get("/task-logs/{log_id}", response_model=TaskLogViewResponse)
 async def get_task_log(
     log_id: int,
@@ -229,10 +310,14 @@ async def approve_task_log(
     log_id: int,
     user_id: int = Depends(require_user_id),
     group_id: int = Depends(require_group_id),
+    idempotency: IdempotentRequest = Depends(idempotent_request),
     task_service: FromDishka[TaskService] = INJECTED,
 ) -> TaskLogResponse:
-    log = await task_service.approve(group_id=group_id, approver_user_id=user_id, log_id=log_id)
-    return TaskLogResponse.model_validate(log, from_attributes=True)
+    async def approve() -> TaskLogResponse:
+        log = await task_service.approve(group_id=group_id, approver_user_id=user_id, log_id=log_id)
+        return TaskLogResponse.model_validate(log, from_attributes=True)
+
+    return await idempotency.run(approve, response_type=TaskLogResponse)
 
 
 @router.post("/task-logs/{log_id}/reject", response_model=TaskLogResponse)
@@ -241,15 +326,19 @@ async def reject_task_log(
     request: RejectTaskLogRequest,
     user_id: int = Depends(require_user_id),
     group_id: int = Depends(require_group_id),
+    idempotency: IdempotentRequest = Depends(idempotent_request),
     task_service: FromDishka[TaskService] = INJECTED,
 ) -> TaskLogResponse:
-    log = await task_service.reject(
-        group_id=group_id,
-        approver_user_id=user_id,
-        log_id=log_id,
-        rejection_reason=request.reason,
-    )
-    return TaskLogResponse.model_validate(log, from_attributes=True)
+    async def reject() -> TaskLogResponse:
+        log = await task_service.reject(
+            group_id=group_id,
+            approver_user_id=user_id,
+            log_id=log_id,
+            rejection_reason=request.reason,
+        )
+        return TaskLogResponse.model_validate(log, from_attributes=True)
+
+    return await idempotency.run(reject, response_type=TaskLogResponse)
 
 
 @router.delete("/task-logs/{log_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -269,4 +358,26 @@ def _task_log_page_response(page: TaskLogPage) -> TaskLogPageResponse:
         limit=page.limit,
         offset=page.offset,
         has_more=page.has_more,
+        next_cursor=page.next_cursor,
+    )
+
+
+def _task_log_batch_response(items: list[TaskLogBatchItem]) -> TaskLogBatchResponse:
+    return TaskLogBatchResponse(
+        items=[
+            TaskLogBatchItemResponse(
+                id=item.id,
+                log=(
+                    TaskLogResponse.model_validate(item.log, from_attributes=True)
+                    if item.log is not None
+                    else None
+                ),
+                error=(
+                    ErrorResponse(code=item.error_code, message=item.error_message or "")
+                    if item.error_code is not None
+                    else None
+                ),
+            )
+            for item in items
+        ]
     )
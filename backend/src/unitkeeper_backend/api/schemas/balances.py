@@ -19,6 +19,14 @@ class BalanceResponse(BaseModel):
     current_balance: Decimal
 
 
+class BalanceAsOfResponse(BaseModel):
+    group_id: int
+    user_id: int
+    as_of: datetime
+    balance: Decimal
+    checkpoint_at: datetime | None
+
+
 class TransferCandidateResponse(BaseModel):
     user: UserResponse
     current_balance: Decimal
@@ -23,12 +23,33 @@ class BotRejectRequest(BaseModel):
     reason: str = Field(min_length=1)
 
 
+class BotNotificationClaimRequest(BaseModel):
+    worker_id: str = Field(min_length=1, max_length=128)
+    limit: int = Field(default=50, ge=1, le=100)
+    lease_seconds: int = Field(default=120, ge=10, le=3600)
+    wait_seconds: float = Field(default=0, ge=0, le=30)
+
+
 class BotNotificationFailRequest(BaseModel):
     error_message: str = Field(min_length=1, max_length=4000)
     retry_after_seconds: int | None = Field(default=None, ge=0, le=86400)
     terminal: bool = False
 
 
+class BotNotificationFailureItem(BotNotificationFailRequest):
+    event_id: UUID
+
+
+class BotNotificationResultsRequest(BaseModel):
+    acknowledged: list[UUID] = Field(default_factory=list, max_length=1000)
+    failed: list[BotNotificationFailureItem] = Field(default_factory=list, max_length=1000)
+
+
+class BotNotificationResultsResponse(BaseModel):
+    acknowledged_count: int
+    failed_count: int
+
+
 class BotNotificationEventResponse(BaseModel):
     id: UUID
     event_type: str
@@ -84,6 +84,16 @@ class TaskLogResponse(BaseModel):
     created_at: datetime
 
 
+class TaskLogBatchItemResponse(BaseModel):
+    id: int
+    log: TaskLogResponse | None
+    error: ErrorResponse | None
+
+
+class TaskLogBatchResponse(BaseModel):
+    items: list[TaskLogBatchItemResponse]
+
+
 class TaskLogTaskResponse(BaseModel):
     id: int
     title: str
@@ -130,10 +140,11 @@ class TaskLogViewResponse(BaseModel):
 
 class TaskLogPageResponse(BaseModel):
     items: list[TaskLogViewResponse]
-    total: int
+    total: int | None
     limit: int
     offset: int
     has_more: bool
+    next_cursor: str | None = None
 
 
 class CompletedTaskBreakdownResponse(BaseModel):
@@ -172,7 +183,7 @@ class SprintMemberResultResponse(BaseModel):
     balance_after: Decimal
 
 
-class SprintRunResponse(BaseModel):
+class SprintRunSummaryResponse(BaseModel):
     id: int
     group_id: int
     period_start: date
@@ -183,4 +194,24 @@ class SprintRunResponse(BaseModel):
     bonus_units: Decimal
     balance_delta: Decimal
     closed_at: datetime | None
+
+
+class SprintRunResponse(SprintRunSummaryResponse):
     member_results: list[SprintMemberResultResponse]
+
+
+class SprintRunPageResponse(BaseModel):
+    items: list[SprintRunSummaryResponse]
+    limit: int
+    has_more: bool
+    next_cursor: str | None = None
+
+
+class ContextCacheStatsResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    size: int
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
@@ -44,6 +44,8 @@ class MemberCardResponse(BaseModel):
     weight_percent: Decimal
     balance: Decimal
     is_owner: bool
+    sprint_completed_units: Decimal
+    sprint_pending_units: Decimal
 
 
 class GroupCardResponse(BaseModel):
@@ -21,6 +21,19 @@ class RejectTaskLogRequest(BaseModel):
     reason: str = Field(min_length=1)
 
 
+class BatchApproveTaskLogsRequest(BaseModel):
+    log_ids: list[int] = Field(min_length=1, max_length=100)
+
+
+class BatchRejectTaskLogsRequest(BaseModel):
+    log_ids: list[int] = Field(min_length=1, max_length=100)
+    reason: str = Field(min_length=1)
+
+
+class BatchMarkTasksDoneRequest(BaseModel):
+    task_ids: list[int] = Field(min_length=1, max_length=100)
+
+
 class BulkImportTaskItem(BaseModel):
     title: str = Field(min_length=1, max_length=255)
     frequency_per_sprint: int = Field(ge=0)
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from unitkeeper_backend.application.context.service import CurrentContextService
-from unitkeeper_backend.application.models import SessionInfo
+from unitkeeper_backend.application.models import SessionClaims, SessionInfo
 from unitkeeper_backend.application.ports import (
     Clock,
     SessionTokenManager,
@@ -30,10 +30,29 @@ class AuthService:
         identity = self._verifier.verify(init_data)
         user = await self._uow.users.upsert_from_telegram(identity)
         await self._uow.commit()
-        issued_at = self._clock.now()
-        token, expires_at = self._token_manager.issue(user_id=user.id, issued_at=issued_at)
-        context = await self._context_service.resolve(user.id)
-        return SessionInfo(access_token=token, expires_at=expires_at, context=context)
+        return await self._issue_session(user.id)
+
+    async def refresh(self, user_id: int) -> SessionInfo:
+        return await self._issue_session(user_id)
 
     def resolve_user_id(self, token: str) -> int:
+        return self._token_manager.verify(token).user_id
+
+    def resolve_claims(self, token: str) -> SessionClaims:
         return self._token_manager.verify(token)
+
+    async def _issue_session(self, user_id: int) -> SessionInfo:
+        # The epoch is read before the context: a membership change in between
+        # leaves the token with a stale epoch, which only costs a fallback.
+        epoch = await self._uow.groups.get_membership_epoch(user_id)
+        context = await self._context_service.refresh(user_id)
+        claims = SessionClaims(user_id=user_id)
+        if context.membership is not None:
+            claims = SessionClaims(
+                user_id=user_id,
+                group_id=context.membership.group_id,
+                membership_id=context.membership.id,
+                membership_epoch=epoch,
+            )
+        token, expires_at = self._token_manager.issue(claims=claims, issued_at=self._clock.now())
+        return SessionInfo(access_token=token, expires_at=expires_at, context=context)
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+from datetime import datetime
 from decimal import Decimal
 from uuid import uuid4
 
 from db.enums import BalanceTransactionType
 
 from unitkeeper_backend.application.models import (
+    BalanceAsOfInfo,
     BalanceInfo,
     BalanceTransactionPage,
     BalanceTransferInfo,
@@ -24,6 +26,34 @@ class BalanceService:
         balance = await self._uow.groups.get_balance(group_id=group_id, user_id=user_id)
         return BalanceInfo(group_id=group_id, user_id=user_id, current_balance=balance)
 
+    async def get_my_balance_as_of(self, *, user_id: int, at: datetime) -> BalanceAsOfInfo:
+        """Return the caller's balance at ``at`` from the nearest earlier checkpoint.
+
+        Only ledger rows between that checkpoint (written at every sprint
+        close) and ``at`` are summed, so the cost follows the distance from the
+        last close rather than the age of the ledger.
+        """
+        if at.tzinfo is None:
+            raise ValidationError("Point in time must include a timezone")
+        group_id = await self._require_active_group(user_id=user_id)
+        checkpoint = await self._uow.ledger.get_latest_balance_checkpoint(
+            group_id=group_id, user_id=user_id, at=at
+        )
+        delta = await self._uow.ledger.sum_user_ledger_between(
+            group_id=group_id,
+            user_id=user_id,
+            after=checkpoint.taken_at if checkpoint is not None else None,
+            through=at,
+        )
+        start = checkpoint.balance if checkpoint is not None else Decimal("0.00")
+        return BalanceAsOfInfo(
+            group_id=group_id,
+            user_id=user_id,
+            as_of=at,
+            balance=start + delta,
+            checkpoint_at=checkpoint.taken_at if checkpoint is not None else None,
+        )
+
     async def list_transfer_candidates(self, *, user_id: int) -> list[TransferCandidateInfo]:
         group_id = await self._require_active_group(user_id=user_id)
         memberships = await self._uow.groups.list_active_memberships(group_id)
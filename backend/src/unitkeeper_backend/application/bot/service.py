@@ -31,6 +31,7 @@ class BotService:
     async def ensure_user(self, identity: TelegramIdentity) -> UserProfile:
         user = await self._uow.users.upsert_from_telegram(identity)
         await self._uow.commit()
+        self._context_service.invalidate_users([user.id])
         _audit.info(
             "bot.ensure_user",
             extra={"telegram_user_id": identity.user_id, "result": "ok"},
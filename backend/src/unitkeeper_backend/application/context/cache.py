@@ -0,0 +1,117 @@
+"""Process-local cache of resolved current contexts."""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+
+from unitkeeper_backend.application.models import CurrentContext
+
+
+@dataclass(slots=True, frozen=True)
+class ContextCacheStats:
+    size: int
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+
+
+class CurrentContextCache:
+    """Bounded TTL/LRU cache of ``CurrentContext`` keyed by user id.
+
+    The cache lives for the whole process, so writers that change what a
+    context contains must invalidate it after their commit. Other processes
+    (the scheduler, additional API workers) do not see those invalidations;
+    for them the TTL is the upper bound on staleness.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int,
+        ttl_seconds: float,
+        monotonic: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._monotonic = monotonic
+        self._entries: OrderedDict[int, tuple[float, CurrentContext]] = OrderedDict()
+        self._users_by_group: dict[int, set[int]] = {}
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._max_entries > 0 and self._ttl_seconds > 0
+
+    @property
+    def generation(self) -> int:
+        """Counter bumped by every invalidation.
+
+        Readers capture it before loading a context and pass it back to
+        ``put`` so a load that raced with a write is never stored.
+        """
+        return self._generation
+
+    def get(self, user_id: int) -> CurrentContext | None:
+        entry = self._entries.get(user_id)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, context = entry
+        if expires_at <= self._monotonic():
+            self._discard(user_id)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(user_id)
+        self.hits += 1
+        return context
+
+    def put(self, user_id: int, context: CurrentContext, *, generation: int) -> None:
+        if not self.enabled or generation != self._generation:
+            return
+        self._discard(user_id)
+        self._entries[user_id] = (self._monotonic() + self._ttl_seconds, context)
+        if context.group is not None:
+            self._users_by_group.setdefault(context.group.id, set()).add(user_id)
+        while len(self._entries) > self._max_entries:
+            oldest_user_id = next(iter(self._entries))
+            self._discard(oldest_user_id)
+            self.evictions += 1
+
+    def invalidate_users(self, user_ids: Iterable[int]) -> None:
+        self._generation += 1
+        for user_id in user_ids:
+            if self._discard(user_id):
+                self.invalidations += 1
+
+    def invalidate_group(self, group_id: int) -> None:
+        self.invalidate_users(list(self._users_by_group.get(group_id, ())))
+
+    def stats(self) -> ContextCacheStats:
+        return ContextCacheStats(
+            size=len(self._entries),
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            invalidations=self.invalidations,
+        )
+
+    def _discard(self, user_id: int) -> bool:
+        entry = self._entries.pop(user_id, None)
+        if entry is None:
+            return False
+        group = entry[1].group
+        if group is not None:
+            members = self._users_by_group.get(group.id)
+            if members is not None:
+                members.discard(user_id)
+                if not members:
+                    del self._users_by_group[group.id]
+        return True
@@ -1,15 +1,68 @@
+"""Current user/group context services."""
+
 from __future__ import annotations
 
-from unitkeeper_backend.application.models import CurrentContext
+from collections.abc import Iterable
+
+from unitkeeper_backend.application.context.cache import CurrentContextCache
+from unitkeeper_backend.application.models import CurrentContext, SessionClaims
 from unitkeeper_backend.application.ports import UnitOfWork
-from unitkeeper_backend.domain.errors import AuthenticationError
+from unitkeeper_backend.domain.errors import AuthenticationError, NotFoundError
 
 
 class CurrentContextService:
-    def __init__(self, *, uow: UnitOfWork) -> None:
+    def __init__(self, *, uow: UnitOfWork, cache: CurrentContextCache | None = None) -> None:
         self._uow = uow
+        self._cache = cache
 
     async def resolve(self, user_id: int) -> CurrentContext:
+        cached = self._cache.get(user_id) if self._cache is not None else None
+        if cached is not None:
+            return cached
+        return await self._load_and_store(user_id)
+
+    async def refresh(self, user_id: int) -> CurrentContext:
+        """Resolve from the database, bypassing and then repopulating the cache."""
+        self.invalidate_users([user_id])
+        return await self._load_and_store(user_id)
+
+    async def resolve_group_id(self, claims: SessionClaims) -> int:
+        """Return the caller's active group id, trusting token claims when possible.
+
+        Group claims are only trusted while the signed membership epoch still
+        matches the user's row; any join or leave since issue falls back to a
+        full context load.
+        """
+        context = self._cache.get(claims.user_id) if self._cache is not None else None
+        if context is None:
+            if claims.group_id is not None and claims.membership_epoch is not None:
+                epoch = await self._uow.groups.get_membership_epoch(claims.user_id)
+                if epoch == claims.membership_epoch:
+                    return claims.group_id
+            context = await self._load_and_store(claims.user_id)
+        if context.group is None:
+            raise NotFoundError("User has no active group")
+        return context.group.id
+
+    def invalidate_users(self, user_ids: Iterable[int]) -> None:
+        """Drop cached contexts of users whose profile or membership changed."""
+        if self._cache is not None:
+            self._cache.invalidate_users(user_ids)
+
+    def invalidate_group(self, group_id: int) -> None:
+        """Drop every cached context that embeds the given group."""
+        if self._cache is not None:
+            self._cache.invalidate_group(group_id)
+
+    async def _load_and_store(self, user_id: int) -> CurrentContext:
+        if self._cache is None:
+            return await self._load(user_id)
+        generation = self._cache.generation
+        context = await self._load(user_id)
+        self._cache.put(user_id, context, generation=generation)
+        return context
+
+    async def _load(self, user_id: int) -> CurrentContext:
         user = await self._uow.users.get_by_id(user_id)
         if user is None:
             raise AuthenticationError("Authenticated user is not registered")
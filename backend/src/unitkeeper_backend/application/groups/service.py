@@ -12,6 +12,7 @@ from unitkeeper_backend.application.models import (
     GroupInfo,
     MemberCardInfo,
     MembershipInfo,
+    NotificationOutboxEventDraft,
 )
 from unitkeeper_backend.application.ports import Clock, UnitOfWork
 from unitkeeper_backend.domain.errors import (
@@ -60,6 +61,13 @@ class GroupService:
         if existing is not None:
             raise ConflictError("Group name is already taken")
 
+        today = self._clock.today()
+        window = current_sprint_window(
+            today=today,
+            start_weekday=sprint_start_weekday,
+            duration_days=sprint_duration_days,
+            anchor=today,
+        )
         group = await self._uow.groups.create_group(
             name=name,
             join_secret=join_secret,
@@ -67,7 +75,8 @@ class GroupService:
             sprint_start_weekday=sprint_start_weekday,
             sprint_duration_days=sprint_duration_days,
             timezone=timezone,
-            created_at=self._clock.today(),
+            created_at=today,
+            sprint_period_end=window.period_end,
         )
         await self._uow.groups.create_membership(group_id=group.id, user_id=user_id)
         await self._uow.groups.replace_weights(
@@ -75,6 +84,7 @@ class GroupService:
         )
         await self._uow.groups.ensure_balance(group_id=group.id, user_id=user_id)
         await self._uow.commit()
+        self._context_service.invalidate_users([user_id])
         return await self._context_service.resolve(user_id)
 
     async def join_group(
@@ -92,21 +102,26 @@ class GroupService:
         await self._uow.groups.ensure_balance(group_id=group.id, user_id=user_id)
         await self._rebalance_group(group.id)
         memberships = await self._uow.groups.list_active_memberships(group.id)
-        for membership in memberships:
-            if membership.user_id == user_id:
-                continue
-            await self._uow.notifications.enqueue(
-                event_type=NotificationEventType.REMINDER,
-                recipient_user_id=membership.user_id,
-                group_id=group.id,
-                payload={
-                    "kind": "membership_event",
-                    "group_name": group.name,
-                    "message": "В группу вступил новый участник.",
-                },
-                deep_link_path="/group",
-            )
+        await self._uow.notifications.enqueue_many(
+            [
+                NotificationOutboxEventDraft(
+                    event_type=NotificationEventType.REMINDER,
+                    recipient_user_id=membership.user_id,
+                    group_id=group.id,
+                    payload={
+                        "kind": "membership_event",
+                        "group_name": group.name,
+                        "message": "В группу вступил новый участник.",
+                    },
+                    deep_link_path="/group",
+                )
+                for membership in memberships
+                if membership.user_id != user_id
+            ]
+        )
         await self._uow.commit()
+        self._context_service.invalidate_group(group.id)
+        self._context_service.invalidate_users([user_id])
         return await self._context_service.resolve(user_id)
 
     async def leave_group(self, *, user_id: int, left_at: datetime) -> None:
@@ -131,25 +146,31 @@ class GroupService:
                 group_id=group.id,
                 weights_by_user_id=distribute_equally([member.user_id for member in remaining]),
             )
+            events: list[NotificationOutboxEventDraft] = []
             for member in remaining:
                 owner_changed = member.user_id == next_owner_id
-                await self._uow.notifications.enqueue(
-                    event_type=NotificationEventType.REMINDER,
-                    recipient_user_id=member.user_id,
-                    group_id=group.id,
-                    payload={
-                        "kind": "group_event" if owner_changed else "membership_event",
-                        "group_name": group.name,
-                        "message": (
-                            "Вы назначены новым владельцем группы."
-                            if owner_changed
-                            else "Один из участников покинул группу."
-                        ),
-                    },
-                    deep_link_path="/group",
+                events.append(
+                    NotificationOutboxEventDraft(
+                        event_type=NotificationEventType.REMINDER,
+                        recipient_user_id=member.user_id,
+                        group_id=group.id,
+                        payload={
+                            "kind": "group_event" if owner_changed else "membership_event",
+                            "group_name": group.name,
+                            "message": (
+                                "Вы назначены новым владельцем группы."
+                                if owner_changed
+                                else "Один из участников покинул группу."
+                            ),
+                        },
+                        deep_link_path="/group",
+                    )
                 )
+            await self._uow.notifications.enqueue_many(events)
 
         await self._uow.commit()
+        self._context_service.invalidate_group(group.id)
+        self._context_service.invalidate_users([user_id])
 
     async def get_current_group(self, *, user_id: int) -> GroupInfo:
         context = await self._context_service.resolve(user_id)
@@ -205,12 +226,24 @@ class GroupService:
             self._validate_join_secret(join_secret)
         if sprint_duration_days is not None:
             self._validate_sprint_duration(sprint_duration_days)
-        return await self._uow.groups.update_settings(
+        sprint_period_end = None
+        if sprint_start_weekday is not None or sprint_duration_days is not None:
+            sprint_period_end = current_sprint_window(
+                today=self._clock.today(),
+                start_weekday=sprint_start_weekday or group.sprint_start_weekday,
+                duration_days=sprint_duration_days or group.sprint_duration_days,
+                anchor=group.created_at,
+            ).period_end
+        updated = await self._uow.groups.update_settings(
             group_id=group.id,
             join_secret=join_secret,
             sprint_start_weekday=sprint_start_weekday,
             sprint_duration_days=sprint_duration_days,
+            sprint_period_end=sprint_period_end,
         )
+        await self._uow.commit()
+        self._context_service.invalidate_group(group.id)
+        return updated
 
     async def update_current_group_weights(
         self,
@@ -226,6 +259,7 @@ class GroupService:
         )
         await self._uow.groups.replace_weights(group_id=group.id, weights_by_user_id=validated)
         await self._uow.commit()
+        self._context_service.invalidate_group(group.id)
         refreshed = await self._uow.groups.list_active_memberships(group.id)
         return await self._build_member_cards(group=group, memberships=refreshed)
 
@@ -254,9 +288,19 @@ class GroupService:
         profiles = await self._uow.users.list_by_ids(user_ids)
         profile_by_id = {profile.id: profile for profile in profiles}
         balances = await self._uow.groups.list_member_balances(group.id)
+        window = current_sprint_window(
+            today=self._clock.today(),
+            start_weekday=group.sprint_start_weekday,
+            duration_days=group.sprint_duration_days,
+            anchor=group.created_at,
+        )
+        progress = await self._uow.tasks.list_sprint_progress(
+            group_id=group.id, period_start=window.period_start
+        )
         cards: list[MemberCardInfo] = []
         for membership in sorted(memberships, key=lambda item: item.user_id):
             profile = profile_by_id.get(membership.user_id)
+            member_progress = progress.get(membership.user_id)
             cards.append(
                 MemberCardInfo(
                     user_id=membership.user_id,
@@ -266,6 +310,12 @@ class GroupService:
                     weight_percent=membership.weight_percent or ZERO,
                     balance=balances.get(membership.user_id, ZERO),
                     is_owner=membership.user_id == group.owner_user_id,
+                    sprint_completed_units=(
+                        member_progress.completed_units if member_progress else ZERO
+                    ),
+                    sprint_pending_units=(
+                        member_progress.pending_units if member_progress else ZERO
+                    ),
                 )
             )
         return cards
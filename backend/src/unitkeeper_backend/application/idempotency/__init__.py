@@ -0,0 +1 @@
+"""Idempotency-Key reservation and response replay for mutating requests."""
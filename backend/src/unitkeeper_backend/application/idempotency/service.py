@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from contextlib import AbstractAsyncContextManager
+from datetime import timedelta
+
+from db.enums import IdempotencyStatus
+
+from unitkeeper_backend.application.models import IdempotencyKeyRef, StoredResponse
+from unitkeeper_backend.application.ports import Clock, UnitOfWork
+from unitkeeper_backend.domain.errors import ConflictError, ValidationError
+
+
+class IdempotencyService:
+    def __init__(self, *, uow: UnitOfWork, clock: Clock, ttl_seconds: int) -> None:
+        self._uow = uow
+        self._clock = clock
+        self._ttl = timedelta(seconds=ttl_seconds)
+
+    async def begin(self, ref: IdempotencyKeyRef) -> StoredResponse | None:
+        """Return the stored response for a repeated key, or reserve the key and return None.
+
+        The reservation is written in the caller's transaction and is not
+        committed here: the use case's own commit makes it durable together
+        with the change it guards, and a use case that fails takes it back
+        with its rollback.
+        """
+        now = self._clock.now()
+        record = await self._uow.idempotency.get(
+            scope=ref.scope, actor_key=ref.actor_key, key=ref.key
+        )
+        if record is not None and (record.expires_at is None or record.expires_at > now):
+            if record.request_fingerprint != ref.request_fingerprint:
+                raise ValidationError("Idempotency-Key was already used for a different request")
+            if (
+                record.status is IdempotencyStatus.COMPLETED
+                and record.response_status_code is not None
+                and record.response_payload is not None
+            ):
+                return StoredResponse(
+                    status_code=record.response_status_code, payload=record.response_payload
+                )
+            raise ConflictError("A request with this Idempotency-Key is still in progress")
+        if not await self._uow.idempotency.claim(ref, now=now, expires_at=now + self._ttl):
+            # A concurrent request with the key held the row until it committed;
+            # if it succeeded, this retry replays its response.
+            record = await self._uow.idempotency.get(
+                scope=ref.scope, actor_key=ref.actor_key, key=ref.key
+            )
+            if (
+                record is not None
+                and record.request_fingerprint == ref.request_fingerprint
+                and record.status is IdempotencyStatus.COMPLETED
+                and record.response_status_code is not None
+                and record.response_payload is not None
+            ):
+                return StoredResponse(
+                    status_code=record.response_status_code, payload=record.response_payload
+                )
+            raise ConflictError("A request with this Idempotency-Key is still in progress")
+        return None
+
+    def single_commit(self) -> AbstractAsyncContextManager[None]:
+        """Hold the use case's commits so ``complete`` lands in the same transaction."""
+        return self._uow.single_commit()
+
+    async def complete(self, ref: IdempotencyKeyRef, response: StoredResponse) -> None:
+        """Store the response; it commits with the use case inside ``single_commit``."""
+        now = self._clock.now()
+        await self._uow.idempotency.complete(
+            ref, response=response, completed_at=now, expires_at=now + self._ttl
+        )
+        await self._uow.commit()
+
+    async def purge_expired(self, *, batch_size: int) -> int:
+        """Delete expired keys in committed batches; return how many were removed."""
+        now = self._clock.now()
+        purged = 0
+        while True:
+            deleted = await self._uow.idempotency.purge_expired(now=now, limit=batch_size)
+            await self._uow.commit()
+            purged += deleted
+            if deleted < batch_size:
+                return purged
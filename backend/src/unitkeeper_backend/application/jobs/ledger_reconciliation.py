@@ -0,0 +1,129 @@
+"""Reconciliation of the ``balances`` read model against the append-only ledger.
+
+Each group keeps a checkpoint: the last ``balance_transactions`` id already
+verified and every user's ledger total up to it. A run streams only the rows
+after the checkpoint, in chunks, so memory stays bounded by the chunk size and
+the number of members however long the ledger grows. It checks that every
+``transaction_group_id`` sums to zero and that each user's ledger total
+matches ``balances.current_balance``, then moves the checkpoint forward.
+
+Rows younger than ``settle_seconds`` are not folded into the checkpoint, since
+transactions still in flight may yet commit rows with lower ids; they are only
+summed for the balance comparison. That comparison is only meaningful when the
+whole run for a group sees one snapshot, so callers run each group in its own
+repeatable-read transaction and commit it to store the checkpoint.
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import timedelta
+from decimal import Decimal
+from uuid import UUID
+
+from unitkeeper_backend.application.models import (
+    BalanceMismatch,
+    LedgerCheckpointInfo,
+    LedgerReconciliationReport,
+)
+from unitkeeper_backend.application.ports import Clock, UnitOfWork
+from unitkeeper_backend.domain.services.sprint_math import ZERO
+
+logger = logging.getLogger(__name__)
+
+
+class LedgerReconciler:
+    def __init__(
+        self, *, uow: UnitOfWork, clock: Clock, chunk_size: int, settle_seconds: int
+    ) -> None:
+        self._uow = uow
+        self._clock = clock
+        self._chunk_size = chunk_size
+        self._settle = timedelta(seconds=settle_seconds)
+
+    async def reconcile_group(self, group_id: int) -> LedgerReconciliationReport:
+        checkpoint = await self._uow.ledger.get_reconciliation_checkpoint(group_id)
+        if checkpoint is None:
+            checkpoint = LedgerCheckpointInfo(
+                group_id=group_id, last_transaction_id=0, ledger_balances={}
+            )
+        ledger_balances = dict(checkpoint.ledger_balances)
+        through_id = await self._uow.ledger.find_settled_ledger_end(
+            group_id=group_id,
+            after_id=checkpoint.last_transaction_id,
+            settled_before=self._clock.now() - self._settle,
+        )
+
+        scanned_count = 0
+        # Partial sums of transaction groups seen so far; an entry is dropped
+        # as soon as its legs cancel out, so only legs still waiting for their
+        # counterpart are held.
+        open_groups: dict[UUID, Decimal] = {}
+        if through_id is not None:
+            async for chunk in self._uow.ledger.stream_ledger_entries(
+                group_id=group_id,
+                after_id=checkpoint.last_transaction_id,
+                through_id=through_id,
+                chunk_size=self._chunk_size,
+            ):
+                scanned_count += len(chunk)
+                for entry in chunk:
+                    if entry.user_id is not None:
+                        ledger_balances[entry.user_id] = (
+                            ledger_balances.get(entry.user_id, ZERO) + entry.amount_delta
+                        )
+                    remaining = open_groups.pop(entry.transaction_group_id, ZERO)
+                    remaining += entry.amount_delta
+                    if remaining != ZERO:
+                        open_groups[entry.transaction_group_id] = remaining
+            checkpoint.last_transaction_id = through_id
+
+        # A posting can straddle the checkpoint, so anything still open is
+        # judged on all of its legs, not only the ones scanned here.
+        totals = await self._uow.ledger.sum_transaction_groups(sorted(open_groups))
+        unbalanced = sorted(
+            transaction_group_id
+            for transaction_group_id in open_groups
+            if totals.get(transaction_group_id, ZERO) != ZERO
+        )
+
+        unsettled = await self._uow.ledger.sum_user_ledger_after(
+            group_id=group_id, after_id=checkpoint.last_transaction_id
+        )
+        current_balances = await self._uow.groups.list_member_balances(group_id)
+        mismatches: list[BalanceMismatch] = []
+        for user_id in sorted(ledger_balances.keys() | unsettled.keys() | current_balances.keys()):
+            expected = ledger_balances.get(user_id, ZERO) + unsettled.get(user_id, ZERO)
+            actual = current_balances.get(user_id, ZERO)
+            if expected != actual:
+                mismatches.append(
+                    BalanceMismatch(
+                        user_id=user_id, ledger_balance=expected, current_balance=actual
+                    )
+                )
+
+        checkpoint.ledger_balances = ledger_balances
+        await self._uow.ledger.save_reconciliation_checkpoint(checkpoint)
+        report = LedgerReconciliationReport(
+            group_id=group_id,
+            scanned_count=scanned_count,
+            last_transaction_id=checkpoint.last_transaction_id,
+            unbalanced_transaction_group_ids=unbalanced,
+            balance_mismatches=mismatches,
+        )
+        for transaction_group_id in unbalanced:
+            logger.error(
+                "ledger_reconciliation.unbalanced group_id=%s transaction_group_id=%s",
+                group_id,
+                transaction_group_id,
+            )
+        for mismatch in mismatches:
+            logger.error(
+                "ledger_reconciliation.balance_mismatch group_id=%s user_id=%s ledger=%s "
+                "current=%s",
+                group_id,
+                mismatch.user_id,
+                mismatch.ledger_balance,
+                mismatch.current_balance,
+            )
+        return report
@@ -2,10 +2,24 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Protocol
 
 
+@dataclass(frozen=True, slots=True)
+class OutboundEvent:
+    """One deduplicated event of a fan-out; every field mirrors ``enqueue_once``."""
+
+    event_type: str
+    recipient_user_id: int
+    group_id: int
+    payload: dict[str, object]
+    deep_link_path: str
+    dedupe_key: str
+    correlation_id: str
+
+
 class EventPublisher(Protocol):
     async def enqueue_once(
         self,
@@ -19,6 +33,8 @@ class EventPublisher(Protocol):
         correlation_id: str,
     ) -> None: ...
 
+    async def enqueue_many_once(self, events: Sequence[OutboundEvent]) -> None: ...
+
 
 @dataclass(frozen=True, slots=True)
 class SprintMemberReport:
@@ -44,8 +60,9 @@ class SprintReportPublisher:
         reports: list[SprintMemberReport],
         correlation_id: str,
     ) -> None:
-        for report in reports:
-            await self._publisher.enqueue_once(
+        # The personal reports and the owner summary go out as one fan-out.
+        events = [
+            OutboundEvent(
                 event_type="sprint_closed",
                 recipient_user_id=report.user_id,
                 group_id=group_id,
@@ -60,21 +77,26 @@ class SprintReportPublisher:
                 dedupe_key=f"sprint-report:{group_id}:{period}:{report.user_id}",
                 correlation_id=correlation_id,
             )
-        await self._publisher.enqueue_once(
-            event_type="sprint_closed",
-            recipient_user_id=owner_user_id,
-            group_id=group_id,
-            payload={
-                "kind": "sprint_owner_summary",
-                "group_name": group_name,
-                "period": period,
-                "planned_units": planned_units,
-                "completed_units": completed_units,
-            },
-            deep_link_path="/progress",
-            dedupe_key=f"sprint-owner-summary:{group_id}:{period}",
-            correlation_id=correlation_id,
+            for report in reports
+        ]
+        events.append(
+            OutboundEvent(
+                event_type="sprint_closed",
+                recipient_user_id=owner_user_id,
+                group_id=group_id,
+                payload={
+                    "kind": "sprint_owner_summary",
+                    "group_name": group_name,
+                    "period": period,
+                    "planned_units": planned_units,
+                    "completed_units": completed_units,
+                },
+                deep_link_path="/progress",
+                dedupe_key=f"sprint-owner-summary:{group_id}:{period}",
+                correlation_id=correlation_id,
+            )
         )
+        await self._publisher.enqueue_many_once(events)
 
 
 class ReminderPublisher:
@@ -99,13 +121,19 @@ class ReminderPublisher:
     async def sprint_deadline(
         self, *, group_id: int, user_ids: list[int], deadline: str, period: str, correlation_id: str
     ) -> None:
-        for user_id in user_ids:
-            await self._publisher.enqueue_once(
-                event_type="reminder",
-                recipient_user_id=user_id,
-                group_id=group_id,
-                payload={"kind": "sprint_deadline_reminder", "deadline": deadline},
-                deep_link_path="/tasks",
-                dedupe_key=f"sprint-deadline:{group_id}:{period}:{user_id}",
-                correlation_id=correlation_id,
-            )
+        if not user_ids:
+            return
+        await self._publisher.enqueue_many_once(
+            [
+                OutboundEvent(
+                    event_type="reminder",
+                    recipient_user_id=user_id,
+                    group_id=group_id,
+                    payload={"kind": "sprint_deadline_reminder", "deadline": deadline},
+                    deep_link_path="/tasks",
+                    dedupe_key=f"sprint-deadline:{group_id}:{period}:{user_id}",
+                    correlation_id=correlation_id,
+                )
+                for user_id in user_ids
+            ]
+        )
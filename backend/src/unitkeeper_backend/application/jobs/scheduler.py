@@ -6,14 +6,20 @@ and report-event production in backend application code, never in the bot.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Protocol
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Literal, Protocol
 
 from unitkeeper_backend.application.jobs.notifications import (
     SprintMemberReport,
     SprintReportPublisher,
 )
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass(frozen=True, slots=True)
 class ClosedSprint:
@@ -57,3 +63,91 @@ class SprintCloseJob:
             )
             closed_count += 1
         return closed_count
+
+
+GroupCloseOutcome = Literal["closed", "skipped", "failed"]
+
+
+@dataclass(frozen=True, slots=True)
+class GroupCloseResult:
+    group_id: int
+    outcome: GroupCloseOutcome
+    duration_seconds: float
+    error: str | None = None
+
+
+@dataclass(slots=True)
+class SprintCloseRunSummary:
+    correlation_id: str
+    duration_seconds: float = 0.0
+    results: list[GroupCloseResult] = field(default_factory=list)
+
+    @property
+    def closed_count(self) -> int:
+        return sum(1 for result in self.results if result.outcome == "closed")
+
+    @property
+    def failed_count(self) -> int:
+        return sum(1 for result in self.results if result.outcome == "failed")
+
+
+class IsolatedSprintCloser(Protocol):
+    async def close_group(self, *, group_id: int, correlation_id: str) -> bool:
+        """Close one group's sprint in its own transaction; return whether it closed."""
+        ...
+
+
+class ConcurrentSprintCloseJob:
+    """Closes due groups side by side, one transaction per group.
+
+    A group that fails or runs slowly no longer holds back or rolls back the
+    others; ``concurrency`` bounds how many connections the run takes from the
+    pool at once.
+    """
+
+    def __init__(
+        self,
+        *,
+        closer: IsolatedSprintCloser,
+        concurrency: int,
+        monotonic: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self._closer = closer
+        self._concurrency = max(concurrency, 1)
+        self._monotonic = monotonic
+
+    async def run(self, *, due_group_ids: list[int], correlation_id: str) -> SprintCloseRunSummary:
+        started = self._monotonic()
+        semaphore = asyncio.Semaphore(self._concurrency)
+
+        async def close(group_id: int) -> GroupCloseResult:
+            async with semaphore:
+                group_started = self._monotonic()
+                try:
+                    closed = await self._closer.close_group(
+                        group_id=group_id, correlation_id=correlation_id
+                    )
+                except Exception as exc:
+                    logger.exception(
+                        "sprint_close.group_failed group_id=%s correlation_id=%s",
+                        group_id,
+                        correlation_id,
+                    )
+                    return GroupCloseResult(
+                        group_id=group_id,
+                        outcome="failed",
+                        duration_seconds=self._monotonic() - group_started,
+                        error=f"{type(exc).__name__}: {exc}",
+                    )
+                return GroupCloseResult(
+                    group_id=group_id,
+                    outcome="closed" if closed else "skipped",
+                    duration_seconds=self._monotonic() - group_started,
+                )
+
+        results = await asyncio.gather(*(close(group_id) for group_id in due_group_ids))
+        return SprintCloseRunSummary(
+            correlation_id=correlation_id,
+            duration_seconds=self._monotonic() - started,
+            results=list(results),
+        )
@@ -33,16 +33,16 @@ async def list_due_group_ids(*, uow: UnitOfWork, clock: Clock) -> list[int]:
 
     A group is "due" on the last calendar day of its running sprint window, so
     the job can be scheduled to run once a day and still close every sprint on
-    time. Groups that are not due are skipped (and logged as such); actual
-    duplicate-close protection is handled downstream by
-    ``SprintCloseRunner.close_due_sprint``.
+    time. Candidates come from one indexed lookup on the stored
+    ``sprint_period_end``, restricted to groups with active members. A stored
+    value that is missing or already in the past (a skipped run, a failed
+    close) is rolled forward to the current window and the group skipped; the
+    caller commits those repairs. Actual duplicate-close protection is handled
+    downstream by ``SprintCloseRunner.close_due_sprint``.
     """
     today = clock.today()
     due_group_ids: list[int] = []
-    for group_id in await uow.groups.list_group_ids():
-        group = await uow.groups.get_by_id(group_id)
-        if group is None:
-            continue
+    for group in await uow.groups.list_groups_due_by(today=today):
         window = current_sprint_window(
             today=today,
             start_weekday=group.sprint_start_weekday,
@@ -52,12 +52,13 @@ async def list_due_group_ids(*, uow: UnitOfWork, clock: Clock) -> list[int]:
         if window.period_end != today:
             logger.debug(
                 "sprint_close.skip_not_due group_id=%s period_end=%s today=%s",
-                group_id,
+                group.id,
                 window.period_end,
                 today,
             )
+            await uow.groups.set_sprint_period_end(group_id=group.id, period_end=window.period_end)
             continue
-        due_group_ids.append(group_id)
+        due_group_ids.append(group.id)
     return due_group_ids
 
 
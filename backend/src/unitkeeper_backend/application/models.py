@@ -6,10 +6,13 @@ from decimal import Decimal
 from uuid import UUID
 
 from db.enums import (
+    BalanceTransactionAccountType,
     BalanceTransactionType,
+    IdempotencyStatus,
     NotificationDeliveryAttemptStatus,
     NotificationEventType,
     NotificationOutboxStatus,
+    NotificationPriority,
     SprintRunStatus,
     TaskLogStatus,
     Weekday,
@@ -69,6 +72,8 @@ class MemberCardInfo:
     weight_percent: Decimal
     balance: Decimal
     is_owner: bool
+    sprint_completed_units: Decimal
+    sprint_pending_units: Decimal
 
 
 @dataclass(slots=True)
@@ -87,6 +92,13 @@ class GroupCardInfo:
     join_secret: str | None = None
 
 
+@dataclass(slots=True)
+class TaskImportItem:
+    title: str
+    frequency_per_sprint: int
+    unit_cost: Decimal
+
+
 @dataclass(slots=True)
 class TaskInfo:
     id: int
@@ -112,6 +124,24 @@ class TaskInfo:
         return max(self.frequency_per_sprint - self.completed_in_sprint - self.pending_in_sprint, 0)
 
 
+@dataclass(slots=True)
+class TaskSlotCounts:
+    """Completed and pending log counts that occupy a task's slots in one sprint window."""
+
+    completed: int = 0
+    pending: int = 0
+
+
+@dataclass(slots=True)
+class TaskCompletionTotals:
+    """Completed logs of one task by one performer, aggregated over a sprint window."""
+
+    task_id: int
+    performer_user_id: int
+    completed_count: int
+    completed_units: Decimal
+
+
 @dataclass(slots=True)
 class TaskLogInfo:
     id: int
@@ -125,6 +155,61 @@ class TaskLogInfo:
     created_at: datetime
 
 
+@dataclass(slots=True)
+class TaskCompletionOutcome:
+    """Result of the combined mark-done write: the guard that stopped it, or the new log."""
+
+    performer_is_member: bool
+    task_found: bool
+    task_active: bool
+    slot_row_exists: bool
+    log: TaskLogInfo | None = None
+
+
+@dataclass(slots=True)
+class SprintSlotDelta:
+    """Change to apply to one task's counter row for one sprint window."""
+
+    task_id: int
+    period_start: date
+    completed: int = 0
+    pending: int = 0
+
+
+@dataclass(slots=True)
+class SprintProgressDelta:
+    """Change in one member's task log counts for one sprint window.
+
+    Units are not carried: the repository values the counts at the task's
+    current unit cost when it applies them.
+    """
+
+    user_id: int
+    task_id: int
+    period_start: date
+    completed: int = 0
+    pending: int = 0
+
+
+@dataclass(slots=True)
+class SprintProgressInfo:
+    user_id: int
+    completed_count: int
+    completed_units: Decimal
+    pending_count: int
+    pending_units: Decimal
+
+
+@dataclass(slots=True)
+class TaskLogBatchItem:
+    """Outcome of one item of a batch mutation: the resulting log, or why it failed."""
+
+    id: int
+    log: TaskLogInfo | None = None
+    error_code: str | None = None
+    error_message: str | None = None
+
+
 @dataclass(slots=True)
 class TaskLogView:
     id: int
@@ -144,13 +229,19 @@ class TaskLogView:
 @dataclass(slots=True)
 class TaskLogPage:
     items: list[TaskLogView]
-    total: int
+    total: int | None
     limit: int
     offset: int
+    has_more: bool
+    next_cursor: str | None = None
 
-    @property
-    def has_more(self) -> bool:
-        return self.offset + len(self.items) < self.total
+
+@dataclass(frozen=True, slots=True)
+class KeysetCursor:
+    """Position after the last row of a newest-first ``(created_at, id)`` listing."""
+
+    created_at: datetime
+    id: int
 
 
 @dataclass(slots=True)
@@ -240,6 +331,22 @@ class SprintMemberResultInfo:
     balance_after: Decimal
 
 
+@dataclass(slots=True)
+class BalanceTransactionDraft:
+    """One ledger line of a settlement, written together with its siblings."""
+
+    group_id: int
+    user_id: int | None
+    account_type: BalanceTransactionAccountType
+    transaction_type: BalanceTransactionType
+    amount_delta: Decimal
+    description: str
+    transaction_group_id: UUID
+    sprint_run_id: int | None = None
+    task_log_id: int | None = None
+    counterparty_user_id: int | None = None
+
+
 @dataclass(slots=True)
 class SprintRunInfo:
     id: int
@@ -255,6 +362,114 @@ class SprintRunInfo:
     member_results: list[SprintMemberResultInfo] = field(default_factory=list)
 
 
+@dataclass(frozen=True, slots=True)
+class SprintRunCursor:
+    """Position after the last row of a newest-first ``(period_start, id)`` listing."""
+
+    period_start: date
+    id: int
+
+
+@dataclass(slots=True)
+class SprintRunPage:
+    """Closed sprint summaries; ``member_results`` is left empty on every item."""
+
+    items: list[SprintRunInfo]
+    limit: int
+    has_more: bool
+    next_cursor: str | None = None
+
+
+@dataclass(slots=True)
+class BalanceCheckpointInfo:
+    group_id: int
+    user_id: int
+    balance: Decimal
+    taken_at: datetime
+    sprint_run_id: int | None = None
+
+
+@dataclass(slots=True)
+class BalanceAsOfInfo:
+    """A member's balance at ``as_of``; ``checkpoint_at`` is where the sum started."""
+
+    group_id: int
+    user_id: int
+    as_of: datetime
+    balance: Decimal
+    checkpoint_at: datetime | None
+
+
+@dataclass(frozen=True, slots=True)
+class LedgerEntry:
+    """The parts of a ``balance_transactions`` row that reconciliation reads."""
+
+    id: int
+    user_id: int | None
+    amount_delta: Decimal
+    transaction_group_id: UUID
+
+
+@dataclass(slots=True)
+class LedgerCheckpointInfo:
+    group_id: int
+    last_transaction_id: int
+    ledger_balances: dict[int, Decimal]
+
+
+@dataclass(frozen=True, slots=True)
+class BalanceMismatch:
+    user_id: int
+    ledger_balance: Decimal
+    current_balance: Decimal
+
+
+@dataclass(slots=True)
+class LedgerReconciliationReport:
+    group_id: int
+    scanned_count: int
+    last_transaction_id: int
+    unbalanced_transaction_group_ids: list[UUID]
+    balance_mismatches: list[BalanceMismatch]
+
+    @property
+    def is_consistent(self) -> bool:
+        return not self.unbalanced_transaction_group_ids and not self.balance_mismatches
+
+
+@dataclass(frozen=True, slots=True)
+class IdempotencyKeyRef:
+    """Identifies one ``idempotency_keys`` row: a client key within a route and caller."""
+
+    scope: str
+    actor_key: str
+    key: str
+    request_fingerprint: str
+
+
+@dataclass(slots=True)
+class IdempotencyRecord:
+    request_fingerprint: str
+    status: IdempotencyStatus
+    response_status_code: int | None
+    response_payload: dict[str, object] | None
+    expires_at: datetime | None
+
+
+@dataclass(frozen=True, slots=True)
+class StoredResponse:
+    status_code: int
+    payload: dict[str, object]
+
+
+@dataclass(slots=True, frozen=True)
+class SessionClaims:
+    user_id: int
+    group_id: int | None = None
+    membership_id: int | None = None
+    membership_epoch: int | None = None
+
+
 @dataclass(slots=True)
 class SessionInfo:
     access_token: str
@@ -287,6 +502,48 @@ class NotificationOutboxEventInfo:
     delivered_at: datetime | None
     last_error: str | None
     created_at: datetime
+    lease_owner: str | None = None
+    lease_expires_at: datetime | None = None
+    priority: NotificationPriority = NotificationPriority.NORMAL
+
+
+@dataclass(frozen=True, slots=True)
+class NotificationOutboxEventDraft:
+    """One outbox event of a fan-out, written together with its siblings."""
+
+    event_type: NotificationEventType
+    recipient_user_id: int
+    group_id: int | None
+    payload: dict[str, object]
+    deep_link_path: str | None
+    dedupe_key: str | None = None
+    correlation_id: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class NotificationFailure:
+    """One failed delivery as recorded: ``retry_at`` is None for a terminal failure."""
+
+    event_id: UUID
+    error_message: str
+    retry_at: datetime | None
+    terminal: bool
+
+
+@dataclass(frozen=True, slots=True)
+class NotificationFailureReport:
+    """One failed delivery as the bot reports it."""
+
+    event_id: UUID
+    error_message: str
+    retry_after_seconds: int | None
+    terminal: bool
+
+
+@dataclass(frozen=True, slots=True)
+class NotificationResults:
+    acknowledged_count: int
+    failed_count: int
 
 
 @dataclass(slots=True)
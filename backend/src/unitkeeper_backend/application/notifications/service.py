@@ -1,22 +1,72 @@
 from __future__ import annotations
 
+import asyncio
+import math
+from collections.abc import Sequence
 from datetime import timedelta
 from uuid import UUID
 
 from db.enums import NotificationEventType
 
-from unitkeeper_backend.application.models import NotificationOutboxEventInfo
-from unitkeeper_backend.application.ports import Clock, UnitOfWork
+from unitkeeper_backend.application.models import (
+    NotificationFailure,
+    NotificationFailureReport,
+    NotificationOutboxEventInfo,
+    NotificationResults,
+)
+from unitkeeper_backend.application.ports import Clock, OutboxWakeups, UnitOfWork
+
+OLDEST_FIRST_SHARE = 10
 
 
 class NotificationOutboxService:
-    def __init__(self, *, uow: UnitOfWork, clock: Clock) -> None:
+    def __init__(
+        self, *, uow: UnitOfWork, clock: Clock, wakeups: OutboxWakeups | None = None
+    ) -> None:
         self._uow = uow
         self._clock = clock
+        self._wakeups = wakeups
 
     async def list_ready(self, *, limit: int) -> list[NotificationOutboxEventInfo]:
         return await self._uow.notifications.list_ready(now=self._clock.now(), limit=limit)
 
+    async def claim_ready(
+        self, *, worker_id: str, limit: int, lease_seconds: int, wait_seconds: float = 0
+    ) -> list[NotificationOutboxEventInfo]:
+        """Lease ready events; with ``wait_seconds``, long-poll for them when there are none.
+
+        The wakeup is taken before the first claim, so an event committed
+        between that claim and the wait still ends the wait. Events that only
+        become due later (retries, expired leases) are picked up when the wait
+        times out.
+        """
+        wakeup = self._wakeups.next_wakeup() if self._wakeups and wait_seconds > 0 else None
+        events = await self._claim(worker_id=worker_id, limit=limit, lease_seconds=lease_seconds)
+        if events or wakeup is None:
+            return events
+        # The claim has committed, so no pooled connection is held while waiting.
+        try:
+            await asyncio.wait_for(wakeup.wait(), timeout=wait_seconds)
+        except TimeoutError:
+            pass
+        return await self._claim(worker_id=worker_id, limit=limit, lease_seconds=lease_seconds)
+
+    async def _claim(
+        self, *, worker_id: str, limit: int, lease_seconds: int
+    ) -> list[NotificationOutboxEventInfo]:
+        now = self._clock.now()
+        events = await self._uow.notifications.claim_ready(
+            now=now,
+            limit=limit,
+            # One slot in ten (none for tiny batches) serves the oldest events
+            # of any lane, so bulk lanes drain even under interactive load.
+            oldest_first=min(limit - 1, math.ceil(limit / OLDEST_FIRST_SHARE)),
+            lease_owner=worker_id,
+            lease_expires_at=now + timedelta(seconds=lease_seconds),
+        )
+        await self._uow.commit()
+        return events
+
     async def enqueue_once(
         self,
         *,
@@ -68,3 +118,28 @@ class NotificationOutboxService:
         )
         await self._uow.commit()
         return event
+
+    async def record_results(
+        self, *, acknowledged: Sequence[UUID], failed: Sequence[NotificationFailureReport]
+    ) -> NotificationResults:
+        """Record a whole delivery batch in one transaction."""
+        now = self._clock.now()
+        acknowledged_count = await self._uow.notifications.acknowledge_many(
+            event_ids=acknowledged, acknowledged_at=now
+        )
+        failed_count = await self._uow.notifications.fail_many(
+            failures=[
+                NotificationFailure(
+                    event_id=report.event_id,
+                    error_message=report.error_message,
+                    retry_at=None
+                    if report.terminal or report.retry_after_seconds is None
+                    else now + timedelta(seconds=report.retry_after_seconds),
+                    terminal=report.terminal,
+                )
+                for report in failed
+            ],
+            failed_at=now,
+        )
+        await self._uow.commit()
+        return NotificationResults(acknowledged_count=acknowledged_count, failed_count=failed_count)
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import base64
+import binascii
+from datetime import date, datetime
+
+from unitkeeper_backend.application.models import KeysetCursor, SprintRunCursor
+from unitkeeper_backend.domain.errors import ValidationError
+
+
+def encode_cursor(cursor: KeysetCursor) -> str:
+    return _encode(f"{cursor.created_at.isoformat()}|{cursor.id}")
+
+
+def decode_cursor(token: str) -> KeysetCursor:
+    """Parse an opaque cursor issued by :func:`encode_cursor`."""
+    try:
+        created_at, row_id = _decode(token).split("|")
+        cursor = KeysetCursor(created_at=datetime.fromisoformat(created_at), id=int(row_id))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise ValidationError("Pagination cursor is invalid") from exc
+    if cursor.created_at.tzinfo is None:
+        raise ValidationError("Pagination cursor is invalid")
+    return cursor
+
+
+def encode_sprint_run_cursor(cursor: SprintRunCursor) -> str:
+    return _encode(f"{cursor.period_start.isoformat()}|{cursor.id}")
+
+
+def decode_sprint_run_cursor(token: str) -> SprintRunCursor:
+    """Parse an opaque cursor issued by :func:`encode_sprint_run_cursor`."""
+    try:
+        period_start, row_id = _decode(token).split("|")
+        return SprintRunCursor(period_start=date.fromisoformat(period_start), id=int(row_id))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise ValidationError("Pagination cursor is invalid") from exc
+
+
+def _encode(raw: str) -> str:
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _decode(token: str) -> str:
+    return base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)).decode()
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+import asyncio
+from collections.abc import AsyncIterator, Mapping, Sequence
+from contextlib import AbstractAsyncContextManager
 from datetime import date, datetime
 from decimal import Decimal
 from typing import Protocol
@@ -15,14 +17,33 @@ from db.enums import (
 )
 
 from unitkeeper_backend.application.models import (
+    BalanceCheckpointInfo,
+    BalanceTransactionDraft,
     BalanceTransactionInfo,
     GroupInfo,
+    IdempotencyKeyRef,
+    IdempotencyRecord,
+    KeysetCursor,
+    LedgerCheckpointInfo,
+    LedgerEntry,
     MembershipInfo,
+    NotificationFailure,
+    NotificationOutboxEventDraft,
     NotificationOutboxEventInfo,
+    SessionClaims,
     SprintMemberResultInfo,
+    SprintProgressDelta,
+    SprintProgressInfo,
+    SprintRunCursor,
     SprintRunInfo,
+    SprintSlotDelta,
+    StoredResponse,
+    TaskCompletionOutcome,
+    TaskCompletionTotals,
+    TaskImportItem,
     TaskInfo,
     TaskLogInfo,
+    TaskSlotCounts,
     TelegramIdentity,
     UserProfile,
 )
@@ -34,14 +55,18 @@ class Clock(Protocol):
     def today(self) -> date: ...
 
 
+class OutboxWakeups(Protocol):
+    def next_wakeup(self) -> asyncio.Event: ...
+
+
 class TelegramInitDataVerifier(Protocol):
     def verify(self, init_data: str) -> TelegramIdentity: ...
 
 
 class SessionTokenManager(Protocol):
-    def issue(self, *, user_id: int, issued_at: datetime) -> tuple[str, datetime]: ...
+    def issue(self, *, claims: SessionClaims, issued_at: datetime) -> tuple[str, datetime]: ...
 
-    def verify(self, token: str) -> int: ...
+    def verify(self, token: str) -> SessionClaims: ...
 
 
 class UserRepository(Protocol):
@@ -53,14 +78,22 @@ class UserRepository(Protocol):
 
 
 class GroupRepository(Protocol):
-    async def get_by_id(self, group_id: int) -> GroupInfo | None: ...
+    async def get_by_id(
+        self, group_id: int, *, include_members: bool = True
+    ) -> GroupInfo | None: ...
 
     async def list_group_ids(self) -> list[int]: ...
 
+    async def list_groups_due_by(self, *, today: date) -> list[GroupInfo]: ...
+
+    async def set_sprint_period_end(self, *, group_id: int, period_end: date) -> None: ...
+
     async def get_by_name(self, name: str) -> GroupInfo | None: ...
 
     async def get_active_membership(self, user_id: int) -> MembershipInfo | None: ...
 
+    async def get_membership_epoch(self, user_id: int) -> int | None: ...
+
     async def get_active_membership_in_group(
         self, *, group_id: int, user_id: int
     ) -> MembershipInfo | None: ...
@@ -77,6 +110,7 @@ class GroupRepository(Protocol):
         sprint_duration_days: int,
         timezone: str,
         created_at: date,
+        sprint_period_end: date,
     ) -> GroupInfo: ...
 
     async def create_membership(self, *, group_id: int, user_id: int) -> MembershipInfo: ...
@@ -100,15 +134,16 @@ class GroupRepository(Protocol):
         join_secret: str | None,
         sprint_start_weekday: Weekday | None,
         sprint_duration_days: int | None,
+        sprint_period_end: date | None = None,
     ) -> GroupInfo: ...
 
     async def list_member_balances(self, group_id: int) -> dict[int, Decimal]: ...
 
     async def get_balance(self, *, group_id: int, user_id: int) -> Decimal: ...
 
-    async def apply_balance_delta(
-        self, *, group_id: int, user_id: int, amount_delta: Decimal
-    ) -> Decimal: ...
+    async def apply_balance_deltas(
+        self, *, group_id: int, deltas_by_user_id: Mapping[int, Decimal]
+    ) -> dict[int, Decimal]: ...
 
     async def transfer_balance(
         self,
@@ -130,6 +165,10 @@ class TaskRepository(Protocol):
         unit_cost: Decimal,
     ) -> TaskInfo: ...
 
+    async def create_tasks(
+        self, *, group_id: int, items: Sequence[TaskImportItem]
+    ) -> list[TaskInfo]: ...
+
     async def list_tasks(self, *, group_id: int, active_only: bool = True) -> list[TaskInfo]: ...
 
     async def list_tasks_by_ids(
@@ -152,39 +191,79 @@ class TaskRepository(Protocol):
         self, *, group_id: int, task_id: int, deleted_at: datetime
     ) -> None: ...
 
-    async def count_completed_in_window(
+    async def count_slots_in_window(
         self,
         *,
-        task_id: int,
+        group_id: int,
         window_start: datetime,
         window_end_exclusive: datetime,
-    ) -> int: ...
+        task_ids: Sequence[int] | None = None,
+    ) -> dict[int, TaskSlotCounts]: ...
 
-    async def count_pending_in_window(
+    async def seed_sprint_slots(
         self,
         *,
+        group_id: int,
         task_id: int,
+        period_start: date,
         window_start: datetime,
         window_end_exclusive: datetime,
-    ) -> int: ...
-
-    async def lock_task(self, *, group_id: int, task_id: int) -> TaskInfo: ...
+    ) -> None: ...
 
-    async def create_task_log(
+    async def complete_task(
         self,
         *,
         group_id: int,
         task_id: int,
         performer_user_id: int,
-        status: TaskLogStatus,
+        period_start: date,
         created_at: datetime,
-        approver_user_id: int | None = None,
-        decided_at: datetime | None = None,
-        rejection_reason: str | None = None,
-    ) -> TaskLogInfo: ...
+    ) -> TaskCompletionOutcome: ...
+
+    async def lock_sprint_slots(
+        self, *, keys: Sequence[tuple[int, date]]
+    ) -> dict[tuple[int, date], TaskSlotCounts]: ...
+
+    async def apply_sprint_slot_deltas(self, *, deltas: Sequence[SprintSlotDelta]) -> None: ...
+
+    async def confirm_sprint_slot(
+        self,
+        *,
+        task_id: int,
+        period_start: date,
+        frequency_per_sprint: int,
+        release_pending: bool,
+    ) -> bool: ...
+
+    async def release_sprint_slot(self, *, task_id: int, period_start: date) -> None: ...
+
+    async def clear_pending_sprint_slots(self, *, group_id: int) -> None: ...
+
+    async def apply_sprint_progress_deltas(
+        self, *, group_id: int, deltas: Sequence[SprintProgressDelta]
+    ) -> None: ...
+
+    async def clear_pending_sprint_progress(self, *, group_id: int) -> None: ...
+
+    async def list_sprint_progress(
+        self, *, group_id: int, period_start: date
+    ) -> dict[int, SprintProgressInfo]: ...
+
+    async def rebuild_sprint_progress(
+        self,
+        *,
+        group_id: int,
+        period_start: date,
+        window_start: datetime,
+        window_end_exclusive: datetime,
+    ) -> int: ...
 
     async def get_task_log(self, *, log_id: int) -> TaskLogInfo | None: ...
 
+    async def list_task_logs_by_ids(
+        self, *, group_id: int, log_ids: Sequence[int], for_update: bool = False
+    ) -> list[TaskLogInfo]: ...
+
     async def list_task_logs(
         self,
         *,
@@ -195,6 +274,7 @@ class TaskRepository(Protocol):
         statuses: Sequence[TaskLogStatus] | None = None,
         limit: int,
         offset: int,
+        before: KeysetCursor | None = None,
     ) -> Sequence[TaskLogInfo]: ...
 
     async def count_task_logs(
@@ -224,6 +304,27 @@ class TaskRepository(Protocol):
         rejection_reason: str,
     ) -> TaskLogInfo: ...
 
+    async def approve_task_logs(
+        self,
+        *,
+        log_ids: Sequence[int],
+        approver_user_id: int,
+        decided_at: datetime,
+    ) -> list[TaskLogInfo]: ...
+
+    async def reject_task_logs(
+        self,
+        *,
+        log_ids: Sequence[int],
+        approver_user_id: int,
+        decided_at: datetime,
+        rejection_reason: str,
+    ) -> list[TaskLogInfo]: ...
+
+    async def reject_pending_task_logs(
+        self, *, group_id: int, decided_at: datetime, rejection_reason: str
+    ) -> int: ...
+
     async def delete_task_log(self, *, log_id: int) -> None: ...
 
     async def list_completed_logs_in_window(
@@ -235,6 +336,14 @@ class TaskRepository(Protocol):
         window_end_exclusive: datetime,
     ) -> Sequence[TaskLogInfo]: ...
 
+    async def summarize_completed_logs_in_window(
+        self,
+        *,
+        group_id: int,
+        window_start: datetime,
+        window_end_exclusive: datetime,
+    ) -> list[TaskCompletionTotals]: ...
+
 
 class SprintRepository(Protocol):
     async def get_sprint_run(
@@ -245,6 +354,18 @@ class SprintRepository(Protocol):
         period_end: date,
     ) -> SprintRunInfo | None: ...
 
+    async def get_closed_sprint_run(
+        self, *, group_id: int, sprint_run_id: int
+    ) -> SprintRunInfo | None: ...
+
+    async def list_closed_sprint_runs(
+        self,
+        *,
+        group_id: int,
+        limit: int,
+        before: SprintRunCursor | None = None,
+    ) -> list[SprintRunInfo]: ...
+
     async def create_sprint_run(
         self,
         *,
@@ -274,6 +395,10 @@ class SprintRepository(Protocol):
         counterparty_user_id: int | None = None,
     ) -> None: ...
 
+    async def add_balance_transactions(
+        self, transactions: Sequence[BalanceTransactionDraft]
+    ) -> None: ...
+
     async def list_balance_transactions(
         self,
         *,
@@ -284,6 +409,59 @@ class SprintRepository(Protocol):
     ) -> tuple[list[BalanceTransactionInfo], int]: ...
 
 
+class LedgerRepository(Protocol):
+    async def get_reconciliation_checkpoint(self, group_id: int) -> LedgerCheckpointInfo | None: ...
+
+    async def save_reconciliation_checkpoint(self, checkpoint: LedgerCheckpointInfo) -> None: ...
+
+    async def find_settled_ledger_end(
+        self, *, group_id: int, after_id: int, settled_before: datetime
+    ) -> int | None: ...
+
+    def stream_ledger_entries(
+        self, *, group_id: int, after_id: int, through_id: int, chunk_size: int
+    ) -> AsyncIterator[list[LedgerEntry]]: ...
+
+    async def sum_transaction_groups(
+        self, transaction_group_ids: Sequence[UUID]
+    ) -> dict[UUID, Decimal]: ...
+
+    async def sum_user_ledger_after(
+        self, *, group_id: int, after_id: int
+    ) -> dict[int, Decimal]: ...
+
+    async def add_balance_checkpoints(
+        self, *, group_id: int, sprint_run_id: int, balances: Mapping[int, Decimal]
+    ) -> None: ...
+
+    async def get_latest_balance_checkpoint(
+        self, *, group_id: int, user_id: int, at: datetime
+    ) -> BalanceCheckpointInfo | None: ...
+
+    async def sum_user_ledger_between(
+        self, *, group_id: int, user_id: int, after: datetime | None, through: datetime
+    ) -> Decimal: ...
+
+
+class IdempotencyRepository(Protocol):
+    async def get(self, *, scope: str, actor_key: str, key: str) -> IdempotencyRecord | None: ...
+
+    async def claim(
+        self, ref: IdempotencyKeyRef, *, now: datetime, expires_at: datetime
+    ) -> bool: ...
+
+    async def complete(
+        self,
+        ref: IdempotencyKeyRef,
+        *,
+        response: StoredResponse,
+        completed_at: datetime,
+        expires_at: datetime,
+    ) -> None: ...
+
+    async def purge_expired(self, *, now: datetime, limit: int) -> int: ...
+
+
 class NotificationRepository(Protocol):
     async def enqueue(
         self,
@@ -307,10 +485,26 @@ class NotificationRepository(Protocol):
         deep_link_path: str | None,
     ) -> tuple[NotificationOutboxEventInfo, bool]: ...
 
+    async def enqueue_many(self, events: Sequence[NotificationOutboxEventDraft]) -> list[UUID]: ...
+
+    async def enqueue_many_once(
+        self, events: Sequence[NotificationOutboxEventDraft]
+    ) -> list[tuple[UUID, bool]]: ...
+
     async def list_ready(
         self, *, now: datetime, limit: int
     ) -> list[NotificationOutboxEventInfo]: ...
 
+    async def claim_ready(
+        self,
+        *,
+        now: datetime,
+        limit: int,
+        oldest_first: int,
+        lease_owner: str,
+        lease_expires_at: datetime,
+    ) -> list[NotificationOutboxEventInfo]: ...
+
     async def acknowledge(
         self,
         *,
@@ -328,6 +522,14 @@ class NotificationRepository(Protocol):
         terminal: bool,
     ) -> NotificationOutboxEventInfo: ...
 
+    async def acknowledge_many(
+        self, *, event_ids: Sequence[UUID], acknowledged_at: datetime
+    ) -> int: ...
+
+    async def fail_many(
+        self, *, failures: Sequence[NotificationFailure], failed_at: datetime
+    ) -> int: ...
+
 
 class UnitOfWork(Protocol):
     @property
@@ -345,6 +547,14 @@ class UnitOfWork(Protocol):
     @property
     def notifications(self) -> NotificationRepository: ...
 
+    @property
+    def ledger(self) -> LedgerRepository: ...
+
+    @property
+    def idempotency(self) -> IdempotencyRepository: ...
+
     async def commit(self) -> None: ...
 
     async def rollback(self) -> None: ...
+
+    def single_commit(self) -> AbstractAsyncContextManager[None]: ...
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from collections import defaultdict
+from datetime import timedelta
 from decimal import Decimal
 from uuid import uuid4
 
@@ -8,16 +9,22 @@ from db.enums import (
     BalanceTransactionAccountType,
     BalanceTransactionType,
     SprintRunStatus,
-    TaskLogStatus,
 )
 
 from unitkeeper_backend.application.models import (
+    BalanceTransactionDraft,
     CompletedTaskBreakdownItem,
     GroupProgressInfo,
     SprintMemberResultInfo,
+    SprintRunCursor,
     SprintRunInfo,
+    SprintRunPage,
     TempResults,
 )
+from unitkeeper_backend.application.pagination import (
+    decode_sprint_run_cursor,
+    encode_sprint_run_cursor,
+)
 from unitkeeper_backend.application.ports import Clock, UnitOfWork
 from unitkeeper_backend.domain.errors import BusinessRuleViolation, NotFoundError
 from unitkeeper_backend.domain.services.sprint_math import (
@@ -58,53 +65,50 @@ class SprintService:
         planned = planned_units(
             total_task_units=total_task_units, weight_percent=membership.weight_percent
         )
-        logs = await self._uow.tasks.list_completed_logs_in_window(
-            group_id=group_id,
-            performer_user_id=None,
-            window_start=window.starts_at,
-            window_end_exclusive=window.ends_before,
-        )
         task_by_id = {task.id: task for task in tasks}
-        completed = ZERO
-        group_completed = ZERO
-        counters: dict[tuple[int, int], int] = defaultdict(int)
-        for log in logs:
-            task = task_by_id.get(log.task_id)
-            if task is None:
-                continue
-            group_completed += task.unit_cost
-            counters[(task.id, log.performer_user_id)] += 1
-            if log.performer_user_id == user_id:
-                completed += task.unit_cost
+        totals = [
+            item
+            for item in await self._uow.tasks.summarize_completed_logs_in_window(
+                group_id=group_id,
+                window_start=window.starts_at,
+                window_end_exclusive=window.ends_before,
+            )
+            if item.task_id in task_by_id
+        ]
+        group_completed = sum((item.completed_units for item in totals), start=ZERO)
+        completed = sum(
+            (item.completed_units for item in totals if item.performer_user_id == user_id),
+            start=ZERO,
+        )
 
         performers = await self._uow.users.list_by_ids(
-            sorted({performer_id for _, performer_id in counters})
+            sorted({item.performer_user_id for item in totals})
         )
         performer_by_id = {performer.id: performer for performer in performers}
 
         breakdown = [
             CompletedTaskBreakdownItem(
-                task_id=task_id,
-                title=task_by_id[task_id].title,
-                completed_count=count,
-                completed_units=quantize(task_by_id[task_id].unit_cost * count),
-                performer_user_id=performer_id,
-                performer_first_name=performer_by_id[performer_id].first_name
-                if performer_id in performer_by_id
+                task_id=item.task_id,
+                title=task_by_id[item.task_id].title,
+                completed_count=item.completed_count,
+                completed_units=quantize(item.completed_units),
+                performer_user_id=item.performer_user_id,
+                performer_first_name=performer_by_id[item.performer_user_id].first_name
+                if item.performer_user_id in performer_by_id
                 else None,
-                performer_username=performer_by_id[performer_id].username
-                if performer_id in performer_by_id
+                performer_username=performer_by_id[item.performer_user_id].username
+                if item.performer_user_id in performer_by_id
                 else None,
             )
-            for (task_id, performer_id), count in sorted(
-                counters.items(),
+            for item in sorted(
+                totals,
                 key=lambda item: (
-                    task_by_id[item[0][0]].title.lower(),
-                    item[0][1] != user_id,
-                    performer_by_id[item[0][1]].first_name
-                    or performer_by_id[item[0][1]].username
+                    task_by_id[item.task_id].title.lower(),
+                    item.performer_user_id != user_id,
+                    performer_by_id[item.performer_user_id].first_name
+                    or performer_by_id[item.performer_user_id].username
                     or ""
-                    if item[0][1] in performer_by_id
+                    if item.performer_user_id in performer_by_id
                     else "",
                 ),
             )
@@ -128,6 +132,33 @@ class SprintService:
             group=group_progress,
         )
 
+    async def list_sprint_history(
+        self, *, group_id: int, limit: int, cursor: str | None = None
+    ) -> SprintRunPage:
+        """Page through closed sprints newest first, as stored when they closed."""
+        before = decode_sprint_run_cursor(cursor) if cursor is not None else None
+        runs = await self._uow.sprints.list_closed_sprint_runs(
+            group_id=group_id, limit=limit + 1, before=before
+        )
+        has_more = len(runs) > limit
+        runs = runs[:limit]
+        next_cursor = (
+            encode_sprint_run_cursor(
+                SprintRunCursor(period_start=runs[-1].period_start, id=runs[-1].id)
+            )
+            if has_more
+            else None
+        )
+        return SprintRunPage(items=runs, limit=limit, has_more=has_more, next_cursor=next_cursor)
+
+    async def get_sprint_history(self, *, group_id: int, sprint_run_id: int) -> SprintRunInfo:
+        sprint_run = await self._uow.sprints.get_closed_sprint_run(
+            group_id=group_id, sprint_run_id=sprint_run_id
+        )
+        if sprint_run is None:
+            raise NotFoundError("Sprint was not found")
+        return sprint_run
+
     async def close_current_sprint(self, *, group_id: int) -> SprintRunInfo:
         group = await self._uow.groups.get_by_id(group_id)
         if group is None:
@@ -161,19 +192,14 @@ class SprintService:
         # Any log still pending when a sprint closes belongs to the window
         # that's ending (nothing for the next window can exist yet). Auto-reject
         # it so it can't later be approved into a future sprint's stats.
-        pending_logs = await self._uow.tasks.list_task_logs(
+        rejected_count = await self._uow.tasks.reject_pending_task_logs(
             group_id=group_id,
-            statuses=[TaskLogStatus.PENDING],
-            limit=10_000,
-            offset=0,
+            decided_at=self._clock.now(),
+            rejection_reason="Спринт закрылся без подтверждения",
         )
-        for pending_log in pending_logs:
-            await self._uow.tasks.reject_task_log(
-                log_id=pending_log.id,
-                approver_user_id=None,
-                decided_at=self._clock.now(),
-                rejection_reason="Спринт закрылся без подтверждения",
-            )
+        if rejected_count:
+            await self._uow.tasks.clear_pending_sprint_slots(group_id=group_id)
+            await self._uow.tasks.clear_pending_sprint_progress(group_id=group_id)
 
         task_by_id = {task.id: task for task in tasks}
         completed_by_user: dict[int, Decimal] = defaultdict(lambda: ZERO)
@@ -193,8 +219,9 @@ class SprintService:
             if total_completed >= total_task_units and total_task_units > ZERO
             else ZERO
         )
+        # Results are computed first so balances are moved with one statement;
+        # ``balance_after`` is filled in from what that statement returns.
         member_results: list[SprintMemberResultInfo] = []
-
         for membership in sorted(memberships, key=lambda item: item.user_id):
             weight = membership.weight_percent or ZERO
             planned_for_user = planned_units(
@@ -206,11 +233,6 @@ class SprintService:
             )
             bonus_for_user = planned_units(total_task_units=bonus_units, weight_percent=weight)
             balance_delta = quantize(completed_for_user - planned_for_user + bonus_for_user)
-            balance_after = await self._uow.groups.apply_balance_delta(
-                group_id=group_id,
-                user_id=membership.user_id,
-                amount_delta=balance_delta,
-            )
             member_results.append(
                 SprintMemberResultInfo(
                     user_id=membership.user_id,
@@ -219,9 +241,15 @@ class SprintService:
                     efficiency_percent=efficiency,
                     bonus_units=bonus_for_user,
                     balance_delta=balance_delta,
-                    balance_after=balance_after,
+                    balance_after=ZERO,
                 )
             )
+        balances = await self._uow.groups.apply_balance_deltas(
+            group_id=group_id,
+            deltas_by_user_id={item.user_id: item.balance_delta for item in member_results},
+        )
+        for item in member_results:
+            item.balance_after = balances[item.user_id]
 
         total_planned = sum((item.planned_units for item in member_results), start=ZERO)
         balance_delta = quantize(total_completed - total_planned)
@@ -238,25 +266,36 @@ class SprintService:
             closed_at=self._clock.now(),
             member_results=member_results,
         )
+        await self._uow.ledger.add_balance_checkpoints(
+            group_id=group_id,
+            sprint_run_id=sprint_run.id,
+            balances={item.user_id: item.balance_after for item in member_results},
+        )
+        # The closed window is done with; the close job looks for the next one.
+        await self._uow.groups.set_sprint_period_end(
+            group_id=group_id,
+            period_end=window.period_end + timedelta(days=group.sprint_duration_days),
+        )
         pool_amount = sum((item.balance_delta for item in member_results), start=ZERO)
         if pool_amount != ZERO or any(item.balance_delta != ZERO for item in member_results):
             settlement_group_id = uuid4()
             description = f"Sprint settlement for {window.period_start}..{window.period_end}"
+            entries: list[BalanceTransactionDraft] = []
             if pool_amount != ZERO:
-                await self._uow.sprints.add_balance_transaction(
-                    group_id=group_id,
-                    user_id=None,
-                    account_type=BalanceTransactionAccountType.GROUP_POOL,
-                    transaction_type=BalanceTransactionType.SPRINT_SETTLEMENT,
-                    amount_delta=-pool_amount,
-                    description=description,
-                    transaction_group_id=settlement_group_id,
-                    sprint_run_id=sprint_run.id,
+                entries.append(
+                    BalanceTransactionDraft(
+                        group_id=group_id,
+                        user_id=None,
+                        account_type=BalanceTransactionAccountType.GROUP_POOL,
+                        transaction_type=BalanceTransactionType.SPRINT_SETTLEMENT,
+                        amount_delta=-pool_amount,
+                        description=description,
+                        transaction_group_id=settlement_group_id,
+                        sprint_run_id=sprint_run.id,
+                    )
                 )
-            for item in member_results:
-                if item.balance_delta == ZERO:
-                    continue
-                await self._uow.sprints.add_balance_transaction(
+            entries.extend(
+                BalanceTransactionDraft(
                     group_id=group_id,
                     user_id=item.user_id,
                     account_type=BalanceTransactionAccountType.USER,
@@ -266,5 +305,9 @@ class SprintService:
                     transaction_group_id=settlement_group_id,
                     sprint_run_id=sprint_run.id,
                 )
+                for item in member_results
+                if item.balance_delta != ZERO
+            )
+            await self._uow.sprints.add_balance_transactions(entries)
         await self._uow.commit()
         return sprint_run
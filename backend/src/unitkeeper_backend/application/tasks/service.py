@@ -1,29 +1,39 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
-from dataclasses import dataclass
+from collections.abc import Awaitable, Callable, Sequence
+from datetime import date, timezone
 from decimal import Decimal, InvalidOperation
 
 from db.enums import NotificationEventType, TaskLogStatus
 
-from unitkeeper_backend.application.models import TaskInfo, TaskLogInfo, TaskLogPage, TaskLogView
+from unitkeeper_backend.application.models import (
+    GroupInfo,
+    KeysetCursor,
+    MembershipInfo,
+    NotificationOutboxEventDraft,
+    SprintProgressDelta,
+    SprintSlotDelta,
+    TaskCompletionOutcome,
+    TaskImportItem,
+    TaskInfo,
+    TaskLogBatchItem,
+    TaskLogInfo,
+    TaskLogPage,
+    TaskLogView,
+    TaskSlotCounts,
+)
+from unitkeeper_backend.application.pagination import decode_cursor, encode_cursor
 from unitkeeper_backend.application.ports import Clock, UnitOfWork
 from unitkeeper_backend.domain.errors import (
     AuthorizationError,
     BusinessRuleViolation,
+    DomainError,
     NotFoundError,
     ValidationError,
 )
 from unitkeeper_backend.domain.services.sprint_math import SprintWindow, current_sprint_window
 
 
-@dataclass(slots=True)
-class TaskImportItem:
-    title: str
-    frequency_per_sprint: int
-    unit_cost: Decimal
-
-
 class TaskService:
     def __init__(self, *, uow: UnitOfWork, clock: Clock) -> None:
         self._uow = uow
@@ -81,6 +91,8 @@ class TaskService:
             frequency_per_sprint=frequency_per_sprint,
             unit_cost=unit_cost,
         )
+        if unit_cost is not None:
+            await self._rebuild_current_progress(group_id)
         await self._uow.commit()
         return await self.get_task(group_id=group_id, task_id=task.id)
 
@@ -107,17 +119,11 @@ class TaskService:
         if errors:
             raise ValidationError("Task import contains invalid rows", details={"errors": errors})
 
-        created: list[TaskInfo] = []
-        for item in normalized:
-            task = await self._uow.tasks.create_task(
-                group_id=group_id,
-                title=item.title,
-                frequency_per_sprint=item.frequency_per_sprint,
-                unit_cost=item.unit_cost,
-            )
-            created.append(task)
+        # Freshly inserted tasks cannot have logs yet, so their sprint counts are
+        # already zero and there is nothing to attach.
+        created = await self._uow.tasks.create_tasks(group_id=group_id, items=normalized)
         await self._uow.commit()
-        return await self._attach_remaining_counts(group_id=group_id, tasks=created)
+        return created
 
     async def adjust_frequency(self, *, group_id: int, task_id: int, delta: int) -> TaskInfo:
         if delta == 0:
@@ -143,74 +149,88 @@ class TaskService:
             task_id=task_id,
             deleted_at=self._clock.now(),
         )
+        await self._rebuild_current_progress(group_id)
         await self._uow.commit()
 
     async def mark_done(
         self, *, group_id: int, performer_user_id: int, task_id: int
     ) -> TaskLogInfo:
-        if (
-            await self._uow.groups.get_active_membership_in_group(
-                group_id=group_id, user_id=performer_user_id
-            )
-            is None
-        ):
-            raise AuthorizationError("Performer is not an active group member")
-        task = await self.get_task(group_id=group_id, task_id=task_id)
-        if not task.is_active:
-            raise BusinessRuleViolation("Soft-deleted tasks cannot be completed")
-
-        # Lock the task row so concurrent completions cannot both slip past the
-        # sprint cap. Every open completion — confirmed or still pending —
-        # consumes a slot, so you can mark a task only as many times as remain
-        # available this sprint.
-        await self._uow.tasks.lock_task(group_id=group_id, task_id=task_id)
         window = await self._current_window(group_id)
-        completed_count = await self._uow.tasks.count_completed_in_window(
-            task_id=task_id,
-            window_start=window.starts_at,
-            window_end_exclusive=window.ends_before,
+        log = await self._complete_task(
+            group_id=group_id, performer_user_id=performer_user_id, task_id=task_id, window=window
         )
-        pending_count = await self._uow.tasks.count_pending_in_window(
-            task_id=task_id,
-            window_start=window.starts_at,
-            window_end_exclusive=window.ends_before,
-        )
-        if completed_count + pending_count >= task.frequency_per_sprint:
-            raise BusinessRuleViolation("Task frequency limit for the current sprint is exhausted")
+        await self._uow.commit()
+        return log
 
-        memberships = await self._uow.groups.list_active_memberships(group_id)
-        status = TaskLogStatus.COMPLETED if len(memberships) == 1 else TaskLogStatus.PENDING
-        approver_user_id = performer_user_id if status is TaskLogStatus.COMPLETED else None
-        decided_at = self._clock.now() if status is TaskLogStatus.COMPLETED else None
-        log = await self._uow.tasks.create_task_log(
-            group_id=group_id,
-            task_id=task_id,
-            performer_user_id=performer_user_id,
-            status=status,
-            created_at=self._clock.now(),
-            approver_user_id=approver_user_id,
-            decided_at=decided_at,
-        )
-        if status is TaskLogStatus.PENDING:
-            for membership in memberships:
-                if membership.user_id == performer_user_id:
-                    continue
-                await self._uow.notifications.enqueue(
-                    event_type=NotificationEventType.TASK_APPROVAL_REQUESTED,
-                    recipient_user_id=membership.user_id,
+    async def mark_done_many(
+        self, *, group_id: int, performer_user_id: int, task_ids: Sequence[int]
+    ) -> list[TaskLogBatchItem]:
+        """Mark several tasks done in one transaction, reporting each item's outcome.
+
+        A task listed twice is marked twice, as two separate calls would do.
+        """
+        window = await self._current_window(group_id)
+        results: list[TaskLogBatchItem] = []
+        for task_id in task_ids:
+            result = TaskLogBatchItem(id=task_id)
+            try:
+                result.log = await self._complete_task(
                     group_id=group_id,
-                    payload={
-                        "task_log_id": log.id,
-                        "task_title": task.title,
-                        "performer_user_id": performer_user_id,
-                    },
-                    deep_link_path=f"/tasks/history?task_log_id={log.id}",
+                    performer_user_id=performer_user_id,
+                    task_id=task_id,
+                    window=window,
                 )
+            except DomainError as error:
+                self._record_failure(result, error)
+            results.append(result)
         await self._uow.commit()
-        return log
+        return results
+
+    async def _complete_task(
+        self, *, group_id: int, performer_user_id: int, task_id: int, window: SprintWindow
+    ) -> TaskLogInfo:
+        # Every open completion — confirmed or still pending — consumes a slot,
+        # so you can mark a task only as many times as remain available this
+        # sprint. The repository checks the performer and the task, reserves
+        # the slot on the sprint's counter row (whose row lock serialises
+        # concurrent completions), inserts the log and fans out approval
+        # requests in a single statement.
+        async def complete() -> TaskCompletionOutcome:
+            return await self._uow.tasks.complete_task(
+                group_id=group_id,
+                task_id=task_id,
+                performer_user_id=performer_user_id,
+                period_start=window.period_start,
+                created_at=self._clock.now(),
+            )
+
+        outcome = await complete()
+        passed_guards = outcome.performer_is_member and outcome.task_found and outcome.task_active
+        if outcome.log is None and passed_guards and not outcome.slot_row_exists:
+            # Nobody has touched the task this sprint yet: seed the counter row
+            # from the logs and retry once.
+            await self._uow.tasks.seed_sprint_slots(
+                group_id=group_id,
+                task_id=task_id,
+                period_start=window.period_start,
+                window_start=window.starts_at,
+                window_end_exclusive=window.ends_before,
+            )
+            outcome = await complete()
+        if not outcome.performer_is_member:
+            raise AuthorizationError("Performer is not an active group member")
+        if not outcome.task_found:
+            raise NotFoundError("Task was not found")
+        if not outcome.task_active:
+            raise BusinessRuleViolation("Soft-deleted tasks cannot be completed")
+        if outcome.log is None:
+            raise BusinessRuleViolation("Task frequency limit for the current sprint is exhausted")
+        return outcome.log
 
     async def approve(self, *, group_id: int, approver_user_id: int, log_id: int) -> TaskLogInfo:
-        log = await self._require_pending_log(group_id=group_id, log_id=log_id)
+        group = await self._require_group(group_id)
+        window = self._sprint_window(group, self._clock.today())
+        log = await self._lock_pending_log(group=group, log_id=log_id, current_window=window)
         memberships = await self._uow.groups.list_active_memberships(group_id)
         if len(memberships) > 1 and approver_user_id == log.performer_user_id:
             raise AuthorizationError("Performer cannot self-approve in a multi-member group")
@@ -222,15 +242,34 @@ class TaskService:
         ):
             raise AuthorizationError("Approver is not an active group member")
 
-        task = await self.get_task(group_id=group_id, task_id=log.task_id)
-        window = await self._current_window(group_id)
-        completed_count = await self._uow.tasks.count_completed_in_window(
-            task_id=task.id,
-            window_start=window.starts_at,
-            window_end_exclusive=window.ends_before,
+        task = await self._require_task(group_id=group_id, task_id=log.task_id)
+        log_window = self._log_window(group, log)
+        # The log moves from pending to completed. When it was marked in an
+        # earlier sprint, its pending slot is released there and the completed
+        # slot is taken in the current one.
+        same_window = log_window == window
+        await self._claim_slot(
+            task=task,
+            window=window,
+            claim=lambda: self._uow.tasks.confirm_sprint_slot(
+                task_id=task.id,
+                period_start=window.period_start,
+                frequency_per_sprint=task.frequency_per_sprint,
+                release_pending=same_window,
+            ),
+        )
+        if not same_window:
+            await self._uow.tasks.release_sprint_slot(
+                task_id=task.id, period_start=log_window.period_start
+            )
+        progress: dict[tuple[int, int, date], SprintProgressDelta] = {}
+        self._add_progress_delta(progress, log=log, period_start=window.period_start, completed=1)
+        self._add_progress_delta(
+            progress, log=log, period_start=log_window.period_start, pending=-1
+        )
+        await self._uow.tasks.apply_sprint_progress_deltas(
+            group_id=group_id, deltas=list(progress.values())
         )
-        if completed_count >= task.frequency_per_sprint:
-            raise BusinessRuleViolation("Task frequency limit for the current sprint is exhausted")
 
         updated = await self._uow.tasks.approve_task_log(
             log_id=log_id,
@@ -261,7 +300,9 @@ class TaskService:
     ) -> TaskLogInfo:
         if not rejection_reason.strip():
             raise ValidationError("Rejection reason is required")
-        log = await self._require_pending_log(group_id=group_id, log_id=log_id)
+        log = await self._lock_pending_log(
+            group=await self._require_group(group_id), log_id=log_id, current_window=None
+        )
         memberships = await self._uow.groups.list_active_memberships(group_id)
         if len(memberships) > 1 and approver_user_id == log.performer_user_id:
             raise AuthorizationError("Performer cannot self-reject in a multi-member group")
@@ -272,13 +313,14 @@ class TaskService:
             is None
         ):
             raise AuthorizationError("Rejector is not an active group member")
+        task = await self._require_task(group_id=group_id, task_id=log.task_id)
+        await self._release_pending_slot(log)
         updated = await self._uow.tasks.reject_task_log(
             log_id=log_id,
             approver_user_id=approver_user_id,
             decided_at=self._clock.now(),
             rejection_reason=rejection_reason.strip(),
         )
-        task = await self.get_task(group_id=group_id, task_id=updated.task_id)
         await self._uow.notifications.enqueue(
             event_type=NotificationEventType.TASK_REJECTED,
             recipient_user_id=updated.performer_user_id,
@@ -294,11 +336,174 @@ class TaskService:
         await self._uow.commit()
         return updated
 
+    async def approve_many(
+        self, *, group_id: int, approver_user_id: int, log_ids: Sequence[int]
+    ) -> list[TaskLogBatchItem]:
+        """Approve several pending logs in one transaction, reporting each log's outcome.
+
+        Shared state — memberships, the group, the logs, their tasks and the
+        sprint counter rows — is loaded once, and the accepted logs are
+        written with one set-based update.
+        """
+        memberships = await self._require_reviewer(
+            group_id=group_id,
+            user_id=approver_user_id,
+            message="Approver is not an active group member",
+        )
+        group = await self._require_group(group_id)
+        window = self._sprint_window(group, self._clock.today())
+        results = {log_id: TaskLogBatchItem(id=log_id) for log_id in log_ids}
+        logs, tasks, slots = await self._lock_review_batch(
+            group=group, log_ids=list(results), current_window=window
+        )
+
+        deltas: dict[tuple[int, date], SprintSlotDelta] = {}
+        progress: dict[tuple[int, int, date], SprintProgressDelta] = {}
+        accepted: list[TaskLogInfo] = []
+        for log_id, result in results.items():
+            try:
+                log = self._reviewable_log(logs.get(log_id))
+                if len(memberships) > 1 and approver_user_id == log.performer_user_id:
+                    raise AuthorizationError(
+                        "Performer cannot self-approve in a multi-member group"
+                    )
+                task = tasks.get(log.task_id)
+                if task is None:
+                    raise NotFoundError("Task was not found")
+                slot = slots.get((task.id, window.period_start))
+                if slot is None or slot.completed >= task.frequency_per_sprint:
+                    raise BusinessRuleViolation(
+                        "Task frequency limit for the current sprint is exhausted"
+                    )
+            except DomainError as error:
+                self._record_failure(result, error)
+                continue
+            # Same slot moves as a single approval: take a completed slot now
+            # and release the pending one in the window the log was marked in.
+            log_period = self._log_window(group, log).period_start
+            slot.completed += 1
+            self._add_slot_delta(
+                deltas, task_id=task.id, period_start=window.period_start, completed=1
+            )
+            if log_period == window.period_start:
+                slot.pending = max(slot.pending - 1, 0)
+            self._add_slot_delta(deltas, task_id=task.id, period_start=log_period, pending=-1)
+            self._add_progress_delta(
+                progress, log=log, period_start=window.period_start, completed=1
+            )
+            self._add_progress_delta(progress, log=log, period_start=log_period, pending=-1)
+            accepted.append(log)
+
+        await self._uow.tasks.apply_sprint_slot_deltas(deltas=list(deltas.values()))
+        await self._uow.tasks.apply_sprint_progress_deltas(
+            group_id=group_id, deltas=list(progress.values())
+        )
+        approved = await self._uow.tasks.approve_task_logs(
+            log_ids=[log.id for log in accepted],
+            approver_user_id=approver_user_id,
+            decided_at=self._clock.now(),
+        )
+        for updated in approved:
+            results[updated.id].log = updated
+        await self._uow.notifications.enqueue_many(
+            [
+                NotificationOutboxEventDraft(
+                    event_type=NotificationEventType.TASK_APPROVED,
+                    recipient_user_id=updated.performer_user_id,
+                    group_id=group_id,
+                    payload={
+                        "task_log_id": updated.id,
+                        "task_title": tasks[updated.task_id].title,
+                        "approver_user_id": approver_user_id,
+                    },
+                    deep_link_path=f"/tasks/history?task_log_id={updated.id}",
+                )
+                for updated in approved
+            ]
+        )
+        await self._uow.commit()
+        return list(results.values())
+
+    async def reject_many(
+        self,
+        *,
+        group_id: int,
+        approver_user_id: int,
+        log_ids: Sequence[int],
+        rejection_reason: str,
+    ) -> list[TaskLogBatchItem]:
+        """Reject several pending logs with one reason, reporting each log's outcome."""
+        if not rejection_reason.strip():
+            raise ValidationError("Rejection reason is required")
+        memberships = await self._require_reviewer(
+            group_id=group_id,
+            user_id=approver_user_id,
+            message="Rejector is not an active group member",
+        )
+        group = await self._require_group(group_id)
+        results = {log_id: TaskLogBatchItem(id=log_id) for log_id in log_ids}
+        logs, tasks, _ = await self._lock_review_batch(
+            group=group, log_ids=list(results), current_window=None
+        )
+
+        deltas: dict[tuple[int, date], SprintSlotDelta] = {}
+        progress: dict[tuple[int, int, date], SprintProgressDelta] = {}
+        accepted: list[TaskLogInfo] = []
+        for log_id, result in results.items():
+            try:
+                log = self._reviewable_log(logs.get(log_id))
+                if len(memberships) > 1 and approver_user_id == log.performer_user_id:
+                    raise AuthorizationError("Performer cannot self-reject in a multi-member group")
+                if log.task_id not in tasks:
+                    raise NotFoundError("Task was not found")
+            except DomainError as error:
+                self._record_failure(result, error)
+                continue
+            log_period = self._log_window(group, log).period_start
+            self._add_slot_delta(deltas, task_id=log.task_id, period_start=log_period, pending=-1)
+            self._add_progress_delta(progress, log=log, period_start=log_period, pending=-1)
+            accepted.append(log)
+
+        await self._uow.tasks.apply_sprint_slot_deltas(deltas=list(deltas.values()))
+        await self._uow.tasks.apply_sprint_progress_deltas(
+            group_id=group_id, deltas=list(progress.values())
+        )
+        rejected = await self._uow.tasks.reject_task_logs(
+            log_ids=[log.id for log in accepted],
+            approver_user_id=approver_user_id,
+            decided_at=self._clock.now(),
+            rejection_reason=rejection_reason.strip(),
+        )
+        for updated in rejected:
+            results[updated.id].log = updated
+        await self._uow.notifications.enqueue_many(
+            [
+                NotificationOutboxEventDraft(
+                    event_type=NotificationEventType.TASK_REJECTED,
+                    recipient_user_id=updated.performer_user_id,
+                    group_id=group_id,
+                    payload={
+                        "task_log_id": updated.id,
+                        "task_title": tasks[updated.task_id].title,
+                        "approver_user_id": approver_user_id,
+                        "rejection_reason": updated.rejection_reason or "",
+                    },
+                    deep_link_path=f"/tasks/history?task_log_id={updated.id}",
+                )
+                for updated in rejected
+            ]
+        )
+        await self._uow.commit()
+        return list(results.values())
+
     async def cancel(self, *, group_id: int, performer_user_id: int, log_id: int) -> None:
         """Let a performer undo their own pending mark before anyone reviews it."""
-        log = await self._require_pending_log(group_id=group_id, log_id=log_id)
+        log = await self._lock_pending_log(
+            group=await self._require_group(group_id), log_id=log_id, current_window=None
+        )
         if log.performer_user_id != performer_user_id:
             raise AuthorizationError("Only the performer can cancel their own pending log")
+        await self._release_pending_slot(log)
         await self._uow.tasks.delete_task_log(log_id=log_id)
         await self._uow.commit()
 
@@ -309,6 +514,8 @@ class TaskService:
         user_id: int,
         limit: int,
         offset: int,
+        cursor: str | None = None,
+        include_total: bool | None = None,
     ) -> TaskLogPage:
         """Return pending logs this member may review, never their own logs."""
         await self._require_active_member(group_id=group_id, user_id=user_id)
@@ -318,6 +525,8 @@ class TaskService:
             statuses=[TaskLogStatus.PENDING],
             limit=limit,
             offset=offset,
+            cursor=cursor,
+            include_total=include_total,
         )
 
     async def list_my_task_logs(
@@ -329,6 +538,8 @@ class TaskService:
         statuses: list[TaskLogStatus] | None,
         limit: int,
         offset: int,
+        cursor: str | None = None,
+        include_total: bool | None = None,
     ) -> TaskLogPage:
         await self._require_active_member(group_id=group_id, user_id=user_id)
         return await self._list_log_page(
@@ -338,6 +549,8 @@ class TaskService:
             statuses=statuses,
             limit=limit,
             offset=offset,
+            cursor=cursor,
+            include_total=include_total,
         )
 
     async def list_group_task_logs(
@@ -350,6 +563,8 @@ class TaskService:
         statuses: list[TaskLogStatus] | None,
         limit: int,
         offset: int,
+        cursor: str | None = None,
+        include_total: bool | None = None,
     ) -> TaskLogPage:
         await self._require_active_member(group_id=group_id, user_id=user_id)
         return await self._list_log_page(
@@ -359,6 +574,8 @@ class TaskService:
             statuses=statuses,
             limit=limit,
             offset=offset,
+            cursor=cursor,
+            include_total=include_total,
         )
 
     async def get_task_log_view(self, *, group_id: int, user_id: int, log_id: int) -> TaskLogView:
@@ -374,32 +591,59 @@ class TaskService:
         group_id: int,
         limit: int,
         offset: int,
+        cursor: str | None = None,
+        include_total: bool | None = None,
         performer_user_id: int | None = None,
         exclude_performer_user_id: int | None = None,
         task_id: int | None = None,
         statuses: list[TaskLogStatus] | None = None,
     ) -> TaskLogPage:
-        logs = await self._uow.tasks.list_task_logs(
-            group_id=group_id,
-            performer_user_id=performer_user_id,
-            exclude_performer_user_id=exclude_performer_user_id,
-            task_id=task_id,
-            statuses=statuses,
-            limit=limit,
-            offset=offset,
+        """Fetch one newest-first page of logs.
+
+        ``cursor`` continues after the last row of a previous page and cannot be
+        combined with ``offset``. The total is counted for offset pages unless
+        ``include_total`` is false, and for cursor pages only when it is true.
+        """
+        if cursor is not None and offset:
+            raise ValidationError("Use either offset or cursor pagination, not both")
+        before = decode_cursor(cursor) if cursor is not None else None
+        logs = list(
+            await self._uow.tasks.list_task_logs(
+                group_id=group_id,
+                performer_user_id=performer_user_id,
+                exclude_performer_user_id=exclude_performer_user_id,
+                task_id=task_id,
+                statuses=statuses,
+                limit=limit + 1,
+                offset=offset,
+                before=before,
+            )
         )
-        total = await self._uow.tasks.count_task_logs(
-            group_id=group_id,
-            performer_user_id=performer_user_id,
-            exclude_performer_user_id=exclude_performer_user_id,
-            task_id=task_id,
-            statuses=statuses,
+        has_more = len(logs) > limit
+        logs = logs[:limit]
+        if include_total is None:
+            include_total = cursor is None
+        total: int | None = None
+        if include_total:
+            total = await self._uow.tasks.count_task_logs(
+                group_id=group_id,
+                performer_user_id=performer_user_id,
+                exclude_performer_user_id=exclude_performer_user_id,
+                task_id=task_id,
+                statuses=statuses,
+            )
+        next_cursor = (
+            encode_cursor(KeysetCursor(created_at=logs[-1].created_at, id=logs[-1].id))
+            if has_more
+            else None
         )
         return TaskLogPage(
             items=await self._build_log_views(logs),
             total=total,
             limit=limit,
             offset=offset,
+            has_more=has_more,
+            next_cursor=next_cursor,
         )
 
     async def _build_log_views(self, logs: Sequence[TaskLogInfo]) -> list[TaskLogView]:
@@ -457,18 +701,15 @@ class TaskService:
         if not tasks:
             return tasks
         window = await self._current_window(group_id)
+        counts = await self._uow.tasks.count_slots_in_window(
+            group_id=group_id,
+            window_start=window.starts_at,
+            window_end_exclusive=window.ends_before,
+            task_ids=[task.id for task in tasks],
+        )
         updated: list[TaskInfo] = []
         for task in tasks:
-            completed = await self._uow.tasks.count_completed_in_window(
-                task_id=task.id,
-                window_start=window.starts_at,
-                window_end_exclusive=window.ends_before,
-            )
-            pending = await self._uow.tasks.count_pending_in_window(
-                task_id=task.id,
-                window_start=window.starts_at,
-                window_end_exclusive=window.ends_before,
-            )
+            slots = counts.get(task.id, TaskSlotCounts())
             updated.append(
                 TaskInfo(
                     id=task.id,
@@ -477,31 +718,199 @@ class TaskService:
                     frequency_per_sprint=task.frequency_per_sprint,
                     unit_cost=task.unit_cost,
                     deleted_at=task.deleted_at,
-                    completed_in_sprint=completed,
-                    pending_in_sprint=pending,
+                    completed_in_sprint=slots.completed,
+                    pending_in_sprint=slots.pending,
                 )
             )
         return updated
 
     async def _current_window(self, group_id: int) -> SprintWindow:
-        group = await self._uow.groups.get_by_id(group_id)
+        group = await self._require_group(group_id)
+        return self._sprint_window(group, self._clock.today())
+
+    async def _rebuild_current_progress(self, group_id: int) -> None:
+        # Progress rows value logs at the task's unit cost and skip deleted
+        # tasks, so a change to either invalidates the whole window's totals.
+        window = await self._current_window(group_id)
+        await self._uow.tasks.rebuild_sprint_progress(
+            group_id=group_id,
+            period_start=window.period_start,
+            window_start=window.starts_at,
+            window_end_exclusive=window.ends_before,
+        )
+
+    async def _require_group(self, group_id: int) -> GroupInfo:
+        group = await self._uow.groups.get_by_id(group_id, include_members=False)
         if group is None:
             raise NotFoundError("Group was not found")
-        return current_sprint_window(
-            today=self._clock.today(),
-            start_weekday=group.sprint_start_weekday,
-            duration_days=group.sprint_duration_days,
-            anchor=group.created_at,
+        return group
+
+    async def _require_task(self, *, group_id: int, task_id: int) -> TaskInfo:
+        task = await self._uow.tasks.get_task(group_id=group_id, task_id=task_id)
+        if task is None:
+            raise NotFoundError("Task was not found")
+        return task
+
+    async def _claim_slot(
+        self,
+        *,
+        task: TaskInfo,
+        window: SprintWindow,
+        claim: Callable[[], Awaitable[bool]],
+    ) -> None:
+        # In the steady state a claim is a single conditional UPDATE. A miss
+        # means either the cap is reached or nobody has touched the task this
+        # sprint yet, so seed the counter row from the logs and retry once.
+        if await claim():
+            return
+        await self._uow.tasks.seed_sprint_slots(
+            group_id=task.group_id,
+            task_id=task.id,
+            period_start=window.period_start,
+            window_start=window.starts_at,
+            window_end_exclusive=window.ends_before,
         )
+        if not await claim():
+            raise BusinessRuleViolation("Task frequency limit for the current sprint is exhausted")
 
-    async def _require_pending_log(self, *, group_id: int, log_id: int) -> TaskLogInfo:
-        log = await self._uow.tasks.get_task_log(log_id=log_id)
-        if log is None or log.group_id != group_id:
+    async def _require_reviewer(
+        self, *, group_id: int, user_id: int, message: str
+    ) -> list[MembershipInfo]:
+        memberships = await self._uow.groups.list_active_memberships(group_id)
+        if all(membership.user_id != user_id for membership in memberships):
+            raise AuthorizationError(message)
+        return memberships
+
+    async def _lock_review_batch(
+        self, *, group: GroupInfo, log_ids: list[int], current_window: SprintWindow | None
+    ) -> tuple[
+        dict[int, TaskLogInfo],
+        dict[int, TaskInfo],
+        dict[tuple[int, date], TaskSlotCounts],
+    ]:
+        # Counter rows are locked before the logs, the same order a single
+        # review takes them in, so batches and single reviews cannot deadlock.
+        # The logs are then re-read under lock to see their settled status.
+        snapshot = await self._uow.tasks.list_task_logs_by_ids(group_id=group.id, log_ids=log_ids)
+        pending = [log for log in snapshot if log.status is TaskLogStatus.PENDING]
+        keys = {(log.task_id, self._log_window(group, log).period_start) for log in pending}
+        current_keys: set[tuple[int, date]] = set()
+        if current_window is not None:
+            current_keys = {(log.task_id, current_window.period_start) for log in pending}
+        slots = await self._uow.tasks.lock_sprint_slots(keys=sorted(keys | current_keys))
+        missing = sorted(current_keys - slots.keys())
+        if current_window is not None and missing:
+            for task_id, period_start in missing:
+                await self._uow.tasks.seed_sprint_slots(
+                    group_id=group.id,
+                    task_id=task_id,
+                    period_start=period_start,
+                    window_start=current_window.starts_at,
+                    window_end_exclusive=current_window.ends_before,
+                )
+            slots.update(await self._uow.tasks.lock_sprint_slots(keys=missing))
+        logs = await self._uow.tasks.list_task_logs_by_ids(
+            group_id=group.id, log_ids=log_ids, for_update=True
+        )
+        tasks = await self._uow.tasks.list_tasks_by_ids(
+            group_id=group.id, task_ids=sorted({log.task_id for log in logs})
+        )
+        return (
+            {log.id: log for log in logs},
+            {task.id: task for task in tasks},
+            slots,
+        )
+
+    @staticmethod
+    def _reviewable_log(log: TaskLogInfo | None) -> TaskLogInfo:
+        if log is None:
             raise NotFoundError("Task log was not found")
         if log.status is not TaskLogStatus.PENDING:
             raise BusinessRuleViolation("Only pending task logs can be reviewed")
         return log
 
+    @staticmethod
+    def _add_slot_delta(
+        deltas: dict[tuple[int, date], SprintSlotDelta],
+        *,
+        task_id: int,
+        period_start: date,
+        completed: int = 0,
+        pending: int = 0,
+    ) -> None:
+        delta = deltas.setdefault(
+            (task_id, period_start), SprintSlotDelta(task_id=task_id, period_start=period_start)
+        )
+        delta.completed += completed
+        delta.pending += pending
+
+    @staticmethod
+    def _add_progress_delta(
+        deltas: dict[tuple[int, int, date], SprintProgressDelta],
+        *,
+        log: TaskLogInfo,
+        period_start: date,
+        completed: int = 0,
+        pending: int = 0,
+    ) -> None:
+        delta = deltas.setdefault(
+            (log.performer_user_id, log.task_id, period_start),
+            SprintProgressDelta(
+                user_id=log.performer_user_id, task_id=log.task_id, period_start=period_start
+            ),
+        )
+        delta.completed += completed
+        delta.pending += pending
+
+    @staticmethod
+    def _record_failure(result: TaskLogBatchItem, error: DomainError) -> None:
+        result.error_code = error.code
+        result.error_message = error.message
+
+    async def _release_pending_slot(self, log: TaskLogInfo) -> None:
+        group = await self._require_group(log.group_id)
+        window = self._log_window(group, log)
+        await self._uow.tasks.release_sprint_slot(
+            task_id=log.task_id, period_start=window.period_start
+        )
+        await self._uow.tasks.apply_sprint_progress_deltas(
+            group_id=log.group_id,
+            deltas=[
+                SprintProgressDelta(
+                    user_id=log.performer_user_id,
+                    task_id=log.task_id,
+                    period_start=window.period_start,
+                    pending=-1,
+                )
+            ],
+        )
+
+    @classmethod
+    def _log_window(cls, group: GroupInfo, log: TaskLogInfo) -> SprintWindow:
+        return cls._sprint_window(group, log.created_at.astimezone(timezone.utc).date())
+
+    @staticmethod
+    def _sprint_window(group: GroupInfo, day: date) -> SprintWindow:
+        return current_sprint_window(
+            today=day,
+            start_weekday=group.sprint_start_weekday,
+            duration_days=group.sprint_duration_days,
+            anchor=group.created_at,
+        )
+
+    async def _lock_pending_log(
+        self, *, group: GroupInfo, log_id: int, current_window: SprintWindow | None
+    ) -> TaskLogInfo:
+        """Lock one log for a decision the way ``_lock_review_batch`` locks a batch.
+
+        A second approve, reject or cancel of the same log waits here and then
+        sees the settled status, so it is refused before moving any counter.
+        """
+        logs, _, _ = await self._lock_review_batch(
+            group=group, log_ids=[log_id], current_window=current_window
+        )
+        return self._reviewable_log(logs.get(log_id))
+
     @staticmethod
     def _validate_task_payload(
         *, title: str, frequency_per_sprint: int, unit_cost: Decimal
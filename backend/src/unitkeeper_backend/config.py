@@ -24,6 +24,13 @@ class Settings(BaseSettings):
     session_ttl_seconds: int = 86400
     default_timezone: str = "UTC"
     internal_bot_secret: str = ""
+    context_cache_ttl_seconds: float = 15.0
+    context_cache_max_entries: int = 10000
+    sprint_close_concurrency: int = 4
+    ledger_reconciliation_chunk_size: int = 5000
+    ledger_reconciliation_settle_seconds: int = 300
+    idempotency_key_ttl_seconds: int = 86400
+    idempotency_purge_batch_size: int = 1000
 
 
 settings = Settings()
@@ -10,14 +10,17 @@ from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 from unitkeeper_backend.application.auth.service import AuthService
 from unitkeeper_backend.application.balances.service import BalanceService
 from unitkeeper_backend.application.bot.service import BotService
+from unitkeeper_backend.application.context.cache import CurrentContextCache
 from unitkeeper_backend.application.context.service import CurrentContextService
 from unitkeeper_backend.application.groups.service import GroupService
+from unitkeeper_backend.application.idempotency.service import IdempotencyService
 from unitkeeper_backend.application.notifications.service import NotificationOutboxService
 from unitkeeper_backend.application.sprints.service import SprintService
 from unitkeeper_backend.application.tasks.service import TaskService
 from unitkeeper_backend.config import Settings, settings
 from unitkeeper_backend.infrastructure.auth.session_tokens import HmacSessionTokenManager
 from unitkeeper_backend.infrastructure.auth.telegram import TelegramWebAppVerifier
+from unitkeeper_backend.infrastructure.db.outbox_wakeups import PostgresOutboxWakeups
 from unitkeeper_backend.infrastructure.db.session import build_engine, build_session_maker
 from unitkeeper_backend.infrastructure.time import UtcClock
 from unitkeeper_backend.infrastructure.uow.sqlalchemy import SqlAlchemyUnitOfWork
@@ -57,6 +60,24 @@ class AppProvider(Provider):
             ttl_seconds=settings.session_ttl_seconds,
         )
 
+    @provide(scope=Scope.APP)
+    def provide_context_cache(self, settings: Settings) -> CurrentContextCache:
+        return CurrentContextCache(
+            max_entries=settings.context_cache_max_entries,
+            ttl_seconds=settings.context_cache_ttl_seconds,
+        )
+
+    @provide(scope=Scope.APP)
+    async def provide_outbox_wakeups(
+        self, settings: Settings
+    ) -> AsyncIterable[PostgresOutboxWakeups]:
+        wakeups = PostgresOutboxWakeups(settings.database_url)
+        wakeups.start()
+        try:
+            yield wakeups
+        finally:
+            await wakeups.close()
+
     @provide(scope=Scope.REQUEST)
     async def provide_session(
         self,
@@ -73,8 +94,12 @@ class AppProvider(Provider):
         return SqlAlchemyUnitOfWork(session)
 
     @provide(scope=Scope.REQUEST)
-    def provide_context_service(self, uow: SqlAlchemyUnitOfWork) -> CurrentContextService:
-        return CurrentContextService(uow=uow)
+    def provide_context_service(
+        self,
+        uow: SqlAlchemyUnitOfWork,
+        cache: CurrentContextCache,
+    ) -> CurrentContextService:
+        return CurrentContextService(uow=uow, cache=cache)
 
     @provide(scope=Scope.REQUEST)
     def provide_auth_service(
@@ -111,8 +136,9 @@ class AppProvider(Provider):
         self,
         uow: SqlAlchemyUnitOfWork,
         clock: UtcClock,
+        wakeups: PostgresOutboxWakeups,
     ) -> NotificationOutboxService:
-        return NotificationOutboxService(uow=uow, clock=clock)
+        return NotificationOutboxService(uow=uow, clock=clock, wakeups=wakeups)
 
     @provide(scope=Scope.REQUEST)
     def provide_balance_service(self, uow: SqlAlchemyUnitOfWork) -> BalanceService:
@@ -126,6 +152,17 @@ class AppProvider(Provider):
     ) -> SprintService:
         return SprintService(uow=uow, clock=clock)
 
+    @provide(scope=Scope.REQUEST)
+    def provide_idempotency_service(
+        self,
+        uow: SqlAlchemyUnitOfWork,
+        clock: UtcClock,
+        settings: Settings,
+    ) -> IdempotencyService:
+        return IdempotencyService(
+            uow=uow, clock=clock, ttl_seconds=settings.idempotency_key_ttl_seconds
+        )
+
     @provide(scope=Scope.REQUEST)
     def provide_bot_service(
         self,
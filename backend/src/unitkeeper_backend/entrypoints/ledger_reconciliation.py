@@ -0,0 +1,89 @@
+"""Reconcile ``balances`` against the ``balance_transactions`` ledger.
+
+Runs nightly from the scheduler process and can be run by hand::
+
+    python -m unitkeeper_backend.entrypoints.ledger_reconciliation [--group-id ID]
+
+Every group is checked in its own repeatable-read transaction, starting from
+its stored checkpoint. The exit status is 1 when any group has an unbalanced
+posting or a balance that disagrees with the ledger.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from unitkeeper_backend.application.jobs.ledger_reconciliation import LedgerReconciler
+from unitkeeper_backend.application.models import LedgerReconciliationReport
+from unitkeeper_backend.config import settings
+from unitkeeper_backend.infrastructure.db.session import build_engine, build_session_maker
+from unitkeeper_backend.infrastructure.time import UtcClock
+from unitkeeper_backend.infrastructure.uow.sqlalchemy import SqlAlchemyUnitOfWork
+
+logger = logging.getLogger(__name__)
+
+
+async def run_ledger_reconciliation_once(
+    session_maker: async_sessionmaker[AsyncSession],
+    *,
+    chunk_size: int,
+    settle_seconds: int,
+    group_ids: list[int] | None = None,
+) -> list[LedgerReconciliationReport]:
+    clock = UtcClock()
+    if group_ids is None:
+        async with session_maker() as session:
+            group_ids = await SqlAlchemyUnitOfWork(session).groups.list_group_ids()
+    reports: list[LedgerReconciliationReport] = []
+    for group_id in group_ids:
+        async with session_maker() as session:
+            # Balances and ledger rows must come from the same snapshot.
+            await session.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+            uow = SqlAlchemyUnitOfWork(session)
+            reconciler = LedgerReconciler(
+                uow=uow, clock=clock, chunk_size=chunk_size, settle_seconds=settle_seconds
+            )
+            report = await reconciler.reconcile_group(group_id)
+            await uow.commit()
+        logger.info(
+            "ledger_reconciliation.group_checked group_id=%s scanned=%s checkpoint=%s "
+            "unbalanced=%s mismatches=%s",
+            report.group_id,
+            report.scanned_count,
+            report.last_transaction_id,
+            len(report.unbalanced_transaction_group_ids),
+            len(report.balance_mismatches),
+        )
+        reports.append(report)
+    return reports
+
+
+async def reconcile(group_ids: list[int] | None) -> list[LedgerReconciliationReport]:
+    engine = build_engine(settings)
+    try:
+        return await run_ledger_reconciliation_once(
+            build_session_maker(engine),
+            chunk_size=settings.ledger_reconciliation_chunk_size,
+            settle_seconds=settings.ledger_reconciliation_settle_seconds,
+            group_ids=group_ids,
+        )
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Reconcile balances against the ledger.")
+    parser.add_argument("--group-id", type=int, action="append", dest="group_ids")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    reports = asyncio.run(reconcile(args.group_ids))
+    if any(not report.is_consistent for report in reports):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
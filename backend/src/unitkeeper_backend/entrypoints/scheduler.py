@@ -1,4 +1,4 @@
-"""Scheduler process entrypoint: runs the sprint-close job on a recurring interval.
+"""Scheduler process entrypoint: runs sprint close, ledger reconciliation and key purge jobs.
 
 Runs as a separate long-lived process from the FastAPI app (see
 `backend/Dockerfile` / root `docker-compose.yml` for how to wire a second
@@ -17,6 +17,7 @@ from __future__ import annotations
 import asyncio
 import logging
 import uuid
+from collections.abc import Sequence
 from datetime import timezone
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
@@ -24,11 +25,18 @@ from apscheduler.triggers.cron import CronTrigger
 from db.enums import NotificationEventType
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 
-from unitkeeper_backend.application.jobs.notifications import SprintReportPublisher
-from unitkeeper_backend.application.jobs.scheduler import SprintCloseJob
+from unitkeeper_backend.application.idempotency.service import IdempotencyService
+from unitkeeper_backend.application.jobs.notifications import OutboundEvent, SprintReportPublisher
+from unitkeeper_backend.application.jobs.scheduler import (
+    ConcurrentSprintCloseJob,
+    SprintCloseJob,
+    SprintCloseRunSummary,
+)
 from unitkeeper_backend.application.jobs.sprint_close import SprintCloseRunner, list_due_group_ids
+from unitkeeper_backend.application.models import NotificationOutboxEventDraft
 from unitkeeper_backend.application.sprints.service import SprintService
 from unitkeeper_backend.config import Settings, settings
+from unitkeeper_backend.entrypoints.ledger_reconciliation import run_ledger_reconciliation_once
 from unitkeeper_backend.infrastructure.db.session import build_engine, build_session_maker
 from unitkeeper_backend.infrastructure.repositories.notifications import (
     SqlAlchemyNotificationRepository,
@@ -40,7 +48,7 @@ logger = logging.getLogger(__name__)
 
 
 class _OutboxEventPublisher:
-    """Adapts SqlAlchemyNotificationRepository.enqueue_once to the EventPublisher protocol."""
+    """Adapts SqlAlchemyNotificationRepository to the EventPublisher protocol."""
 
     def __init__(self, repository: SqlAlchemyNotificationRepository) -> None:
         self._repository = repository
@@ -66,40 +74,109 @@ class _OutboxEventPublisher:
             deep_link_path=deep_link_path,
         )
 
+    async def enqueue_many_once(self, events: Sequence[OutboundEvent]) -> None:
+        await self._repository.enqueue_many_once(
+            [
+                NotificationOutboxEventDraft(
+                    event_type=NotificationEventType(event.event_type),
+                    recipient_user_id=event.recipient_user_id,
+                    group_id=event.group_id,
+                    payload=event.payload,
+                    deep_link_path=event.deep_link_path,
+                    dedupe_key=event.dedupe_key,
+                    correlation_id=event.correlation_id,
+                )
+                for event in events
+            ]
+        )
+
 
 # Runs once a day, shortly after UTC midnight, so a group whose sprint window
 # ended "yesterday" (period_end == yesterday's date) is picked up as soon as
 # today begins. See `list_due_group_ids` for the exact due-ness check.
 SPRINT_CLOSE_CRON = CronTrigger(hour=0, minute=5, timezone=timezone.utc)
 
+# Runs after the sprint-close pass so the night's settlements are already in
+# the ledger it checks.
+LEDGER_RECONCILIATION_CRON = CronTrigger(hour=1, minute=15, timezone=timezone.utc)
+
+# Expired idempotency keys are no longer replayed, so an hourly purge keeps the
+# table at about one TTL's worth of mutations.
+IDEMPOTENCY_PURGE_CRON = CronTrigger(minute=40, timezone=timezone.utc)
+
+
+class _SessionPerGroupCloser:
+    """Closes one group per session so each close commits or rolls back on its own."""
+
+    def __init__(self, session_maker: async_sessionmaker[AsyncSession], clock: UtcClock) -> None:
+        self._session_maker = session_maker
+        self._clock = clock
+
+    async def close_group(self, *, group_id: int, correlation_id: str) -> bool:
+        async with self._session_maker() as session:
+            uow = SqlAlchemyUnitOfWork(session)
+            sprint_service = SprintService(uow=uow, clock=self._clock)
+            job = SprintCloseJob(
+                closer=SprintCloseRunner(sprint_service=sprint_service, uow=uow),
+                reports=SprintReportPublisher(
+                    _OutboxEventPublisher(SqlAlchemyNotificationRepository(session))
+                ),
+            )
+            closed_count = await job.run(due_group_ids=[group_id], correlation_id=correlation_id)
+            await session.commit()
+            return closed_count > 0
+
 
-async def run_sprint_close_once(session_maker: async_sessionmaker[AsyncSession]) -> int:
+async def run_sprint_close_once(
+    session_maker: async_sessionmaker[AsyncSession], *, concurrency: int
+) -> SprintCloseRunSummary:
     """Run one sprint-close pass. Safe to call repeatedly (duplicate-close protected)."""
     clock = UtcClock()
     correlation_id = f"sprint-close-{uuid.uuid4()}"
     async with session_maker() as session:
-        uow = SqlAlchemyUnitOfWork(session)
-        sprint_service = SprintService(uow=uow, clock=clock)
-        closer = SprintCloseRunner(sprint_service=sprint_service, uow=uow)
-        reports = SprintReportPublisher(
-            _OutboxEventPublisher(SqlAlchemyNotificationRepository(session))
-        )
-        job = SprintCloseJob(closer=closer, reports=reports)
-
-        due_group_ids = await list_due_group_ids(uow=uow, clock=clock)
-        logger.info(
-            "sprint_close.run_start due_count=%s correlation_id=%s",
-            len(due_group_ids),
-            correlation_id,
-        )
-        closed_count = await job.run(due_group_ids=due_group_ids, correlation_id=correlation_id)
+        due_group_ids = await list_due_group_ids(uow=SqlAlchemyUnitOfWork(session), clock=clock)
         await session.commit()
+    logger.info(
+        "sprint_close.run_start due_count=%s concurrency=%s correlation_id=%s",
+        len(due_group_ids),
+        concurrency,
+        correlation_id,
+    )
+    job = ConcurrentSprintCloseJob(
+        closer=_SessionPerGroupCloser(session_maker, clock), concurrency=concurrency
+    )
+    summary = await job.run(due_group_ids=due_group_ids, correlation_id=correlation_id)
+    for result in summary.results:
         logger.info(
-            "sprint_close.run_finished closed_count=%s correlation_id=%s",
-            closed_count,
+            "sprint_close.group_finished group_id=%s outcome=%s duration_ms=%.1f correlation_id=%s",
+            result.group_id,
+            result.outcome,
+            result.duration_seconds * 1000,
             correlation_id,
         )
-        return closed_count
+    logger.info(
+        "sprint_close.run_finished closed_count=%s failed_count=%s duration_ms=%.1f "
+        "correlation_id=%s",
+        summary.closed_count,
+        summary.failed_count,
+        summary.duration_seconds * 1000,
+        correlation_id,
+    )
+    return summary
+
+
+async def run_idempotency_purge_once(
+    session_maker: async_sessionmaker[AsyncSession], *, batch_size: int
+) -> int:
+    async with session_maker() as session:
+        service = IdempotencyService(
+            uow=SqlAlchemyUnitOfWork(session),
+            clock=UtcClock(),
+            ttl_seconds=settings.idempotency_key_ttl_seconds,
+        )
+        purged = await service.purge_expired(batch_size=batch_size)
+    logger.info("idempotency_purge.finished purged_count=%s", purged)
+    return purged
 
 
 def build_scheduler(app_settings: Settings, engine: AsyncEngine) -> AsyncIOScheduler:
@@ -109,11 +186,35 @@ def build_scheduler(app_settings: Settings, engine: AsyncEngine) -> AsyncIOSched
         run_sprint_close_once,
         trigger=SPRINT_CLOSE_CRON,
         args=[session_maker],
+        kwargs={"concurrency": app_settings.sprint_close_concurrency},
         id="sprint_close",
         replace_existing=True,
         coalesce=True,
         max_instances=1,
     )
+    scheduler.add_job(
+        run_ledger_reconciliation_once,
+        trigger=LEDGER_RECONCILIATION_CRON,
+        args=[session_maker],
+        kwargs={
+            "chunk_size": app_settings.ledger_reconciliation_chunk_size,
+            "settle_seconds": app_settings.ledger_reconciliation_settle_seconds,
+        },
+        id="ledger_reconciliation",
+        replace_existing=True,
+        coalesce=True,
+        max_instances=1,
+    )
+    scheduler.add_job(
+        run_idempotency_purge_once,
+        trigger=IDEMPOTENCY_PURGE_CRON,
+        args=[session_maker],
+        kwargs={"batch_size": app_settings.idempotency_purge_batch_size},
+        id="idempotency_purge",
+        replace_existing=True,
+        coalesce=True,
+        max_instances=1,
+    )
     return scheduler
 
 
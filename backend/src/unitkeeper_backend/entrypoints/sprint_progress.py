@@ -0,0 +1,108 @@
+"""Rebuild the ``sprint_progress`` read model from task logs.
+
+The migration that adds the table fills the running sprints; run this any
+time the rows are suspected to have drifted from the logs::
+
+    python -m unitkeeper_backend.entrypoints.sprint_progress [--group-id ID] [--date DAY] [--check]
+
+Each group's sprint window containing ``--date`` (today by default) is rebuilt
+in its own transaction. With ``--check`` nothing is written: every group is
+rebuilt, compared with the rows that were there before and rolled back, and
+the exit status is 1 when any group had drifted.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+from datetime import date
+
+from unitkeeper_backend.application.models import SprintProgressInfo
+from unitkeeper_backend.config import settings
+from unitkeeper_backend.domain.services.sprint_math import current_sprint_window
+from unitkeeper_backend.infrastructure.db.session import build_engine, build_session_maker
+from unitkeeper_backend.infrastructure.time import UtcClock
+from unitkeeper_backend.infrastructure.uow.sqlalchemy import SqlAlchemyUnitOfWork
+
+logger = logging.getLogger(__name__)
+
+
+async def rebuild_groups(*, group_ids: list[int] | None, day: date | None, check: bool) -> int:
+    """Rebuild (or with ``check``, only compare) progress rows; return drifted group count."""
+    clock = UtcClock()
+    engine = build_engine(settings)
+    session_maker = build_session_maker(engine)
+    drifted = 0
+    try:
+        async with session_maker() as session:
+            uow = SqlAlchemyUnitOfWork(session)
+            if group_ids is None:
+                group_ids = await uow.groups.list_group_ids()
+            for group_id in group_ids:
+                group = await uow.groups.get_by_id(group_id, include_members=False)
+                if group is None:
+                    logger.warning("sprint_progress.group_missing group_id=%s", group_id)
+                    continue
+                window = current_sprint_window(
+                    today=day or clock.today(),
+                    start_weekday=group.sprint_start_weekday,
+                    duration_days=group.sprint_duration_days,
+                    anchor=group.created_at,
+                )
+                before = await uow.tasks.list_sprint_progress(
+                    group_id=group_id, period_start=window.period_start
+                )
+                rows = await uow.tasks.rebuild_sprint_progress(
+                    group_id=group_id,
+                    period_start=window.period_start,
+                    window_start=window.starts_at,
+                    window_end_exclusive=window.ends_before,
+                )
+                after = await uow.tasks.list_sprint_progress(
+                    group_id=group_id, period_start=window.period_start
+                )
+                # Rows whose counts all went back to zero are left in place by
+                # the incremental path but not recreated by a rebuild.
+                changed = _nonzero(before) != _nonzero(after)
+                drifted += changed
+                logger.info(
+                    "sprint_progress.rebuilt group_id=%s period_start=%s rows=%s drifted=%s",
+                    group_id,
+                    window.period_start,
+                    rows,
+                    changed,
+                )
+                if check:
+                    await uow.rollback()
+                else:
+                    await uow.commit()
+    finally:
+        await engine.dispose()
+    return drifted
+
+
+def _nonzero(progress: dict[int, SprintProgressInfo]) -> dict[int, SprintProgressInfo]:
+    return {
+        user_id: item
+        for user_id, item in progress.items()
+        if item.completed_count or item.pending_count
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Rebuild the sprint_progress read model.")
+    parser.add_argument("--group-id", type=int, action="append", dest="group_ids")
+    parser.add_argument(
+        "--check", action="store_true", help="report drift without writing anything"
+    )
+    parser.add_argument("--date", type=date.fromisoformat, dest="day")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    drifted = asyncio.run(rebuild_groups(group_ids=args.group_ids, day=args.day, check=args.check))
+    if args.check and drifted:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
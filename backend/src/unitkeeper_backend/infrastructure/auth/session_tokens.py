@@ -6,18 +6,27 @@ import hmac
 import json
 from datetime import datetime, timedelta, timezone
 
+from unitkeeper_backend.application.models import SessionClaims
 from unitkeeper_backend.domain.errors import AuthenticationError
 
+# Version 1 tokens only carried ``user_id``/``exp`` and are still accepted
+# until they expire; version 2 adds the group membership claims.
+TOKEN_VERSION = 2
+
 
 class HmacSessionTokenManager:
     def __init__(self, *, secret: str, ttl_seconds: int) -> None:
         self._secret = secret.encode("utf-8")
         self._ttl_seconds = ttl_seconds
 
-    def issue(self, *, user_id: int, issued_at: datetime) -> tuple[str, datetime]:
+    def issue(self, *, claims: SessionClaims, issued_at: datetime) -> tuple[str, datetime]:
         expires_at = issued_at + timedelta(seconds=self._ttl_seconds)
         payload = {
-            "user_id": user_id,
+            "v": TOKEN_VERSION,
+            "user_id": claims.user_id,
+            "group_id": claims.group_id,
+            "membership_id": claims.membership_id,
+            "epoch": claims.membership_epoch,
             "exp": int(expires_at.timestamp()),
         }
         payload_bytes = json.dumps(payload, separators=(",", ":"), sort_keys=True).encode("utf-8")
@@ -27,7 +36,7 @@ class HmacSessionTokenManager:
         token = base64.urlsafe_b64encode(payload_bytes + b"." + signature).decode("ascii")
         return token, expires_at
 
-    def verify(self, token: str) -> int:
+    def verify(self, token: str) -> SessionClaims:
         try:
             decoded = base64.urlsafe_b64decode(token.encode("ascii"))
             payload_bytes, signature = decoded.rsplit(b".", 1)
@@ -44,4 +53,19 @@ class HmacSessionTokenManager:
         expires_at = datetime.fromtimestamp(payload["exp"], tz=timezone.utc)
         if expires_at <= datetime.now(timezone.utc):
             raise AuthenticationError("Session token has expired")
-        return int(payload["user_id"])
+
+        version = payload.get("v", 1)
+        if version == 1:
+            return SessionClaims(user_id=int(payload["user_id"]))
+        if version != TOKEN_VERSION:
+            raise AuthenticationError("Unsupported session token version")
+        return SessionClaims(
+            user_id=int(payload["user_id"]),
+            group_id=_optional_int(payload.get("group_id")),
+            membership_id=_optional_int(payload.get("membership_id")),
+            membership_epoch=_optional_int(payload.get("epoch")),
+        )
+
+
+def _optional_int(value: object) -> int | None:
+    return value if isinstance(value, int) else None
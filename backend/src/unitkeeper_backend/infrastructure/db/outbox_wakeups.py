@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+
+import asyncpg
+from sqlalchemy.engine import make_url
+
+logger = logging.getLogger(__name__)
+
+# Matches the trigger added by the 20261018_0013 migration.
+OUTBOX_CHANNEL = "notification_outbox"
+
+
+class PostgresOutboxWakeups:
+    """Turns NOTIFYs on the outbox channel into in-process wakeups.
+
+    The process keeps one dedicated connection LISTENing, outside the
+    SQLAlchemy pool. If it drops, it is reopened in the background; until
+    then waiters simply run to their timeout.
+    """
+
+    def __init__(
+        self,
+        database_url: str,
+        *,
+        reconnect_seconds: float = 5.0,
+        keepalive_seconds: float = 30.0,
+    ) -> None:
+        self._dsn = (
+            make_url(database_url)
+            .set(drivername="postgresql")
+            .render_as_string(hide_password=False)
+        )
+        self._reconnect_seconds = reconnect_seconds
+        self._keepalive_seconds = keepalive_seconds
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    def next_wakeup(self) -> asyncio.Event:
+        return self._wakeup
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._listen_forever())
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def _wake(self, *_: object) -> None:
+        wakeup, self._wakeup = self._wakeup, asyncio.Event()
+        wakeup.set()
+
+    async def _listen_forever(self) -> None:
+        while True:
+            try:
+                await self._listen()
+            except (OSError, asyncpg.PostgresError, asyncpg.InterfaceError):
+                logger.exception("outbox_wakeups.connection_lost channel=%s", OUTBOX_CHANNEL)
+            await asyncio.sleep(self._reconnect_seconds)
+
+    async def _listen(self) -> None:
+        connection = await asyncpg.connect(self._dsn)
+        try:
+            await connection.add_listener(OUTBOX_CHANNEL, self._wake)
+            # Events committed while no connection was listening sent their
+            # NOTIFY to nobody, so current waiters re-check the outbox.
+            self._wake()
+            while not connection.is_closed():
+                await asyncio.sleep(self._keepalive_seconds)
+                await connection.execute("SELECT 1")
+        finally:
+            await connection.close()
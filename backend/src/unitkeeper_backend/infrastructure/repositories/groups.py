@@ -1,11 +1,26 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
 from datetime import UTC, date, datetime, time
 from decimal import Decimal
+from typing import Any
 
 from db.enums import Weekday
-from db.models import Balance, Group, GroupMembership, GroupMemberWeight
-from sqlalchemy import select
+from db.models import Balance, Group, GroupMembership, GroupMemberWeight, User
+from sqlalchemy import (
+    BigInteger,
+    Numeric,
+    Row,
+    Select,
+    column,
+    func,
+    literal,
+    or_,
+    select,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -18,7 +33,9 @@ class SqlAlchemyGroupRepository:
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
 
-    async def get_by_id(self, group_id: int) -> GroupInfo | None:
+    async def get_by_id(self, group_id: int, *, include_members: bool = True) -> GroupInfo | None:
+        if not include_members:
+            return await self._fetch_group_settings(group_id)
         model = await self._fetch_group(group_id=group_id)
         return map_group(model) if model is not None else None
 
@@ -26,6 +43,32 @@ class SqlAlchemyGroupRepository:
         result = await self._session.execute(select(Group.id).order_by(Group.id))
         return [row[0] for row in result.all()]
 
+    async def list_groups_due_by(self, *, today: date) -> list[GroupInfo]:
+        has_active_member = (
+            select(GroupMembership.id)
+            .where(GroupMembership.group_id == Group.id, GroupMembership.left_at.is_(None))
+            .exists()
+        )
+        query = (
+            self._group_settings_query()
+            .where(
+                or_(Group.sprint_period_end.is_(None), Group.sprint_period_end <= today),
+                has_active_member,
+            )
+            .order_by(Group.id)
+        )
+        result = await self._session.execute(query)
+        return [self._map_group_settings(row) for row in result.all()]
+
+    async def set_sprint_period_end(self, *, group_id: int, period_end: date) -> None:
+        statement = (
+            update(Group)
+            .where(Group.id == group_id)
+            .values(sprint_period_end=period_end)
+            .execution_options(synchronize_session=False)
+        )
+        await self._session.execute(statement)
+
     async def get_by_name(self, name: str) -> GroupInfo | None:
         query = (
             select(Group)
@@ -46,6 +89,11 @@ class SqlAlchemyGroupRepository:
         model = result.scalar_one_or_none()
         return map_membership(model) if model is not None else None
 
+    async def get_membership_epoch(self, user_id: int) -> int | None:
+        query = select(User.membership_epoch).where(User.id == user_id)
+        result = await self._session.execute(query)
+        return result.scalar_one_or_none()
+
     async def get_active_membership_in_group(
         self, *, group_id: int, user_id: int
     ) -> MembershipInfo | None:
@@ -81,6 +129,7 @@ class SqlAlchemyGroupRepository:
         sprint_duration_days: int,
         timezone: str,
         created_at: date,
+        sprint_period_end: date,
     ) -> GroupInfo:
         model = Group(
             name=name,
@@ -90,6 +139,7 @@ class SqlAlchemyGroupRepository:
             sprint_duration_days=sprint_duration_days,
             timezone=timezone,
             created_at=datetime.combine(created_at, time.min, tzinfo=UTC),
+            sprint_period_end=sprint_period_end,
         )
         self._session.add(model)
         await self._session.flush()
@@ -102,6 +152,7 @@ class SqlAlchemyGroupRepository:
         model = GroupMembership(group_id=group_id, user_id=user_id)
         self._session.add(model)
         await self._session.flush()
+        await self._bump_membership_epoch(user_id)
         return MembershipInfo(
             id=model.id,
             group_id=model.group_id,
@@ -136,6 +187,7 @@ class SqlAlchemyGroupRepository:
             raise NotFoundError("Membership was not found")
         model.left_at = left_at
         await self._session.flush()
+        await self._bump_membership_epoch(model.user_id)
 
     async def replace_weights(
         self, *, group_id: int, weights_by_user_id: dict[int, Decimal]
@@ -164,6 +216,7 @@ class SqlAlchemyGroupRepository:
         join_secret: str | None,
         sprint_start_weekday: Weekday | None,
         sprint_duration_days: int | None = None,
+        sprint_period_end: date | None = None,
     ) -> GroupInfo:
         model = await self._require_group_model(group_id)
         if join_secret is not None:
@@ -172,6 +225,8 @@ class SqlAlchemyGroupRepository:
             model.sprint_start_weekday = sprint_start_weekday
         if sprint_duration_days is not None:
             model.sprint_duration_days = sprint_duration_days
+        if sprint_period_end is not None:
+            model.sprint_period_end = sprint_period_end
         await self._session.flush()
         await self._session.refresh(model)
         return map_group(model)
@@ -189,19 +244,36 @@ class SqlAlchemyGroupRepository:
             raise NotFoundError("Balance was not found")
         return model.current_balance
 
-    async def apply_balance_delta(
-        self, *, group_id: int, user_id: int, amount_delta: Decimal
-    ) -> Decimal:
-        query = select(Balance).where(Balance.group_id == group_id, Balance.user_id == user_id)
-        result = await self._session.execute(query)
-        model = result.scalar_one_or_none()
-        if model is None:
-            model = Balance(group_id=group_id, user_id=user_id, current_balance=Decimal("0"))
-            self._session.add(model)
-            await self._session.flush()
-        model.current_balance += amount_delta
-        await self._session.flush()
-        return model.current_balance
+    async def apply_balance_deltas(
+        self, *, group_id: int, deltas_by_user_id: Mapping[int, Decimal]
+    ) -> dict[int, Decimal]:
+        if not deltas_by_user_id:
+            return {}
+        deltas = values(
+            column("user_id", BigInteger),
+            column("amount_delta", Numeric(12, 2)),
+            name="deltas",
+        ).data(sorted(deltas_by_user_id.items()))
+        # An upsert rather than UPDATE ... FROM so members without a balance
+        # row yet still get one. Rows are touched in user id order, the same
+        # order transfer_balance locks them in.
+        statement = insert(Balance).from_select(
+            [Balance.group_id, Balance.user_id, Balance.current_balance],
+            select(literal(group_id), deltas.c.user_id, deltas.c.amount_delta).order_by(
+                deltas.c.user_id
+            ),
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=[Balance.group_id, Balance.user_id],
+            set_={
+                "current_balance": Balance.current_balance + statement.excluded.current_balance,
+                "updated_at": func.now(),
+            },
+        )
+        result = await self._session.execute(
+            statement.returning(Balance.user_id, Balance.current_balance)
+        )
+        return {row.user_id: row.current_balance for row in result.all()}
 
     async def transfer_balance(
         self,
@@ -242,8 +314,53 @@ class SqlAlchemyGroupRepository:
         result = await self._session.execute(query)
         return result.scalar_one_or_none()
 
+    async def _fetch_group_settings(self, group_id: int) -> GroupInfo | None:
+        # Callers that only need the sprint settings read the single group row.
+        # Plain columns rather than a Group entity, so a membership-less
+        # instance never lands in the identity map.
+        query = self._group_settings_query().where(Group.id == group_id)
+        row = (await self._session.execute(query)).one_or_none()
+        return self._map_group_settings(row) if row is not None else None
+
+    @staticmethod
+    def _group_settings_query() -> Select[Any]:
+        return select(
+            Group.id,
+            Group.name,
+            Group.join_secret,
+            Group.owner_user_id,
+            Group.sprint_start_weekday,
+            Group.sprint_duration_days,
+            Group.timezone,
+            Group.balance,
+            Group.created_at,
+        )
+
+    @staticmethod
+    def _map_group_settings(row: Row[Any]) -> GroupInfo:
+        return GroupInfo(
+            id=row.id,
+            name=row.name,
+            join_secret=row.join_secret,
+            owner_user_id=row.owner_user_id,
+            sprint_start_weekday=row.sprint_start_weekday,
+            sprint_duration_days=row.sprint_duration_days,
+            timezone=row.timezone,
+            balance=row.balance,
+            created_at=row.created_at.date(),
+        )
+
     async def _require_group_model(self, group_id: int) -> Group:
         model = await self._fetch_group(group_id=group_id)
         if model is None:
             raise NotFoundError("Group was not found")
         return model
+
+    async def _bump_membership_epoch(self, user_id: int) -> None:
+        # Session tokens sign the epoch they were issued under; any join or
+        # leave moves it so those claims stop being trusted.
+        await self._session.execute(
+            update(User)
+            .where(User.id == user_id)
+            .values(membership_epoch=User.membership_epoch + 1)
+        )
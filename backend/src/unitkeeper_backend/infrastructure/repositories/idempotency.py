@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from db.enums import IdempotencyStatus
+from db.models import IdempotencyKey
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from unitkeeper_backend.application.models import (
+    IdempotencyKeyRef,
+    IdempotencyRecord,
+    StoredResponse,
+)
+
+_KEY_COLUMNS = [IdempotencyKey.scope, IdempotencyKey.actor_key, IdempotencyKey.key]
+
+
+class SqlAlchemyIdempotencyRepository:
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def get(self, *, scope: str, actor_key: str, key: str) -> IdempotencyRecord | None:
+        query = select(IdempotencyKey).where(
+            IdempotencyKey.scope == scope,
+            IdempotencyKey.actor_key == actor_key,
+            IdempotencyKey.key == key,
+        )
+        model = (await self._session.execute(query)).scalar_one_or_none()
+        if model is None:
+            return None
+        return IdempotencyRecord(
+            request_fingerprint=model.request_fingerprint,
+            status=model.status,
+            response_status_code=model.response_status_code,
+            response_payload=model.response_payload,
+            expires_at=model.expires_at,
+        )
+
+    async def claim(self, ref: IdempotencyKeyRef, *, now: datetime, expires_at: datetime) -> bool:
+        # An expired row the purge job has not reached yet is taken over in place.
+        values = {
+            "request_fingerprint": ref.request_fingerprint,
+            "status": IdempotencyStatus.PROCESSING,
+            "response_status_code": None,
+            "response_payload": None,
+            "completed_at": None,
+            "expires_at": expires_at,
+        }
+        statement = (
+            insert(IdempotencyKey)
+            .values(scope=ref.scope, actor_key=ref.actor_key, key=ref.key, **values)
+            .on_conflict_do_update(
+                index_elements=_KEY_COLUMNS,
+                set_={**values, "updated_at": func.now()},
+                where=IdempotencyKey.expires_at <= now,
+            )
+            .returning(IdempotencyKey.id)
+        )
+        return (await self._session.execute(statement)).scalar_one_or_none() is not None
+
+    async def complete(
+        self,
+        ref: IdempotencyKeyRef,
+        *,
+        response: StoredResponse,
+        completed_at: datetime,
+        expires_at: datetime,
+    ) -> None:
+        # Upsert rather than update: a use case that rolled back its own
+        # transaction after succeeding has also discarded the claim.
+        values = {
+            "request_fingerprint": ref.request_fingerprint,
+            "status": IdempotencyStatus.COMPLETED,
+            "response_status_code": response.status_code,
+            "response_payload": response.payload,
+            "completed_at": completed_at,
+            "expires_at": expires_at,
+        }
+        statement = insert(IdempotencyKey).values(
+            scope=ref.scope, actor_key=ref.actor_key, key=ref.key, **values
+        )
+        await self._session.execute(
+            statement.on_conflict_do_update(
+                index_elements=_KEY_COLUMNS, set_={**values, "updated_at": func.now()}
+            )
+        )
+
+    async def purge_expired(self, *, now: datetime, limit: int) -> int:
+        batch = (
+            select(IdempotencyKey.id)
+            .where(IdempotencyKey.expires_at <= now)
+            .order_by(IdempotencyKey.expires_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        result = await self._session.execute(
+            delete(IdempotencyKey).where(IdempotencyKey.id.in_(batch)).returning(IdempotencyKey.id)
+        )
+        return len(result.scalars().all())
@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+from collections.abc import AsyncIterator, Mapping, Sequence
+from datetime import datetime
+from decimal import Decimal
+from uuid import UUID
+
+from db.enums import BalanceTransactionAccountType
+from db.models import BalanceCheckpoint, BalanceTransaction, LedgerReconciliationCheckpoint
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from unitkeeper_backend.application.models import (
+    BalanceCheckpointInfo,
+    LedgerCheckpointInfo,
+    LedgerEntry,
+)
+
+
+class SqlAlchemyLedgerRepository:
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def get_reconciliation_checkpoint(self, group_id: int) -> LedgerCheckpointInfo | None:
+        query = select(LedgerReconciliationCheckpoint).where(
+            LedgerReconciliationCheckpoint.group_id == group_id
+        )
+        model = (await self._session.execute(query)).scalar_one_or_none()
+        if model is None:
+            return None
+        return LedgerCheckpointInfo(
+            group_id=model.group_id,
+            last_transaction_id=model.last_transaction_id,
+            ledger_balances={
+                int(user_id): Decimal(amount) for user_id, amount in model.ledger_balances.items()
+            },
+        )
+
+    async def save_reconciliation_checkpoint(self, checkpoint: LedgerCheckpointInfo) -> None:
+        values = {
+            "last_transaction_id": checkpoint.last_transaction_id,
+            "ledger_balances": {
+                str(user_id): str(amount)
+                for user_id, amount in sorted(checkpoint.ledger_balances.items())
+            },
+        }
+        statement = insert(LedgerReconciliationCheckpoint).values(
+            group_id=checkpoint.group_id, **values
+        )
+        await self._session.execute(
+            statement.on_conflict_do_update(
+                index_elements=[LedgerReconciliationCheckpoint.group_id],
+                set_={**values, "updated_at": func.now()},
+            )
+        )
+
+    async def find_settled_ledger_end(
+        self, *, group_id: int, after_id: int, settled_before: datetime
+    ) -> int | None:
+        """Return the highest id such that every row in ``(after_id, id]`` is settled.
+
+        Ids are handed out before commit, so a young row can still be joined
+        by rows with lower ids from transactions that have not committed yet.
+        Stopping right before the first row created after ``settled_before``
+        leaves those for a later run instead of stepping over them.
+        """
+        query = select(
+            func.min(BalanceTransaction.id).filter(BalanceTransaction.created_at >= settled_before),
+            func.max(BalanceTransaction.id),
+        ).where(BalanceTransaction.group_id == group_id, BalanceTransaction.id > after_id)
+        row = (await self._session.execute(query)).one()
+        first_unsettled_id: int | None = row[0]
+        last_id: int | None = row[1]
+        if first_unsettled_id is not None:
+            return first_unsettled_id - 1 if first_unsettled_id - 1 > after_id else None
+        return last_id
+
+    async def stream_ledger_entries(
+        self, *, group_id: int, after_id: int, through_id: int, chunk_size: int
+    ) -> AsyncIterator[list[LedgerEntry]]:
+        # A server-side cursor keeps only one chunk in memory at a time.
+        query = (
+            select(
+                BalanceTransaction.id,
+                BalanceTransaction.account_type,
+                BalanceTransaction.user_id,
+                BalanceTransaction.amount_delta,
+                BalanceTransaction.transaction_group_id,
+            )
+            .where(
+                BalanceTransaction.group_id == group_id,
+                BalanceTransaction.id > after_id,
+                BalanceTransaction.id <= through_id,
+            )
+            .order_by(BalanceTransaction.id)
+            .execution_options(yield_per=chunk_size)
+        )
+        result = await self._session.stream(query)
+        async for rows in result.partitions():
+            yield [
+                LedgerEntry(
+                    id=row.id,
+                    user_id=(
+                        row.user_id
+                        if row.account_type is BalanceTransactionAccountType.USER
+                        else None
+                    ),
+                    amount_delta=row.amount_delta,
+                    transaction_group_id=row.transaction_group_id,
+                )
+                for row in rows
+            ]
+
+    async def sum_transaction_groups(
+        self, transaction_group_ids: Sequence[UUID]
+    ) -> dict[UUID, Decimal]:
+        if not transaction_group_ids:
+            return {}
+        query = (
+            select(
+                BalanceTransaction.transaction_group_id, func.sum(BalanceTransaction.amount_delta)
+            )
+            .where(BalanceTransaction.transaction_group_id.in_(transaction_group_ids))
+            .group_by(BalanceTransaction.transaction_group_id)
+        )
+        result = await self._session.execute(query)
+        return {row[0]: row[1] for row in result.all()}
+
+    async def sum_user_ledger_after(self, *, group_id: int, after_id: int) -> dict[int, Decimal]:
+        query = (
+            select(BalanceTransaction.user_id, func.sum(BalanceTransaction.amount_delta))
+            .where(
+                BalanceTransaction.group_id == group_id,
+                BalanceTransaction.id > after_id,
+                BalanceTransaction.account_type == BalanceTransactionAccountType.USER,
+            )
+            .group_by(BalanceTransaction.user_id)
+        )
+        result = await self._session.execute(query)
+        return {row[0]: row[1] for row in result.all() if row[0] is not None}
+
+    async def add_balance_checkpoints(
+        self, *, group_id: int, sprint_run_id: int, balances: Mapping[int, Decimal]
+    ) -> None:
+        if not balances:
+            return
+        # Stamped with the transaction time, which is also the created_at of
+        # the settlement's ledger rows, so those rows are never counted twice.
+        await self._session.execute(
+            insert(BalanceCheckpoint).values(taken_at=func.now()),
+            [
+                {
+                    "group_id": group_id,
+                    "user_id": user_id,
+                    "sprint_run_id": sprint_run_id,
+                    "balance": balance,
+                }
+                for user_id, balance in sorted(balances.items())
+            ],
+        )
+
+    async def get_latest_balance_checkpoint(
+        self, *, group_id: int, user_id: int, at: datetime
+    ) -> BalanceCheckpointInfo | None:
+        query = (
+            select(BalanceCheckpoint)
+            .where(
+                BalanceCheckpoint.group_id == group_id,
+                BalanceCheckpoint.user_id == user_id,
+                BalanceCheckpoint.taken_at <= at,
+            )
+            .order_by(BalanceCheckpoint.taken_at.desc(), BalanceCheckpoint.id.desc())
+            .limit(1)
+        )
+        model = (await self._session.execute(query)).scalar_one_or_none()
+        if model is None:
+            return None
+        return BalanceCheckpointInfo(
+            group_id=model.group_id,
+            user_id=model.user_id,
+            balance=model.balance,
+            taken_at=model.taken_at,
+            sprint_run_id=model.sprint_run_id,
+        )
+
+    async def sum_user_ledger_between(
+        self, *, group_id: int, user_id: int, after: datetime | None, through: datetime
+    ) -> Decimal:
+        conditions = [
+            BalanceTransaction.group_id == group_id,
+            BalanceTransaction.user_id == user_id,
+            BalanceTransaction.created_at <= through,
+        ]
+        if after is not None:
+            conditions.append(BalanceTransaction.created_at > after)
+        query = select(func.coalesce(func.sum(BalanceTransaction.amount_delta), 0)).where(
+            *conditions
+        )
+        total: Decimal = (await self._session.execute(query)).scalar_one()
+        return total
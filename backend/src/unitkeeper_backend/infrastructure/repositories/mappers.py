@@ -87,7 +87,7 @@ def map_sprint_member_result(model: SprintMemberResult) -> SprintMemberResultInf
     )
 
 
-def map_sprint_run(model: SprintRun) -> SprintRunInfo:
+def map_sprint_run(model: SprintRun, *, include_members: bool = True) -> SprintRunInfo:
     return SprintRunInfo(
         id=model.id,
         group_id=model.group_id,
@@ -99,5 +99,9 @@ def map_sprint_run(model: SprintRun) -> SprintRunInfo:
         bonus_units=model.bonus_units,
         balance_delta=model.balance_delta,
         closed_at=model.closed_at,
-        member_results=[map_sprint_member_result(item) for item in model.member_results],
+        member_results=(
+            [map_sprint_member_result(item) for item in model.member_results]
+            if include_members
+            else []
+        ),
     )
@@ -1,19 +1,40 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from datetime import datetime
-from uuid import UUID
+from typing import Any
+from uuid import UUID, uuid4
 
 from db.enums import (
+    NOTIFICATION_EVENT_PRIORITIES,
     NotificationDeliveryAttemptStatus,
     NotificationEventType,
     NotificationOutboxStatus,
+    NotificationPriority,
 )
 from db.models import NotificationDeliveryAttempt, NotificationOutboxEvent
-from sqlalchemy import or_, select
+from sqlalchemy import (
+    Boolean,
+    DateTime,
+    Text,
+    Uuid,
+    case,
+    column,
+    literal,
+    or_,
+    select,
+    update,
+    values,
+)
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
 
-from unitkeeper_backend.application.models import NotificationOutboxEventInfo
+from unitkeeper_backend.application.models import (
+    NotificationFailure,
+    NotificationOutboxEventDraft,
+    NotificationOutboxEventInfo,
+)
 from unitkeeper_backend.domain.errors import NotFoundError
 
 
@@ -32,6 +53,9 @@ def _map_event(model: NotificationOutboxEvent) -> NotificationOutboxEventInfo:
         delivered_at=model.delivered_at,
         last_error=model.last_error,
         created_at=model.created_at,
+        lease_owner=model.lease_owner,
+        lease_expires_at=model.lease_expires_at,
+        priority=NotificationPriority(model.priority),
     )
 
 
@@ -50,6 +74,7 @@ class SqlAlchemyNotificationRepository:
     ) -> NotificationOutboxEventInfo:
         model = NotificationOutboxEvent(
             event_type=event_type,
+            priority=NOTIFICATION_EVENT_PRIORITIES[event_type],
             recipient_user_id=recipient_user_id,
             group_id=group_id,
             payload=payload,
@@ -75,6 +100,7 @@ class SqlAlchemyNotificationRepository:
             insert(NotificationOutboxEvent)
             .values(
                 event_type=event_type,
+                priority=NOTIFICATION_EVENT_PRIORITIES[event_type],
                 recipient_user_id=recipient_user_id,
                 group_id=group_id,
                 payload=payload,
@@ -99,6 +125,75 @@ class SqlAlchemyNotificationRepository:
         event = await self._require_event(event_id)
         return _map_event(event), created
 
+    async def enqueue_many(self, events: Sequence[NotificationOutboxEventDraft]) -> list[UUID]:
+        if not events:
+            return []
+        # Ids are assigned here so the whole fan-out is one multi-row INSERT
+        # without a RETURNING round trip per row.
+        event_ids = [uuid4() for _ in events]
+        rows = [
+            {"id": event_id, **self._draft_values(event)}
+            for event_id, event in zip(event_ids, events, strict=True)
+        ]
+        await self._session.execute(insert(NotificationOutboxEvent).values(rows))
+        return event_ids
+
+    async def enqueue_many_once(
+        self, events: Sequence[NotificationOutboxEventDraft]
+    ) -> list[tuple[UUID, bool]]:
+        """Write a fan-out of deduplicated events; return each event's id and created flag.
+
+        Every draft must carry a ``dedupe_key``. New keys are inserted by one
+        multi-row INSERT ... ON CONFLICT DO NOTHING; keys that already existed
+        (or repeat within the batch) are resolved by a single follow-up SELECT.
+        """
+        if not events:
+            return []
+        if any(event.dedupe_key is None for event in events):
+            raise ValueError("enqueue_many_once requires a dedupe_key on every event")
+        statement = (
+            insert(NotificationOutboxEvent)
+            .values([self._draft_values(event) for event in events])
+            .on_conflict_do_nothing(index_elements=["dedupe_key"])
+            .returning(NotificationOutboxEvent.dedupe_key, NotificationOutboxEvent.id)
+        )
+        created: dict[str | None, UUID] = dict(
+            (await self._session.execute(statement)).tuples().all()
+        )
+        existing: dict[str | None, UUID] = {}
+        replayed = {event.dedupe_key for event in events} - created.keys()
+        if replayed:
+            query = select(NotificationOutboxEvent.dedupe_key, NotificationOutboxEvent.id).where(
+                NotificationOutboxEvent.dedupe_key.in_(replayed)
+            )
+            existing = dict((await self._session.execute(query)).tuples().all())
+
+        results: list[tuple[UUID, bool]] = []
+        for event in events:
+            event_id = created.pop(event.dedupe_key, None)
+            if event_id is not None:
+                existing[event.dedupe_key] = event_id
+                results.append((event_id, True))
+                continue
+            event_id = existing.get(event.dedupe_key)
+            if event_id is None:
+                raise NotFoundError("Notification event was not found after idempotent enqueue")
+            results.append((event_id, False))
+        return results
+
+    @staticmethod
+    def _draft_values(event: NotificationOutboxEventDraft) -> dict[str, object]:
+        return {
+            "event_type": event.event_type,
+            "priority": NOTIFICATION_EVENT_PRIORITIES[event.event_type],
+            "recipient_user_id": event.recipient_user_id,
+            "group_id": event.group_id,
+            "payload": event.payload,
+            "deep_link_path": event.deep_link_path,
+            "dedupe_key": event.dedupe_key,
+            "correlation_id": event.correlation_id,
+        }
+
     async def list_ready(self, *, now: datetime, limit: int) -> list[NotificationOutboxEventInfo]:
         query = (
             select(NotificationOutboxEvent)
@@ -115,6 +210,88 @@ class SqlAlchemyNotificationRepository:
         result = await self._session.execute(query)
         return [_map_event(item) for item in result.scalars().all()]
 
+    async def claim_ready(
+        self,
+        *,
+        now: datetime,
+        limit: int,
+        oldest_first: int,
+        lease_owner: str,
+        lease_expires_at: datetime,
+    ) -> list[NotificationOutboxEventInfo]:
+        """Lease up to ``limit`` ready events to ``lease_owner`` and return them.
+
+        Rows another worker is claiming right now are skipped rather than
+        waited on, and rows under a live lease are not eligible, so concurrent
+        workers always get disjoint batches. A lease that ran out without an
+        ack or fail (a crashed worker) makes its event eligible again.
+
+        The first ``oldest_first`` slots go to the oldest ready events of any
+        lane, so a long backlog of bulk events keeps moving; the rest are
+        filled lane by lane, highest priority first.
+        """
+        claimed = await self._lease(
+            now=now,
+            limit=oldest_first,
+            order_by=(NotificationOutboxEvent.created_at, NotificationOutboxEvent.id),
+            lease_owner=lease_owner,
+            lease_expires_at=lease_expires_at,
+        )
+        # The first statement's leases already hide its rows from the second.
+        claimed += await self._lease(
+            now=now,
+            limit=limit - len(claimed),
+            order_by=(
+                NotificationOutboxEvent.priority,
+                NotificationOutboxEvent.created_at,
+                NotificationOutboxEvent.id,
+            ),
+            lease_owner=lease_owner,
+            lease_expires_at=lease_expires_at,
+        )
+        return [
+            _map_event(item)
+            for item in sorted(claimed, key=lambda item: (item.priority, item.created_at, item.id))
+        ]
+
+    async def _lease(
+        self,
+        *,
+        now: datetime,
+        limit: int,
+        order_by: Sequence[InstrumentedAttribute[Any]],
+        lease_owner: str,
+        lease_expires_at: datetime,
+    ) -> list[NotificationOutboxEvent]:
+        if limit <= 0:
+            return []
+        batch = (
+            select(NotificationOutboxEvent.id)
+            .where(
+                NotificationOutboxEvent.status == NotificationOutboxStatus.PENDING,
+                or_(
+                    NotificationOutboxEvent.next_attempt_at.is_(None),
+                    NotificationOutboxEvent.next_attempt_at <= now,
+                ),
+                or_(
+                    NotificationOutboxEvent.lease_expires_at.is_(None),
+                    NotificationOutboxEvent.lease_expires_at <= now,
+                ),
+            )
+            .order_by(*order_by)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .cte("claimable")
+        )
+        statement = (
+            update(NotificationOutboxEvent)
+            .where(NotificationOutboxEvent.id == batch.c.id)
+            .values(lease_owner=lease_owner, lease_expires_at=lease_expires_at)
+            .returning(NotificationOutboxEvent)
+            .execution_options(synchronize_session=False)
+        )
+        return list((await self._session.execute(statement)).scalars().all())
+
     async def acknowledge(
         self, *, event_id: UUID, acknowledged_at: datetime
     ) -> NotificationOutboxEventInfo:
@@ -127,6 +304,8 @@ class SqlAlchemyNotificationRepository:
         event.next_attempt_at = None
         event.last_error = None
         event.status = NotificationOutboxStatus.DELIVERED
+        event.lease_owner = None
+        event.lease_expires_at = None
         self._session.add(
             NotificationDeliveryAttempt(
                 event_id=event.id,
@@ -157,6 +336,8 @@ class SqlAlchemyNotificationRepository:
         event.status = (
             NotificationOutboxStatus.DEAD_LETTER if terminal else NotificationOutboxStatus.PENDING
         )
+        event.lease_owner = None
+        event.lease_expires_at = None
         self._session.add(
             NotificationDeliveryAttempt(
                 event_id=event.id,
@@ -168,6 +349,112 @@ class SqlAlchemyNotificationRepository:
         await self._session.flush()
         return _map_event(event)
 
+    async def acknowledge_many(
+        self, *, event_ids: Sequence[UUID], acknowledged_at: datetime
+    ) -> int:
+        """Mark events delivered in one UPDATE and log their attempts in one INSERT.
+
+        Events that are already delivered or do not exist are skipped, so a
+        repeated report is harmless; returns how many events were updated.
+        """
+        if not event_ids:
+            return 0
+        statement = (
+            update(NotificationOutboxEvent)
+            .where(
+                NotificationOutboxEvent.id.in_(set(event_ids)),
+                NotificationOutboxEvent.status != NotificationOutboxStatus.DELIVERED,
+            )
+            .values(
+                attempt_count=NotificationOutboxEvent.attempt_count + 1,
+                last_attempt_at=acknowledged_at,
+                delivered_at=acknowledged_at,
+                next_attempt_at=None,
+                last_error=None,
+                status=NotificationOutboxStatus.DELIVERED,
+                lease_owner=None,
+                lease_expires_at=None,
+            )
+            .returning(NotificationOutboxEvent.id, NotificationOutboxEvent.attempt_count)
+            .execution_options(synchronize_session=False)
+        )
+        updated = (await self._session.execute(statement)).tuples().all()
+        if updated:
+            await self._session.execute(
+                insert(NotificationDeliveryAttempt).values(
+                    [
+                        {
+                            "event_id": event_id,
+                            "attempt_number": attempt_number,
+                            "status": NotificationDeliveryAttemptStatus.ACKNOWLEDGED,
+                            "acknowledged_at": acknowledged_at,
+                        }
+                        for event_id, attempt_number in updated
+                    ]
+                )
+            )
+        return len(updated)
+
+    async def fail_many(
+        self, *, failures: Sequence[NotificationFailure], failed_at: datetime
+    ) -> int:
+        """Record failed deliveries in one UPDATE ... FROM (VALUES ...) and one INSERT."""
+        # One row per event: a second report for the same event in a batch
+        # would otherwise make the UPDATE ambiguous.
+        by_event = {failure.event_id: failure for failure in failures}
+        if not by_event:
+            return 0
+        reported = values(
+            column("event_id", Uuid()),
+            column("error_message", Text()),
+            column("retry_at", DateTime(timezone=True)),
+            column("terminal", Boolean()),
+            name="reported",
+        ).data(
+            [
+                (failure.event_id, failure.error_message, failure.retry_at, failure.terminal)
+                for failure in by_event.values()
+            ]
+        )
+        status = NotificationOutboxEvent.__table__.c.status.type
+        statement = (
+            update(NotificationOutboxEvent)
+            .where(
+                NotificationOutboxEvent.id == reported.c.event_id,
+                NotificationOutboxEvent.status != NotificationOutboxStatus.DELIVERED,
+            )
+            .values(
+                attempt_count=NotificationOutboxEvent.attempt_count + 1,
+                last_attempt_at=failed_at,
+                last_error=reported.c.error_message,
+                next_attempt_at=case((reported.c.terminal, None), else_=reported.c.retry_at),
+                status=case(
+                    (reported.c.terminal, literal(NotificationOutboxStatus.DEAD_LETTER, status)),
+                    else_=literal(NotificationOutboxStatus.PENDING, status),
+                ),
+                lease_owner=None,
+                lease_expires_at=None,
+            )
+            .returning(NotificationOutboxEvent.id, NotificationOutboxEvent.attempt_count)
+            .execution_options(synchronize_session=False)
+        )
+        updated = (await self._session.execute(statement)).tuples().all()
+        if updated:
+            await self._session.execute(
+                insert(NotificationDeliveryAttempt).values(
+                    [
+                        {
+                            "event_id": event_id,
+                            "attempt_number": attempt_number,
+                            "status": NotificationDeliveryAttemptStatus.FAILED,
+                            "error_message": by_event[event_id].error_message,
+                        }
+                        for event_id, attempt_number in updated
+                    ]
+                )
+            )
+        return len(updated)
+
     async def _require_event(self, event_id: UUID) -> NotificationOutboxEvent:
         event = await self._session.get(NotificationOutboxEvent, event_id)
         if event is None:
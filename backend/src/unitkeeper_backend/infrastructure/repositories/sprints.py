@@ -1,22 +1,29 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from datetime import date, datetime
 from decimal import Decimal
 from uuid import UUID
 
 from db.enums import BalanceTransactionAccountType, BalanceTransactionType, SprintRunStatus
 from db.models import BalanceTransaction, SprintMemberResult, SprintRun
-from sqlalchemy import func, select
+from sqlalchemy import func, insert, literal, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from unitkeeper_backend.application.models import (
+    BalanceTransactionDraft,
     BalanceTransactionInfo,
     SprintMemberResultInfo,
+    SprintRunCursor,
     SprintRunInfo,
 )
 from unitkeeper_backend.infrastructure.repositories.mappers import map_sprint_run
 
+# Member results come in one extra round trip however many members the sprint
+# had. Profiles are deliberately not joined: names change, a snapshot does not.
+_WITH_MEMBER_RESULTS = selectinload(SprintRun.member_results)
+
 
 class SqlAlchemySprintRepository:
     def __init__(self, session: AsyncSession) -> None:
@@ -31,7 +38,7 @@ class SqlAlchemySprintRepository:
     ) -> SprintRunInfo | None:
         query = (
             select(SprintRun)
-            .options(selectinload(SprintRun.member_results))
+            .options(_WITH_MEMBER_RESULTS)
             .where(
                 SprintRun.group_id == group_id,
                 SprintRun.period_start == period_start,
@@ -42,6 +49,50 @@ class SqlAlchemySprintRepository:
         model = result.scalar_one_or_none()
         return map_sprint_run(model) if model is not None else None
 
+    async def get_closed_sprint_run(
+        self, *, group_id: int, sprint_run_id: int
+    ) -> SprintRunInfo | None:
+        query = (
+            select(SprintRun)
+            .options(_WITH_MEMBER_RESULTS)
+            .where(
+                SprintRun.id == sprint_run_id,
+                SprintRun.group_id == group_id,
+                SprintRun.status == SprintRunStatus.CLOSED,
+            )
+        )
+        model = (await self._session.execute(query)).scalar_one_or_none()
+        if model is None:
+            return None
+        info = map_sprint_run(model)
+        info.member_results.sort(key=lambda item: item.user_id)
+        return info
+
+    async def list_closed_sprint_runs(
+        self,
+        *,
+        group_id: int,
+        limit: int,
+        before: SprintRunCursor | None = None,
+    ) -> list[SprintRunInfo]:
+        """Return newest-first sprint summaries without their member results."""
+        conditions = [SprintRun.group_id == group_id, SprintRun.status == SprintRunStatus.CLOSED]
+        if before is not None:
+            # The (group_id, period_start, period_end) unique index starts the
+            # scan right after the previous page.
+            conditions.append(
+                tuple_(SprintRun.period_start, SprintRun.id)
+                < tuple_(literal(before.period_start), literal(before.id))
+            )
+        query = (
+            select(SprintRun)
+            .where(*conditions)
+            .order_by(SprintRun.period_start.desc(), SprintRun.id.desc())
+            .limit(limit)
+        )
+        result = await self._session.execute(query)
+        return [map_sprint_run(model, include_members=False) for model in result.scalars()]
+
     async def create_sprint_run(
         self,
         *,
@@ -69,29 +120,36 @@ class SqlAlchemySprintRepository:
         self._session.add(model)
         await self._session.flush()
 
-        for item in member_results:
-            self._session.add(
-                SprintMemberResult(
-                    sprint_run_id=model.id,
-                    user_id=item.user_id,
-                    planned_units=item.planned_units,
-                    completed_units=item.completed_units,
-                    efficiency_percent=item.efficiency_percent,
-                    bonus_units=item.bonus_units,
-                    balance_delta=item.balance_delta,
-                    balance_after=item.balance_after,
-                )
+        if member_results:
+            await self._session.execute(
+                insert(SprintMemberResult),
+                [
+                    {
+                        "sprint_run_id": model.id,
+                        "user_id": item.user_id,
+                        "planned_units": item.planned_units,
+                        "completed_units": item.completed_units,
+                        "efficiency_percent": item.efficiency_percent,
+                        "bonus_units": item.bonus_units,
+                        "balance_delta": item.balance_delta,
+                        "balance_after": item.balance_after,
+                    }
+                    for item in member_results
+                ],
             )
-
-        await self._session.flush()
-        await self._session.refresh(model)
-        refreshed = await self.get_sprint_run(
-            group_id=group_id,
-            period_start=period_start,
-            period_end=period_end,
+        return SprintRunInfo(
+            id=model.id,
+            group_id=model.group_id,
+            period_start=model.period_start,
+            period_end=model.period_end,
+            status=model.status,
+            total_planned_units=model.total_planned_units,
+            total_completed_units=model.total_completed_units,
+            bonus_units=model.bonus_units,
+            balance_delta=model.balance_delta,
+            closed_at=model.closed_at,
+            member_results=sorted(member_results, key=lambda item: item.user_id),
         )
-        assert refreshed is not None
-        return refreshed
 
     async def add_balance_transaction(
         self,
@@ -123,6 +181,30 @@ class SqlAlchemySprintRepository:
         )
         await self._session.flush()
 
+    async def add_balance_transactions(
+        self, transactions: Sequence[BalanceTransactionDraft]
+    ) -> None:
+        if not transactions:
+            return
+        await self._session.execute(
+            insert(BalanceTransaction),
+            [
+                {
+                    "group_id": item.group_id,
+                    "account_type": item.account_type,
+                    "user_id": item.user_id,
+                    "transaction_type": item.transaction_type,
+                    "amount_delta": item.amount_delta,
+                    "description": item.description,
+                    "transaction_group_id": item.transaction_group_id,
+                    "sprint_run_id": item.sprint_run_id,
+                    "task_log_id": item.task_log_id,
+                    "counterparty_user_id": item.counterparty_user_id,
+                }
+                for item in transactions
+            ],
+        )
+
     async def list_balance_transactions(
         self,
         *,
@@ -1,16 +1,58 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
-from datetime import datetime
+from datetime import date, datetime
 from decimal import Decimal
+from typing import Any
 
-from db.enums import TaskLogStatus
-from db.models import Task, TaskLog
-from sqlalchemy import func, select
+from db.enums import NOTIFICATION_EVENT_PRIORITIES, NotificationEventType, TaskLogStatus
+from db.models import (
+    GroupMembership,
+    NotificationOutboxEvent,
+    SprintProgress,
+    Task,
+    TaskLog,
+    TaskSprintSlot,
+)
+from sqlalchemy import (
+    BigInteger,
+    Date,
+    DateTime,
+    Integer,
+    Select,
+    SmallInteger,
+    and_,
+    case,
+    column,
+    delete,
+    exists,
+    func,
+    literal,
+    null,
+    or_,
+    select,
+    true,
+    tuple_,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.dml import ReturningInsert
 from sqlalchemy.sql.elements import ColumnElement
 
-from unitkeeper_backend.application.models import TaskInfo, TaskLogInfo
+from unitkeeper_backend.application.models import (
+    KeysetCursor,
+    SprintProgressDelta,
+    SprintProgressInfo,
+    SprintSlotDelta,
+    TaskCompletionOutcome,
+    TaskCompletionTotals,
+    TaskImportItem,
+    TaskInfo,
+    TaskLogInfo,
+    TaskSlotCounts,
+)
 from unitkeeper_backend.domain.errors import NotFoundError
 from unitkeeper_backend.infrastructure.repositories.mappers import map_task, map_task_log
 
@@ -37,6 +79,27 @@ class SqlAlchemyTaskRepository:
         await self._session.flush()
         return map_task(model)
 
+    async def create_tasks(
+        self, *, group_id: int, items: Sequence[TaskImportItem]
+    ) -> list[TaskInfo]:
+        if not items:
+            return []
+        # One multi-row INSERT ... RETURNING; rows come back in input order.
+        statement = insert(Task).returning(Task, sort_by_parameter_order=True)
+        result = await self._session.scalars(
+            statement,
+            [
+                {
+                    "group_id": group_id,
+                    "title": item.title,
+                    "frequency_per_sprint": item.frequency_per_sprint,
+                    "unit_cost": item.unit_cost,
+                }
+                for item in items
+            ],
+        )
+        return [map_task(model) for model in result.all()]
+
     async def list_tasks(self, *, group_id: int, active_only: bool = True) -> list[TaskInfo]:
         query = select(Task).where(Task.group_id == group_id)
         if active_only:
@@ -82,83 +145,523 @@ class SqlAlchemyTaskRepository:
         model.deleted_at = deleted_at
         await self._session.flush()
 
-    async def count_completed_in_window(
+    async def count_slots_in_window(
         self,
         *,
-        task_id: int,
+        group_id: int,
         window_start: datetime,
         window_end_exclusive: datetime,
-    ) -> int:
-        completed_at = func.coalesce(TaskLog.decided_at, TaskLog.created_at)
-        query = select(func.count(TaskLog.id)).where(
-            TaskLog.task_id == task_id,
-            TaskLog.status == TaskLogStatus.COMPLETED,
-            completed_at >= window_start,
-            completed_at < window_end_exclusive,
+        task_ids: Sequence[int] | None = None,
+    ) -> dict[int, TaskSlotCounts]:
+        # One grouped aggregate for the whole task list. Tasks without logs in
+        # the window are simply absent from the result.
+        is_completed, is_pending = self._slot_conditions(
+            window_start=window_start, window_end_exclusive=window_end_exclusive
+        )
+        query = (
+            select(
+                TaskLog.task_id,
+                func.count().filter(is_completed),
+                func.count().filter(is_pending),
+            )
+            .where(TaskLog.group_id == group_id, or_(is_completed, is_pending))
+            .group_by(TaskLog.task_id)
         )
+        if task_ids is not None:
+            if not task_ids:
+                return {}
+            query = query.where(TaskLog.task_id.in_(tuple(task_ids)))
         result = await self._session.execute(query)
-        return int(result.scalar_one())
+        return {
+            task_id: TaskSlotCounts(completed=int(completed), pending=int(pending))
+            for task_id, completed, pending in result.all()
+        }
 
-    async def count_pending_in_window(
+    async def seed_sprint_slots(
         self,
         *,
+        group_id: int,
         task_id: int,
+        period_start: date,
         window_start: datetime,
         window_end_exclusive: datetime,
-    ) -> int:
-        # Pending logs are not yet decided, so they are placed in the window by
-        # their creation time.
-        query = select(func.count(TaskLog.id)).where(
-            TaskLog.task_id == task_id,
-            TaskLog.status == TaskLogStatus.PENDING,
-            TaskLog.created_at >= window_start,
-            TaskLog.created_at < window_end_exclusive,
+    ) -> None:
+        # Runs once per task and sprint: the first writer counts the task's
+        # logs into a fresh counter row, concurrent seeders wait on the unique
+        # key and then leave the committed row alone.
+        is_completed, is_pending = self._slot_conditions(
+            window_start=window_start, window_end_exclusive=window_end_exclusive
+        )
+        counts = select(
+            literal(group_id, Integer),
+            literal(task_id, Integer),
+            literal(period_start, Date),
+            func.count().filter(is_completed),
+            func.count().filter(is_pending),
+        ).where(TaskLog.task_id == task_id)
+        statement = (
+            insert(TaskSprintSlot)
+            .from_select(
+                ["group_id", "task_id", "period_start", "completed_count", "pending_count"],
+                counts,
+            )
+            .on_conflict_do_nothing(index_elements=["task_id", "period_start"])
+        )
+        await self._session.execute(statement)
+
+    async def lock_sprint_slots(
+        self, *, keys: Sequence[tuple[int, date]]
+    ) -> dict[tuple[int, date], TaskSlotCounts]:
+        if not keys:
+            return {}
+        # Rows are locked in key order so overlapping batches queue up
+        # instead of deadlocking.
+        query = (
+            select(
+                TaskSprintSlot.task_id,
+                TaskSprintSlot.period_start,
+                TaskSprintSlot.completed_count,
+                TaskSprintSlot.pending_count,
+            )
+            .where(tuple_(TaskSprintSlot.task_id, TaskSprintSlot.period_start).in_(list(keys)))
+            .order_by(TaskSprintSlot.task_id, TaskSprintSlot.period_start)
+            .with_for_update()
         )
         result = await self._session.execute(query)
-        return int(result.scalar_one())
+        return {
+            (row.task_id, row.period_start): TaskSlotCounts(
+                completed=row.completed_count, pending=row.pending_count
+            )
+            for row in result.all()
+        }
+
+    async def apply_sprint_slot_deltas(self, *, deltas: Sequence[SprintSlotDelta]) -> None:
+        if not deltas:
+            return
+        changes = values(
+            column("task_id", Integer),
+            column("period_start", Date),
+            column("completed", Integer),
+            column("pending", Integer),
+            name="changes",
+        ).data([(item.task_id, item.period_start, item.completed, item.pending) for item in deltas])
+        statement = (
+            update(TaskSprintSlot)
+            .where(
+                TaskSprintSlot.task_id == changes.c.task_id,
+                TaskSprintSlot.period_start == changes.c.period_start,
+            )
+            .values(
+                completed_count=TaskSprintSlot.completed_count + changes.c.completed,
+                pending_count=func.greatest(TaskSprintSlot.pending_count + changes.c.pending, 0),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        await self._session.execute(statement)
+
+    async def confirm_sprint_slot(
+        self,
+        *,
+        task_id: int,
+        period_start: date,
+        frequency_per_sprint: int,
+        release_pending: bool,
+    ) -> bool:
+        pending_count = (
+            func.greatest(TaskSprintSlot.pending_count - 1, 0)
+            if release_pending
+            else TaskSprintSlot.pending_count
+        )
+        statement = (
+            update(TaskSprintSlot)
+            .where(
+                TaskSprintSlot.task_id == task_id,
+                TaskSprintSlot.period_start == period_start,
+                TaskSprintSlot.completed_count < frequency_per_sprint,
+            )
+            .values(
+                completed_count=TaskSprintSlot.completed_count + 1,
+                pending_count=pending_count,
+            )
+            .returning(TaskSprintSlot.id)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self._session.execute(statement)
+        return result.scalar_one_or_none() is not None
+
+    async def release_sprint_slot(self, *, task_id: int, period_start: date) -> None:
+        statement = (
+            update(TaskSprintSlot)
+            .where(
+                TaskSprintSlot.task_id == task_id,
+                TaskSprintSlot.period_start == period_start,
+            )
+            .values(pending_count=func.greatest(TaskSprintSlot.pending_count - 1, 0))
+            .execution_options(synchronize_session=False)
+        )
+        await self._session.execute(statement)
+
+    async def clear_pending_sprint_slots(self, *, group_id: int) -> None:
+        statement = (
+            update(TaskSprintSlot)
+            .where(TaskSprintSlot.group_id == group_id, TaskSprintSlot.pending_count > 0)
+            .values(pending_count=0)
+            .execution_options(synchronize_session=False)
+        )
+        await self._session.execute(statement)
 
-    async def lock_task(self, *, group_id: int, task_id: int) -> TaskInfo:
-        # Row-level lock to serialise concurrent completions against the sprint
-        # frequency cap. A no-op on backends without SELECT ... FOR UPDATE.
-        query = select(Task).where(Task.group_id == group_id, Task.id == task_id).with_for_update()
+    async def apply_sprint_progress_deltas(
+        self, *, group_id: int, deltas: Sequence[SprintProgressDelta]
+    ) -> None:
+        if not deltas:
+            return
+        changes = values(
+            column("user_id", BigInteger),
+            column("task_id", Integer),
+            column("period_start", Date),
+            column("completed", Integer),
+            column("pending", Integer),
+            name="changes",
+        ).data(
+            [
+                (item.user_id, item.task_id, item.period_start, item.completed, item.pending)
+                for item in deltas
+            ]
+        )
+        # Counts are valued at the current unit cost, and soft-deleted tasks
+        # drop out, the same way rebuild_sprint_progress derives the rows.
+        # Sorted input keeps the row lock order stable across transactions.
+        rows = (
+            select(
+                literal(group_id),
+                changes.c.period_start,
+                changes.c.user_id,
+                func.sum(changes.c.completed),
+                func.sum(changes.c.completed * Task.unit_cost),
+                func.sum(changes.c.pending),
+                func.sum(changes.c.pending * Task.unit_cost),
+            )
+            .select_from(changes)
+            .join(
+                Task,
+                and_(
+                    Task.id == changes.c.task_id,
+                    Task.group_id == group_id,
+                    Task.deleted_at.is_(None),
+                ),
+            )
+            .group_by(changes.c.period_start, changes.c.user_id)
+            .order_by(changes.c.period_start, changes.c.user_id)
+        )
+        await self._lock_sprint_progress(group_id)
+        await self._session.execute(self._upsert_sprint_progress(rows))
+
+    async def clear_pending_sprint_progress(self, *, group_id: int) -> None:
+        await self._lock_sprint_progress(group_id)
+        statement = (
+            update(SprintProgress)
+            .where(SprintProgress.group_id == group_id, SprintProgress.pending_count != 0)
+            .values(pending_count=0, pending_units=0)
+            .execution_options(synchronize_session=False)
+        )
+        await self._session.execute(statement)
+
+    async def list_sprint_progress(
+        self, *, group_id: int, period_start: date
+    ) -> dict[int, SprintProgressInfo]:
+        query = select(
+            SprintProgress.user_id,
+            SprintProgress.completed_count,
+            SprintProgress.completed_units,
+            SprintProgress.pending_count,
+            SprintProgress.pending_units,
+        ).where(SprintProgress.group_id == group_id, SprintProgress.period_start == period_start)
         result = await self._session.execute(query)
-        model = result.scalar_one_or_none()
-        if model is None:
-            raise NotFoundError("Task was not found")
-        return map_task(model)
+        return {
+            row.user_id: SprintProgressInfo(
+                user_id=row.user_id,
+                completed_count=row.completed_count,
+                completed_units=row.completed_units,
+                pending_count=row.pending_count,
+                pending_units=row.pending_units,
+            )
+            for row in result.all()
+        }
 
-    async def create_task_log(
+    async def rebuild_sprint_progress(
+        self,
+        *,
+        group_id: int,
+        period_start: date,
+        window_start: datetime,
+        window_end_exclusive: datetime,
+    ) -> int:
+        # Writers only ever add deltas, so holding off the group's writers
+        # while its rows are recomputed is what keeps their later deltas on
+        # top of a consistent base. The lock is released at commit.
+        await self._lock_sprint_progress(group_id, exclusive=True)
+        await self._session.execute(
+            delete(SprintProgress).where(
+                SprintProgress.group_id == group_id,
+                SprintProgress.period_start == period_start,
+            )
+        )
+        completed = and_(
+            TaskLog.status == TaskLogStatus.COMPLETED,
+            TaskLog.completed_at >= window_start,
+            TaskLog.completed_at < window_end_exclusive,
+        )
+        pending = and_(
+            TaskLog.status == TaskLogStatus.PENDING,
+            TaskLog.completed_at >= window_start,
+            TaskLog.completed_at < window_end_exclusive,
+        )
+        rows = (
+            select(
+                literal(group_id),
+                literal(period_start, Date),
+                TaskLog.performer_user_id,
+                func.count().filter(completed),
+                func.coalesce(func.sum(Task.unit_cost).filter(completed), 0),
+                func.count().filter(pending),
+                func.coalesce(func.sum(Task.unit_cost).filter(pending), 0),
+            )
+            .join(Task, and_(Task.id == TaskLog.task_id, Task.deleted_at.is_(None)))
+            .where(TaskLog.group_id == group_id, or_(completed, pending))
+            .group_by(TaskLog.performer_user_id)
+        )
+        statement = (
+            insert(SprintProgress)
+            .from_select(self._SPRINT_PROGRESS_COLUMNS, rows)
+            .returning(SprintProgress.id)
+        )
+        return len((await self._session.execute(statement)).all())
+
+    async def complete_task(
         self,
         *,
         group_id: int,
         task_id: int,
         performer_user_id: int,
-        status: TaskLogStatus,
+        period_start: date,
         created_at: datetime,
-        approver_user_id: int | None = None,
-        decided_at: datetime | None = None,
-        rejection_reason: str | None = None,
-    ) -> TaskLogInfo:
-        model = TaskLog(
-            group_id=group_id,
-            task_id=task_id,
-            performer_user_id=performer_user_id,
-            status=status,
-            approver_user_id=approver_user_id,
-            decided_at=decided_at,
-            rejection_reason=rejection_reason,
-            created_at=created_at,
-            updated_at=created_at,
+    ) -> TaskCompletionOutcome:
+        # Membership check, slot reservation, the log insert and the approval
+        # fan-out run as one statement, so the round trips do not grow with
+        # the group. Every guard is reported back so the service can raise
+        # the same errors as the step-by-step flow.
+        members = (
+            select(GroupMembership.user_id)
+            .where(GroupMembership.group_id == group_id, GroupMembership.left_at.is_(None))
+            .cte("members")
+        )
+        task = (
+            select(Task.id, Task.title, Task.frequency_per_sprint, Task.unit_cost, Task.deleted_at)
+            .where(Task.id == task_id, Task.group_id == group_id)
+            .cte("task")
+        )
+        performer_is_member = exists().where(members.c.user_id == performer_user_id)
+        # A single active member approves their own work immediately.
+        is_solo = select(func.count()).select_from(members).scalar_subquery() == 1
+        frequency = (
+            select(task.c.frequency_per_sprint).where(task.c.deleted_at.is_(None)).scalar_subquery()
+        )
+        reserved = (
+            update(TaskSprintSlot)
+            .where(
+                TaskSprintSlot.task_id == task_id,
+                TaskSprintSlot.period_start == period_start,
+                TaskSprintSlot.completed_count + TaskSprintSlot.pending_count < frequency,
+                performer_is_member,
+            )
+            .values(
+                completed_count=TaskSprintSlot.completed_count + case((is_solo, 1), else_=0),
+                pending_count=TaskSprintSlot.pending_count + case((is_solo, 0), else_=1),
+            )
+            .returning(TaskSprintSlot.id)
+            .cte("reserved")
+        )
+        status_type = TaskLog.__table__.c.status.type
+        log = (
+            insert(TaskLog)
+            .from_select(
+                [
+                    TaskLog.group_id,
+                    TaskLog.task_id,
+                    TaskLog.performer_user_id,
+                    TaskLog.status,
+                    TaskLog.approver_user_id,
+                    TaskLog.decided_at,
+                    TaskLog.created_at,
+                    TaskLog.updated_at,
+                ],
+                select(
+                    literal(group_id),
+                    literal(task_id),
+                    literal(performer_user_id, BigInteger),
+                    case(
+                        (is_solo, literal(TaskLogStatus.COMPLETED, status_type)),
+                        else_=literal(TaskLogStatus.PENDING, status_type),
+                    ),
+                    case((is_solo, literal(performer_user_id, BigInteger)), else_=null()),
+                    case((is_solo, literal(created_at, DateTime(timezone=True))), else_=null()),
+                    literal(created_at, DateTime(timezone=True)),
+                    literal(created_at, DateTime(timezone=True)),
+                ).where(exists().select_from(reserved)),
+            )
+            .returning(
+                TaskLog.id,
+                TaskLog.status,
+                TaskLog.approver_user_id,
+                TaskLog.decided_at,
+                TaskLog.created_at,
+            )
+            .cte("log")
+        )
+        outbox = (
+            insert(NotificationOutboxEvent)
+            .from_select(
+                [
+                    NotificationOutboxEvent.id,
+                    NotificationOutboxEvent.event_type,
+                    NotificationOutboxEvent.priority,
+                    NotificationOutboxEvent.recipient_user_id,
+                    NotificationOutboxEvent.group_id,
+                    NotificationOutboxEvent.payload,
+                    NotificationOutboxEvent.deep_link_path,
+                ],
+                select(
+                    func.gen_random_uuid(),
+                    literal(
+                        NotificationEventType.TASK_APPROVAL_REQUESTED,
+                        NotificationOutboxEvent.__table__.c.event_type.type,
+                    ),
+                    literal(
+                        NOTIFICATION_EVENT_PRIORITIES[
+                            NotificationEventType.TASK_APPROVAL_REQUESTED
+                        ],
+                        SmallInteger,
+                    ),
+                    members.c.user_id,
+                    literal(group_id),
+                    func.jsonb_build_object(
+                        "task_log_id",
+                        log.c.id,
+                        "task_title",
+                        task.c.title,
+                        "performer_user_id",
+                        literal(performer_user_id, BigInteger),
+                    ),
+                    func.concat("/tasks/history?task_log_id=", log.c.id),
+                )
+                .select_from(log)
+                .join(task, true())
+                .join(members, members.c.user_id != performer_user_id)
+                .where(log.c.status == TaskLogStatus.PENDING),
+                include_defaults=False,
+            )
+            .returning(NotificationOutboxEvent.id)
+            .cte("outbox")
+        )
+        is_completed = log.c.status == TaskLogStatus.COMPLETED
+        progress = self._upsert_sprint_progress(
+            select(
+                literal(group_id),
+                literal(period_start, Date),
+                literal(performer_user_id, BigInteger),
+                case((is_completed, 1), else_=0),
+                case((is_completed, task.c.unit_cost), else_=0),
+                case((is_completed, 0), else_=1),
+                case((is_completed, 0), else_=task.c.unit_cost),
+            )
+            .select_from(log)
+            .join(task, true())
+        ).cte("progress")
+        anchor = select(literal(1).label("one")).subquery("anchor")
+        statement = select(
+            performer_is_member.label("performer_is_member"),
+            task.c.id.label("task_id"),
+            task.c.deleted_at,
+            exists()
+            .where(
+                TaskSprintSlot.task_id == task_id,
+                TaskSprintSlot.period_start == period_start,
+            )
+            .label("slot_row_exists"),
+            log.c.id.label("log_id"),
+            log.c.status,
+            log.c.approver_user_id,
+            log.c.decided_at,
+            log.c.created_at,
+            # Referencing the fan-out keeps its CTE in the rendered statement.
+            select(func.count()).select_from(outbox).scalar_subquery().label("notified"),
+            select(func.count()).select_from(progress).scalar_subquery().label("progressed"),
+        ).select_from(anchor.outerjoin(task, true()).outerjoin(log, true()))
+        # Taken before the statement starts, so a rebuild that finished while
+        # this waited is in the statement's snapshot, unit costs included.
+        await self._lock_sprint_progress(group_id)
+        row = (await self._session.execute(statement)).one()
+        completed_log = None
+        if row.log_id is not None:
+            completed_log = TaskLogInfo(
+                id=row.log_id,
+                group_id=group_id,
+                task_id=task_id,
+                performer_user_id=performer_user_id,
+                status=row.status,
+                approver_user_id=row.approver_user_id,
+                decided_at=row.decided_at,
+                rejection_reason=None,
+                created_at=row.created_at,
+            )
+        return TaskCompletionOutcome(
+            performer_is_member=row.performer_is_member,
+            task_found=row.task_id is not None,
+            task_active=row.deleted_at is None,
+            slot_row_exists=row.slot_row_exists,
+            log=completed_log,
         )
-        self._session.add(model)
-        await self._session.flush()
-        await self._session.refresh(model)
-        return map_task_log(model)
 
     async def get_task_log(self, *, log_id: int) -> TaskLogInfo | None:
         model = await self._session.get(TaskLog, log_id)
         return map_task_log(model) if model is not None else None
 
+    async def list_task_logs_by_ids(
+        self, *, group_id: int, log_ids: Sequence[int], for_update: bool = False
+    ) -> list[TaskLogInfo]:
+        if not log_ids:
+            return []
+        query = (
+            select(TaskLog)
+            .where(TaskLog.group_id == group_id, TaskLog.id.in_(tuple(log_ids)))
+            .order_by(TaskLog.id)
+        )
+        if for_update:
+            query = query.with_for_update().execution_options(populate_existing=True)
+        result = await self._session.execute(query)
+        return [map_task_log(item) for item in result.scalars().all()]
+
+    @staticmethod
+    def _slot_conditions(
+        *, window_start: datetime, window_end_exclusive: datetime
+    ) -> tuple[ColumnElement[bool], ColumnElement[bool]]:
+        # Completed logs occupy the window they were decided in; pending logs
+        # are not yet decided, so they are placed by their creation time,
+        # which completed_at falls back to. Filtering both on completed_at
+        # keeps the counts answerable from the (group, status, completed_at)
+        # index alone.
+        is_completed = and_(
+            TaskLog.status == TaskLogStatus.COMPLETED,
+            TaskLog.completed_at >= window_start,
+            TaskLog.completed_at < window_end_exclusive,
+        )
+        is_pending = and_(
+            TaskLog.status == TaskLogStatus.PENDING,
+            TaskLog.completed_at >= window_start,
+            TaskLog.completed_at < window_end_exclusive,
+        )
+        return is_completed, is_pending
+
     @staticmethod
     def _task_log_filters(
         *,
@@ -189,6 +692,7 @@ class SqlAlchemyTaskRepository:
         statuses: Sequence[TaskLogStatus] | None = None,
         limit: int,
         offset: int,
+        before: KeysetCursor | None = None,
     ) -> Sequence[TaskLogInfo]:
         conditions = self._task_log_filters(
             group_id=group_id,
@@ -197,6 +701,13 @@ class SqlAlchemyTaskRepository:
             task_id=task_id,
             statuses=statuses,
         )
+        if before is not None:
+            # Row-value comparison keeps the newest-first order and lets the
+            # scan start right after the previous page instead of skipping rows.
+            conditions.append(
+                tuple_(TaskLog.created_at, TaskLog.id)
+                < tuple_(literal(before.created_at), literal(before.id))
+            )
         query = (
             select(TaskLog)
             .where(*conditions)
@@ -223,7 +734,7 @@ class SqlAlchemyTaskRepository:
             task_id=task_id,
             statuses=statuses,
         )
-        query = select(func.count(TaskLog.id)).where(*conditions)
+        query = select(func.count()).where(*conditions)
         result = await self._session.execute(query)
         return int(result.scalar_one())
 
@@ -257,6 +768,54 @@ class SqlAlchemyTaskRepository:
         await self._session.flush()
         return map_task_log(model)
 
+    async def approve_task_logs(
+        self,
+        *,
+        log_ids: Sequence[int],
+        approver_user_id: int,
+        decided_at: datetime,
+    ) -> list[TaskLogInfo]:
+        return await self._decide_task_logs(
+            log_ids=log_ids,
+            status=TaskLogStatus.COMPLETED,
+            approver_user_id=approver_user_id,
+            decided_at=decided_at,
+            rejection_reason=None,
+        )
+
+    async def reject_task_logs(
+        self,
+        *,
+        log_ids: Sequence[int],
+        approver_user_id: int,
+        decided_at: datetime,
+        rejection_reason: str,
+    ) -> list[TaskLogInfo]:
+        return await self._decide_task_logs(
+            log_ids=log_ids,
+            status=TaskLogStatus.REJECTED,
+            approver_user_id=approver_user_id,
+            decided_at=decided_at,
+            rejection_reason=rejection_reason,
+        )
+
+    async def reject_pending_task_logs(
+        self, *, group_id: int, decided_at: datetime, rejection_reason: str
+    ) -> int:
+        statement = (
+            update(TaskLog)
+            .where(TaskLog.group_id == group_id, TaskLog.status == TaskLogStatus.PENDING)
+            .values(
+                status=TaskLogStatus.REJECTED,
+                approver_user_id=None,
+                decided_at=decided_at,
+                rejection_reason=rejection_reason,
+            )
+            .returning(TaskLog.id)
+            .execution_options(synchronize_session=False)
+        )
+        return len((await self._session.execute(statement)).all())
+
     async def delete_task_log(self, *, log_id: int) -> None:
         model = await self._require_log(log_id)
         await self._session.delete(model)
@@ -270,12 +829,11 @@ class SqlAlchemyTaskRepository:
         window_start: datetime,
         window_end_exclusive: datetime,
     ) -> Sequence[TaskLogInfo]:
-        completed_at = func.coalesce(TaskLog.decided_at, TaskLog.created_at)
         query = select(TaskLog).where(
             TaskLog.group_id == group_id,
             TaskLog.status == TaskLogStatus.COMPLETED,
-            completed_at >= window_start,
-            completed_at < window_end_exclusive,
+            TaskLog.completed_at >= window_start,
+            TaskLog.completed_at < window_end_exclusive,
         )
         if performer_user_id is not None:
             query = query.where(TaskLog.performer_user_id == performer_user_id)
@@ -283,6 +841,42 @@ class SqlAlchemyTaskRepository:
         result = await self._session.execute(query)
         return [map_task_log(item) for item in result.scalars().all()]
 
+    async def summarize_completed_logs_in_window(
+        self,
+        *,
+        group_id: int,
+        window_start: datetime,
+        window_end_exclusive: datetime,
+    ) -> list[TaskCompletionTotals]:
+        completed_count = func.count()
+        query = (
+            select(
+                TaskLog.task_id,
+                TaskLog.performer_user_id,
+                completed_count,
+                func.sum(Task.unit_cost),
+            )
+            .join(Task, Task.id == TaskLog.task_id)
+            .where(
+                TaskLog.group_id == group_id,
+                TaskLog.status == TaskLogStatus.COMPLETED,
+                TaskLog.completed_at >= window_start,
+                TaskLog.completed_at < window_end_exclusive,
+            )
+            .group_by(TaskLog.task_id, TaskLog.performer_user_id)
+            .order_by(TaskLog.task_id, TaskLog.performer_user_id)
+        )
+        result = await self._session.execute(query)
+        return [
+            TaskCompletionTotals(
+                task_id=task_id,
+                performer_user_id=performer_user_id,
+                completed_count=count,
+                completed_units=units,
+            )
+            for task_id, performer_user_id, count, units in result.tuples().all()
+        ]
+
     async def _require_task(self, *, group_id: int, task_id: int) -> Task:
         query = select(Task).where(Task.group_id == group_id, Task.id == task_id)
         result = await self._session.execute(query)
@@ -291,8 +885,69 @@ class SqlAlchemyTaskRepository:
             raise NotFoundError("Task was not found")
         return model
 
+    async def _decide_task_logs(
+        self,
+        *,
+        log_ids: Sequence[int],
+        status: TaskLogStatus,
+        approver_user_id: int,
+        decided_at: datetime,
+        rejection_reason: str | None,
+    ) -> list[TaskLogInfo]:
+        if not log_ids:
+            return []
+        statement = (
+            update(TaskLog)
+            .where(TaskLog.id.in_(tuple(log_ids)))
+            .values(
+                status=status,
+                approver_user_id=approver_user_id,
+                decided_at=decided_at,
+                rejection_reason=rejection_reason,
+            )
+            .returning(TaskLog)
+            .execution_options(populate_existing=True)
+        )
+        result = await self._session.scalars(statement)
+        return sorted((map_task_log(item) for item in result.all()), key=lambda log: log.id)
+
     async def _require_log(self, log_id: int) -> TaskLog:
         model = await self._session.get(TaskLog, log_id)
         if model is None:
             raise NotFoundError("Task log was not found")
         return model
+
+    async def _lock_sprint_progress(self, group_id: int, *, exclusive: bool = False) -> None:
+        # Transaction-level advisory lock on one group's progress rows: delta
+        # writers share it and run side by side, a rebuild holds it alone.
+        lock = func.pg_advisory_xact_lock if exclusive else func.pg_advisory_xact_lock_shared
+        await self._session.execute(select(lock(func.hashtext("sprint_progress"), group_id)))
+
+    _SPRINT_PROGRESS_COLUMNS = [
+        SprintProgress.group_id,
+        SprintProgress.period_start,
+        SprintProgress.user_id,
+        SprintProgress.completed_count,
+        SprintProgress.completed_units,
+        SprintProgress.pending_count,
+        SprintProgress.pending_units,
+    ]
+
+    @classmethod
+    def _upsert_sprint_progress(cls, rows: Select[Any]) -> ReturningInsert[tuple[int]]:
+        statement = insert(SprintProgress).from_select(cls._SPRINT_PROGRESS_COLUMNS, rows)
+        excluded = statement.excluded
+        return statement.on_conflict_do_update(
+            index_elements=[
+                SprintProgress.group_id,
+                SprintProgress.period_start,
+                SprintProgress.user_id,
+            ],
+            set_={
+                "completed_count": SprintProgress.completed_count + excluded.completed_count,
+                "completed_units": SprintProgress.completed_units + excluded.completed_units,
+                "pending_count": SprintProgress.pending_count + excluded.pending_count,
+                "pending_units": SprintProgress.pending_units + excluded.pending_units,
+                "updated_at": func.now(),
+            },
+        ).returning(SprintProgress.id)
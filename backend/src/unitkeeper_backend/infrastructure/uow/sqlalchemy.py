@@ -1,8 +1,15 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from unitkeeper_backend.infrastructure.repositories.groups import SqlAlchemyGroupRepository
+from unitkeeper_backend.infrastructure.repositories.idempotency import (
+    SqlAlchemyIdempotencyRepository,
+)
+from unitkeeper_backend.infrastructure.repositories.ledger import SqlAlchemyLedgerRepository
 from unitkeeper_backend.infrastructure.repositories.notifications import (
     SqlAlchemyNotificationRepository,
 )
@@ -19,9 +26,30 @@ class SqlAlchemyUnitOfWork:
         self.tasks = SqlAlchemyTaskRepository(session)
         self.sprints = SqlAlchemySprintRepository(session)
         self.notifications = SqlAlchemyNotificationRepository(session)
+        self.ledger = SqlAlchemyLedgerRepository(session)
+        self.idempotency = SqlAlchemyIdempotencyRepository(session)
+        self._held_commits = 0
 
     async def commit(self) -> None:
+        if self._held_commits:
+            await self._session.flush()
+            return
         await self._session.commit()
 
+    @asynccontextmanager
+    async def single_commit(self) -> AsyncIterator[None]:
+        """Turn ``commit()`` calls inside the block into flushes and commit once at its end.
+
+        Lets a caller add its own writes to a use case's transaction. If the
+        block raises, nothing is committed.
+        """
+        self._held_commits += 1
+        try:
+            yield
+        finally:
+            self._held_commits -= 1
+        if not self._held_commits:
+            await self._session.commit()
+
     async def rollback(self) -> None:
         await self._session.rollback()
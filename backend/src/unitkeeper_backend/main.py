@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 
@@ -10,13 +13,20 @@ from unitkeeper_backend.domain.errors import DomainError
 
 
 def create_app() -> FastAPI:
-    app = FastAPI(title=settings.app_name)
+    app = FastAPI(title=settings.app_name, lifespan=lifespan)
     app.include_router(build_api_router())
     app.add_exception_handler(DomainError, domain_error_handler)
     setup_di(app)
     return app
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    yield
+    # Releases app-scoped resources such as the outbox LISTEN connection.
+    await app.state.dishka_container.close()
+
+
 async def domain_error_handler(_: Request, exc: Exception) -> JSONResponse:
     if not isinstance(exc, DomainError):
         raise exc
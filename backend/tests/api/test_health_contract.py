@@ -11,3 +11,12 @@ def test_health_route_is_exposed_under_v1_prefix() -> None:
     paths = set(app.openapi()["paths"])
 
     assert "/api/v1/health" in paths
+    assert "/api/v1/health/context-cache" in paths
+
+
+def test_session_refresh_route_is_exposed_under_v1_prefix() -> None:
+    app = FastAPI()
+    app.include_router(build_api_router())
+    paths = set(app.openapi()["paths"])
+
+    assert "/api/v1/auth/refresh" in paths
@@ -12,14 +12,20 @@ def test_task_management_routes_are_registered_under_v1_prefix() -> None:
 
     assert "/api/v1/tasks" in paths
     assert "/api/v1/tasks/import" in paths
+    assert "/api/v1/tasks/done" in paths
     assert "/api/v1/tasks/{task_id}" in paths
     assert "/api/v1/tasks/{task_id}/increase-frequency" in paths
     assert "/api/v1/tasks/{task_id}/decrease-frequency" in paths
     assert "/api/v1/task-logs/pending-approval" in paths
     assert "/api/v1/task-logs/mine" in paths
     assert "/api/v1/task-logs/{log_id}" in paths
+    assert "/api/v1/task-logs/approve" in paths
+    assert "/api/v1/task-logs/reject" in paths
     assert "/api/v1/groups/current/task-logs" in paths
     assert "/api/v1/balances/me" in paths
+    assert "/api/v1/balances/me/as-of" in paths
     assert "/api/v1/balances/transfer-candidates" in paths
     assert "/api/v1/balances/transfers" in paths
     assert "/api/v1/balances/transactions" in paths
+    assert "/api/v1/sprints/history" in paths
+    assert "/api/v1/sprints/history/{sprint_run_id}" in paths
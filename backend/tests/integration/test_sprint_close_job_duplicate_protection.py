@@ -10,6 +10,8 @@ proves the pieces are wired correctly end to end and not just individually.
 
 from __future__ import annotations
 
+from collections.abc import Sequence
+from dataclasses import asdict
 from decimal import Decimal
 
 import pytest
@@ -18,7 +20,10 @@ from db.enums import Weekday
 from tests.support.fakes import FakeClock, InMemoryUnitOfWork, utc_datetime
 from unitkeeper_backend.application.context.service import CurrentContextService
 from unitkeeper_backend.application.groups.service import GroupService
-from unitkeeper_backend.application.jobs.notifications import SprintReportPublisher
+from unitkeeper_backend.application.jobs.notifications import (
+    OutboundEvent,
+    SprintReportPublisher,
+)
 from unitkeeper_backend.application.jobs.scheduler import SprintCloseJob
 from unitkeeper_backend.application.jobs.sprint_close import SprintCloseRunner, list_due_group_ids
 from unitkeeper_backend.application.models import UserProfile
@@ -38,6 +43,10 @@ class RecordingPublisher:
         self.keys.add(key)
         self.calls.append(kwargs)
 
+    async def enqueue_many_once(self, events: Sequence[OutboundEvent]) -> None:
+        for event in events:
+            await self.enqueue_once(**asdict(event))
+
 
 async def _seed_group(uow: InMemoryUnitOfWork, *, clock: FakeClock) -> None:
     for user_id in (1, 2):
@@ -87,14 +96,15 @@ async def test_rerunning_scheduler_pass_does_not_double_close_or_double_pay() ->
     notification_calls_after_first_run = len(publisher.calls)
     assert notification_calls_after_first_run > 0
 
-    # Simulate the scheduler firing again for the same day (e.g. process
-    # restart, overlapping trigger, or a retry). The window is still "due" by
-    # date, but the period has already been closed.
-    due_group_ids_again = await list_due_group_ids(uow=uow, clock=clock)
-    assert due_group_ids_again == [1]
+    # Closing moved the group's stored period end to the next window, so a
+    # rerun on the same day no longer lists it as due.
+    assert await list_due_group_ids(uow=uow, clock=clock) == []
 
+    # Simulate a trigger that listed the group before the first close
+    # committed (process restart, overlapping trigger, or a retry). The window
+    # is still "due" by date, but the period has already been closed.
     second_closed_count = await job.run(
-        due_group_ids=due_group_ids_again, correlation_id="scheduler-run-2"
+        due_group_ids=due_group_ids, correlation_id="scheduler-run-2"
     )
 
     assert second_closed_count == 0
@@ -1,14 +1,17 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Mapping, Sequence
+from contextlib import asynccontextmanager
 from dataclasses import replace
 from datetime import date, datetime, timezone
 from decimal import Decimal
 from uuid import UUID, uuid4
 
 from db.enums import (
+    NOTIFICATION_EVENT_PRIORITIES,
     BalanceTransactionAccountType,
     BalanceTransactionType,
+    IdempotencyStatus,
     NotificationEventType,
     NotificationOutboxStatus,
     SprintRunStatus,
@@ -17,18 +20,36 @@ from db.enums import (
 )
 
 from unitkeeper_backend.application.models import (
+    BalanceCheckpointInfo,
+    BalanceTransactionDraft,
     BalanceTransactionInfo,
     GroupInfo,
+    IdempotencyKeyRef,
+    IdempotencyRecord,
+    KeysetCursor,
+    LedgerCheckpointInfo,
+    LedgerEntry,
     MembershipInfo,
+    NotificationFailure,
+    NotificationOutboxEventDraft,
     NotificationOutboxEventInfo,
     SprintMemberResultInfo,
+    SprintProgressDelta,
+    SprintProgressInfo,
+    SprintRunCursor,
     SprintRunInfo,
+    SprintSlotDelta,
+    StoredResponse,
+    TaskCompletionOutcome,
+    TaskCompletionTotals,
+    TaskImportItem,
     TaskInfo,
     TaskLogInfo,
+    TaskSlotCounts,
     TelegramIdentity,
     UserProfile,
 )
-from unitkeeper_backend.domain.errors import BusinessRuleViolation, NotFoundError
+from unitkeeper_backend.domain.errors import BusinessRuleViolation
 
 
 class FakeClock:
@@ -70,18 +91,39 @@ class InMemoryGroupRepository:
         self.groups: dict[int, GroupInfo] = {}
         self.memberships: dict[int, MembershipInfo] = {}
         self.balances: dict[tuple[int, int], Decimal] = {}
+        self.membership_epochs: dict[int, int] = {}
+        self.sprint_period_ends: dict[int, date | None] = {}
+        self.balance_batch_calls = 0
         self._group_seq = 1
         self._membership_seq = 1
 
-    async def get_by_id(self, group_id: int) -> GroupInfo | None:
+    async def get_by_id(self, group_id: int, *, include_members: bool = True) -> GroupInfo | None:
         group = self.groups.get(group_id)
         if group is None:
             return None
+        if not include_members:
+            return replace(group, active_members=[])
         return replace(group, active_members=await self.list_active_memberships(group_id))
 
     async def list_group_ids(self) -> list[int]:
         return sorted(self.groups.keys())
 
+    async def list_groups_due_by(self, *, today: date) -> list[GroupInfo]:
+        active_group_ids = {
+            membership.group_id
+            for membership in self.memberships.values()
+            if membership.left_at is None
+        }
+        due: list[GroupInfo] = []
+        for group_id in sorted(self.groups):
+            period_end = self.sprint_period_ends.get(group_id)
+            if group_id in active_group_ids and (period_end is None or period_end <= today):
+                due.append(self.groups[group_id])
+        return due
+
+    async def set_sprint_period_end(self, *, group_id: int, period_end: date) -> None:
+        self.sprint_period_ends[group_id] = period_end
+
     async def get_by_name(self, name: str) -> GroupInfo | None:
         for group in self.groups.values():
             if group.name == name:
@@ -94,6 +136,9 @@ class InMemoryGroupRepository:
                 return membership
         return None
 
+    async def get_membership_epoch(self, user_id: int) -> int | None:
+        return self.membership_epochs.get(user_id, 0)
+
     async def get_active_membership_in_group(
         self, *, group_id: int, user_id: int
     ) -> MembershipInfo | None:
@@ -123,6 +168,7 @@ class InMemoryGroupRepository:
         sprint_duration_days: int,
         timezone: str,
         created_at: date,
+        sprint_period_end: date,
     ) -> GroupInfo:
         group = GroupInfo(
             id=self._group_seq,
@@ -137,6 +183,7 @@ class InMemoryGroupRepository:
             active_members=[],
         )
         self.groups[group.id] = group
+        self.sprint_period_ends[group.id] = sprint_period_end
         self._group_seq += 1
         return group
 
@@ -150,6 +197,7 @@ class InMemoryGroupRepository:
         )
         self.memberships[membership.id] = membership
         self._membership_seq += 1
+        self.membership_epochs[user_id] = self.membership_epochs.get(user_id, 0) + 1
         return membership
 
     async def ensure_balance(self, *, group_id: int, user_id: int) -> Decimal:
@@ -167,6 +215,9 @@ class InMemoryGroupRepository:
     async def deactivate_membership(self, membership_id: int, *, left_at: datetime) -> None:
         membership = self.memberships[membership_id]
         self.memberships[membership_id] = replace(membership, left_at=left_at)
+        self.membership_epochs[membership.user_id] = (
+            self.membership_epochs.get(membership.user_id, 0) + 1
+        )
 
     async def update_settings(
         self,
@@ -175,7 +226,10 @@ class InMemoryGroupRepository:
         join_secret: str | None,
         sprint_start_weekday: Weekday | None = None,
         sprint_duration_days: int | None = None,
+        sprint_period_end: date | None = None,
     ) -> GroupInfo:
+        if sprint_period_end is not None:
+            self.sprint_period_ends[group_id] = sprint_period_end
         group = self.groups[group_id]
         updated = replace(
             group,
@@ -207,12 +261,15 @@ class InMemoryGroupRepository:
     async def get_balance(self, *, group_id: int, user_id: int) -> Decimal:
         return self.balances[(group_id, user_id)]
 
-    async def apply_balance_delta(
-        self, *, group_id: int, user_id: int, amount_delta: Decimal
-    ) -> Decimal:
-        current = self.balances.get((group_id, user_id), Decimal("0.00"))
-        updated = current + amount_delta
-        self.balances[(group_id, user_id)] = updated
+    async def apply_balance_deltas(
+        self, *, group_id: int, deltas_by_user_id: Mapping[int, Decimal]
+    ) -> dict[int, Decimal]:
+        self.balance_batch_calls += 1
+        updated: dict[int, Decimal] = {}
+        for user_id, amount_delta in sorted(deltas_by_user_id.items()):
+            current = self.balances.get((group_id, user_id), Decimal("0.00"))
+            updated[user_id] = current + amount_delta
+            self.balances[(group_id, user_id)] = updated[user_id]
         return updated
 
     async def transfer_balance(
@@ -235,9 +292,24 @@ class InMemoryGroupRepository:
 
 
 class InMemoryTaskRepository:
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        *,
+        groups: InMemoryGroupRepository,
+        notifications: InMemoryNotificationRepository,
+    ) -> None:
+        self._groups = groups
+        self._notifications = notifications
         self.tasks: dict[int, TaskInfo] = {}
         self.logs: dict[int, TaskLogInfo] = {}
+        self.sprint_slots: dict[tuple[int, date], TaskSlotCounts] = {}
+        self.sprint_progress: dict[tuple[int, date, int], SprintProgressInfo] = {}
+        self.slot_count_calls = 0
+        self.bulk_create_calls = 0
+        self.complete_calls = 0
+        self.summary_calls = 0
+        self.slot_lock_calls = 0
+        self.batch_decide_calls = 0
         self._task_seq = 1
         self._log_seq = 1
 
@@ -261,6 +333,20 @@ class InMemoryTaskRepository:
         self._task_seq += 1
         return task
 
+    async def create_tasks(
+        self, *, group_id: int, items: Sequence[TaskImportItem]
+    ) -> list[TaskInfo]:
+        self.bulk_create_calls += 1
+        return [
+            await self.create_task(
+                group_id=group_id,
+                title=item.title,
+                frequency_per_sprint=item.frequency_per_sprint,
+                unit_cost=item.unit_cost,
+            )
+            for item in items
+        ]
+
     async def list_tasks(self, *, group_id: int, active_only: bool = True) -> list[TaskInfo]:
         return [
             task
@@ -307,76 +393,183 @@ class InMemoryTaskRepository:
         task = self.tasks[task_id]
         self.tasks[task_id] = replace(task, deleted_at=deleted_at)
 
-    async def count_completed_in_window(
+    async def count_slots_in_window(
         self,
         *,
-        task_id: int,
+        group_id: int,
         window_start: datetime,
         window_end_exclusive: datetime,
-    ) -> int:
-        return len(
-            [
-                log
-                for log in self.logs.values()
-                if log.task_id == task_id
-                and log.status is TaskLogStatus.COMPLETED
+        task_ids: Sequence[int] | None = None,
+    ) -> dict[int, TaskSlotCounts]:
+        self.slot_count_calls += 1
+        counts: dict[int, TaskSlotCounts] = {}
+        for log in self.logs.values():
+            if log.group_id != group_id or (task_ids is not None and log.task_id not in task_ids):
+                continue
+            if (
+                log.status is TaskLogStatus.COMPLETED
                 and window_start <= (log.decided_at or log.created_at) < window_end_exclusive
-            ]
-        )
+            ):
+                counts.setdefault(log.task_id, TaskSlotCounts()).completed += 1
+            elif (
+                log.status is TaskLogStatus.PENDING
+                and window_start <= log.created_at < window_end_exclusive
+            ):
+                counts.setdefault(log.task_id, TaskSlotCounts()).pending += 1
+        return counts
 
-    async def count_pending_in_window(
+    async def seed_sprint_slots(
         self,
         *,
+        group_id: int,
         task_id: int,
+        period_start: date,
         window_start: datetime,
         window_end_exclusive: datetime,
-    ) -> int:
-        return len(
-            [
-                log
-                for log in self.logs.values()
-                if log.task_id == task_id
-                and log.status is TaskLogStatus.PENDING
-                and window_start <= log.created_at < window_end_exclusive
-            ]
+    ) -> None:
+        if (task_id, period_start) in self.sprint_slots:
+            return
+        counts = await self.count_slots_in_window(
+            group_id=group_id,
+            window_start=window_start,
+            window_end_exclusive=window_end_exclusive,
+            task_ids=[task_id],
         )
+        self.sprint_slots[(task_id, period_start)] = counts.get(task_id, TaskSlotCounts())
+
+    async def lock_sprint_slots(
+        self, *, keys: Sequence[tuple[int, date]]
+    ) -> dict[tuple[int, date], TaskSlotCounts]:
+        self.slot_lock_calls += 1
+        return {key: replace(self.sprint_slots[key]) for key in keys if key in self.sprint_slots}
+
+    async def apply_sprint_slot_deltas(self, *, deltas: Sequence[SprintSlotDelta]) -> None:
+        for delta in deltas:
+            slots = self.sprint_slots.get((delta.task_id, delta.period_start))
+            if slots is None:
+                continue
+            slots.completed += delta.completed
+            slots.pending = max(slots.pending + delta.pending, 0)
 
-    async def lock_task(self, *, group_id: int, task_id: int) -> TaskInfo:
-        task = self.tasks.get(task_id)
-        if task is None or task.group_id != group_id:
-            raise NotFoundError("Task was not found")
-        return task
-
-    async def create_task_log(
+    async def confirm_sprint_slot(
+        self,
+        *,
+        task_id: int,
+        period_start: date,
+        frequency_per_sprint: int,
+        release_pending: bool,
+    ) -> bool:
+        slots = self.sprint_slots.get((task_id, period_start))
+        if slots is None or slots.completed >= frequency_per_sprint:
+            return False
+        slots.completed += 1
+        if release_pending:
+            slots.pending = max(slots.pending - 1, 0)
+        return True
+
+    async def release_sprint_slot(self, *, task_id: int, period_start: date) -> None:
+        slots = self.sprint_slots.get((task_id, period_start))
+        if slots is not None:
+            slots.pending = max(slots.pending - 1, 0)
+
+    async def clear_pending_sprint_slots(self, *, group_id: int) -> None:
+        for (task_id, _), slots in self.sprint_slots.items():
+            if self.tasks[task_id].group_id == group_id:
+                slots.pending = 0
+
+    async def complete_task(
         self,
         *,
         group_id: int,
         task_id: int,
         performer_user_id: int,
-        status: TaskLogStatus,
+        period_start: date,
         created_at: datetime,
-        approver_user_id: int | None = None,
-        decided_at: datetime | None = None,
-        rejection_reason: str | None = None,
-    ) -> TaskLogInfo:
+    ) -> TaskCompletionOutcome:
+        self.complete_calls += 1
+        member_ids = [
+            membership.user_id
+            for membership in await self._groups.list_active_memberships(group_id)
+        ]
+        task = self.tasks.get(task_id)
+        if task is not None and task.group_id != group_id:
+            task = None
+        slots = self.sprint_slots.get((task_id, period_start))
+        outcome = TaskCompletionOutcome(
+            performer_is_member=performer_user_id in member_ids,
+            task_found=task is not None,
+            task_active=task is None or task.is_active,
+            slot_row_exists=slots is not None,
+        )
+        if (
+            task is None
+            or slots is None
+            or not outcome.performer_is_member
+            or not outcome.task_active
+            or slots.completed + slots.pending >= task.frequency_per_sprint
+        ):
+            return outcome
+
+        is_solo = len(member_ids) == 1
+        if is_solo:
+            slots.completed += 1
+        else:
+            slots.pending += 1
         log = TaskLogInfo(
             id=self._log_seq,
             group_id=group_id,
             task_id=task_id,
             performer_user_id=performer_user_id,
-            status=status,
-            approver_user_id=approver_user_id,
-            decided_at=decided_at,
-            rejection_reason=rejection_reason,
+            status=TaskLogStatus.COMPLETED if is_solo else TaskLogStatus.PENDING,
+            approver_user_id=performer_user_id if is_solo else None,
+            decided_at=created_at if is_solo else None,
+            rejection_reason=None,
             created_at=created_at,
         )
         self.logs[log.id] = log
         self._log_seq += 1
-        return log
+        await self.apply_sprint_progress_deltas(
+            group_id=group_id,
+            deltas=[
+                SprintProgressDelta(
+                    user_id=performer_user_id,
+                    task_id=task_id,
+                    period_start=period_start,
+                    completed=1 if is_solo else 0,
+                    pending=0 if is_solo else 1,
+                )
+            ],
+        )
+        for user_id in member_ids:
+            if is_solo or user_id == performer_user_id:
+                continue
+            await self._notifications.enqueue(
+                event_type=NotificationEventType.TASK_APPROVAL_REQUESTED,
+                recipient_user_id=user_id,
+                group_id=group_id,
+                payload={
+                    "task_log_id": log.id,
+                    "task_title": task.title,
+                    "performer_user_id": performer_user_id,
+                },
+                deep_link_path=f"/tasks/history?task_log_id={log.id}",
+            )
+        outcome.log = log
+        return outcome
 
     async def get_task_log(self, *, log_id: int) -> TaskLogInfo | None:
         return self.logs.get(log_id)
 
+    async def list_task_logs_by_ids(
+        self, *, group_id: int, log_ids: Sequence[int], for_update: bool = False
+    ) -> list[TaskLogInfo]:
+        requested = set(log_ids)
+        return [
+            log
+            for log_id, log in sorted(self.logs.items())
+            if log_id in requested and log.group_id == group_id
+        ]
+
     async def list_task_logs(
         self,
         *,
@@ -387,6 +580,7 @@ class InMemoryTaskRepository:
         statuses: Sequence[TaskLogStatus] | None = None,
         limit: int,
         offset: int,
+        before: KeysetCursor | None = None,
     ) -> Sequence[TaskLogInfo]:
         logs = self._filtered_logs(
             group_id=group_id,
@@ -395,6 +589,10 @@ class InMemoryTaskRepository:
             task_id=task_id,
             statuses=statuses,
         )
+        if before is not None:
+            logs = [
+                log for log in logs if (log.created_at, log.id) < (before.created_at, before.id)
+            ]
         return logs[offset : offset + limit]
 
     async def count_task_logs(
@@ -478,6 +676,57 @@ class InMemoryTaskRepository:
         self.logs[log_id] = updated
         return updated
 
+    async def reject_pending_task_logs(
+        self, *, group_id: int, decided_at: datetime, rejection_reason: str
+    ) -> int:
+        pending = [
+            log
+            for log in self.logs.values()
+            if log.group_id == group_id and log.status is TaskLogStatus.PENDING
+        ]
+        for log in pending:
+            await self.reject_task_log(
+                log_id=log.id,
+                approver_user_id=None,
+                decided_at=decided_at,
+                rejection_reason=rejection_reason,
+            )
+        return len(pending)
+
+    async def approve_task_logs(
+        self,
+        *,
+        log_ids: Sequence[int],
+        approver_user_id: int,
+        decided_at: datetime,
+    ) -> list[TaskLogInfo]:
+        self.batch_decide_calls += 1
+        return [
+            await self.approve_task_log(
+                log_id=log_id, approver_user_id=approver_user_id, decided_at=decided_at
+            )
+            for log_id in sorted(log_ids)
+        ]
+
+    async def reject_task_logs(
+        self,
+        *,
+        log_ids: Sequence[int],
+        approver_user_id: int,
+        decided_at: datetime,
+        rejection_reason: str,
+    ) -> list[TaskLogInfo]:
+        self.batch_decide_calls += 1
+        return [
+            await self.reject_task_log(
+                log_id=log_id,
+                approver_user_id=approver_user_id,
+                decided_at=decided_at,
+                rejection_reason=rejection_reason,
+            )
+            for log_id in sorted(log_ids)
+        ]
+
     async def delete_task_log(self, *, log_id: int) -> None:
         del self.logs[log_id]
 
@@ -498,6 +747,93 @@ class InMemoryTaskRepository:
             and window_start <= (log.decided_at or log.created_at) < window_end_exclusive
         ]
 
+    async def summarize_completed_logs_in_window(
+        self,
+        *,
+        group_id: int,
+        window_start: datetime,
+        window_end_exclusive: datetime,
+    ) -> list[TaskCompletionTotals]:
+        self.summary_calls += 1
+        totals: dict[tuple[int, int], TaskCompletionTotals] = {}
+        logs = await self.list_completed_logs_in_window(
+            group_id=group_id,
+            performer_user_id=None,
+            window_start=window_start,
+            window_end_exclusive=window_end_exclusive,
+        )
+        for log in logs:
+            key = (log.task_id, log.performer_user_id)
+            item = totals.setdefault(
+                key, TaskCompletionTotals(log.task_id, log.performer_user_id, 0, Decimal("0"))
+            )
+            item.completed_count += 1
+            item.completed_units += self.tasks[log.task_id].unit_cost
+        return [totals[key] for key in sorted(totals)]
+
+    async def apply_sprint_progress_deltas(
+        self, *, group_id: int, deltas: Sequence[SprintProgressDelta]
+    ) -> None:
+        for delta in deltas:
+            task = self.tasks.get(delta.task_id)
+            if task is None or task.group_id != group_id or not task.is_active:
+                continue
+            item = self.sprint_progress.setdefault(
+                (group_id, delta.period_start, delta.user_id),
+                SprintProgressInfo(delta.user_id, 0, Decimal("0"), 0, Decimal("0")),
+            )
+            item.completed_count += delta.completed
+            item.completed_units += delta.completed * task.unit_cost
+            item.pending_count += delta.pending
+            item.pending_units += delta.pending * task.unit_cost
+
+    async def clear_pending_sprint_progress(self, *, group_id: int) -> None:
+        for (progress_group_id, _, _), item in self.sprint_progress.items():
+            if progress_group_id == group_id:
+                item.pending_count = 0
+                item.pending_units = Decimal("0")
+
+    async def list_sprint_progress(
+        self, *, group_id: int, period_start: date
+    ) -> dict[int, SprintProgressInfo]:
+        return {
+            user_id: item
+            for (progress_group_id, progress_period, user_id), item in self.sprint_progress.items()
+            if progress_group_id == group_id and progress_period == period_start
+        }
+
+    async def rebuild_sprint_progress(
+        self,
+        *,
+        group_id: int,
+        period_start: date,
+        window_start: datetime,
+        window_end_exclusive: datetime,
+    ) -> int:
+        for key in [key for key in self.sprint_progress if key[:2] == (group_id, period_start)]:
+            del self.sprint_progress[key]
+        for log in self.logs.values():
+            if (
+                log.group_id != group_id
+                or log.status not in (TaskLogStatus.COMPLETED, TaskLogStatus.PENDING)
+                or not window_start <= (log.decided_at or log.created_at) < window_end_exclusive
+            ):
+                continue
+            is_completed = log.status is TaskLogStatus.COMPLETED
+            await self.apply_sprint_progress_deltas(
+                group_id=group_id,
+                deltas=[
+                    SprintProgressDelta(
+                        user_id=log.performer_user_id,
+                        task_id=log.task_id,
+                        period_start=period_start,
+                        completed=1 if is_completed else 0,
+                        pending=0 if is_completed else 1,
+                    )
+                ],
+            )
+        return len(await self.list_sprint_progress(group_id=group_id, period_start=period_start))
+
 
 class InMemorySprintRepository:
     def __init__(self) -> None:
@@ -506,6 +842,7 @@ class InMemorySprintRepository:
             tuple[int, int | None, BalanceTransactionType, Decimal, int | None]
         ] = []
         self.balance_transactions: list[BalanceTransactionInfo] = []
+        self.ledger_batch_calls = 0
         self._seq = 1
 
     async def get_sprint_run(
@@ -517,6 +854,32 @@ class InMemorySprintRepository:
     ) -> SprintRunInfo | None:
         return self.sprint_runs.get((group_id, period_start, period_end))
 
+    async def get_closed_sprint_run(
+        self, *, group_id: int, sprint_run_id: int
+    ) -> SprintRunInfo | None:
+        for run in self.sprint_runs.values():
+            if run.id == sprint_run_id and run.group_id == group_id:
+                return run
+        return None
+
+    async def list_closed_sprint_runs(
+        self,
+        *,
+        group_id: int,
+        limit: int,
+        before: SprintRunCursor | None = None,
+    ) -> list[SprintRunInfo]:
+        runs = sorted(
+            (run for run in self.sprint_runs.values() if run.group_id == group_id),
+            key=lambda run: (run.period_start, run.id),
+            reverse=True,
+        )
+        if before is not None:
+            runs = [
+                run for run in runs if (run.period_start, run.id) < (before.period_start, before.id)
+            ]
+        return [replace(run, member_results=[]) for run in runs[:limit]]
+
     async def create_sprint_run(
         self,
         *,
@@ -579,6 +942,24 @@ class InMemorySprintRepository:
             )
         )
 
+    async def add_balance_transactions(
+        self, transactions: Sequence[BalanceTransactionDraft]
+    ) -> None:
+        self.ledger_batch_calls += 1
+        for item in transactions:
+            await self.add_balance_transaction(
+                group_id=item.group_id,
+                user_id=item.user_id,
+                transaction_type=item.transaction_type,
+                amount_delta=item.amount_delta,
+                description=item.description,
+                transaction_group_id=item.transaction_group_id,
+                account_type=item.account_type,
+                sprint_run_id=item.sprint_run_id,
+                task_log_id=item.task_log_id,
+                counterparty_user_id=item.counterparty_user_id,
+            )
+
     async def list_balance_transactions(
         self,
         *,
@@ -599,6 +980,8 @@ class InMemorySprintRepository:
 class InMemoryNotificationRepository:
     def __init__(self) -> None:
         self.events: dict[UUID, NotificationOutboxEventInfo] = {}
+        self.bulk_enqueue_calls = 0
+        self.batch_result_calls = 0
 
     async def enqueue(
         self,
@@ -623,6 +1006,7 @@ class InMemoryNotificationRepository:
             delivered_at=None,
             last_error=None,
             created_at=utc_datetime(2026, 3, 16),
+            priority=NOTIFICATION_EVENT_PRIORITIES[event_type],
         )
         self.events[event.id] = event
         return event
@@ -652,6 +1036,39 @@ class InMemoryNotificationRepository:
         self.events[event.id] = event
         return event, True
 
+    async def enqueue_many(self, events: Sequence[NotificationOutboxEventDraft]) -> list[UUID]:
+        self.bulk_enqueue_calls += 1
+        ids: list[UUID] = []
+        for draft in events:
+            event = await self.enqueue(
+                event_type=draft.event_type,
+                recipient_user_id=draft.recipient_user_id,
+                group_id=draft.group_id,
+                payload=draft.payload,
+                deep_link_path=draft.deep_link_path,
+            )
+            ids.append(event.id)
+        return ids
+
+    async def enqueue_many_once(
+        self, events: Sequence[NotificationOutboxEventDraft]
+    ) -> list[tuple[UUID, bool]]:
+        self.bulk_enqueue_calls += 1
+        results: list[tuple[UUID, bool]] = []
+        for draft in events:
+            assert draft.dedupe_key is not None
+            event, created = await self.enqueue_once(
+                dedupe_key=draft.dedupe_key,
+                correlation_id=draft.correlation_id,
+                event_type=draft.event_type,
+                recipient_user_id=draft.recipient_user_id,
+                group_id=draft.group_id,
+                payload=draft.payload,
+                deep_link_path=draft.deep_link_path,
+            )
+            results.append((event.id, created))
+        return results
+
     async def list_ready(self, *, now: datetime, limit: int) -> list[NotificationOutboxEventInfo]:
         return [
             event
@@ -660,6 +1077,32 @@ class InMemoryNotificationRepository:
             and (event.next_attempt_at is None or event.next_attempt_at <= now)
         ][:limit]
 
+    async def claim_ready(
+        self,
+        *,
+        now: datetime,
+        limit: int,
+        oldest_first: int,
+        lease_owner: str,
+        lease_expires_at: datetime,
+    ) -> list[NotificationOutboxEventInfo]:
+        # Events share one created_at here, so insertion order stands in for age.
+        ready = [
+            event
+            for event in await self.list_ready(now=now, limit=len(self.events))
+            if event.lease_expires_at is None or event.lease_expires_at <= now
+        ]
+        claimable = ready[:oldest_first]
+        claimable += sorted(ready[oldest_first:], key=lambda event: event.priority)[
+            : limit - len(claimable)
+        ]
+        claimed: list[NotificationOutboxEventInfo] = []
+        for event in sorted(claimable, key=lambda event: event.priority):
+            updated = replace(event, lease_owner=lease_owner, lease_expires_at=lease_expires_at)
+            self.events[event.id] = updated
+            claimed.append(updated)
+        return claimed
+
     async def acknowledge(
         self, *, event_id: UUID, acknowledged_at: datetime
     ) -> NotificationOutboxEventInfo:
@@ -671,6 +1114,8 @@ class InMemoryNotificationRepository:
             delivered_at=acknowledged_at,
             next_attempt_at=None,
             last_error=None,
+            lease_owner=None,
+            lease_expires_at=None,
         )
         self.events[event_id] = updated
         return updated
@@ -693,26 +1138,245 @@ class InMemoryNotificationRepository:
             attempt_count=event.attempt_count + 1,
             next_attempt_at=None if terminal else retry_at,
             last_error=error_message,
+            lease_owner=None,
+            lease_expires_at=None,
         )
         self.events[event_id] = updated
         return updated
 
+    async def acknowledge_many(
+        self, *, event_ids: Sequence[UUID], acknowledged_at: datetime
+    ) -> int:
+        self.batch_result_calls += 1
+        pending = [
+            event_id
+            for event_id in dict.fromkeys(event_ids)
+            if event_id in self.events
+            and self.events[event_id].status is not NotificationOutboxStatus.DELIVERED
+        ]
+        for event_id in pending:
+            await self.acknowledge(event_id=event_id, acknowledged_at=acknowledged_at)
+        return len(pending)
+
+    async def fail_many(
+        self, *, failures: Sequence[NotificationFailure], failed_at: datetime
+    ) -> int:
+        self.batch_result_calls += 1
+        by_event = {failure.event_id: failure for failure in failures}
+        pending = [
+            failure
+            for event_id, failure in by_event.items()
+            if event_id in self.events
+            and self.events[event_id].status is not NotificationOutboxStatus.DELIVERED
+        ]
+        for failure in pending:
+            await self.fail(
+                event_id=failure.event_id,
+                failed_at=failed_at,
+                error_message=failure.error_message,
+                retry_at=failure.retry_at,
+                terminal=failure.terminal,
+            )
+        return len(pending)
+
+
+class InMemoryLedgerRepository:
+    def __init__(self) -> None:
+        self.rows: list[tuple[int, datetime, LedgerEntry]] = []
+        self.checkpoints: dict[int, LedgerCheckpointInfo] = {}
+        self.balance_checkpoints: list[BalanceCheckpointInfo] = []
+        self.streamed_chunks: list[int] = []
+
+    def add(
+        self,
+        *,
+        group_id: int,
+        user_id: int | None,
+        amount_delta: Decimal,
+        transaction_group_id: UUID,
+        created_at: datetime,
+    ) -> LedgerEntry:
+        entry = LedgerEntry(
+            id=len(self.rows) + 1,
+            user_id=user_id,
+            amount_delta=amount_delta,
+            transaction_group_id=transaction_group_id,
+        )
+        self.rows.append((group_id, created_at, entry))
+        return entry
+
+    async def get_reconciliation_checkpoint(self, group_id: int) -> LedgerCheckpointInfo | None:
+        checkpoint = self.checkpoints.get(group_id)
+        if checkpoint is None:
+            return None
+        return replace(checkpoint, ledger_balances=dict(checkpoint.ledger_balances))
+
+    async def save_reconciliation_checkpoint(self, checkpoint: LedgerCheckpointInfo) -> None:
+        self.checkpoints[checkpoint.group_id] = replace(
+            checkpoint, ledger_balances=dict(checkpoint.ledger_balances)
+        )
+
+    async def find_settled_ledger_end(
+        self, *, group_id: int, after_id: int, settled_before: datetime
+    ) -> int | None:
+        rows = [
+            (created_at, entry)
+            for gid, created_at, entry in self.rows
+            if gid == group_id and entry.id > after_id
+        ]
+        unsettled = [entry.id for created_at, entry in rows if created_at >= settled_before]
+        if unsettled:
+            return min(unsettled) - 1 if min(unsettled) - 1 > after_id else None
+        return max((entry.id for _, entry in rows), default=None)
+
+    async def stream_ledger_entries(
+        self, *, group_id: int, after_id: int, through_id: int, chunk_size: int
+    ) -> AsyncIterator[list[LedgerEntry]]:
+        entries = [
+            entry
+            for gid, _, entry in self.rows
+            if gid == group_id and after_id < entry.id <= through_id
+        ]
+        for start in range(0, len(entries), chunk_size):
+            chunk = entries[start : start + chunk_size]
+            self.streamed_chunks.append(len(chunk))
+            yield chunk
+
+    async def sum_transaction_groups(
+        self, transaction_group_ids: Sequence[UUID]
+    ) -> dict[UUID, Decimal]:
+        totals: dict[UUID, Decimal] = {}
+        for _, _, entry in self.rows:
+            if entry.transaction_group_id in transaction_group_ids:
+                totals[entry.transaction_group_id] = (
+                    totals.get(entry.transaction_group_id, Decimal("0")) + entry.amount_delta
+                )
+        return totals
+
+    async def sum_user_ledger_after(self, *, group_id: int, after_id: int) -> dict[int, Decimal]:
+        totals: dict[int, Decimal] = {}
+        for gid, _, entry in self.rows:
+            if gid == group_id and entry.id > after_id and entry.user_id is not None:
+                totals[entry.user_id] = totals.get(entry.user_id, Decimal("0")) + entry.amount_delta
+        return totals
+
+    async def add_balance_checkpoints(
+        self, *, group_id: int, sprint_run_id: int, balances: Mapping[int, Decimal]
+    ) -> None:
+        for user_id, balance in sorted(balances.items()):
+            self.balance_checkpoints.append(
+                BalanceCheckpointInfo(
+                    group_id=group_id,
+                    user_id=user_id,
+                    balance=balance,
+                    taken_at=utc_datetime(2026, 3, 16),
+                    sprint_run_id=sprint_run_id,
+                )
+            )
+
+    async def get_latest_balance_checkpoint(
+        self, *, group_id: int, user_id: int, at: datetime
+    ) -> BalanceCheckpointInfo | None:
+        matching = [
+            item
+            for item in self.balance_checkpoints
+            if item.group_id == group_id and item.user_id == user_id and item.taken_at <= at
+        ]
+        return max(matching, key=lambda item: item.taken_at, default=None)
+
+    async def sum_user_ledger_between(
+        self, *, group_id: int, user_id: int, after: datetime | None, through: datetime
+    ) -> Decimal:
+        return sum(
+            (
+                entry.amount_delta
+                for gid, created_at, entry in self.rows
+                if gid == group_id
+                and entry.user_id == user_id
+                and created_at <= through
+                and (after is None or created_at > after)
+            ),
+            start=Decimal("0.00"),
+        )
+
+
+class InMemoryIdempotencyRepository:
+    def __init__(self) -> None:
+        self.records: dict[tuple[str, str, str], IdempotencyRecord] = {}
+
+    async def get(self, *, scope: str, actor_key: str, key: str) -> IdempotencyRecord | None:
+        record = self.records.get((scope, actor_key, key))
+        return replace(record) if record is not None else None
+
+    async def claim(self, ref: IdempotencyKeyRef, *, now: datetime, expires_at: datetime) -> bool:
+        existing = self.records.get((ref.scope, ref.actor_key, ref.key))
+        if existing is not None and (existing.expires_at is None or existing.expires_at > now):
+            return False
+        self.records[(ref.scope, ref.actor_key, ref.key)] = IdempotencyRecord(
+            request_fingerprint=ref.request_fingerprint,
+            status=IdempotencyStatus.PROCESSING,
+            response_status_code=None,
+            response_payload=None,
+            expires_at=expires_at,
+        )
+        return True
+
+    async def complete(
+        self,
+        ref: IdempotencyKeyRef,
+        *,
+        response: StoredResponse,
+        completed_at: datetime,
+        expires_at: datetime,
+    ) -> None:
+        self.records[(ref.scope, ref.actor_key, ref.key)] = IdempotencyRecord(
+            request_fingerprint=ref.request_fingerprint,
+            status=IdempotencyStatus.COMPLETED,
+            response_status_code=response.status_code,
+            response_payload=response.payload,
+            expires_at=expires_at,
+        )
+
+    async def purge_expired(self, *, now: datetime, limit: int) -> int:
+        expired = [
+            identity
+            for identity, record in self.records.items()
+            if record.expires_at is not None and record.expires_at <= now
+        ][:limit]
+        for identity in expired:
+            del self.records[identity]
+        return len(expired)
+
 
 class InMemoryUnitOfWork:
     def __init__(self) -> None:
         self.users = InMemoryUserRepository()
         self.groups = InMemoryGroupRepository()
-        self.tasks = InMemoryTaskRepository()
-        self.sprints = InMemorySprintRepository()
         self.notifications = InMemoryNotificationRepository()
+        self.tasks = InMemoryTaskRepository(groups=self.groups, notifications=self.notifications)
+        self.sprints = InMemorySprintRepository()
+        self.ledger = InMemoryLedgerRepository()
+        self.idempotency = InMemoryIdempotencyRepository()
         self.commit_count = 0
+        self._held_commits = 0
 
     async def commit(self) -> None:
-        self.commit_count += 1
+        if not self._held_commits:
+            self.commit_count += 1
 
     async def rollback(self) -> None:
         return None
 
+    @asynccontextmanager
+    async def single_commit(self) -> AsyncIterator[None]:
+        self._held_commits += 1
+        try:
+            yield
+        finally:
+            self._held_commits -= 1
+        if not self._held_commits:
+            self.commit_count += 1
+
 
 def utc_datetime(year: int, month: int, day: int, hour: int = 12) -> datetime:
     return datetime(year, month, day, hour, tzinfo=timezone.utc)
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import base64
+import hashlib
+import hmac
+import json
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from db.enums import Weekday
+
+from tests.support.fakes import FakeClock, InMemoryUnitOfWork
+from unitkeeper_backend.application.auth.service import AuthService
+from unitkeeper_backend.application.context.service import CurrentContextService
+from unitkeeper_backend.application.groups.service import GroupService
+from unitkeeper_backend.application.models import SessionClaims, TelegramIdentity
+from unitkeeper_backend.domain.errors import AuthenticationError, NotFoundError
+from unitkeeper_backend.infrastructure.auth.session_tokens import HmacSessionTokenManager
+
+
+class StubVerifier:
+    def verify(self, init_data: str) -> TelegramIdentity:
+        return TelegramIdentity(int(init_data), f"user{init_data}", None, None, "en", False)
+
+
+def _legacy_token(secret: str, user_id: int) -> str:
+    expires_at = datetime.now(UTC) + timedelta(hours=1)
+    payload = json.dumps(
+        {"exp": int(expires_at.timestamp()), "user_id": user_id},
+        separators=(",", ":"),
+        sort_keys=True,
+    ).encode("utf-8")
+    signature = hmac.new(secret.encode("utf-8"), payload, hashlib.sha256).hexdigest()
+    return base64.urlsafe_b64encode(payload + b"." + signature.encode("ascii")).decode("ascii")
+
+
+def test_session_tokens_round_trip_claims_and_accept_legacy_format() -> None:
+    manager = HmacSessionTokenManager(secret="secret", ttl_seconds=60)
+    claims = SessionClaims(user_id=1, group_id=7, membership_id=3, membership_epoch=2)
+
+    token, _ = manager.issue(claims=claims, issued_at=datetime.now(UTC))
+
+    assert manager.verify(token) == claims
+    assert manager.verify(_legacy_token("secret", 5)) == SessionClaims(user_id=5)
+    with pytest.raises(AuthenticationError):
+        manager.verify(_legacy_token("other", 5))
+
+
+@pytest.mark.asyncio
+async def test_group_claims_are_trusted_only_while_the_membership_epoch_is_current() -> None:
+    uow = InMemoryUnitOfWork()
+    clock = FakeClock(datetime.now(UTC))
+    context_service = CurrentContextService(uow=uow)
+    manager = HmacSessionTokenManager(secret="secret", ttl_seconds=60)
+    auth = AuthService(
+        uow=uow,
+        verifier=StubVerifier(),
+        token_manager=manager,
+        clock=clock,
+        context_service=context_service,
+    )
+    groups = GroupService(uow=uow, context_service=context_service, clock=clock)
+    await auth.authenticate("1")
+    context = await groups.create_group(
+        user_id=1,
+        name="team",
+        join_secret="secret",
+        sprint_start_weekday=Weekday.MONDAY,
+        sprint_duration_days=14,
+        timezone="UTC",
+    )
+    assert context.group is not None
+
+    session = await auth.refresh(1)
+    claims = auth.resolve_claims(session.access_token)
+    assert claims.group_id == context.group.id
+    assert claims.membership_epoch == 1
+
+    # The fast path never loads the context, so it works even without the user row.
+    profile = uow.users.users.pop(1)
+    assert await context_service.resolve_group_id(claims) == context.group.id
+    uow.users.users[1] = profile
+
+    await groups.leave_group(user_id=1, left_at=clock.now())
+    with pytest.raises(NotFoundError):
+        await context_service.resolve_group_id(claims)
+    assert auth.resolve_claims((await auth.refresh(1)).access_token).group_id is None
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+from datetime import datetime
 from decimal import Decimal
+from uuid import uuid4
 
 import pytest
 from db.enums import Weekday
@@ -9,7 +11,7 @@ from tests.support.fakes import FakeClock, InMemoryUnitOfWork, utc_datetime
 from unitkeeper_backend.application.balances.service import BalanceService
 from unitkeeper_backend.application.context.service import CurrentContextService
 from unitkeeper_backend.application.groups.service import GroupService
-from unitkeeper_backend.application.models import UserProfile
+from unitkeeper_backend.application.models import BalanceCheckpointInfo, UserProfile
 from unitkeeper_backend.domain.errors import BusinessRuleViolation, ValidationError
 
 
@@ -91,3 +93,30 @@ async def test_balance_read_candidates_and_transaction_history_use_current_group
     assert [(item.user.id, item.current_balance) for item in candidates] == [(2, Decimal("3.00"))]
     assert history.total == 1
     assert history.items[0].amount_delta == Decimal("-2.00")
+
+
+@pytest.mark.asyncio
+async def test_balance_as_of_starts_from_the_nearest_earlier_checkpoint() -> None:
+    uow, service = await _seed_group()
+    for day, amount in [(10, "5.00"), (12, "-2.00"), (18, "4.00")]:
+        uow.ledger.add(
+            group_id=1,
+            user_id=1,
+            amount_delta=Decimal(amount),
+            transaction_group_id=uuid4(),
+            created_at=utc_datetime(2026, 3, day),
+        )
+    uow.ledger.balance_checkpoints.append(
+        BalanceCheckpointInfo(
+            group_id=1, user_id=1, balance=Decimal("3.00"), taken_at=utc_datetime(2026, 3, 14)
+        )
+    )
+
+    before = await service.get_my_balance_as_of(user_id=1, at=utc_datetime(2026, 3, 11))
+    assert (before.balance, before.checkpoint_at) == (Decimal("5.00"), None)
+
+    after = await service.get_my_balance_as_of(user_id=1, at=utc_datetime(2026, 3, 20))
+    assert (after.balance, after.checkpoint_at) == (Decimal("7.00"), utc_datetime(2026, 3, 14))
+
+    with pytest.raises(ValidationError):
+        await service.get_my_balance_as_of(user_id=1, at=datetime(2026, 3, 20))
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from decimal import Decimal
+
+import pytest
+from db.enums import Weekday
+
+from tests.support.fakes import FakeClock, InMemoryUnitOfWork, utc_datetime
+from unitkeeper_backend.application.context.cache import CurrentContextCache
+from unitkeeper_backend.application.context.service import CurrentContextService
+from unitkeeper_backend.application.groups.service import GroupService
+from unitkeeper_backend.application.models import CurrentContext, UserProfile
+
+
+class FakeMonotonic:
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    def __call__(self) -> float:
+        return self.value
+
+
+def _context(user_id: int) -> CurrentContext:
+    user = UserProfile(user_id, f"user{user_id}", None, None, "en", False)
+    return CurrentContext(user=user, membership=None, group=None)
+
+
+def test_cache_expires_entries_and_evicts_least_recently_used() -> None:
+    monotonic = FakeMonotonic()
+    cache = CurrentContextCache(max_entries=2, ttl_seconds=10, monotonic=monotonic)
+
+    for user_id in (1, 2):
+        cache.put(user_id, _context(user_id), generation=cache.generation)
+    assert cache.get(1) is not None
+    cache.put(3, _context(3), generation=cache.generation)
+
+    assert cache.get(2) is None
+    assert cache.get(3) is not None
+    monotonic.value = 10
+    assert cache.get(1) is None
+    assert cache.stats().hits == 2
+    assert cache.stats().misses == 2
+    assert cache.stats().evictions == 1
+    assert cache.stats().size == 1
+
+
+def test_cache_skips_loads_that_raced_with_an_invalidation() -> None:
+    cache = CurrentContextCache(max_entries=10, ttl_seconds=10)
+    generation = cache.generation
+
+    cache.invalidate_users([1])
+    cache.put(1, _context(1), generation=generation)
+
+    assert cache.get(1) is None
+
+
+@pytest.mark.asyncio
+async def test_group_changes_invalidate_cached_contexts_of_all_members() -> None:
+    uow = InMemoryUnitOfWork()
+    uow.users.users[1] = UserProfile(1, "owner", "Owner", None, "en", False)
+    uow.users.users[2] = UserProfile(2, "member", "Member", None, "en", False)
+    cache = CurrentContextCache(max_entries=10, ttl_seconds=60)
+    context_service = CurrentContextService(uow=uow, cache=cache)
+    service = GroupService(
+        uow=uow,
+        context_service=context_service,
+        clock=FakeClock(utc_datetime(2026, 3, 16)),
+    )
+    await service.create_group(
+        user_id=1,
+        name="team",
+        join_secret="secret",
+        sprint_start_weekday=Weekday.MONDAY,
+        sprint_duration_days=14,
+        timezone="UTC",
+    )
+
+    for _ in range(5):
+        owner_context = await context_service.resolve(1)
+    assert owner_context.group is not None
+    assert len(owner_context.group.active_members) == 1
+    assert cache.hits >= 4
+
+    await service.join_group(user_id=2, group_name="team", join_secret="secret")
+    owner_context = await context_service.resolve(1)
+    assert owner_context.group is not None
+    assert len(owner_context.group.active_members) == 2
+
+    await service.update_current_group_weights(
+        user_id=1, weights_by_user_id={1: Decimal("70.00"), 2: Decimal("30.00")}
+    )
+    member_context = await context_service.resolve(2)
+    assert member_context.membership is not None
+    assert member_context.membership.weight_percent == Decimal("30.00")
+
+    await service.leave_group(user_id=1, left_at=utc_datetime(2026, 3, 17))
+    assert (await context_service.resolve(1)).group is None
+    member_context = await context_service.resolve(2)
+    assert member_context.group is not None
+    assert member_context.group.owner_user_id == 2
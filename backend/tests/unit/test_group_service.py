@@ -73,6 +73,7 @@ async def test_join_and_leave_rebalance_weights_and_handover_owner() -> None:
     assert {event.recipient_user_id for event in join_events} == {1, 2}
     assert all(event.payload["kind"] == "membership_event" for event in join_events)
     assert all(event.deep_link_path == "/group" for event in join_events)
+    assert uow.notifications.bulk_enqueue_calls == 2
 
     memberships = await uow.groups.list_active_memberships(1)
     assert {membership.user_id: membership.weight_percent for membership in memberships} == {
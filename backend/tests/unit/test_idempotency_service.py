@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from datetime import timedelta
+
+import pytest
+from fastapi import Response
+from pydantic import BaseModel
+
+from tests.support.fakes import FakeClock, InMemoryUnitOfWork, utc_datetime
+from unitkeeper_backend.api.dependencies.idempotency import (
+    IDEMPOTENT_REPLAYED_HEADER,
+    IdempotentRequest,
+)
+from unitkeeper_backend.application.idempotency.service import IdempotencyService
+from unitkeeper_backend.application.models import IdempotencyKeyRef
+from unitkeeper_backend.domain.errors import ConflictError, ValidationError
+
+
+class CounterResponse(BaseModel):
+    calls: int
+
+
+def _ref(key: str = "key-1", fingerprint: str = "body-a") -> IdempotencyKeyRef:
+    return IdempotencyKeyRef(
+        scope="POST /api/v1/tasks/done", actor_key="1", key=key, request_fingerprint=fingerprint
+    )
+
+
+@pytest.mark.asyncio
+async def test_repeated_key_replays_stored_response_without_running_the_use_case() -> None:
+    uow = InMemoryUnitOfWork()
+    service = IdempotencyService(uow=uow, clock=FakeClock(utc_datetime(2026, 3, 2)), ttl_seconds=60)
+    calls = 0
+
+    async def operation() -> CounterResponse:
+        nonlocal calls
+        calls += 1
+        await uow.commit()
+        return CounterResponse(calls=calls)
+
+    first_response = Response()
+    first = await IdempotentRequest(
+        service=service, ref=_ref(), response=first_response, status_code=201
+    ).run(operation, response_type=CounterResponse)
+    retry_response = Response()
+    retry = await IdempotentRequest(
+        service=service, ref=_ref(), response=retry_response, status_code=201
+    ).run(operation, response_type=CounterResponse)
+
+    assert first == retry == CounterResponse(calls=1)
+    assert calls == 1
+    # The use case's commit and the stored response share one transaction.
+    assert uow.commit_count == 1
+    assert IDEMPOTENT_REPLAYED_HEADER.lower() not in first_response.headers
+    assert retry_response.headers[IDEMPOTENT_REPLAYED_HEADER] == "true"
+    assert retry_response.status_code == 201
+
+    unkeyed = IdempotentRequest(service=service, ref=None, response=Response(), status_code=200)
+    assert await unkeyed.run(operation, response_type=CounterResponse) == CounterResponse(calls=2)
+
+    with pytest.raises(ValidationError):
+        await service.begin(_ref(fingerprint="body-b"))
+    assert await service.begin(_ref(key="key-2")) is None
+    with pytest.raises(ConflictError):
+        await service.begin(_ref(key="key-2"))
+
+
+@pytest.mark.asyncio
+async def test_expired_keys_are_reclaimable_and_purged_in_batches() -> None:
+    uow = InMemoryUnitOfWork()
+    now = utc_datetime(2026, 3, 2)
+    service = IdempotencyService(uow=uow, clock=FakeClock(now), ttl_seconds=60)
+    for index in range(5):
+        assert await service.begin(_ref(key=f"key-{index}")) is None
+
+    later = IdempotencyService(
+        uow=uow, clock=FakeClock(now + timedelta(seconds=61)), ttl_seconds=60
+    )
+    assert await later.begin(_ref(key="key-0", fingerprint="body-b")) is None
+    commits_before = uow.commit_count
+
+    assert await later.purge_expired(batch_size=2) == 4
+    assert set(uow.idempotency.records) == {("POST /api/v1/tasks/done", "1", "key-0")}
+    assert uow.commit_count - commits_before == 3
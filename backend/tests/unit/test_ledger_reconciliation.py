@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from tests.support.fakes import FakeClock, InMemoryUnitOfWork, utc_datetime
+from unitkeeper_backend.application.jobs.ledger_reconciliation import LedgerReconciler
+from unitkeeper_backend.application.models import BalanceMismatch
+
+
+@pytest.mark.asyncio
+async def test_reconciliation_resumes_from_checkpoint_and_reports_drift() -> None:
+    uow = InMemoryUnitOfWork()
+    ledger = uow.ledger
+    old = utc_datetime(2026, 3, 16, hour=9)
+    clock = FakeClock(utc_datetime(2026, 3, 16))
+    reconciler = LedgerReconciler(uow=uow, clock=clock, chunk_size=2, settle_seconds=300)
+
+    transfer, settlement = uuid4(), uuid4()
+    for user_id, amount, group in [
+        (1, "-5", transfer),
+        (2, "5", transfer),
+        (None, "-3", settlement),
+        (1, "1", settlement),
+        (2, "2", settlement),
+    ]:
+        ledger.add(
+            group_id=1,
+            user_id=user_id,
+            amount_delta=Decimal(amount),
+            transaction_group_id=group,
+            created_at=old,
+        )
+    uow.groups.balances[(1, 1)] = Decimal("-4")
+    uow.groups.balances[(1, 2)] = Decimal("7")
+
+    report = await reconciler.reconcile_group(1)
+    assert report.is_consistent
+    assert (report.scanned_count, report.last_transaction_id) == (5, 5)
+    assert ledger.streamed_chunks == [2, 2, 1]
+
+    # A posting whose legs straddle a row that is still too young to settle.
+    straddling, young = uuid4(), uuid4()
+    ledger.add(
+        group_id=1,
+        user_id=1,
+        amount_delta=Decimal("-1"),
+        transaction_group_id=straddling,
+        created_at=old,
+    )
+    for user_id, amount in [(2, "2"), (None, "-2")]:
+        ledger.add(
+            group_id=1,
+            user_id=user_id,
+            amount_delta=Decimal(amount),
+            transaction_group_id=young,
+            created_at=clock.now(),
+        )
+    ledger.add(
+        group_id=1,
+        user_id=2,
+        amount_delta=Decimal("1"),
+        transaction_group_id=straddling,
+        created_at=old,
+    )
+    uow.groups.balances[(1, 1)] = Decimal("-5")
+    uow.groups.balances[(1, 2)] = Decimal("10")
+
+    ledger.streamed_chunks.clear()
+    report = await reconciler.reconcile_group(1)
+    assert report.is_consistent
+    assert (report.scanned_count, report.last_transaction_id) == (1, 6)
+    assert ledger.checkpoints[1].ledger_balances == {1: Decimal("-5"), 2: Decimal("7")}
+
+    broken = uuid4()
+    ledger.add(
+        group_id=1,
+        user_id=1,
+        amount_delta=Decimal("2"),
+        transaction_group_id=broken,
+        created_at=old,
+    )
+    uow.groups.balances[(1, 1)] = Decimal("-2")
+    later = FakeClock(clock.now() + timedelta(hours=1))
+    reconciler = LedgerReconciler(uow=uow, clock=later, chunk_size=2, settle_seconds=300)
+
+    report = await reconciler.reconcile_group(1)
+    assert (report.scanned_count, report.last_transaction_id) == (4, 10)
+    assert report.unbalanced_transaction_group_ids == [broken]
+    assert report.balance_mismatches == [
+        BalanceMismatch(user_id=1, ledger_balance=Decimal("-3"), current_balance=Decimal("-2"))
+    ]
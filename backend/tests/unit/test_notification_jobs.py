@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
+from dataclasses import asdict
+
 import pytest
 
 from unitkeeper_backend.application.jobs.notifications import (
+    OutboundEvent,
     ReminderPublisher,
     SprintMemberReport,
     SprintReportPublisher,
@@ -14,6 +18,7 @@ class FakePublisher:
     def __init__(self) -> None:
         self.calls: list[dict[str, object]] = []
         self.keys: set[str] = set()
+        self.batch_sizes: list[int] = []
 
     async def enqueue_once(self, **kwargs: object) -> None:
         key = str(kwargs["dedupe_key"])
@@ -21,6 +26,11 @@ class FakePublisher:
             self.keys.add(key)
             self.calls.append(kwargs)
 
+    async def enqueue_many_once(self, events: Sequence[OutboundEvent]) -> None:
+        self.batch_sizes.append(len(events))
+        for event in events:
+            await self.enqueue_once(**asdict(event))
+
 
 @pytest.mark.asyncio
 async def test_sprint_reports_are_durable_deduplicated_and_correlated() -> None:
@@ -41,6 +51,7 @@ async def test_sprint_reports_are_durable_deduplicated_and_correlated() -> None:
         )
 
     assert len(publisher.calls) == 3
+    assert publisher.batch_sizes == [3, 3]
     assert {item["correlation_id"] for item in publisher.calls} == {"close-7"}
 
 
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+
+import pytest
+from db.enums import NotificationEventType, NotificationOutboxStatus, NotificationPriority
+
+from tests.support.fakes import FakeClock, InMemoryUnitOfWork, utc_datetime
+from unitkeeper_backend.application.models import NotificationFailureReport
+from unitkeeper_backend.application.notifications.service import NotificationOutboxService
+
+
+async def _enqueue(uow: InMemoryUnitOfWork, count: int) -> None:
+    for recipient_user_id in range(1, count + 1):
+        await uow.notifications.enqueue(
+            event_type=NotificationEventType.TASK_APPROVAL_REQUESTED,
+            recipient_user_id=recipient_user_id,
+            group_id=7,
+            payload={},
+            deep_link_path=None,
+        )
+
+
+class FakeWakeups:
+    def __init__(self) -> None:
+        self.event = asyncio.Event()
+
+    def next_wakeup(self) -> asyncio.Event:
+        return self.event
+
+
+@pytest.mark.asyncio
+async def test_workers_claim_disjoint_batches_and_reclaim_expired_leases() -> None:
+    uow = InMemoryUnitOfWork()
+    await _enqueue(uow, 5)
+    now = utc_datetime(2026, 3, 16)
+    service = NotificationOutboxService(uow=uow, clock=FakeClock(now))
+
+    first = await service.claim_ready(worker_id="bot-a", limit=3, lease_seconds=60)
+    second = await service.claim_ready(worker_id="bot-b", limit=3, lease_seconds=60)
+
+    assert len(first) == 3
+    assert len(second) == 2
+    assert not {event.id for event in first} & {event.id for event in second}
+    assert {event.lease_owner for event in second} == {"bot-b"}
+    assert await service.claim_ready(worker_id="bot-c", limit=3, lease_seconds=60) == []
+
+    await service.acknowledge(event_id=first[0].id)
+    await service.fail(
+        event_id=first[1].id, error_message="boom", retry_after_seconds=0, terminal=False
+    )
+    later = NotificationOutboxService(uow=uow, clock=FakeClock(now + timedelta(seconds=61)))
+    reclaimed = await later.claim_ready(worker_id="bot-c", limit=10, lease_seconds=60)
+
+    # The acknowledged event is gone; the failed one and every expired lease are back.
+    assert {event.id for event in reclaimed} == {event.id for event in [*first[1:], *second]}
+    assert {event.lease_owner for event in reclaimed} == {"bot-c"}
+
+
+@pytest.mark.asyncio
+async def test_delivery_results_are_recorded_for_a_whole_batch_at_once() -> None:
+    uow = InMemoryUnitOfWork()
+    await _enqueue(uow, 4)
+    now = utc_datetime(2026, 3, 16)
+    service = NotificationOutboxService(uow=uow, clock=FakeClock(now))
+    events = await service.claim_ready(worker_id="bot-a", limit=10, lease_seconds=60)
+    delivered, retried, dead = events[:2], events[2], events[3]
+
+    results = await service.record_results(
+        acknowledged=[event.id for event in delivered] * 2,
+        failed=[
+            NotificationFailureReport(retried.id, "flood wait", 30, terminal=False),
+            NotificationFailureReport(dead.id, "chat not found", None, terminal=True),
+            # Already delivered in this very batch: the ack wins.
+            NotificationFailureReport(delivered[0].id, "late error", 30, terminal=False),
+        ],
+    )
+
+    assert (results.acknowledged_count, results.failed_count) == (2, 2)
+    assert uow.notifications.batch_result_calls == 2
+    assert uow.commit_count == 2
+    stored = uow.notifications.events
+    assert {stored[event.id].status for event in delivered} == {NotificationOutboxStatus.DELIVERED}
+    assert stored[retried.id].status is NotificationOutboxStatus.PENDING
+    assert stored[retried.id].next_attempt_at == now + timedelta(seconds=30)
+    assert stored[dead.id].status is NotificationOutboxStatus.DEAD_LETTER
+    assert {stored[event.id].lease_owner for event in events} == {None}
+
+
+@pytest.mark.asyncio
+async def test_long_poll_claim_returns_once_an_event_is_enqueued() -> None:
+    uow = InMemoryUnitOfWork()
+    wakeups = FakeWakeups()
+    service = NotificationOutboxService(
+        uow=uow, clock=FakeClock(utc_datetime(2026, 3, 16)), wakeups=wakeups
+    )
+
+    claim = asyncio.create_task(
+        service.claim_ready(worker_id="bot-a", limit=10, lease_seconds=60, wait_seconds=5)
+    )
+    await asyncio.sleep(0)
+    assert not claim.done()
+    await _enqueue(uow, 1)
+    wakeups.event.set()
+
+    events = await asyncio.wait_for(claim, timeout=1)
+    assert [event.lease_owner for event in events] == ["bot-a"]
+
+    wakeups.event = asyncio.Event()
+    assert (
+        await service.claim_ready(worker_id="bot-a", limit=10, lease_seconds=60, wait_seconds=0.01)
+        == []
+    )
+
+
+@pytest.mark.asyncio
+async def test_claim_serves_interactive_lane_first_but_keeps_bulk_moving() -> None:
+    uow = InMemoryUnitOfWork()
+    reminders = [
+        await uow.notifications.enqueue(
+            event_type=NotificationEventType.REMINDER,
+            recipient_user_id=recipient_user_id,
+            group_id=7,
+            payload={},
+            deep_link_path=None,
+        )
+        for recipient_user_id in range(100, 120)
+    ]
+    await _enqueue(uow, 3)
+    service = NotificationOutboxService(uow=uow, clock=FakeClock(utc_datetime(2026, 3, 16)))
+
+    claimed = await service.claim_ready(worker_id="bot-a", limit=10, lease_seconds=60)
+
+    assert [event.priority for event in claimed[:3]] == [NotificationPriority.INTERACTIVE] * 3
+    assert reminders[0].id in {event.id for event in claimed}
+    assert len(claimed) == 10
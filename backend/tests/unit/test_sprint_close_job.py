@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from datetime import timedelta
+import asyncio
+from datetime import date, timedelta
 from decimal import Decimal
 
 import pytest
@@ -9,6 +10,7 @@ from db.enums import Weekday
 from tests.support.fakes import FakeClock, InMemoryUnitOfWork, utc_datetime
 from unitkeeper_backend.application.context.service import CurrentContextService
 from unitkeeper_backend.application.groups.service import GroupService
+from unitkeeper_backend.application.jobs.scheduler import ConcurrentSprintCloseJob
 from unitkeeper_backend.application.jobs.sprint_close import SprintCloseRunner, list_due_group_ids
 from unitkeeper_backend.application.models import UserProfile
 from unitkeeper_backend.application.sprints.service import SprintService
@@ -77,6 +79,32 @@ async def test_list_due_group_ids_is_due_only_on_last_day_for_any_sprint_length(
     assert await list_due_group_ids(uow=uow, clock=next_window_clock) == []
 
 
+@pytest.mark.asyncio
+async def test_list_due_group_ids_reads_stored_period_ends_and_repairs_stale_ones() -> None:
+    uow = InMemoryUnitOfWork()
+    clock = FakeClock(utc_datetime(2026, 3, 16))
+    await _build_group(uow, clock=clock)
+    assert uow.groups.sprint_period_ends[1] == date(2026, 3, 22)
+
+    group_service = GroupService(
+        uow=uow, context_service=CurrentContextService(uow=uow), clock=clock
+    )
+    await group_service.update_current_group_settings(
+        user_id=1, join_secret=None, sprint_start_weekday=None, sprint_duration_days=14
+    )
+    assert uow.groups.sprint_period_ends[1] == date(2026, 3, 29)
+
+    # A missing or past end (say, after a missed run) is rolled forward to the
+    # running window instead of closing the wrong one.
+    uow.groups.sprint_period_ends[1] = None
+    assert await list_due_group_ids(uow=uow, clock=FakeClock(utc_datetime(2026, 4, 1))) == []
+    assert uow.groups.sprint_period_ends[1] == date(2026, 4, 12)
+
+    for membership in await uow.groups.list_active_memberships(1):
+        await uow.groups.deactivate_membership(membership.id, left_at=clock.now())
+    assert await uow.groups.list_groups_due_by(today=date(2026, 4, 12)) == []
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize("sprint_duration_days", [7, 14, 21, 28])
 async def test_sprint_close_runner_closes_multi_week_sprint_and_skips_duplicate_close(
@@ -136,3 +164,41 @@ async def test_sprint_close_runner_skips_unknown_group() -> None:
 
     result = await runner.close_due_sprint(group_id=999, correlation_id="close-missing")
     assert result is None
+
+
+class SlowCloser:
+    def __init__(self) -> None:
+        self.active = 0
+        self.peak = 0
+
+    async def close_group(self, *, group_id: int, correlation_id: str) -> bool:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(0.01)
+            if group_id == 3:
+                raise RuntimeError("lock timeout")
+            return group_id != 4
+        finally:
+            self.active -= 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_close_bounds_parallelism_and_isolates_failures() -> None:
+    closer = SlowCloser()
+    job = ConcurrentSprintCloseJob(closer=closer, concurrency=2)
+
+    summary = await job.run(due_group_ids=[1, 2, 3, 4, 5], correlation_id="close-run")
+
+    assert closer.peak == 2
+    assert [(result.group_id, result.outcome) for result in summary.results] == [
+        (1, "closed"),
+        (2, "closed"),
+        (3, "failed"),
+        (4, "skipped"),
+        (5, "closed"),
+    ]
+    assert summary.results[2].error == "RuntimeError: lock timeout"
+    assert summary.closed_count == 3
+    assert summary.failed_count == 1
+    assert all(result.duration_seconds > 0 for result in summary.results)
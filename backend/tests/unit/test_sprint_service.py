@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from datetime import date
 from decimal import Decimal
 
 import pytest
@@ -11,7 +12,7 @@ from unitkeeper_backend.application.groups.service import GroupService
 from unitkeeper_backend.application.models import UserProfile
 from unitkeeper_backend.application.sprints.service import SprintService
 from unitkeeper_backend.application.tasks.service import TaskService
-from unitkeeper_backend.domain.errors import BusinessRuleViolation
+from unitkeeper_backend.domain.errors import BusinessRuleViolation, NotFoundError, ValidationError
 
 
 @pytest.mark.asyncio
@@ -65,11 +66,22 @@ async def test_temp_results_and_sprint_close_persist_balances() -> None:
     # Breakdown is group-wide: user2 sees what user1 completed too.
     assert results_for_user2.breakdown[0].title == "Laundry"
     assert results_for_user2.breakdown[0].performer_user_id == 1
+    assert results_for_user2.breakdown[0].completed_count == 1
+    assert uow.tasks.summary_calls == 2
 
     run = await sprint_service.close_current_sprint(group_id=1)
     assert run.status is SprintRunStatus.CLOSED
     assert len(run.member_results) == 2
     assert uow.sprints.transactions
+    # Settlement moves every balance and writes every ledger line in one batch.
+    assert uow.groups.balance_batch_calls == 1
+    assert uow.sprints.ledger_batch_calls == 1
+    assert [item.balance_after for item in run.member_results] == [
+        uow.groups.balances[(1, user_id)] for user_id in (1, 2)
+    ]
+    assert [(item.user_id, item.balance) for item in uow.ledger.balance_checkpoints] == [
+        (item.user_id, item.balance_after) for item in run.member_results
+    ]
 
     with pytest.raises(BusinessRuleViolation):
         await sprint_service.close_current_sprint(group_id=1)
@@ -119,3 +131,41 @@ async def test_close_current_sprint_auto_rejects_stale_pending_logs() -> None:
 
     with pytest.raises(BusinessRuleViolation):
         await task_service.approve(group_id=1, approver_user_id=2, log_id=pending.id)
+
+
+@pytest.mark.asyncio
+async def test_sprint_history_pages_closed_snapshots_newest_first() -> None:
+    uow = InMemoryUnitOfWork()
+    uow.users.users[1] = UserProfile(1, "user1", "User 1", None, "en", False)
+    clock = FakeClock(utc_datetime(2026, 3, 16))
+    group_service = GroupService(
+        uow=uow, context_service=CurrentContextService(uow=uow), clock=clock
+    )
+    await group_service.create_group(
+        user_id=1,
+        name="team",
+        join_secret="secret",
+        sprint_start_weekday=Weekday.MONDAY,
+        sprint_duration_days=7,
+        timezone="UTC",
+    )
+    for day in (16, 23, 30):
+        sprint_service = SprintService(uow=uow, clock=FakeClock(utc_datetime(2026, 3, day)))
+        await sprint_service.close_current_sprint(group_id=1)
+
+    first = await sprint_service.list_sprint_history(group_id=1, limit=2)
+    assert [item.period_start for item in first.items] == [date(2026, 3, 30), date(2026, 3, 23)]
+    assert all(item.member_results == [] for item in first.items)
+    assert first.has_more and first.next_cursor is not None
+
+    second = await sprint_service.list_sprint_history(group_id=1, limit=2, cursor=first.next_cursor)
+    assert [item.period_start for item in second.items] == [date(2026, 3, 16)]
+    assert not second.has_more and second.next_cursor is None
+
+    detail = await sprint_service.get_sprint_history(group_id=1, sprint_run_id=second.items[0].id)
+    assert [item.user_id for item in detail.member_results] == [1]
+
+    with pytest.raises(ValidationError):
+        await sprint_service.list_sprint_history(group_id=1, limit=2, cursor="not-a-cursor")
+    with pytest.raises(NotFoundError):
+        await sprint_service.get_sprint_history(group_id=2, sprint_run_id=detail.id)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from copy import deepcopy
+from datetime import date
 from decimal import Decimal
 
 import pytest
@@ -8,8 +10,8 @@ from db.enums import NotificationEventType, TaskLogStatus, Weekday
 from tests.support.fakes import FakeClock, InMemoryUnitOfWork, utc_datetime
 from unitkeeper_backend.application.context.service import CurrentContextService
 from unitkeeper_backend.application.groups.service import GroupService
-from unitkeeper_backend.application.models import UserProfile
-from unitkeeper_backend.application.tasks.service import TaskImportItem, TaskService
+from unitkeeper_backend.application.models import TaskImportItem, TaskSlotCounts, UserProfile
+from unitkeeper_backend.application.tasks.service import TaskService
 from unitkeeper_backend.domain.errors import (
     AuthorizationError,
     BusinessRuleViolation,
@@ -202,6 +204,292 @@ async def test_pending_hold_consumes_a_slot_and_blocks_over_marking() -> None:
     assert freed.status is TaskLogStatus.PENDING
 
 
+@pytest.mark.asyncio
+async def test_second_decision_on_a_log_leaves_sprint_counters_unchanged() -> None:
+    uow = InMemoryUnitOfWork()
+    for user_id in (1, 2):
+        uow.users.users[user_id] = UserProfile(
+            user_id, f"user{user_id}", f"User {user_id}", None, "en", False
+        )
+    group_service = GroupService(
+        uow=uow,
+        context_service=CurrentContextService(uow=uow),
+        clock=FakeClock(utc_datetime(2026, 3, 16)),
+    )
+    await group_service.create_group(
+        user_id=1,
+        name="team",
+        join_secret="secret",
+        sprint_start_weekday=Weekday.MONDAY,
+        sprint_duration_days=7,
+        timezone="UTC",
+    )
+    await group_service.join_group(user_id=2, group_name="team", join_secret="secret")
+    task_service = TaskService(uow=uow, clock=FakeClock(utc_datetime(2026, 3, 16)))
+    task = await task_service.create_task(
+        group_id=1,
+        title="Mop floors",
+        frequency_per_sprint=2,
+        unit_cost=Decimal("1.00"),
+    )
+    pending = await task_service.mark_done(group_id=1, performer_user_id=1, task_id=task.id)
+    await task_service.approve(group_id=1, approver_user_id=2, log_id=pending.id)
+    slots = deepcopy(uow.tasks.sprint_slots)
+    progress = deepcopy(uow.tasks.sprint_progress)
+    assert slots[(task.id, date(2026, 3, 16))] == TaskSlotCounts(completed=1)
+
+    with pytest.raises(BusinessRuleViolation):
+        await task_service.approve(group_id=1, approver_user_id=2, log_id=pending.id)
+    with pytest.raises(BusinessRuleViolation):
+        await task_service.reject(
+            group_id=1, approver_user_id=2, log_id=pending.id, rejection_reason="late tap"
+        )
+    with pytest.raises(BusinessRuleViolation):
+        await task_service.cancel(group_id=1, performer_user_id=1, log_id=pending.id)
+
+    assert uow.tasks.sprint_slots == slots
+    assert uow.tasks.sprint_progress == progress
+
+
+@pytest.mark.asyncio
+async def test_late_approval_moves_the_slot_into_the_current_sprint() -> None:
+    uow = InMemoryUnitOfWork()
+    for user_id in (1, 2):
+        uow.users.users[user_id] = UserProfile(
+            user_id, f"user{user_id}", f"User {user_id}", None, "en", False
+        )
+    group_service = GroupService(
+        uow=uow,
+        context_service=CurrentContextService(uow=uow),
+        clock=FakeClock(utc_datetime(2026, 3, 16)),
+    )
+    await group_service.create_group(
+        user_id=1,
+        name="team",
+        join_secret="secret",
+        sprint_start_weekday=Weekday.MONDAY,
+        sprint_duration_days=7,
+        timezone="UTC",
+    )
+    await group_service.join_group(user_id=2, group_name="team", join_secret="secret")
+    first_week = TaskService(uow=uow, clock=FakeClock(utc_datetime(2026, 3, 20)))
+    task = await first_week.create_task(
+        group_id=1,
+        title="Water plants",
+        frequency_per_sprint=1,
+        unit_cost=Decimal("1.00"),
+    )
+    pending = await first_week.mark_done(group_id=1, performer_user_id=1, task_id=task.id)
+    assert uow.tasks.sprint_slots[(task.id, date(2026, 3, 16))] == TaskSlotCounts(pending=1)
+
+    second_week = TaskService(uow=uow, clock=FakeClock(utc_datetime(2026, 3, 24)))
+    await second_week.approve(group_id=1, approver_user_id=2, log_id=pending.id)
+
+    assert uow.tasks.sprint_slots[(task.id, date(2026, 3, 16))] == TaskSlotCounts()
+    assert uow.tasks.sprint_slots[(task.id, date(2026, 3, 23))] == TaskSlotCounts(completed=1)
+    with pytest.raises(BusinessRuleViolation):
+        await second_week.mark_done(group_id=1, performer_user_id=2, task_id=task.id)
+
+
+@pytest.mark.asyncio
+async def test_mark_done_fans_out_approval_requests_in_one_write_per_completion() -> None:
+    uow = InMemoryUnitOfWork()
+    for user_id in (1, 2, 3, 4):
+        uow.users.users[user_id] = UserProfile(
+            user_id, f"user{user_id}", f"User {user_id}", None, "en", False
+        )
+    group_service = GroupService(
+        uow=uow,
+        context_service=CurrentContextService(uow=uow),
+        clock=FakeClock(utc_datetime(2026, 3, 16)),
+    )
+    await group_service.create_group(
+        user_id=1,
+        name="crew",
+        join_secret="secret",
+        sprint_start_weekday=Weekday.MONDAY,
+        sprint_duration_days=7,
+        timezone="UTC",
+    )
+    for user_id in (2, 3):
+        await group_service.join_group(user_id=user_id, group_name="crew", join_secret="secret")
+    task_service = TaskService(uow=uow, clock=FakeClock(utc_datetime(2026, 3, 16)))
+    task = await task_service.create_task(
+        group_id=1, title="Mop", frequency_per_sprint=3, unit_cost=Decimal("2.00")
+    )
+    uow.notifications.events.clear()
+
+    first = await task_service.mark_done(group_id=1, performer_user_id=2, task_id=task.id)
+    # The first completion of the sprint seeds the counter row and retries.
+    assert uow.tasks.complete_calls == 2
+    second = await task_service.mark_done(group_id=1, performer_user_id=2, task_id=task.id)
+    assert uow.tasks.complete_calls == 3
+
+    requests = [
+        (event.payload["task_log_id"], event.recipient_user_id)
+        for event in uow.notifications.events.values()
+        if event.event_type is NotificationEventType.TASK_APPROVAL_REQUESTED
+    ]
+    assert sorted(requests) == [(first.id, 1), (first.id, 3), (second.id, 1), (second.id, 3)]
+
+    with pytest.raises(AuthorizationError):
+        await task_service.mark_done(group_id=1, performer_user_id=4, task_id=task.id)
+    with pytest.raises(NotFoundError):
+        await task_service.mark_done(group_id=1, performer_user_id=2, task_id=999)
+    await task_service.delete_task(group_id=1, task_id=task.id)
+    with pytest.raises(BusinessRuleViolation, match="Soft-deleted"):
+        await task_service.mark_done(group_id=1, performer_user_id=2, task_id=task.id)
+    assert uow.tasks.sprint_slots[(task.id, date(2026, 3, 16))] == TaskSlotCounts(pending=2)
+
+
+@pytest.mark.asyncio
+async def test_batch_review_reports_each_log_and_writes_once() -> None:
+    uow = InMemoryUnitOfWork()
+    for user_id in (1, 2, 3):
+        uow.users.users[user_id] = UserProfile(
+            user_id, f"user{user_id}", f"User {user_id}", None, "en", False
+        )
+    group_service = GroupService(
+        uow=uow,
+        context_service=CurrentContextService(uow=uow),
+        clock=FakeClock(utc_datetime(2026, 3, 16)),
+    )
+    await group_service.create_group(
+        user_id=1,
+        name="reviewers",
+        join_secret="secret",
+        sprint_start_weekday=Weekday.MONDAY,
+        sprint_duration_days=7,
+        timezone="UTC",
+    )
+    for user_id in (2, 3):
+        await group_service.join_group(
+            user_id=user_id, group_name="reviewers", join_secret="secret"
+        )
+    task_service = TaskService(uow=uow, clock=FakeClock(utc_datetime(2026, 3, 17)))
+    sweep, dust = await task_service.import_tasks(
+        group_id=1,
+        items=[
+            TaskImportItem(title="Sweep", frequency_per_sprint=5, unit_cost=Decimal("1.00")),
+            TaskImportItem(title="Dust", frequency_per_sprint=2, unit_cost=Decimal("1.00")),
+        ],
+    )
+    marked = await task_service.mark_done_many(
+        group_id=1, performer_user_id=2, task_ids=[sweep.id, sweep.id, dust.id, 999]
+    )
+    assert [item.error_code for item in marked] == [None, None, None, "not_found"]
+    first, second, third = (item.log for item in marked[:3])
+    assert first is not None and second is not None and third is not None
+    own = await task_service.mark_done(group_id=1, performer_user_id=1, task_id=dust.id)
+    uow.notifications.events.clear()
+    uow.notifications.bulk_enqueue_calls = 0
+
+    approved = await task_service.approve_many(
+        group_id=1, approver_user_id=1, log_ids=[first.id, third.id, own.id, 404]
+    )
+
+    assert [(item.id, item.error_code) for item in approved] == [
+        (first.id, None),
+        (third.id, None),
+        (own.id, "forbidden"),
+        (404, "not_found"),
+    ]
+    assert all(
+        item.log is not None and item.log.status is TaskLogStatus.COMPLETED for item in approved[:2]
+    )
+    assert uow.tasks.batch_decide_calls == 1
+    assert uow.tasks.slot_lock_calls == 1
+    assert uow.notifications.bulk_enqueue_calls == 1
+    assert sorted(
+        event.recipient_user_id
+        for event in uow.notifications.events.values()
+        if event.event_type is NotificationEventType.TASK_APPROVED
+    ) == [2, 2]
+    sprint = date(2026, 3, 16)
+    assert uow.tasks.sprint_slots[(sweep.id, sprint)] == TaskSlotCounts(completed=1, pending=1)
+    assert uow.tasks.sprint_slots[(dust.id, sprint)] == TaskSlotCounts(completed=1, pending=1)
+
+    rejected = await task_service.reject_many(
+        group_id=1, approver_user_id=3, log_ids=[second.id, first.id], rejection_reason=" Redo "
+    )
+    assert [(item.id, item.error_code) for item in rejected] == [
+        (second.id, None),
+        (first.id, "business_rule_violation"),
+    ]
+    assert rejected[0].log is not None and rejected[0].log.rejection_reason == "Redo"
+    assert uow.tasks.sprint_slots[(sweep.id, sprint)] == TaskSlotCounts(completed=1)
+
+    with pytest.raises(AuthorizationError):
+        await task_service.approve_many(group_id=1, approver_user_id=9, log_ids=[own.id])
+
+
+@pytest.mark.asyncio
+async def test_sprint_progress_deltas_match_a_rebuild_from_logs() -> None:
+    uow = InMemoryUnitOfWork()
+    for user_id in (1, 2):
+        uow.users.users[user_id] = UserProfile(user_id, f"user{user_id}", None, None, "en", False)
+    clock = FakeClock(utc_datetime(2026, 3, 17))
+    group_service = GroupService(
+        uow=uow, context_service=CurrentContextService(uow=uow), clock=clock
+    )
+    await group_service.create_group(
+        user_id=1,
+        name="progress",
+        join_secret="secret",
+        sprint_start_weekday=Weekday.MONDAY,
+        sprint_duration_days=7,
+        timezone="UTC",
+    )
+    await group_service.join_group(user_id=2, group_name="progress", join_secret="secret")
+    task_service = TaskService(uow=uow, clock=clock)
+    sweep, dust = await task_service.import_tasks(
+        group_id=1,
+        items=[
+            TaskImportItem(title="Sweep", frequency_per_sprint=5, unit_cost=Decimal("2.00")),
+            TaskImportItem(title="Dust", frequency_per_sprint=5, unit_cost=Decimal("1.50")),
+        ],
+    )
+    marked = await task_service.mark_done_many(
+        group_id=1, performer_user_id=2, task_ids=[sweep.id, sweep.id, dust.id, dust.id]
+    )
+    first, second, third, fourth = (item.log for item in marked)
+    assert first and second and third and fourth
+    await task_service.approve(group_id=1, approver_user_id=1, log_id=first.id)
+    await task_service.approve_many(group_id=1, approver_user_id=1, log_ids=[third.id])
+    await task_service.reject(
+        group_id=1, approver_user_id=1, log_id=second.id, rejection_reason="Redo"
+    )
+    await task_service.cancel(group_id=1, performer_user_id=2, log_id=fourth.id)
+    await task_service.mark_done(group_id=1, performer_user_id=1, task_id=dust.id)
+
+    cards = {
+        card.user_id: card for card in await group_service.list_current_group_members(user_id=1)
+    }
+    assert cards[2].sprint_completed_units == Decimal("3.50")
+    assert cards[1].sprint_pending_units == Decimal("1.50")
+
+    sprint = date(2026, 3, 16)
+    incremental = await uow.tasks.list_sprint_progress(group_id=1, period_start=sprint)
+    await uow.tasks.rebuild_sprint_progress(
+        group_id=1,
+        period_start=sprint,
+        window_start=utc_datetime(2026, 3, 16, 0),
+        window_end_exclusive=utc_datetime(2026, 3, 23, 0),
+    )
+    assert await uow.tasks.list_sprint_progress(group_id=1, period_start=sprint) == incremental
+
+    await task_service.update_task(
+        group_id=1,
+        task_id=dust.id,
+        title=None,
+        frequency_per_sprint=None,
+        unit_cost=Decimal("3.00"),
+    )
+    repriced = await uow.tasks.list_sprint_progress(group_id=1, period_start=sprint)
+    assert repriced[2].completed_units == Decimal("5.00")
+    assert repriced[1].pending_units == Decimal("3.00")
+
+
 async def _bootstrap_solo_group() -> tuple[InMemoryUnitOfWork, TaskService]:
     uow = InMemoryUnitOfWork()
     uow.users.users[1] = UserProfile(1, "solo", "Solo", None, "en", False)
@@ -239,6 +527,9 @@ async def test_import_tasks_creates_all_when_payload_is_valid() -> None:
     assert all(t.id > 0 for t in created)
     assert len(uow.tasks.tasks) == 3
     assert uow.commit_count >= 1
+    assert uow.tasks.bulk_create_calls == 1
+    assert uow.tasks.slot_count_calls == 0
+    assert all(t.completed_in_sprint == 0 and t.pending_in_sprint == 0 for t in created)
 
 
 @pytest.mark.asyncio
@@ -281,6 +572,30 @@ async def test_import_tasks_rejects_payload_with_invalid_rows_and_creates_nothin
     assert uow.tasks.tasks == {}
 
 
+@pytest.mark.asyncio
+async def test_list_tasks_counts_every_task_slot_with_one_aggregate() -> None:
+    uow, task_service = await _bootstrap_solo_group()
+    tasks = [
+        await task_service.create_task(
+            group_id=1, title=f"Task {index}", frequency_per_sprint=3, unit_cost=Decimal("1")
+        )
+        for index in range(5)
+    ]
+    await task_service.mark_done(group_id=1, performer_user_id=1, task_id=tasks[0].id)
+    await task_service.mark_done(group_id=1, performer_user_id=1, task_id=tasks[0].id)
+    await task_service.mark_done(group_id=1, performer_user_id=1, task_id=tasks[3].id)
+    uow.tasks.slot_count_calls = 0
+
+    listed = {task.id: task for task in await task_service.list_tasks(group_id=1)}
+
+    assert uow.tasks.slot_count_calls == 1
+    assert listed[tasks[0].id].completed_in_sprint == 2
+    assert listed[tasks[0].id].available_in_sprint == 1
+    assert listed[tasks[3].id].completed_in_sprint == 1
+    assert listed[tasks[1].id].completed_in_sprint == 0
+    assert listed[tasks[1].id].pending_in_sprint == 0
+
+
 @pytest.mark.asyncio
 async def test_import_tasks_rejects_empty_payload() -> None:
     _, task_service = await _bootstrap_solo_group()
@@ -410,3 +725,68 @@ async def test_task_log_queries_enforce_visibility_and_return_enriched_filtered_
         )
     with pytest.raises(NotFoundError):
         await task_service.get_task_log_view(group_id=1, user_id=2, log_id=999)
+
+
+@pytest.mark.asyncio
+async def test_group_task_log_history_pages_by_cursor_without_counting() -> None:
+    uow, task_service = await _bootstrap_solo_group()
+    task = await task_service.create_task(
+        group_id=1, title="Dishes", frequency_per_sprint=5, unit_cost=Decimal("1")
+    )
+    # Same clock for every mark, so the cursor has to break created_at ties by id.
+    logs = [
+        await task_service.mark_done(group_id=1, performer_user_id=1, task_id=task.id)
+        for _ in range(5)
+    ]
+
+    first = await task_service.list_group_task_logs(
+        group_id=1,
+        user_id=1,
+        performer_user_id=None,
+        task_id=None,
+        statuses=None,
+        limit=2,
+        offset=0,
+    )
+    assert first.total == 5
+    assert first.has_more is True
+    assert first.next_cursor is not None
+
+    seen = [item.id for item in first.items]
+    cursor: str | None = first.next_cursor
+    while cursor is not None:
+        page = await task_service.list_group_task_logs(
+            group_id=1,
+            user_id=1,
+            performer_user_id=None,
+            task_id=None,
+            statuses=None,
+            limit=2,
+            offset=0,
+            cursor=cursor,
+        )
+        assert page.total is None
+        seen.extend(item.id for item in page.items)
+        cursor = page.next_cursor
+    assert seen == [log.id for log in reversed(logs)]
+
+    with pytest.raises(ValidationError):
+        await task_service.list_my_task_logs(
+            group_id=1,
+            user_id=1,
+            task_id=None,
+            statuses=None,
+            limit=2,
+            offset=2,
+            cursor=first.next_cursor,
+        )
+    with pytest.raises(ValidationError):
+        await task_service.list_my_task_logs(
+            group_id=1,
+            user_id=1,
+            task_id=None,
+            statuses=None,
+            limit=2,
+            offset=0,
+            cursor="not-a-cursor",
+        )
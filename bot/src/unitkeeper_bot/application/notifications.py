@@ -1,43 +1,157 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+import math
+from collections.abc import Sequence
 
 from aiogram import Bot
+from aiogram.exceptions import TelegramRetryAfter
 from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup, WebAppInfo
 
-from unitkeeper_bot.backend.client import BackendGateway, BackendTransportError
+from unitkeeper_bot.application.rate_limit import ChatThrottle, TokenBucket
+from unitkeeper_bot.backend.client import BackendGateway, BackendTransportError, DeliveryFailure
 from unitkeeper_bot.rendering import NotificationEvent as RenderedEvent
-from unitkeeper_bot.rendering import render_notification
+from unitkeeper_bot.rendering import RenderedDigest, render_digests
 
 _logger = logging.getLogger(__name__)
 
+# Telegram's documented ceilings for one bot: ~30 messages a second overall
+# and about one a second to any single chat.
+TELEGRAM_MESSAGES_PER_SECOND = 30.0
+TELEGRAM_CHAT_INTERVAL_SECONDS = 1.0
+
 
 class NotificationWorker:
-    """Delivery adapter: it renders backend events and acknowledges the result."""
+    """Delivery adapter: it renders backend events and acknowledges the result.
+
+    A claimed batch is split by chat, and each chat's events go out as one
+    digest message wherever they fit; results are still reported per event.
+    Up to ``concurrency`` chats are served at once, and every send waits for
+    both the per-chat slot and the bot-wide token bucket. A ``retry_after``
+    from Telegram pauses only that chat; its remaining events are handed back
+    to the backend with the same delay instead of being sent into the 429.
+    """
 
-    def __init__(self, *, backend: BackendGateway, bot: Bot, miniapp_url: str) -> None:
+    def __init__(
+        self,
+        *,
+        backend: BackendGateway,
+        bot: Bot,
+        miniapp_url: str,
+        worker_id: str,
+        batch_size: int = 50,
+        wait_seconds: float = 0,
+        concurrency: int = 8,
+        coalesce_seconds: float = 0,
+        rate_limiter: TokenBucket | None = None,
+        chat_throttle: ChatThrottle | None = None,
+    ) -> None:
         self._backend = backend
         self._bot = bot
         self._miniapp_url = miniapp_url
+        self._worker_id = worker_id
+        self._batch_size = batch_size
+        self._wait_seconds = wait_seconds
+        self._concurrency = concurrency
+        self._coalesce_seconds = coalesce_seconds
+        self._rate_limiter = rate_limiter or TokenBucket(rate=TELEGRAM_MESSAGES_PER_SECOND)
+        self._chat_throttle = chat_throttle or ChatThrottle(
+            interval_seconds=TELEGRAM_CHAT_INTERVAL_SECONDS
+        )
 
-    async def deliver_ready(self) -> None:
+    async def deliver_ready(self) -> bool:
+        """Claim and deliver one batch; returns ``False`` if the backend was unreachable."""
         try:
-            events = await self._backend.list_notification_outbox()
+            events = await self._backend.claim_notification_outbox(
+                worker_id=self._worker_id, limit=self._batch_size, wait_seconds=self._wait_seconds
+            )
         except BackendTransportError:
             _logger.exception("Unable to fetch notification outbox")
-            return
+            return False
+        if not events:
+            return True
+        if self._coalesce_seconds > 0 and len(events) < self._batch_size:
+            # A burst (several logs marked done, a sprint close) is usually
+            # still being committed; a short pause lets the rest of it join
+            # this batch and its digests.
+            await asyncio.sleep(self._coalesce_seconds)
+            try:
+                events += await self._backend.claim_notification_outbox(
+                    worker_id=self._worker_id, limit=self._batch_size - len(events)
+                )
+            except BackendTransportError:
+                _logger.exception("Unable to fetch notification outbox")
+        chats: dict[int, list[RenderedEvent]] = {}
         for event in events:
-            rendered = render_notification(
-                RenderedEvent(
-                    id=event.id,
-                    event_type=event.event_type,
-                    recipient_user_id=event.recipient_user_id,
-                    payload=event.payload,
-                    deep_link_path=event.deep_link_path,
-                ),
-                app_url=self._miniapp_url,
+            chats.setdefault(event.recipient_user_id, []).append(event)
+        failures: dict[str, DeliveryFailure] = {}
+        slots = asyncio.Semaphore(self._concurrency)
+
+        async def deliver_chat(chat_events: list[RenderedEvent]) -> None:
+            async with slots:
+                await self._deliver_chat(chat_events, failures)
+
+        await asyncio.gather(*(deliver_chat(chat_events) for chat_events in chats.values()))
+        try:
+            await self._backend.report_notification_results(
+                acknowledged=[event.id for event in events if event.id not in failures],
+                failed=[failures[event.id] for event in events if event.id in failures],
             )
-            rows: list[list[InlineKeyboardButton]] = []
+        except BackendTransportError:
+            # The batch stays leased until it expires and is then delivered again.
+            _logger.exception(
+                "Unable to record notification results",
+                extra={"event_ids": [event.id for event in events]},
+            )
+        return True
+
+    async def _deliver_chat(
+        self, events: list[RenderedEvent], failures: dict[str, DeliveryFailure]
+    ) -> None:
+        chat_id = events[0].recipient_user_id
+        for digest in render_digests(events, app_url=self._miniapp_url):
+            paused_for = self._chat_throttle.paused_for(chat_id)
+            if paused_for > 0:
+                _fail(
+                    failures,
+                    digest.events,
+                    "Chat is paused by Telegram flood control",
+                    retry_after_seconds=math.ceil(paused_for),
+                )
+                continue
+            await self._chat_throttle.wait(chat_id)
+            await self._rate_limiter.acquire()
+            event_ids = [event.id for event in digest.events]
+            try:
+                await self._bot.send_message(
+                    chat_id=chat_id,
+                    text=digest.notification.text,
+                    reply_markup=self._keyboard(digest),
+                )
+            except TelegramRetryAfter as error:
+                _logger.warning(
+                    "Telegram asked to slow down",
+                    extra={"event_ids": event_ids, "retry_after": error.retry_after},
+                )
+                self._chat_throttle.pause(chat_id, error.retry_after)
+                _fail(
+                    failures,
+                    digest.events,
+                    str(error)[:4000],
+                    retry_after_seconds=error.retry_after,
+                )
+            except Exception as error:
+                _logger.exception("Unable to deliver notification", extra={"event_ids": event_ids})
+                _fail(failures, digest.events, str(error)[:4000])
+
+    @staticmethod
+    def _keyboard(digest: RenderedDigest) -> InlineKeyboardMarkup | None:
+        rows: list[list[InlineKeyboardButton]] = []
+        # Approve/reject callbacks act on one log, so a digest links to the
+        # Mini App's approval list instead.
+        if len(digest.events) == 1:
+            event = digest.events[0]
             log_id = event.payload.get("task_log_id")
             if event.event_type == "task_approval_requested" and isinstance(log_id, int):
                 rows.append(
@@ -50,29 +164,32 @@ class NotificationWorker:
                         ),
                     ]
                 )
-            if rendered.miniapp_url and rendered.button_label:
-                rows.append(
-                    [
-                        InlineKeyboardButton(
-                            text=rendered.button_label,
-                            web_app=WebAppInfo(url=rendered.miniapp_url),
-                        )
-                    ]
-                )
-            try:
-                await self._bot.send_message(
-                    chat_id=event.recipient_user_id,
-                    text=rendered.text,
-                    reply_markup=InlineKeyboardMarkup(inline_keyboard=rows) if rows else None,
-                )
-                await self._backend.acknowledge_notification(event_id=event.id)
-            except Exception as error:
-                _logger.exception("Unable to deliver notification", extra={"event_id": event.id})
-                try:
-                    await self._backend.fail_notification(
-                        event_id=event.id, error_message=str(error)[:4000]
-                    )
-                except BackendTransportError:
-                    _logger.exception(
-                        "Unable to record notification failure", extra={"event_id": event.id}
+        rendered = digest.notification
+        if rendered.miniapp_url and rendered.button_label:
+            rows.append(
+                [
+                    InlineKeyboardButton(
+                        text=rendered.button_label,
+                        web_app=WebAppInfo(url=rendered.miniapp_url),
                     )
+                ]
+            )
+        return InlineKeyboardMarkup(inline_keyboard=rows) if rows else None
+
+
+def _fail(
+    failures: dict[str, DeliveryFailure],
+    events: Sequence[RenderedEvent],
+    error_message: str,
+    *,
+    retry_after_seconds: int | None = None,
+) -> None:
+    for event in events:
+        if retry_after_seconds is None:
+            failures[event.id] = DeliveryFailure(event_id=event.id, error_message=error_message)
+        else:
+            failures[event.id] = DeliveryFailure(
+                event_id=event.id,
+                error_message=error_message,
+                retry_after_seconds=retry_after_seconds,
+            )
@@ -0,0 +1,96 @@
+"""Client-side pacing for Telegram's send limits.
+
+Telegram allows a bot roughly 30 messages per second overall and about one
+per second to a single chat; going faster earns ``429 Too Many Requests`` with
+a ``retry_after``. Staying under both limits locally is cheaper than bouncing
+off them.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+
+Clock = Callable[[], float]
+Sleep = Callable[[float], Awaitable[None]]
+
+# Above this many tracked chats, entries that no longer delay anything are dropped.
+_MAX_IDLE_CHATS = 10_000
+
+
+class TokenBucket:
+    """Global send budget of ``rate`` sends per second, bursting up to ``burst``.
+
+    Each caller reserves the next free send slot before sleeping, so waiters
+    are served first come, first served without holding a lock. The default
+    burst of one spaces sends evenly, which keeps any one-second window at
+    ``rate`` instead of allowing a burst on top of the refill.
+    """
+
+    def __init__(
+        self,
+        *,
+        rate: float,
+        burst: int = 1,
+        clock: Clock = time.monotonic,
+        sleep: Sleep = asyncio.sleep,
+    ) -> None:
+        self._interval = 1 / rate
+        self._tolerance = (burst - 1) * self._interval
+        self._clock = clock
+        self._sleep = sleep
+        self._next_free_at = clock()
+
+    async def acquire(self) -> None:
+        now = self._clock()
+        slot = max(self._next_free_at, now)
+        self._next_free_at = slot + self._interval
+        send_at = slot - self._tolerance
+        if send_at > now:
+            await self._sleep(send_at - now)
+
+
+class ChatThrottle:
+    """Per-chat pacing plus the pauses Telegram asks for with ``retry_after``."""
+
+    def __init__(
+        self,
+        *,
+        interval_seconds: float,
+        clock: Clock = time.monotonic,
+        sleep: Sleep = asyncio.sleep,
+    ) -> None:
+        self._interval = interval_seconds
+        self._clock = clock
+        self._sleep = sleep
+        self._next_send_at: dict[int, float] = {}
+        self._paused_until: dict[int, float] = {}
+
+    def paused_for(self, chat_id: int) -> float:
+        """Seconds left on a ``retry_after`` pause for the chat, or ``0``."""
+        return max(0.0, self._paused_until.get(chat_id, 0.0) - self._clock())
+
+    def pause(self, chat_id: int, seconds: float) -> None:
+        self._paused_until[chat_id] = self._clock() + seconds
+
+    async def wait(self, chat_id: int) -> None:
+        """Wait for the chat's next send slot and reserve it.
+
+        Callers send to one chat sequentially, so no lock is needed per chat.
+        """
+        now = self._clock()
+        send_at = max(now, self._next_send_at.get(chat_id, now))
+        self._next_send_at[chat_id] = send_at + self._interval
+        if len(self._next_send_at) > _MAX_IDLE_CHATS:
+            self._forget_idle(now)
+        if send_at > now:
+            await self._sleep(send_at - now)
+
+    def _forget_idle(self, now: float) -> None:
+        self._next_send_at = {
+            chat_id: send_at for chat_id, send_at in self._next_send_at.items() if send_at > now
+        }
+        self._paused_until = {
+            chat_id: until for chat_id, until in self._paused_until.items() if until > now
+        }
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Any, Protocol
 
@@ -27,6 +28,13 @@ class CurrentContext:
     has_active_group: bool
 
 
+@dataclass(frozen=True, slots=True)
+class DeliveryFailure:
+    event_id: str
+    error_message: str
+    retry_after_seconds: int | None = 60
+
+
 class BackendGateway(Protocol):
     async def ensure_user(self, user: TelegramUser) -> None: ...
 
@@ -34,10 +42,18 @@ class BackendGateway(Protocol):
 
     async def list_notification_outbox(self) -> list[NotificationEvent]: ...
 
+    async def claim_notification_outbox(
+        self, *, worker_id: str, limit: int, wait_seconds: float = 0
+    ) -> list[NotificationEvent]: ...
+
     async def acknowledge_notification(self, *, event_id: str) -> None: ...
 
     async def fail_notification(self, *, event_id: str, error_message: str) -> None: ...
 
+    async def report_notification_results(
+        self, *, acknowledged: Sequence[str], failed: Sequence[DeliveryFailure]
+    ) -> None: ...
+
     async def approve_task_log(self, *, log_id: int, telegram_user_id: int) -> None: ...
 
     async def reject_task_log(self, *, log_id: int, telegram_user_id: int, reason: str) -> None: ...
@@ -52,6 +68,7 @@ class BackendClient:
         timeout_seconds: float,
         transport: httpx.AsyncBaseTransport | None = None,
     ) -> None:
+        self._timeout_seconds = timeout_seconds
         self._client = httpx.AsyncClient(
             base_url=base_url.rstrip("/") + "/",
             headers={"X-Internal-Auth": internal_secret},
@@ -82,6 +99,26 @@ class BackendClient:
 
     async def list_notification_outbox(self) -> list[NotificationEvent]:
         payload = await self._request("GET", "internal/bot/notifications/outbox")
+        return self._parse_outbox(payload)
+
+    async def claim_notification_outbox(
+        self, *, worker_id: str, limit: int, wait_seconds: float = 0
+    ) -> list[NotificationEvent]:
+        """Lease ready events to this worker so other replicas skip them.
+
+        With ``wait_seconds`` the backend holds the request open until events
+        arrive or the wait runs out, so the request timeout is extended by it.
+        """
+        payload = await self._request(
+            "POST",
+            "internal/bot/notifications/claim",
+            json={"worker_id": worker_id, "limit": limit, "wait_seconds": wait_seconds},
+            timeout=self._timeout_seconds + wait_seconds,
+        )
+        return self._parse_outbox(payload)
+
+    @staticmethod
+    def _parse_outbox(payload: dict[str, object]) -> list[NotificationEvent]:
         raw_items = payload.get("items")
         if not isinstance(raw_items, list):
             raise BackendTransportError("Backend returned an invalid notification outbox")
@@ -118,6 +155,26 @@ class BackendClient:
             json={"error_message": error_message, "retry_after_seconds": 60},
         )
 
+    async def report_notification_results(
+        self, *, acknowledged: Sequence[str], failed: Sequence[DeliveryFailure]
+    ) -> None:
+        """Acknowledge and fail a whole delivery batch in one backend request."""
+        await self._request(
+            "POST",
+            "internal/bot/notifications/results",
+            json={
+                "acknowledged": list(acknowledged),
+                "failed": [
+                    {
+                        "event_id": failure.event_id,
+                        "error_message": failure.error_message,
+                        "retry_after_seconds": failure.retry_after_seconds,
+                    }
+                    for failure in failed
+                ],
+            },
+        )
+
     async def approve_task_log(self, *, log_id: int, telegram_user_id: int) -> None:
         await self._request(
             "POST",
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from pydantic import AnyHttpUrl, SecretStr
+from pydantic import AnyHttpUrl, Field, SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -19,3 +19,8 @@ class Settings(BaseSettings):
     miniapp_url: AnyHttpUrl
     request_timeout_seconds: float = 10.0
     tgproxy: SecretStr | None = None
+    worker_id: str | None = None
+    notification_wait_seconds: float = Field(default=25.0, gt=0, le=30)
+    notification_concurrency: int = Field(default=8, ge=1, le=64)
+    notification_coalesce_seconds: float = Field(default=2.0, ge=0, le=10)
+    telegram_messages_per_second: float = Field(default=30.0, gt=0, le=30)
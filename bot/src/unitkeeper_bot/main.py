@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import os
+import socket
 
 from aiogram import Bot, Dispatcher
 from aiogram.client.default import DefaultBotProperties
@@ -9,6 +11,7 @@ from aiogram.client.session.aiohttp import AiohttpSession
 from aiogram.enums import ParseMode
 
 from unitkeeper_bot.application.notifications import NotificationWorker
+from unitkeeper_bot.application.rate_limit import TokenBucket
 from unitkeeper_bot.application.start import StartService
 from unitkeeper_bot.backend.client import BackendClient
 from unitkeeper_bot.config import Settings
@@ -39,12 +42,23 @@ async def run(settings: Settings) -> None:
         )
     )
     dispatcher.include_router(build_notification_router(backend=backend))
-    worker = NotificationWorker(backend=backend, bot=bot, miniapp_url=str(settings.miniapp_url))
+    worker = NotificationWorker(
+        backend=backend,
+        bot=bot,
+        miniapp_url=str(settings.miniapp_url),
+        worker_id=settings.worker_id or f"{socket.gethostname()}:{os.getpid()}",
+        wait_seconds=settings.notification_wait_seconds,
+        concurrency=settings.notification_concurrency,
+        coalesce_seconds=settings.notification_coalesce_seconds,
+        rate_limiter=TokenBucket(rate=settings.telegram_messages_per_second),
+    )
 
     async def deliver_notifications() -> None:
+        # Each claim long-polls the backend, so the loop only backs off when
+        # the backend cannot be reached.
         while True:
-            await worker.deliver_ready()
-            await asyncio.sleep(10)
+            if not await worker.deliver_ready():
+                await asyncio.sleep(10)
 
     notification_task = asyncio.create_task(deliver_notifications())
     try:
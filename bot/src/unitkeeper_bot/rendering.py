@@ -8,7 +8,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from html import escape
-from typing import Mapping
+from typing import Mapping, Sequence
 from urllib.parse import urlencode
 
 
@@ -31,6 +31,19 @@ class RenderedNotification:
     button_label: str | None
 
 
+@dataclass(frozen=True, slots=True)
+class RenderedDigest:
+    """One Telegram message standing in for ``events``, oldest first."""
+
+    events: tuple[NotificationEvent, ...]
+    notification: RenderedNotification
+
+
+# Telegram rejects messages longer than this many characters.
+MESSAGE_MAX_LENGTH = 4096
+_DIGEST_SEPARATOR = "\n\n"
+
+
 def _text(payload: Mapping[str, object], name: str, fallback: str = "") -> str:
     value = payload.get(name, fallback)
     return escape(str(value))
@@ -98,3 +111,55 @@ def render_notification(event: NotificationEvent, *, app_url: str) -> RenderedNo
         miniapp_url=miniapp_url(app_url=app_url, path=event.deep_link_path, event_id=event.id),
         button_label=label,
     )
+
+
+def render_digests(events: Sequence[NotificationEvent], *, app_url: str) -> list[RenderedDigest]:
+    """Coalesce one recipient's events into as few messages as Telegram accepts.
+
+    Every part is the event's own ``render_notification`` copy, so a digest
+    reads exactly like the messages it replaces. A digest of one event is
+    that event's plain rendering.
+    """
+    parts = [(event, render_notification(event, app_url=app_url)) for event in events]
+    groups: list[list[tuple[NotificationEvent, RenderedNotification]]] = []
+    length = 0
+    for part in parts:
+        added = len(_DIGEST_SEPARATOR) + len(part[1].text)
+        if groups and length + added <= MESSAGE_MAX_LENGTH:
+            groups[-1].append(part)
+            length += added
+        else:
+            groups.append([part])
+            length = len(_digest_header(len(parts))) + added
+    return [_digest(group, app_url=app_url) for group in groups]
+
+
+def _digest_header(count: int) -> str:
+    return f"<b>Новых уведомлений: {count}</b>"
+
+
+def _digest(
+    group: list[tuple[NotificationEvent, RenderedNotification]], *, app_url: str
+) -> RenderedDigest:
+    events = tuple(event for event, _ in group)
+    if len(group) == 1:
+        return RenderedDigest(events=events, notification=group[0][1])
+    text = _DIGEST_SEPARATOR.join(
+        [_digest_header(len(group)), *(rendered.text for _, rendered in group)]
+    )
+    # One shared destination keeps its button; a mix falls back to the app root.
+    paths = {event.deep_link_path for event in events}
+    labels = {rendered.button_label for _, rendered in group}
+    shared = len(paths) == 1 and len(labels) == 1
+    return RenderedDigest(
+        events=events,
+        notification=RenderedNotification(
+            text=text,
+            miniapp_url=miniapp_url(
+                app_url=app_url,
+                path=events[0].deep_link_path if shared else "/",
+                event_id=events[0].id,
+            ),
+            button_label=group[0][1].button_label if shared else "Открыть UnitKeeper",
+        ),
+    )
@@ -1,9 +1,16 @@
 from __future__ import annotations
 
+import json
+
 import httpx
 import pytest
 
-from unitkeeper_bot.backend.client import BackendClient, BackendTransportError, TelegramUser
+from unitkeeper_bot.backend.client import (
+    BackendClient,
+    BackendTransportError,
+    DeliveryFailure,
+    TelegramUser,
+)
 
 
 @pytest.mark.asyncio
@@ -55,7 +62,7 @@ async def test_client_lists_and_acknowledges_outbox_events() -> None:
 
     def handler(request: httpx.Request) -> httpx.Response:
         requests.append(request)
-        if request.url.path.endswith("/outbox"):
+        if request.url.path.endswith(("/outbox", "/claim")):
             return httpx.Response(
                 200,
                 json={
@@ -82,9 +89,50 @@ async def test_client_lists_and_acknowledges_outbox_events() -> None:
     try:
         events = await client.list_notification_outbox()
         await client.acknowledge_notification(event_id=events[0].id)
+        claimed = await client.claim_notification_outbox(
+            worker_id="bot-1", limit=20, wait_seconds=25
+        )
     finally:
         await client.close()
 
     assert events[0].recipient_user_id == 12
+    assert claimed == events
     assert requests[0].url.path.endswith("/notifications/outbox")
     assert requests[1].url.path.endswith("/notifications/00000000-0000-0000-0000-000000000001/ack")
+    assert requests[2].method == "POST"
+    assert requests[2].url.path.endswith("/notifications/claim")
+    assert json.loads(requests[2].content) == {
+        "worker_id": "bot-1",
+        "limit": 20,
+        "wait_seconds": 25,
+    }
+    assert requests[2].extensions["timeout"]["read"] == 26
+
+
+@pytest.mark.asyncio
+async def test_client_reports_delivery_results_in_one_request() -> None:
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"acknowledged_count": 1, "failed_count": 1})
+
+    client = BackendClient(
+        base_url="https://backend.example/api/v1",
+        internal_secret="internal-secret",
+        timeout_seconds=1,
+        transport=httpx.MockTransport(handler),
+    )
+    try:
+        await client.report_notification_results(
+            acknowledged=["event-1"], failed=[DeliveryFailure("event-2", "blocked")]
+        )
+    finally:
+        await client.close()
+
+    assert len(requests) == 1
+    assert requests[0].url.path == "/api/v1/internal/bot/notifications/results"
+    assert json.loads(requests[0].content) == {
+        "acknowledged": ["event-1"],
+        "failed": [{"event_id": "event-2", "error_message": "blocked", "retry_after_seconds": 60}],
+    }
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from urllib.parse import urlsplit
 
 import pytest
+from aiogram.exceptions import TelegramRetryAfter
+from aiogram.methods import SendMessage
 from aiogram.types import InlineKeyboardMarkup
 
 from unitkeeper_bot.application.notifications import NotificationWorker
+from unitkeeper_bot.application.rate_limit import TokenBucket
+from unitkeeper_bot.backend.client import DeliveryFailure
 from unitkeeper_bot.rendering import NotificationEvent
 
 
@@ -14,25 +19,34 @@ class FakeBackend:
         self.events = [event]
         self.acknowledged: list[str] = []
         self.failed: list[tuple[str, str]] = []
-
-    async def list_notification_outbox(self) -> list[NotificationEvent]:
-        return self.events
-
-    async def acknowledge_notification(self, *, event_id: str) -> None:
-        self.acknowledged.append(event_id)
-
-    async def fail_notification(
-        self,
-        *,
-        event_id: str,
-        error_message: str,
+        self.retry_after: dict[str, int | None] = {}
+        self.claims: list[str] = []
+        self.reports = 0
+
+    async def claim_notification_outbox(
+        self, *, worker_id: str, limit: int, wait_seconds: float = 0
+    ) -> list[NotificationEvent]:
+        self.claims.append(worker_id)
+        events, self.events = self.events[:limit], self.events[limit:]
+        return events
+
+    async def report_notification_results(
+        self, *, acknowledged: Sequence[str], failed: Sequence[DeliveryFailure]
     ) -> None:
-        self.failed.append((event_id, error_message))
+        self.reports += 1
+        self.acknowledged.extend(acknowledged)
+        self.failed.extend((failure.event_id, failure.error_message) for failure in failed)
+        self.retry_after.update(
+            (failure.event_id, failure.retry_after_seconds) for failure in failed
+        )
 
 
 class FakeBot:
-    def __init__(self, error: Exception | None = None) -> None:
+    def __init__(
+        self, error: Exception | None = None, *, flooded_chat_id: int | None = None
+    ) -> None:
         self.error = error
+        self.flooded_chat_id = flooded_chat_id
         self.messages: list[tuple[int, str, InlineKeyboardMarkup | None]] = []
 
     async def send_message(
@@ -44,11 +58,27 @@ class FakeBot:
     ) -> object:
         if self.error is not None:
             raise self.error
+        if chat_id == self.flooded_chat_id:
+            raise TelegramRetryAfter(
+                method=SendMessage(chat_id=chat_id, text=text),
+                message="Too Many Requests: retry after 17",
+                retry_after=17,
+            )
 
         self.messages.append((chat_id, text, reply_markup))
         return object()
 
 
+def approved_event(event_id: str, recipient_user_id: int) -> NotificationEvent:
+    return NotificationEvent(
+        id=event_id,
+        event_type="task_approved",
+        recipient_user_id=recipient_user_id,
+        payload={"task_title": "Задача"},
+        deep_link_path=None,
+    )
+
+
 def approval_event() -> NotificationEvent:
     return NotificationEvent(
         id="event-1",
@@ -71,6 +101,7 @@ async def test_worker_sends_web_app_button_and_preserves_approval_callbacks() ->
         backend=backend,  # type: ignore[arg-type]
         bot=bot,  # type: ignore[arg-type]
         miniapp_url="https://app.example",
+        worker_id="bot-1",
     ).deliver_ready()
 
     assert len(bot.messages) == 1
@@ -98,6 +129,7 @@ async def test_worker_sends_web_app_button_and_preserves_approval_callbacks() ->
     assert target.netloc == "app.example"
     assert target.path == "/tasks/history"
 
+    assert backend.claims == ["bot-1"]
     assert backend.acknowledged == ["event-1"]
     assert backend.failed == []
 
@@ -111,7 +143,81 @@ async def test_worker_reports_telegram_failure_without_acknowledging() -> None:
         backend=backend,  # type: ignore[arg-type]
         bot=bot,  # type: ignore[arg-type]
         miniapp_url="https://app.example",
+        worker_id="bot-1",
     ).deliver_ready()
 
     assert backend.acknowledged == []
     assert backend.failed == [("event-1", "blocked by Telegram")]
+
+
+@pytest.mark.asyncio
+async def test_worker_reports_a_whole_batch_in_one_backend_call() -> None:
+    backend = FakeBackend(approval_event())
+    backend.events = [approved_event(f"event-{index}", index) for index in range(1, 26)]
+
+    await NotificationWorker(
+        backend=backend,  # type: ignore[arg-type]
+        bot=FakeBot(),  # type: ignore[arg-type]
+        miniapp_url="https://app.example",
+        worker_id="bot-1",
+        rate_limiter=TokenBucket(rate=1000, burst=25),
+    ).deliver_ready()
+
+    assert backend.reports == 1
+    assert backend.acknowledged == [f"event-{index}" for index in range(1, 26)]
+
+
+@pytest.mark.asyncio
+async def test_retry_after_pauses_only_the_flooded_chat_and_forwards_the_delay() -> None:
+    backend = FakeBackend(approved_event("event-1", 42))
+    backend.events += [approved_event("event-2", 42), approved_event("event-3", 7)]
+    bot = FakeBot(flooded_chat_id=42)
+    worker = NotificationWorker(
+        backend=backend,  # type: ignore[arg-type]
+        bot=bot,  # type: ignore[arg-type]
+        miniapp_url="https://app.example",
+        worker_id="bot-1",
+    )
+
+    await worker.deliver_ready()
+
+    # Both chat 42 events went out as one digest, which Telegram refused.
+    assert [chat_id for chat_id, _, _ in bot.messages] == [7]
+    assert backend.acknowledged == ["event-3"]
+    assert backend.retry_after == {"event-1": 17, "event-2": 17}
+
+    backend.events = [approved_event("event-4", 42)]
+    bot.flooded_chat_id = None
+    await worker.deliver_ready()
+
+    assert backend.acknowledged == ["event-3"]
+    assert 0 < (backend.retry_after["event-4"] or 0) <= 17
+
+
+@pytest.mark.asyncio
+async def test_events_for_one_recipient_go_out_as_one_digest_but_are_acked_each() -> None:
+    backend = FakeBackend(approval_event())
+    backend.events += [approved_event("event-2", 42), approved_event("event-3", 7)]
+    bot = FakeBot()
+
+    await NotificationWorker(
+        backend=backend,  # type: ignore[arg-type]
+        bot=bot,  # type: ignore[arg-type]
+        miniapp_url="https://app.example",
+        worker_id="bot-1",
+    ).deliver_ready()
+
+    assert sorted(chat_id for chat_id, _, _ in bot.messages) == [7, 42]
+    digest_text, digest_markup = next(
+        (text, markup) for chat_id, text, markup in bot.messages if chat_id == 42
+    )
+    assert "Новых уведомлений: 2" in digest_text
+    assert "Нужна проверка задачи" in digest_text
+    assert "Задача подтверждена" in digest_text
+    # Per-log approve/reject callbacks are left to the Mini App in a digest.
+    assert digest_markup is not None
+    assert [[button.text for button in row] for row in digest_markup.inline_keyboard] == [
+        ["Открыть UnitKeeper"]
+    ]
+    assert backend.reports == 1
+    assert backend.acknowledged == ["event-1", "event-2", "event-3"]
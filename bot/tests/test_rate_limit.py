@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import pytest
+
+from unitkeeper_bot.application.rate_limit import ChatThrottle, TokenBucket
+
+
+class FakeTime:
+    def __init__(self) -> None:
+        self.now = 100.0
+        self.sleeps: list[float] = []
+
+    def clock(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(round(seconds, 3))
+        self.now += seconds
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_spaces_sends_at_the_configured_rate() -> None:
+    time = FakeTime()
+    bucket = TokenBucket(rate=30, burst=2, clock=time.clock, sleep=time.sleep)
+
+    for _ in range(5):
+        await bucket.acquire()
+
+    assert time.sleeps == [0.033, 0.033, 0.033]
+    assert time.now == pytest.approx(100.1)
+
+
+@pytest.mark.asyncio
+async def test_chat_throttle_paces_each_chat_separately_and_honours_pauses() -> None:
+    time = FakeTime()
+    throttle = ChatThrottle(interval_seconds=1.0, clock=time.clock, sleep=time.sleep)
+
+    await throttle.wait(1)
+    await throttle.wait(2)
+    await throttle.wait(1)
+    assert time.sleeps == [1.0]
+
+    throttle.pause(2, 17)
+    assert throttle.paused_for(2) == 17
+    assert throttle.paused_for(1) == 0
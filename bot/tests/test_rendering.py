@@ -3,7 +3,12 @@ from unitkeeper_bot.recovery import (
     owner_handover_required,
     unsupported_legacy_command,
 )
-from unitkeeper_bot.rendering import NotificationEvent, render_notification
+from unitkeeper_bot.rendering import (
+    MESSAGE_MAX_LENGTH,
+    NotificationEvent,
+    render_digests,
+    render_notification,
+)
 
 
 def test_personal_sprint_report_is_rendered_from_backend_payload() -> None:
@@ -43,6 +48,31 @@ def test_renderer_escapes_backend_supplied_text() -> None:
     assert "&lt;joined&gt;" in rendered.text
 
 
+def test_digests_reuse_event_copy_and_stay_within_telegram_message_limit() -> None:
+    events = [
+        NotificationEvent(
+            id=f"evt-{index}",
+            event_type="task_approval_requested",
+            recipient_user_id=10,
+            payload={"task_title": "x" * 500},
+            deep_link_path="/approvals",
+        )
+        for index in range(12)
+    ]
+
+    digests = render_digests(events, app_url="https://app.example")
+
+    assert [event.id for digest in digests for event in digest.events] == [
+        event.id for event in events
+    ]
+    assert len(digests) == 2
+    assert all(len(digest.notification.text) <= MESSAGE_MAX_LENGTH for digest in digests)
+    first = digests[0].notification
+    assert first.text.count("Нужна проверка задачи") == len(digests[0].events)
+    assert first.button_label == "Открыть подтверждения"
+    assert first.miniapp_url == "https://app.example/approvals?notification=evt-0"
+
+
 def test_recovery_responses_only_redirect_to_miniapp() -> None:
     replies = [miniapp_unavailable(), unsupported_legacy_command(), owner_handover_required()]
 
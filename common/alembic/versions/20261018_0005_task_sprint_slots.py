@@ -0,0 +1,67 @@
+"""add task sprint slot counters
+
+Revision ID: 20261018_0005
+Revises: 20260802_0004
+Create Date: 2026-10-18 10:00:00
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "20261018_0005"
+down_revision: Union[str, Sequence[str], None] = "20260802_0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # No backfill: the backend seeds a counter row from task_logs the first
+    # time a task is touched in a sprint window.
+    op.create_table(
+        "task_sprint_slots",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("group_id", sa.Integer(), nullable=False),
+        sa.Column("task_id", sa.Integer(), nullable=False),
+        sa.Column("period_start", sa.Date(), nullable=False),
+        sa.Column("completed_count", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.Column("pending_count", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.CheckConstraint(
+            "completed_count >= 0",
+            name=op.f("ck_task_sprint_slots_task_sprint_slots_completed_nonnegative"),
+        ),
+        sa.CheckConstraint(
+            "pending_count >= 0",
+            name=op.f("ck_task_sprint_slots_task_sprint_slots_pending_nonnegative"),
+        ),
+        sa.ForeignKeyConstraint(
+            ["group_id"],
+            ["groups.id"],
+            name=op.f("fk_task_sprint_slots_group_id_groups"),
+            ondelete="CASCADE",
+        ),
+        sa.ForeignKeyConstraint(
+            ["task_id"],
+            ["tasks.id"],
+            name=op.f("fk_task_sprint_slots_task_id_tasks"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_task_sprint_slots")),
+        sa.UniqueConstraint("task_id", "period_start", name=op.f("uq_task_sprint_slots_task_id_period_start")),
+    )
+    op.create_index(
+        op.f("ix_task_sprint_slots_group_id"),
+        "task_sprint_slots",
+        ["group_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_task_sprint_slots_group_id"), table_name="task_sprint_slots")
+    op.drop_table("task_sprint_slots")
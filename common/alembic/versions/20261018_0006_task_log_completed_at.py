@@ -0,0 +1,49 @@
+"""add generated task log completed_at with window indexes
+
+Revision ID: 20261018_0006
+Revises: 20261018_0005
+Create Date: 2026-10-18 12:00:00
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "20261018_0006"
+down_revision: Union[str, Sequence[str], None] = "20261018_0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "task_logs",
+        sa.Column(
+            "completed_at",
+            sa.DateTime(timezone=True),
+            sa.Computed("coalesce(decided_at, created_at)", persisted=True),
+            nullable=False,
+        ),
+    )
+    op.create_index(
+        "ix_task_logs_group_status_completed_at",
+        "task_logs",
+        ["group_id", "status", "completed_at"],
+        unique=False,
+        postgresql_include=["task_id"],
+    )
+    op.create_index(
+        "ix_task_logs_task_status_completed_at",
+        "task_logs",
+        ["task_id", "status", "completed_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_task_logs_task_status_completed_at", table_name="task_logs")
+    op.drop_index("ix_task_logs_group_status_completed_at", table_name="task_logs")
+    op.drop_column("task_logs", "completed_at")
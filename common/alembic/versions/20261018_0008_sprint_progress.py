@@ -0,0 +1,104 @@
+"""add sprint_progress read model
+
+Revision ID: 20261018_0008
+Revises: 20261018_0007
+Create Date: 2026-10-18 14:00:00
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "20261018_0008"
+down_revision: Union[str, Sequence[str], None] = "20261018_0007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "sprint_progress",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("group_id", sa.Integer(), nullable=False),
+        sa.Column("period_start", sa.Date(), nullable=False),
+        sa.Column("user_id", sa.BigInteger(), nullable=False),
+        sa.Column("completed_count", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.Column("completed_units", sa.Numeric(12, 2), server_default=sa.text("0"), nullable=False),
+        sa.Column("pending_count", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.Column("pending_units", sa.Numeric(12, 2), server_default=sa.text("0"), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["group_id"],
+            ["groups.id"],
+            name=op.f("fk_sprint_progress_group_id_groups"),
+            ondelete="CASCADE",
+        ),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.id"],
+            name=op.f("fk_sprint_progress_user_id_users"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_sprint_progress")),
+        sa.UniqueConstraint(
+            "group_id",
+            "period_start",
+            "user_id",
+            name=op.f("uq_sprint_progress_group_id_period_start_user_id"),
+        ),
+    )
+    # Each group's running sprint is filled from task_logs the way the backend
+    # rebuilds it: windows are whole sprint_duration_days blocks counted from
+    # the sprint_start_weekday on or before the group's creation date (UTC),
+    # and logs are valued at the unit cost of tasks that are not deleted.
+    op.execute(
+        """
+        WITH anchors AS (
+            SELECT groups.id AS group_id,
+                   groups.sprint_duration_days AS duration_days,
+                   (groups.created_at AT TIME ZONE 'UTC')::date
+                   - (
+                       extract(isodow FROM groups.created_at AT TIME ZONE 'UTC')::int
+                       - array_position(enum_range(NULL::weekday_enum), groups.sprint_start_weekday)
+                       + 7
+                   ) % 7 AS cycle_zero_start
+            FROM groups
+        ),
+        windows AS (
+            SELECT group_id,
+                   cycle_zero_start
+                   + ((now() AT TIME ZONE 'UTC')::date - cycle_zero_start)
+                   / duration_days * duration_days AS period_start,
+                   duration_days
+            FROM anchors
+        )
+        INSERT INTO sprint_progress (
+            group_id, period_start, user_id,
+            completed_count, completed_units, pending_count, pending_units
+        )
+        SELECT windows.group_id,
+               windows.period_start,
+               task_logs.performer_user_id,
+               count(*) FILTER (WHERE task_logs.status = 'completed'),
+               COALESCE(sum(tasks.unit_cost) FILTER (WHERE task_logs.status = 'completed'), 0),
+               count(*) FILTER (WHERE task_logs.status = 'pending'),
+               COALESCE(sum(tasks.unit_cost) FILTER (WHERE task_logs.status = 'pending'), 0)
+        FROM windows
+        JOIN task_logs
+          ON task_logs.group_id = windows.group_id
+         AND task_logs.status IN ('completed', 'pending')
+         AND task_logs.completed_at >= windows.period_start::timestamp AT TIME ZONE 'UTC'
+         AND task_logs.completed_at
+             < (windows.period_start + windows.duration_days)::timestamp AT TIME ZONE 'UTC'
+        JOIN tasks ON tasks.id = task_logs.task_id AND tasks.deleted_at IS NULL
+        GROUP BY windows.group_id, windows.period_start, task_logs.performer_user_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("sprint_progress")
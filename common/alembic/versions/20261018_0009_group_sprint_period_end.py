@@ -0,0 +1,30 @@
+"""add groups.sprint_period_end for indexed due-sprint discovery
+
+Revision ID: 20261018_0009
+Revises: 20261018_0008
+Create Date: 2026-10-18 15:00:00
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "20261018_0009"
+down_revision: Union[str, Sequence[str], None] = "20261018_0008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Left NULL for existing groups: the sprint-close job computes the value
+    # the first time it sees a group with a missing or stale period end.
+    op.add_column("groups", sa.Column("sprint_period_end", sa.Date(), nullable=True))
+    op.create_index(op.f("ix_groups_sprint_period_end"), "groups", ["sprint_period_end"])
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_groups_sprint_period_end"), table_name="groups")
+    op.drop_column("groups", "sprint_period_end")
@@ -0,0 +1,52 @@
+"""add ledger_reconciliation_checkpoints
+
+Revision ID: 20261018_0010
+Revises: 20261018_0009
+Create Date: 2026-10-18 16:00:00
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision: str = "20261018_0010"
+down_revision: Union[str, Sequence[str], None] = "20261018_0009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Groups without a row are reconciled from the start of their ledger.
+    op.create_table(
+        "ledger_reconciliation_checkpoints",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("group_id", sa.Integer(), nullable=False),
+        sa.Column("last_transaction_id", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.Column(
+            "ledger_balances",
+            postgresql.JSONB(astext_type=sa.Text()),
+            server_default=sa.text("'{}'::jsonb"),
+            nullable=False,
+        ),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["group_id"],
+            ["groups.id"],
+            name=op.f("fk_ledger_reconciliation_checkpoints_group_id_groups"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_ledger_reconciliation_checkpoints")),
+        sa.UniqueConstraint("group_id", name=op.f("uq_ledger_reconciliation_checkpoints_group_id")),
+    )
+    # Reconciliation scans a group's ledger past the checkpoint's transaction id.
+    op.create_index("ix_balance_transactions_group_id_id", "balance_transactions", ["group_id", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_balance_transactions_group_id_id", table_name="balance_transactions")
+    op.drop_table("ledger_reconciliation_checkpoints")
@@ -0,0 +1,86 @@
+"""add balance_checkpoints for point-in-time balances
+
+Revision ID: 20261018_0011
+Revises: 20261018_0010
+Create Date: 2026-10-18 17:00:00
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "20261018_0011"
+down_revision: Union[str, Sequence[str], None] = "20261018_0010"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "balance_checkpoints",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("group_id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.BigInteger(), nullable=False),
+        sa.Column("sprint_run_id", sa.Integer(), nullable=True),
+        sa.Column("balance", sa.Numeric(12, 2), nullable=False),
+        sa.Column("taken_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["group_id"],
+            ["groups.id"],
+            name=op.f("fk_balance_checkpoints_group_id_groups"),
+            ondelete="CASCADE",
+        ),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.id"],
+            name=op.f("fk_balance_checkpoints_user_id_users"),
+            ondelete="CASCADE",
+        ),
+        sa.ForeignKeyConstraint(
+            ["sprint_run_id"],
+            ["sprint_runs.id"],
+            name=op.f("fk_balance_checkpoints_sprint_run_id_sprint_runs"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_balance_checkpoints")),
+    )
+    op.create_index(
+        "ix_balance_checkpoints_group_user_taken_at",
+        "balance_checkpoints",
+        ["group_id", "user_id", "taken_at"],
+    )
+    op.create_index(op.f("ix_balance_checkpoints_sprint_run_id"), "balance_checkpoints", ["sprint_run_id"])
+    # Sprints closed before this revision already recorded every member's
+    # balance after settlement, so they become the first checkpoints. They are
+    # stamped with the settlement's own ledger time, as new checkpoints are.
+    op.execute(
+        """
+        INSERT INTO balance_checkpoints (group_id, user_id, sprint_run_id, balance, taken_at)
+        SELECT sprint_runs.group_id,
+               sprint_member_results.user_id,
+               sprint_runs.id,
+               sprint_member_results.balance_after,
+               COALESCE(
+                   (
+                       SELECT max(balance_transactions.created_at)
+                       FROM balance_transactions
+                       WHERE balance_transactions.sprint_run_id = sprint_runs.id
+                   ),
+                   sprint_runs.closed_at
+               )
+        FROM sprint_member_results
+        JOIN sprint_runs ON sprint_runs.id = sprint_member_results.sprint_run_id
+        WHERE sprint_runs.closed_at IS NOT NULL
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_balance_checkpoints_sprint_run_id"), table_name="balance_checkpoints")
+    op.drop_index("ix_balance_checkpoints_group_user_taken_at", table_name="balance_checkpoints")
+    op.drop_table("balance_checkpoints")
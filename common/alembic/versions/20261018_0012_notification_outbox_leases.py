@@ -0,0 +1,31 @@
+"""add lease columns to notification_outbox_events for concurrent bot workers
+
+Revision ID: 20261018_0012
+Revises: 20261018_0011
+Create Date: 2026-10-18 21:00:00
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "20261018_0012"
+down_revision: Union[str, Sequence[str], None] = "20261018_0011"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("notification_outbox_events", sa.Column("lease_owner", sa.String(length=128), nullable=True))
+    op.add_column(
+        "notification_outbox_events",
+        sa.Column("lease_expires_at", sa.DateTime(timezone=True), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("notification_outbox_events", "lease_expires_at")
+    op.drop_column("notification_outbox_events", "lease_owner")
@@ -0,0 +1,45 @@
+"""notify listeners when notification outbox events are inserted
+
+Revision ID: 20261018_0013
+Revises: 20261018_0012
+Create Date: 2026-10-18 22:00:00
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "20261018_0013"
+down_revision: Union[str, Sequence[str], None] = "20261018_0012"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Statement-level, so a fan-out written by one multi-row INSERT wakes the
+    # listeners once; NOTIFY is only delivered when the inserting transaction
+    # commits.
+    op.execute(
+        """
+        CREATE FUNCTION notify_notification_outbox() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            PERFORM pg_notify('notification_outbox', '');
+            RETURN NULL;
+        END;
+        $$
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER notification_outbox_events_notify
+        AFTER INSERT ON notification_outbox_events
+        FOR EACH STATEMENT EXECUTE FUNCTION notify_notification_outbox()
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER notification_outbox_events_notify ON notification_outbox_events")
+    op.execute("DROP FUNCTION notify_notification_outbox()")
@@ -0,0 +1,63 @@
+"""add priority lanes to notification_outbox_events
+
+Revision ID: 20261018_0014
+Revises: 20261018_0013
+Create Date: 2026-10-18 23:00:00
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "20261018_0014"
+down_revision: Union[str, Sequence[str], None] = "20261018_0013"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Lane per event type at the time of this migration (db.enums.NOTIFICATION_EVENT_PRIORITIES).
+_BACKFILL_PRIORITY = """
+    CASE event_type
+        WHEN 'task_approval_requested' THEN 0
+        WHEN 'task_approved' THEN 1
+        WHEN 'task_rejected' THEN 1
+        ELSE 2
+    END
+"""
+
+
+def upgrade() -> None:
+    op.add_column(
+        "notification_outbox_events",
+        sa.Column("priority", sa.SmallInteger(), nullable=False, server_default=sa.text("1")),
+    )
+    op.execute(f"UPDATE notification_outbox_events SET priority = {_BACKFILL_PRIORITY}")
+    op.alter_column("notification_outbox_events", "priority", server_default=None)
+    op.drop_index(
+        "ix_notification_outbox_events_pending_delivery",
+        table_name="notification_outbox_events",
+    )
+    op.create_index(
+        "ix_notification_outbox_events_pending_delivery",
+        "notification_outbox_events",
+        ["status", "priority", "created_at", "next_attempt_at"],
+        unique=False,
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_notification_outbox_events_pending_delivery",
+        table_name="notification_outbox_events",
+    )
+    op.create_index(
+        "ix_notification_outbox_events_pending_delivery",
+        "notification_outbox_events",
+        ["status", "next_attempt_at", "created_at"],
+        unique=False,
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+    op.drop_column("notification_outbox_events", "priority")
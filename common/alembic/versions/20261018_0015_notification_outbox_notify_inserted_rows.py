@@ -0,0 +1,57 @@
+"""notify outbox listeners only for inserts that wrote rows
+
+Revision ID: 20261018_0015
+Revises: 20261018_0014
+Create Date: 2026-10-18 23:30:00
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "20261018_0015"
+down_revision: Union[str, Sequence[str], None] = "20261018_0014"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _replace_trigger(function_body: str, referencing: str) -> None:
+    op.execute("DROP TRIGGER notification_outbox_events_notify ON notification_outbox_events")
+    op.execute(
+        f"""
+        CREATE OR REPLACE FUNCTION notify_notification_outbox() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            {function_body}
+            RETURN NULL;
+        END;
+        $$
+        """
+    )
+    op.execute(
+        f"""
+        CREATE TRIGGER notification_outbox_events_notify
+        AFTER INSERT ON notification_outbox_events
+        {referencing}
+        FOR EACH STATEMENT EXECUTE FUNCTION notify_notification_outbox()
+        """
+    )
+
+
+def upgrade() -> None:
+    # A statement trigger also fires for inserts that wrote nothing (ON CONFLICT
+    # DO NOTHING replays, task completions that notify nobody); the transition
+    # table keeps those from waking every long-polling worker.
+    _replace_trigger(
+        """
+            IF EXISTS (SELECT 1 FROM inserted) THEN
+                PERFORM pg_notify('notification_outbox', '');
+            END IF;
+        """,
+        "REFERENCING NEW TABLE AS inserted",
+    )
+
+
+def downgrade() -> None:
+    _replace_trigger("PERFORM pg_notify('notification_outbox', '');", "")
@@ -5,29 +5,35 @@ from db.enums import (
     NotificationDeliveryAttemptStatus,
     NotificationEventType,
     NotificationOutboxStatus,
+    NotificationPriority,
     SprintRunStatus,
     TaskLogStatus,
     Weekday,
 )
 from db.models import (
     Balance,
+    BalanceCheckpoint,
     BalanceTransaction,
     Group,
     GroupMembership,
     GroupMemberWeight,
     IdempotencyKey,
+    LedgerReconciliationCheckpoint,
     NotificationDeliveryAttempt,
     NotificationOutboxEvent,
     SprintMemberResult,
+    SprintProgress,
     SprintRun,
     Task,
     TaskLog,
+    TaskSprintSlot,
     User,
 )
 from db.settings import settings
 
 __all__ = [
     "Balance",
+    "BalanceCheckpoint",
     "BalanceTransaction",
     "BalanceTransactionType",
     "Base",
@@ -36,17 +42,21 @@ __all__ = [
     "GroupMembership",
     "IdempotencyKey",
     "IdempotencyStatus",
+    "LedgerReconciliationCheckpoint",
     "NotificationDeliveryAttempt",
     "NotificationDeliveryAttemptStatus",
     "NotificationEventType",
     "NotificationOutboxEvent",
     "NotificationOutboxStatus",
+    "NotificationPriority",
     "SprintMemberResult",
+    "SprintProgress",
     "SprintRun",
     "SprintRunStatus",
     "Task",
     "TaskLog",
     "TaskLogStatus",
+    "TaskSprintSlot",
     "User",
     "Weekday",
     "async_session_maker",
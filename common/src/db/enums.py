@@ -52,6 +52,23 @@ class NotificationEventType(str, enum.Enum):
     REMINDER = "reminder"
 
 
+class NotificationPriority(enum.IntEnum):
+    """Delivery lane of an outbox event; lower values are claimed first."""
+
+    INTERACTIVE = 0
+    NORMAL = 1
+    BULK = 2
+
+
+NOTIFICATION_EVENT_PRIORITIES: dict[NotificationEventType, NotificationPriority] = {
+    NotificationEventType.TASK_APPROVAL_REQUESTED: NotificationPriority.INTERACTIVE,
+    NotificationEventType.TASK_APPROVED: NotificationPriority.NORMAL,
+    NotificationEventType.TASK_REJECTED: NotificationPriority.NORMAL,
+    NotificationEventType.SPRINT_CLOSED: NotificationPriority.BULK,
+    NotificationEventType.REMINDER: NotificationPriority.BULK,
+}
+
+
 class NotificationOutboxStatus(str, enum.Enum):
     PENDING = "pending"
     DELIVERED = "delivered"
@@ -8,12 +8,14 @@ from sqlalchemy import (
     BigInteger,
     Boolean,
     CheckConstraint,
+    Computed,
     Date,
     DateTime,
     ForeignKey,
     Index,
     Integer,
     Numeric,
+    SmallInteger,
     String,
     Text,
     UniqueConstraint,
@@ -66,6 +68,12 @@ class User(TimestampMixin, Base):
         default=False,
         server_default=text("false"),
     )
+    membership_epoch: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default=text("0"),
+    )
 
     owned_groups: Mapped[list["Group"]] = relationship(
         back_populates="owner",
@@ -144,6 +152,10 @@ class Group(TimestampMixin, Base):
         default=Decimal("0"),
         server_default=text("0"),
     )
+    # Last day of the running sprint window, maintained by the backend so the
+    # daily close job can find due groups with one indexed lookup. NULL means
+    # it has not been computed yet; the close job fills it in.
+    sprint_period_end: Mapped[date | None] = mapped_column(Date, index=True)
 
     owner: Mapped["User"] = relationship(
         back_populates="owned_groups",
@@ -266,6 +278,108 @@ class Task(TimestampMixin, Base):
 
     group: Mapped["Group"] = relationship(back_populates="tasks")
     logs: Mapped[list["TaskLog"]] = relationship(back_populates="task")
+    sprint_slots: Mapped[list["TaskSprintSlot"]] = relationship(
+        back_populates="task",
+        cascade="all, delete-orphan",
+    )
+
+
+class TaskSprintSlot(TimestampMixin, Base):
+    """Running slot counters for one task in one sprint window.
+
+    ``completed_count`` and ``pending_count`` track the task logs that occupy
+    the task's slots in the sprint starting at ``period_start``, so a
+    completion can reserve a slot with a single conditional UPDATE instead of
+    counting ``task_logs`` under a task row lock.
+    """
+
+    __tablename__ = "task_sprint_slots"
+    __table_args__ = (
+        UniqueConstraint("task_id", "period_start"),
+        CheckConstraint(
+            "completed_count >= 0",
+            name="task_sprint_slots_completed_nonnegative",
+        ),
+        CheckConstraint(
+            "pending_count >= 0",
+            name="task_sprint_slots_pending_nonnegative",
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    group_id: Mapped[int] = mapped_column(
+        ForeignKey("groups.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    task_id: Mapped[int] = mapped_column(
+        ForeignKey("tasks.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    period_start: Mapped[date] = mapped_column(Date, nullable=False)
+    completed_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default=text("0"),
+    )
+    pending_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default=text("0"),
+    )
+
+    task: Mapped["Task"] = relationship(back_populates="sprint_slots")
+
+
+class SprintProgress(TimestampMixin, Base):
+    """Per-member completed and pending totals for one sprint window.
+
+    A read model over ``task_logs``: completions and reviews adjust it in the
+    same transaction, so per-member sprint totals are read in O(members).
+    Completed work counts in the window it was completed in, pending work in
+    the window it was marked in, both valued at the task's current unit cost.
+    """
+
+    __tablename__ = "sprint_progress"
+    __table_args__ = (UniqueConstraint("group_id", "period_start", "user_id"),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    group_id: Mapped[int] = mapped_column(
+        ForeignKey("groups.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    period_start: Mapped[date] = mapped_column(Date, nullable=False)
+    user_id: Mapped[int] = mapped_column(
+        BigInteger,
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    completed_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default=text("0"),
+    )
+    completed_units: Mapped[Decimal] = mapped_column(
+        Numeric(12, 2),
+        nullable=False,
+        default=Decimal("0.00"),
+        server_default=text("0"),
+    )
+    pending_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default=text("0"),
+    )
+    pending_units: Mapped[Decimal] = mapped_column(
+        Numeric(12, 2),
+        nullable=False,
+        default=Decimal("0.00"),
+        server_default=text("0"),
+    )
 
 
 class TaskLog(TimestampMixin, Base):
@@ -287,6 +401,19 @@ class TaskLog(TimestampMixin, Base):
             "performer_user_id",
             "created_at",
         ),
+        Index(
+            "ix_task_logs_group_status_completed_at",
+            "group_id",
+            "status",
+            "completed_at",
+            postgresql_include=["task_id"],
+        ),
+        Index(
+            "ix_task_logs_task_status_completed_at",
+            "task_id",
+            "status",
+            "completed_at",
+        ),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
@@ -318,6 +445,13 @@ class TaskLog(TimestampMixin, Base):
     )
     decided_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
     rejection_reason: Mapped[str | None] = mapped_column(Text)
+    # The moment a log counts towards a sprint window: when it was decided,
+    # or when it was created for logs that never needed a review.
+    completed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        Computed("coalesce(decided_at, created_at)", persisted=True),
+        nullable=False,
+    )
 
     group: Mapped["Group"] = relationship(back_populates="task_logs")
     task: Mapped["Task"] = relationship(back_populates="logs")
@@ -478,6 +612,41 @@ class SprintMemberResult(TimestampMixin, Base):
     user: Mapped["User"] = relationship(back_populates="sprint_results")
 
 
+class BalanceCheckpoint(TimestampMixin, Base):
+    """A member's balance as of ``taken_at``, written at every sprint close.
+
+    Point-in-time balances start from the latest checkpoint at or before the
+    requested moment and add only the ledger rows created after it.
+    """
+
+    __tablename__ = "balance_checkpoints"
+    __table_args__ = (
+        Index(
+            "ix_balance_checkpoints_group_user_taken_at",
+            "group_id",
+            "user_id",
+            "taken_at",
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    group_id: Mapped[int] = mapped_column(
+        ForeignKey("groups.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    user_id: Mapped[int] = mapped_column(
+        BigInteger,
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    sprint_run_id: Mapped[int | None] = mapped_column(
+        ForeignKey("sprint_runs.id", ondelete="CASCADE"),
+        index=True,
+    )
+    balance: Mapped[Decimal] = mapped_column(Numeric(12, 2), nullable=False)
+    taken_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+
 class BalanceTransaction(TimestampMixin, Base):
     """One leg of a double-entry ledger posting.
 
@@ -506,6 +675,8 @@ class BalanceTransaction(TimestampMixin, Base):
             "ix_balance_transactions_transaction_group_id",
             "transaction_group_id",
         ),
+        # Ledger reconciliation reads a group's rows past its checkpoint id.
+        Index("ix_balance_transactions_group_id_id", "group_id", "id"),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
@@ -564,6 +735,36 @@ class BalanceTransaction(TimestampMixin, Base):
     )
 
 
+class LedgerReconciliationCheckpoint(TimestampMixin, Base):
+    """How far the reconciliation job has verified one group's ledger.
+
+    ``ledger_balances`` holds each user's summed ``amount_delta`` over every
+    row up to and including ``last_transaction_id``, keyed by user id, so the
+    next run only has to scan the rows added after it.
+    """
+
+    __tablename__ = "ledger_reconciliation_checkpoints"
+    __table_args__ = (UniqueConstraint("group_id"),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    group_id: Mapped[int] = mapped_column(
+        ForeignKey("groups.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    last_transaction_id: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default=text("0"),
+    )
+    ledger_balances: Mapped[dict[str, str]] = mapped_column(
+        JSONB,
+        nullable=False,
+        default=dict,
+        server_default=text("'{}'::jsonb"),
+    )
+
+
 class NotificationOutboxEvent(TimestampMixin, Base):
     __tablename__ = "notification_outbox_events"
     __table_args__ = (
@@ -571,8 +772,9 @@ class NotificationOutboxEvent(TimestampMixin, Base):
         Index(
             "ix_notification_outbox_events_pending_delivery",
             "status",
-            "next_attempt_at",
+            "priority",
             "created_at",
+            "next_attempt_at",
             postgresql_where=text("status = 'pending'"),
         ),
         Index(
@@ -622,6 +824,11 @@ class NotificationOutboxEvent(TimestampMixin, Base):
     last_attempt_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
     delivered_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
     last_error: Mapped[str | None] = mapped_column(Text)
+    lease_owner: Mapped[str | None] = mapped_column(String(128))
+    lease_expires_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    # Set from NOTIFICATION_EVENT_PRIORITIES by every writer; no default, so
+    # a new insert path cannot silently land in the wrong lane.
+    priority: Mapped[int] = mapped_column(SmallInteger, nullable=False)
 
     recipient: Mapped["User"] = relationship(back_populates="notification_events")
     group: Mapped["Group | None"] = relationship(back_populates="notification_events")
@@ -693,16 +900,20 @@ class IdempotencyKey(TimestampMixin, Base):
 
 __all__ = [
     "Balance",
+    "BalanceCheckpoint",
     "BalanceTransaction",
     "Group",
     "GroupMemberWeight",
     "GroupMembership",
     "IdempotencyKey",
+    "LedgerReconciliationCheckpoint",
     "NotificationDeliveryAttempt",
     "NotificationOutboxEvent",
     "SprintMemberResult",
+    "SprintProgress",
     "SprintRun",
     "Task",
     "TaskLog",
+    "TaskSprintSlot",
     "User",
 ]
@@ -10,17 +10,21 @@ from sqlalchemy import create_engine, inspect
 
 EXPECTED_TABLES = {
     "alembic_version",
+    "balance_checkpoints",
     "balance_transactions",
     "balances",
     "group_member_weights",
     "group_memberships",
     "groups",
     "idempotency_keys",
+    "ledger_reconciliation_checkpoints",
     "notification_delivery_attempts",
     "notification_outbox_events",
     "sprint_member_results",
+    "sprint_progress",
     "sprint_runs",
     "task_logs",
+    "task_sprint_slots",
     "tasks",
     "users",
 }
@@ -1,17 +1,21 @@
 from db import (
     Balance,
+    BalanceCheckpoint,
     BalanceTransaction,
     Base,
     Group,
     GroupMembership,
     GroupMemberWeight,
     IdempotencyKey,
+    LedgerReconciliationCheckpoint,
     NotificationDeliveryAttempt,
     NotificationOutboxEvent,
     SprintMemberResult,
+    SprintProgress,
     SprintRun,
     Task,
     TaskLog,
+    TaskSprintSlot,
     User,
     async_session_maker,
     engine,
@@ -29,17 +33,21 @@ def test_public_package_surface_is_importable() -> None:
 def test_metadata_contains_shared_schema_models() -> None:
     expected_models = {
         Balance,
+        BalanceCheckpoint,
         BalanceTransaction,
         Group,
         GroupMemberWeight,
         GroupMembership,
         IdempotencyKey,
+        LedgerReconciliationCheckpoint,
         NotificationDeliveryAttempt,
         NotificationOutboxEvent,
         SprintMemberResult,
+        SprintProgress,
         SprintRun,
         Task,
         TaskLog,
+        TaskSprintSlot,
         User,
     }
 
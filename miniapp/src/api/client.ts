@@ -45,6 +45,11 @@ export interface RequestOptions {
   body?: unknown;
   /** Bearer token attached as `Authorization` when provided. */
   token?: string | null;
+  /**
+   * Sent as `Idempotency-Key`. The backend replays the stored response for a
+   * repeated key, so a request that failed in transit is retried once with it.
+   */
+  idempotencyKey?: string;
   signal?: AbortSignal;
 }
 
@@ -71,7 +76,7 @@ async function parseError(response: Response): Promise<ApiError> {
  * `undefined` for 204, and throws `ApiError` / `NetworkError` otherwise.
  */
 export async function request<T>(path: string, options: RequestOptions = {}): Promise<T> {
-  const { method = 'GET', body, token, signal } = options;
+  const { method = 'GET', body, token, idempotencyKey, signal } = options;
 
   const headers: Record<string, string> = { Accept: 'application/json' };
   if (body !== undefined) {
@@ -80,15 +85,28 @@ export async function request<T>(path: string, options: RequestOptions = {}): Pr
   if (token) {
     headers.Authorization = `Bearer ${token}`;
   }
+  if (idempotencyKey) {
+    headers['Idempotency-Key'] = idempotencyKey;
+  }
 
-  let response: Response;
-  try {
-    response = await fetch(`${config.apiBaseUrl}${path}`, {
+  const send = () =>
+    fetch(`${config.apiBaseUrl}${path}`, {
       method,
       headers,
       body: body === undefined ? undefined : JSON.stringify(body),
       signal,
     });
+
+  let response: Response;
+  try {
+    try {
+      response = await send();
+    } catch (error) {
+      if (!idempotencyKey || (error instanceof DOMException && error.name === 'AbortError')) {
+        throw error;
+      }
+      response = await send();
+    }
   } catch (error) {
     if (error instanceof DOMException && error.name === 'AbortError') {
       throw error;
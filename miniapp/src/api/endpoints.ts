@@ -13,6 +13,9 @@ import type {
   JoinGroupRequest,
   SessionResponse,
   SprintResultsResponse,
+  SprintRunPageResponse,
+  SprintRunResponse,
+  TaskLogBatchResponse,
   TaskLogResponse,
   TaskLogPageResponse,
   TaskResponse,
@@ -33,6 +36,15 @@ export function authenticateTelegram(initData: string): Promise<SessionResponse>
   });
 }
 
+/**
+ * Reissue the session token. Tokens carry the caller's group membership, so
+ * refreshing after joining or leaving a group keeps group routes off the
+ * backend's slower context lookup.
+ */
+export function refreshSession(token: string): Promise<SessionResponse> {
+  return request<SessionResponse>('/auth/refresh', { method: 'POST', token });
+}
+
 /** Resolve the current context (user + membership + group) for a saved token. */
 export function getCurrentContext(token: string): Promise<CurrentContextResponse> {
   return request<CurrentContextResponse>('/auth/me', { token });
@@ -122,7 +134,21 @@ export function decreaseTaskFrequency(token: string, taskId: number): Promise<Ta
 
 /** Log a completion for a task; the entry awaits owner approval. */
 export function markTaskDone(token: string, taskId: number): Promise<TaskLogResponse> {
-  return request<TaskLogResponse>(`/tasks/${taskId}/done`, { method: 'POST', token });
+  return request<TaskLogResponse>(`/tasks/${taskId}/done`, {
+    method: 'POST',
+    token,
+    idempotencyKey: crypto.randomUUID(),
+  });
+}
+
+/** Log completions for several tasks at once; each item reports its own result. */
+export function markTasksDone(token: string, taskIds: number[]): Promise<TaskLogBatchResponse> {
+  return request<TaskLogBatchResponse>('/tasks/done', {
+    method: 'POST',
+    body: { task_ids: taskIds },
+    token,
+    idempotencyKey: crypto.randomUUID(),
+  });
 }
 
 export function listPendingApprovals(token: string): Promise<TaskLogPageResponse> {
@@ -138,7 +164,11 @@ export function listGroupTaskLogs(token: string): Promise<TaskLogPageResponse> {
 }
 
 export function approveTaskLog(token: string, logId: number): Promise<TaskLogResponse> {
-  return request<TaskLogResponse>(`/task-logs/${logId}/approve`, { method: 'POST', token });
+  return request<TaskLogResponse>(`/task-logs/${logId}/approve`, {
+    method: 'POST',
+    token,
+    idempotencyKey: crypto.randomUUID(),
+  });
 }
 
 export function rejectTaskLog(token: string, logId: number, reason: string): Promise<TaskLogResponse> {
@@ -146,6 +176,29 @@ export function rejectTaskLog(token: string, logId: number, reason: string): Pro
     method: 'POST',
     body: { reason },
     token,
+    idempotencyKey: crypto.randomUUID(),
+  });
+}
+
+export function approveTaskLogs(token: string, logIds: number[]): Promise<TaskLogBatchResponse> {
+  return request<TaskLogBatchResponse>('/task-logs/approve', {
+    method: 'POST',
+    body: { log_ids: logIds },
+    token,
+    idempotencyKey: crypto.randomUUID(),
+  });
+}
+
+export function rejectTaskLogs(
+  token: string,
+  logIds: number[],
+  reason: string,
+): Promise<TaskLogBatchResponse> {
+  return request<TaskLogBatchResponse>('/task-logs/reject', {
+    method: 'POST',
+    body: { log_ids: logIds, reason },
+    token,
+    idempotencyKey: crypto.randomUUID(),
   });
 }
 
@@ -159,6 +212,26 @@ export function getSprintResults(token: string): Promise<SprintResultsResponse>
   return request<SprintResultsResponse>('/sprints/current/results', { token });
 }
 
+/**
+ * One page of closed sprints, newest first. Pass the previous page's
+ * `next_cursor` to continue.
+ */
+export function listSprintHistory(
+  token: string,
+  { limit, cursor }: { limit: number; cursor?: string | null },
+): Promise<SprintRunPageResponse> {
+  const params = new URLSearchParams({ limit: String(limit) });
+  if (cursor) {
+    params.set('cursor', cursor);
+  }
+  return request<SprintRunPageResponse>(`/sprints/history?${params}`, { token });
+}
+
+/** A closed sprint with every member's settled result. */
+export function getSprintHistory(token: string, sprintRunId: number): Promise<SprintRunResponse> {
+  return request<SprintRunResponse>(`/sprints/history/${sprintRunId}`, { token });
+}
+
 /** Active group members eligible to receive a transfer, other than yourself. */
 export function listTransferCandidates(token: string): Promise<TransferCandidatesResponse> {
   return request<TransferCandidatesResponse>('/balances/transfer-candidates', { token });
@@ -168,7 +241,12 @@ export function createTransfer(
   token: string,
   body: CreateTransferRequest,
 ): Promise<BalanceTransferResponse> {
-  return request<BalanceTransferResponse>('/balances/transfers', { method: 'POST', body, token });
+  return request<BalanceTransferResponse>('/balances/transfers', {
+    method: 'POST',
+    body,
+    token,
+    idempotencyKey: crypto.randomUUID(),
+  });
 }
 
 export function listBalanceTransactions(
@@ -1,6 +1,6 @@
 import { useMutation, useQueryClient, type UseMutationResult } from '@tanstack/react-query';
 
-import { useAuthToken } from '@/auth/useAuth';
+import { useAuth, useAuthToken } from '@/auth/useAuth';
 
 import {
   createGroup,
@@ -89,30 +89,42 @@ export function useCreateGroup(): UseMutationResult<
   CreateGroupRequest
 > {
   const token = useAuthToken();
+  const { refreshSession } = useAuth();
   const refreshCurrentGroup = useRefreshCurrentGroup();
 
   return useMutation({
     mutationFn: (body: CreateGroupRequest) => createGroup(token, body),
-    onSuccess: () => refreshCurrentGroup(),
+    onSuccess: async () => {
+      await refreshSession();
+      await refreshCurrentGroup();
+    },
   });
 }
 
 export function useJoinGroup(): UseMutationResult<CurrentContextResponse, Error, JoinGroupRequest> {
   const token = useAuthToken();
+  const { refreshSession } = useAuth();
   const refreshCurrentGroup = useRefreshCurrentGroup();
 
   return useMutation({
     mutationFn: (body: JoinGroupRequest) => joinGroup(token, body),
-    onSuccess: () => refreshCurrentGroup(),
+    onSuccess: async () => {
+      await refreshSession();
+      await refreshCurrentGroup();
+    },
   });
 }
 
 export function useLeaveGroup(): UseMutationResult<void, Error, void> {
   const token = useAuthToken();
+  const { refreshSession } = useAuth();
   const invalidate = useInvalidateGroup();
   return useMutation({
     mutationFn: () => leaveGroup(token),
-    onSuccess: () => invalidate(),
+    onSuccess: async () => {
+      await refreshSession();
+      await invalidate();
+    },
   });
 }
 
@@ -5,17 +5,21 @@ import { useAuthToken } from '@/auth/useAuth';
 import { ApiError } from './client';
 import {
   getCurrentGroup,
+  getSprintHistory,
   getSprintResults,
   listBalanceTransactions,
   listGroupTaskLogs,
   listMyTaskLogs,
   listPendingApprovals,
+  listSprintHistory,
   listTasks,
   listTransferCandidates,
 } from './endpoints';
 import type {
   BalanceTransactionPageResponse,
   SprintResultsResponse,
+  SprintRunPageResponse,
+  SprintRunResponse,
   TaskLogPageResponse,
   TaskResponse,
   TransferCandidatesResponse,
@@ -32,6 +36,9 @@ export const queryKeys = {
   currentGroup: ['groups', 'current'] as const,
   tasks: ['tasks'] as const,
   sprintResults: ['sprints', 'current', 'results'] as const,
+  sprintHistory: (limit: number, cursor: string | null) =>
+    ['sprints', 'history', limit, cursor] as const,
+  sprintHistoryItem: (sprintRunId: number) => ['sprints', 'history', sprintRunId] as const,
   pendingApprovals: ['task-logs', 'pending-approval'] as const,
   myTaskLogs: ['task-logs', 'mine'] as const,
   groupTaskLogs: ['groups', 'current', 'task-logs'] as const,
@@ -89,6 +96,31 @@ export function useSprintResults(): UseQueryResult<SprintResultsResponse, Error>
   });
 }
 
+/**
+ * A page of closed sprints. Closed sprints never change, so pages reached
+ * through a cursor are never refetched; only the first page can gain items.
+ */
+export function useSprintHistory(
+  { limit, cursor }: { limit: number; cursor: string | null },
+): UseQueryResult<SprintRunPageResponse, Error> {
+  const token = useAuthToken();
+  return useQuery({
+    queryKey: queryKeys.sprintHistory(limit, cursor),
+    queryFn: () => listSprintHistory(token, { limit, cursor }),
+    ...(cursor !== null && { staleTime: Infinity }),
+  });
+}
+
+/** Member breakdown of a closed sprint; immutable once loaded. */
+export function useSprintHistoryItem(sprintRunId: number): UseQueryResult<SprintRunResponse, Error> {
+  const token = useAuthToken();
+  return useQuery({
+    queryKey: queryKeys.sprintHistoryItem(sprintRunId),
+    queryFn: () => getSprintHistory(token, sprintRunId),
+    staleTime: Infinity,
+  });
+}
+
 export function usePendingApprovals(enabled: boolean): UseQueryResult<TaskLogPageResponse, Error> {
   const token = useAuthToken();
   return useQuery({
@@ -55,6 +55,8 @@ export interface MemberCardResponse {
   weight_percent: string;
   balance: string;
   is_owner: boolean;
+  sprint_completed_units: string;
+  sprint_pending_units: string;
 }
 
 export interface GroupCardResponse {
@@ -185,6 +187,17 @@ export interface TaskLogResponse {
   created_at: string;
 }
 
+/** Per-item outcome of a batch approve/reject/done call: the log or the error. */
+export interface TaskLogBatchItemResponse {
+  id: number;
+  log: TaskLogResponse | null;
+  error: ErrorResponse | null;
+}
+
+export interface TaskLogBatchResponse {
+  items: TaskLogBatchItemResponse[];
+}
+
 export type TaskLogStatus = 'pending' | 'completed' | 'rejected';
 
 export interface TaskLogTaskResponse {
@@ -208,10 +221,11 @@ export interface TaskLogViewResponse {
 
 export interface TaskLogPageResponse {
   items: TaskLogViewResponse[];
-  total: number;
+  total: number | null;
   limit: number;
   offset: number;
   has_more: boolean;
+  next_cursor: string | null;
 }
 
 export interface CompletedTaskBreakdownResponse {
@@ -241,6 +255,41 @@ export interface SprintResultsResponse {
   group: GroupProgressResponse;
 }
 
+export interface SprintMemberResultResponse {
+  user_id: number;
+  planned_units: string;
+  completed_units: string;
+  efficiency_percent: string;
+  bonus_units: string;
+  balance_delta: string;
+  balance_after: string;
+}
+
+/** A closed sprint as snapshotted when it was settled. */
+export interface SprintRunSummaryResponse {
+  id: number;
+  group_id: number;
+  period_start: string;
+  period_end: string;
+  status: string;
+  total_planned_units: string;
+  total_completed_units: string;
+  bonus_units: string;
+  balance_delta: string;
+  closed_at: string | null;
+}
+
+export interface SprintRunResponse extends SprintRunSummaryResponse {
+  member_results: SprintMemberResultResponse[];
+}
+
+export interface SprintRunPageResponse {
+  items: SprintRunSummaryResponse[];
+  limit: number;
+  has_more: boolean;
+  next_cursor: string | null;
+}
+
 export interface BalanceResponse {
   group_id: number;
   user_id: number;
@@ -1,7 +1,7 @@
 import { useCallback, useEffect, useRef, useState, type ReactNode } from 'react';
 
 import { ApiError } from '@/api/client';
-import { authenticateTelegram, getCurrentContext } from '@/api/endpoints';
+import { authenticateTelegram, getCurrentContext, refreshSession } from '@/api/endpoints';
 import type { CurrentContextResponse } from '@/api/types';
 import { resolveRawInitData } from '@/telegram/launch';
 
@@ -99,12 +99,27 @@ export function AuthProvider({ children }: { children: ReactNode }) {
     void bootstrap();
   }, [bootstrap]);
 
+  const currentToken = state.token;
+  const refresh = useCallback(async (): Promise<void> => {
+    if (!currentToken) return;
+    const runId = runRef.current;
+    try {
+      const session = await refreshSession(currentToken);
+      if (runRef.current !== runId) return;
+      saveSession({ accessToken: session.access_token, expiresAt: session.expires_at });
+      setState((prev) => ({ ...prev, token: session.access_token, context: session.context }));
+    } catch {
+      // The previous token stays valid; the backend just resolves its group from the DB.
+    }
+  }, [currentToken]);
+
   const value: AuthState = {
     status: state.status,
     token: state.token,
     context: state.context,
     error: state.error,
     reauthenticate,
+    refreshSession: refresh,
   };
 
   return <AuthContext.Provider value={value}>{children}</AuthContext.Provider>;
@@ -14,6 +14,8 @@ export interface AuthState {
   error: Error | null;
   /** Re-run the auth bootstrap (e.g. after a failure or expiry). */
   reauthenticate: () => void;
+  /** Reissue the token after a membership change; failures keep the old one. */
+  refreshSession: () => Promise<void>;
 }
 
 export const AuthContext = createContext<AuthState | null>(null);
@@ -6,7 +6,7 @@ import { useAuth } from '@/auth/useAuth';
 import { ErrorState } from '@/components/ErrorState';
 import { Loader } from '@/components/Loader';
 import { routes } from '@/routes/paths';
-import { UNIT_SYMBOL, balanceColor, formatBalance, memberName } from '@/ui/format';
+import { UNIT_SYMBOL, balanceColor, formatBalance, formatUnits, memberName } from '@/ui/format';
 import {
   Avatar,
   Button,
@@ -151,7 +151,8 @@ export function BalanceScreen() {
                       {member.is_owner ? <span className="uk-badge">владелец</span> : null}
                     </div>
                     <div style={{ font: "400 12px 'Manrope'", color: 'var(--uk-ink-55)' }}>
-                      Нагрузка {member.weight_percent}%
+                      Нагрузка {member.weight_percent}% · в спринте{' '}
+                      {formatUnits(member.sprint_completed_units)} {UNIT_SYMBOL}
                     </div>
                   </div>
                   <span style={{ font: "700 15px 'Manrope'", color: balanceColor(member.balance) }}>